@@ -30,22 +30,43 @@
 
     Usage:
         merge_repo.py -c config -d config_dir
-            -p project_directory [-r repo_name]
-            {-M [-a] [-n] [-u]}
+            {-p project_directory [project_directory ...] [-r repo_name] |
+             -b drop_directory | -D}
+            {-M [-a] [-n] [-u] [-Q socket_path [-w]]}
+            {-R bundle_file [-t directory_path]}
             {-v | -h}
 
     Arguments:
         -c file_name => Name of merge_repo configuration file.
         -d directory_path => Directory path to the configuration file.
 
-        -p directory_path => Absolute path name to project directory.
-            -r repo_name => Repository name being merged with.
+        -p directory_path [directory_path ...] => Absolute path name to
+                project directory.  If more than one directory path is passed
+                then the projects are merged in batch mode.
+            -r repo_name => Repository name being merged with.  Not used in
+                batch mode.
+
+        -b directory_path => Absolute path name to a drop directory.  Each
+            sub-directory in the drop directory is merged as a project in
+            batch mode.  Can be used in conjunction with the -p option.
+
+        -D => Daemon mode:  Run continuously and merge each project directory
+            placed into the spool_dir directory.
 
         -M => Run the merge function.
             -a => Use the repository name as an alias in the Git url.  Used in
                 a Github repository setting.
             -n => Override email setting and do not send email notifications.
             -u => Allows unrelated Git repo histories to be merged.
+            -Q socket_path => Client mode:  Submit the merge of the projects
+                as jobs to the merge daemon listening on the Unix socket
+                socket_path (daemon_socket setting) and print the job ids.
+                -w => Wait for and print the final merge status of the jobs.
+
+        -R file_path => Restore a project from a bundle archive.  The
+                file_path is the archive's .bundle file.
+            -t directory_path => Directory path to restore the project to.
+                Default is the file_path without the .bundle extension.
 
         -v => Display version of this program.
         -h => Help and usage message.
@@ -54,13 +75,117 @@
             "fatal: refusing to merge unrelated histories".
             This typically means these projects started independently of each
             other and this needs to be clarified you want to merge these
-            repositories.
+            repositories.  Unrelated histories are detected right after the
+            fetch, see NOTE 14.
 
         NOTE 1:  -v or -h overrides the other options.
         NOTE 2:  If -r is not passed, the program will use the basename from
             the -p option directory path to populate the -r argument.
         NOTE 3:  If -a is used, this assumes there is an alias name in the
             account's ~/.ssh/config that matches the repository name.
+        NOTE 4:  In batch mode the configuration file is loaded and the log
+            file is opened once for all of the projects.  The repository name
+            for each project is the basename of the project directory and each
+            project is locked separately during its merge.  If the workers
+            configuration setting is greater than one, the projects are merged
+            in parallel and each worker process uses its own sub-directory of
+            the work_dir directory.
+        NOTE 5:  In daemon mode the program watches the spool_dir directory
+            using Linux inotify, or polls it every spool_interval seconds if
+            inotify is not available.  A project directory is merged once it
+            has not been modified for spool_settle seconds.  Projects should
+            be moved into the spool_dir directory once they are complete or
+            copied in under a hidden name (leading ".") and then renamed.
+            The daemon is stopped with a SIGTERM or SIGINT signal.  On a
+            SIGTERM the merges in progress are completed and the projects
+            not yet started are left in the spool_dir directory.  If the
+            daemon_socket setting is set, the daemon also merges the jobs
+            submitted by the -Q client mode over the Unix socket.  A job for
+            a project directory which is already queued or being merged is
+            not queued again.
+        NOTE 6:  The snapshot setting selects how the .Original archive copy
+            of the project is made:  reflink clones each file (copy-on-write
+            on XFS or btrfs), hardlink links the immutable .git/objects files
+            and copies the rest, and copy makes a full copy.  A reflink or
+            hardlink which is not supported falls back to a full copy.
+            Symbolic links are kept as links with reflink and hardlink.
+        NOTE 7:  If the archive_format setting is set to bundle, the projects
+            are archived as a Git bundle of all refs, a compressed tar file
+            (archive_compress setting of gzip or zstd) of the changed,
+            untracked and ignored files and the .git/config file, and a .json
+            manifest file.  Use the -R option to restore an archive.  If the
+            bundle archive fails, the archive falls back to a directory.
+        NOTE 8:  If the ssh_mux setting is True, the Git commands share a
+            single SSH ControlMaster connection per server or alias for the
+            whole run, or for the life of the daemon.  The connections are
+            closed when the program exits.  Not used if GIT_SSH_COMMAND or
+            GIT_SSH is already set in the environment.
+        NOTE 9:  If the atomic_push setting is True, the branch and tags are
+            pushed in a single "git push --atomic".  If any ref is rejected
+            then none of the refs are updated on the remote.
+        NOTE 10:  If the fetch_mode setting is set to branch, only the branch
+            setting is fetched from the remote instead of all branches.  The
+            tags pointing into the branch are fetched unless fetch_tags is
+            False.  Requires Git 2.19 or later.
+        NOTE 11:  If the mirror_dir setting is set, a bare mirror of each
+            remote repository's branch and tags is kept in the directory and
+            refreshed before each fetch.  The project borrows the mirror's
+            objects through objects/info/alternates, so the fetch only
+            transfers new objects.  The borrowed objects are copied into the
+            project before it is archived.
+        NOTE 12:  If the incoming tree is the same as the remote branch tree
+            after the fetch, the merge and push are skipped and the project
+            is archived as a successful merge with no changes.
+        NOTE 13:  If the merge_mode setting is set to index, the merge is
+            built in a temporary index with merge-tree, read-tree and
+            commit-tree and only the branch ref is updated.  The branch is
+            not checked out, so the working tree is never rewritten.  The
+            incoming side takes precedence for conflicts and the branch and
+            tags are pushed atomically.  Requires Git 2.38 or later.
+        NOTE 14:  The merge base of the incoming HEAD and the remote branch
+            is checked right after the fetch.  If the histories are
+            unrelated and the -u option is not used, the unrelated setting
+            selects whether the merge proceeds as if -u was used (allow) or
+            the project fails before the merge (fail).
+        NOTE 15:  Each stage of a merge is timed and the copy and quarantine
+            files and bytes are counted.  A summary line is logged at the end
+            of each merge and, if the metrics_file setting is set, appended
+            to the file as a JSON record, one record per line.
+        NOTE 16:  If the prom_file setting is set, the cumulative merge
+            counters, failures by stage and stage latency histograms are
+            written to the file in the Prometheus text format for the
+            node_exporter textfile collector.  The counters are kept in a
+            .json state file next to the prom_file.
+        NOTE 17:  GitPython and git_class are imported when first used, so
+            the -v, -h and argument error paths do not load the Git stack.
+            The import times are logged at the end of each run.  For a full
+            breakdown use (Python 3.7+):  python -X importtime merge_repo.py -v
+        NOTE 18:  If the workers setting is greater than one in daemon mode,
+            the daemon starts the worker processes once, after the Git stack
+            is imported and the configuration is loaded, and keeps them
+            ready for the spool projects and submitted jobs.  A worker is
+            replaced after worker_max_jobs merges or once its resident memory
+            exceeds worker_max_mem megabytes.  In batch mode a pool worker is
+            replaced after worker_max_jobs merges.
+        NOTE 19:  If the async_jobs setting is greater than one and there is
+            more than one project to merge in batch or daemon mode, the
+            remote repository check and the mirror refresh of all projects
+            are run first as concurrent asyncio subprocesses in the one
+            process, at most async_jobs at a time.  The merge of each project
+            then skips these network waits.  Requires Python 3.
+        NOTE 20:  If the pipeline setting is True, the .Original archive
+            snapshot is made in a background thread while the remote
+            repository is checked and, if mirror_dir is set, the mirror is
+            fetched.  The project is only moved into the work_dir directory
+            once the snapshot is complete.  If the remote check fails the
+            snapshot is removed.
+        NOTE 21:  If the mail_spool setting is set, the email notifications
+            are queued as files in the mail_spool directory and sent by a
+            background thread, so a slow or unavailable mail server does not
+            delay the merges.  A failed message is retried mail_retries
+            times, waiting mail_backoff seconds and doubling the wait after
+            each failure, and is then renamed to .failed.  Messages not sent
+            by the end of a run are sent by the next run.
 
     Notes:
         Config file:
@@ -74,9 +199,44 @@
             archive_dir="/PATH_DIRECTORY/merge-repo/archive_dir"
             quar_dir="/PATH_DIRECTORY/merge-repo/quarantine"
             log_file="/PATH_DIRECTORY/merge-repo/logs/merge-repo.log"
+            metrics_file=None
+            prom_file=None
+
+            # Batch mode set up
+            workers=1
+            worker_max_jobs=50
+            worker_max_mem=1024
+            async_jobs=8
+
+            # Archive set up
+            snapshot="copy"
+            archive_format="dir"
+            archive_compress="gzip"
+            pipeline=False
+
+            # SSH set up
+            ssh_mux=False
+            ssh_persist=300
+
+            # Fetch and push set up
+            fetch_mode="all"
+            fetch_tags=True
+            atomic_push=False
+            mirror_dir=None
+            merge_mode="worktree"
+            unrelated="fail"
+
+            # Daemon mode set up
+            spool_dir="/PATH_DIRECTORY/merge-repo/spool_dir"
+            spool_interval=60
+            spool_settle=30
+            daemon_socket=None
 
             # Email set up
             to_line="EMAIL_ADDRESS@EMAIL_DOMAIN"
+            mail_spool=None
+            mail_retries=5
+            mail_backoff=60
 
             # Do not modify unless you know what you are doing
             name="gituser"
@@ -128,6 +288,18 @@
     Examples:
         merge_repo.py -c merge -d config -r python-lib -p /local/python-lib -M
 
+        merge_repo.py -c merge -d config -p /local/python-lib /local/git-lib -M
+
+        merge_repo.py -c merge -d config -b /local/drop_dir -M
+
+        merge_repo.py -c merge -d config -D -M
+
+        merge_repo.py -c merge -d config -p /local/python-lib -M
+            -Q /data/merge-repo/merge.sock -w
+
+        merge_repo.py -c merge -d config
+            -R /archive_dir/python-lib.20260101_120000.bundle
+
 """
 
 # Libraries and Global Variables
@@ -137,26 +309,194 @@ from __future__ import absolute_import
 # Standard
 import sys
 import os
+import collections
+import copy
+import errno
+import fcntl
+import functools
+import json
+import select
+import shutil
+import signal
+import subprocess
+import tarfile
+import tempfile
+import threading
+import time
+import uuid
 import datetime
 import socket
 import getpass
-import git
+import importlib
 
 # Local
+IMPORT_START = time.time()
+
 try:
     from .lib import gen_libs
     from .lib import gen_class
-    from .git_lib import git_class
     from . import version
+    GIT_CLASS_MODULE = (".git_lib.git_class", __package__)
 
 except (ValueError, ImportError) as err:
     import lib.gen_libs as gen_libs                     # pylint:disable=R0402
     import lib.gen_class as gen_class                   # pylint:disable=R0402
-    import git_lib.git_class as git_class               # pylint:disable=R0402
     import version
+    GIT_CLASS_MODULE = ("git_lib.git_class", None)
 
 __version__ = version.__version__
 
+# Import times in seconds of the local libraries and of the lazy modules.
+IMPORT_TIMES = {"gen_libs, gen_class": time.time() - IMPORT_START}
+
+
+class LazyModule(object):                               # pylint:disable=R0205
+
+    """Class:  LazyModule
+
+    Description:  Placeholder for a module which is only imported when one
+        of its attributes is first used.  Attributes set or deleted on the
+        placeholder are set or deleted on the module.
+
+    Methods:
+        __init__
+        load
+        __getattr__
+        __setattr__
+        __delattr__
+
+    """
+
+    def __init__(self, name, package=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the LazyModule class.
+
+        Arguments:
+            (input) name -> Module name
+            (input) package -> Package name for a relative module name
+
+        """
+
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "package", package)
+        object.__setattr__(self, "module", None)
+
+    def load(self):
+
+        """Method:  load
+
+        Description:  Import the module if not already imported.
+
+        Arguments:
+            (output) module -> Module
+
+        """
+
+        if self.module is None:
+            start = time.time()
+            object.__setattr__(
+                self, "module", importlib.import_module(self.name,
+                                                        self.package))
+            IMPORT_TIMES[self.name.lstrip(".")] = time.time() - start
+
+        return self.module
+
+    def __getattr__(self, attr):
+
+        """Method:  __getattr__
+
+        Description:  Get an attribute of the module.
+
+        Arguments:
+            (input) attr -> Attribute name
+            (output) Attribute of the module
+
+        """
+
+        return getattr(self.load(), attr)
+
+    def __setattr__(self, attr, value):
+
+        """Method:  __setattr__
+
+        Description:  Set an attribute of the module.
+
+        Arguments:
+            (input) attr -> Attribute name
+            (input) value -> Attribute value
+
+        """
+
+        setattr(self.load(), attr, value)
+
+    def __delattr__(self, attr):
+
+        """Method:  __delattr__
+
+        Description:  Delete an attribute of the module.
+
+        Arguments:
+            (input) attr -> Attribute name
+
+        """
+
+        delattr(self.load(), attr)
+
+
+# GitPython and git_class are only imported when a merge needs them, so the
+#   -v, -h and argument error paths do not load the Git stack.
+git = LazyModule("git")
+git_class = LazyModule(*GIT_CLASS_MODULE)
+
+# Only used by batch and daemon runs.  Python 2.7 has no asyncio, the remote
+#   checks are then left to preflight.
+multiprocessing = LazyModule("multiprocessing")
+asyncio = LazyModule("asyncio") if sys.version_info[0] >= 3 else None
+
+# Final merge status of each project, keyed by the project directory name.
+MERGE_STATUS = {}
+
+# Settings of a merge pool worker process, set by init_worker.
+WORKER_ENV = {}
+
+# Signal which stopped the merge daemon, set by stop_daemon, and the daemon's
+#   process id and wake up pipe, set by daemon_merge.
+DAEMON_STOP = {"signum": None, "pid": None, "wake": None}
+
+# Remote Git repository urls found by remote_check and mirrors refreshed by
+#   remote_check, used by preflight and update_mirror.
+REMOTE_CHECK = set()
+MIRROR_FRESH = set()
+
+# Mail spool and background sender of the email notifications, set by
+#   mail_start.
+MAIL_QUEUE = {}
+
+# Seconds between scans of the mail spool by the sender and the upper bound
+#   in seconds of the retry backoff of a message.
+MAIL_POLL = 10
+MAIL_BACKOFF_MAX = 3600
+
+# Stage timings and counters of the project being merged, set by
+#   metrics_start.
+RUN_METRICS = {}
+
+# Upper bounds in seconds of the stage latency histogram buckets.
+PROM_BUCKETS = [0.1, 0.5, 1, 5, 10, 30, 60, 300, 900]
+
+# Linux inotify flags:  IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+IN_CLOEXEC = 0o2000000
+IN_WATCH_MASK = 0x00000008 | 0x00000080 | 0x00000100
+
+# Linux ioctl request to clone (reflink) a file:  _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# Snapshot of the working tree status from a single git status scan
+GitStatus = collections.namedtuple(
+    "GitStatus", ["dirty", "chg_files", "new_files", "rm_files"])
+
 
 def help_message():
 
@@ -239,29 +579,277 @@ def is_git_repo(path):
         return False
 
 
-def send_mail(to_line, subj, mail_body):
+def mail_write(path, msg):
 
-    """Function:  send_mail
+    """Function:  mail_write
 
-    Description:  Compiles and sends out an email notification message.
+    Description:  Write a message file to the mail spool.  The file is
+        synced to disk and renamed into place, so a sender never reads a
+        partial message and a queued message survives a crash.
+
+    Arguments:
+        (input) path -> Path name of the message file
+        (input) msg -> Dictionary of the email message
+
+    """
+
+    fdesc, tmp_file = tempfile.mkstemp(
+        prefix=".merge_repo.", suffix=".tmp", dir=os.path.dirname(path))
+
+    try:
+        with os.fdopen(fdesc, "w") as f_hdlr:
+            json.dump(msg, f_hdlr)
+            f_hdlr.flush()
+            os.fsync(f_hdlr.fileno())
+
+        os.rename(tmp_file, path)
+
+    except (IOError, OSError):
+        if os.path.isfile(tmp_file):
+            os.remove(tmp_file)
+
+        raise
+
+
+def mail_enqueue(spool_dir, to_line, subj, mail_body):
+
+    """Function:  mail_enqueue
+
+    Description:  Queue an email notification message in the mail spool for
+        the background sender.
 
     Arguments:
+        (input) spool_dir -> Directory of the mail spool
         (input) to_line -> Email's to line
         (input) subj -> Email subject line
         (input) mail_body -> Email body list
+        (output) path -> Path name of the message file
+
+    """
+
+    msg = {"to_line": to_line, "subj": subj, "body": list(mail_body),
+           "frm_line": getpass.getuser() + "@" + socket.gethostname(),
+           "queued": time.time(), "attempts": 0, "next_try": 0}
+
+    # Time ordered names so the messages are sent in the order queued
+    path = os.path.join(spool_dir, "%d_%s.mail" % (
+        msg["queued"] * 1000000, uuid.uuid4().hex))
+    mail_write(path, msg)
+
+    return path
+
+
+def mail_deliver(msg):
+
+    """Function:  mail_deliver
+
+    Description:  Compiles and sends out an email notification message.
+
+    Arguments:
+        (input) msg -> Dictionary of the email message
 
     """
 
-    body = list(mail_body)
-    frm_line = getpass.getuser() + "@" + socket.gethostname()
-    email = gen_class.Mail(to_line, subj, frm_line)
+    email = gen_class.Mail(msg["to_line"], msg["subj"], msg["frm_line"])
 
-    for line in body:
+    for line in msg["body"]:
         email.add_2_msg(line, new_line=True)
 
     email.send_mail()
 
 
+def send_mail(to_line, subj, mail_body):
+
+    """Function:  send_mail
+
+    Description:  Queues an email notification message in the mail spool
+        for the background sender or, if there is no mail spool, compiles
+        and sends out the email notification message.
+
+    Arguments:
+        (input) to_line -> Email's to line
+        (input) subj -> Email subject line
+        (input) mail_body -> Email body list
+
+    """
+
+    queued = False
+
+    if MAIL_QUEUE.get("spool_dir"):
+        try:
+            mail_enqueue(MAIL_QUEUE["spool_dir"], to_line, subj, mail_body)
+            queued = True
+
+            # Forked workers leave the message to the sender's next scan
+            if MAIL_QUEUE["pid"] == os.getpid():
+                MAIL_QUEUE["wake"].set()
+
+        # The message is sent directly if it cannot be queued
+        except (IOError, OSError):
+            queued = False
+
+    if not queued:
+        mail_deliver(
+            {"to_line": to_line, "subj": subj, "body": list(mail_body),
+             "frm_line": getpass.getuser() + "@" + socket.gethostname()})
+
+
+def mail_attempt(path, cfg, log):
+
+    """Function:  mail_attempt
+
+    Description:  Make a delivery attempt of a message in the mail spool.
+        A delivered message is removed from the spool.  A failed message is
+        retried with an exponential backoff and is renamed to .failed once
+        mail_retries attempts have failed.  The message is locked, so only
+        one sender makes the attempt.
+
+    Arguments:
+        (input) path -> Path name of the message file
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) next_try -> Time of the next attempt or None
+
+    """
+
+    next_try = None
+
+    with open(path) as f_msg:
+        try:
+            fcntl.flock(f_msg, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        except (IOError, OSError):
+            log.log_info("mail_attempt:  Message locked by another sender: %s"
+                         % (path))
+            return next_try
+
+        # Message delivered or replaced by another sender since opened
+        if os.fstat(f_msg.fileno()).st_ino != os.stat(path).st_ino:
+            return next_try
+
+        msg = json.load(f_msg)
+
+        try:
+            mail_deliver(msg)
+            os.remove(path)
+            log.log_info("mail_attempt:  Message sent: %s" % (msg["subj"]))
+
+        except Exception as err:                        # pylint:disable=W0703
+            msg["attempts"] += 1
+
+            if msg["attempts"] >= int(getattr(cfg, "mail_retries", 5)):
+                os.rename(path, os.path.splitext(path)[0] + ".failed")
+                log.log_err("mail_attempt:  Message not sent after %s"
+                            " attempts: %s: %s"
+                            % (msg["attempts"], msg["subj"], err))
+
+            else:
+                backoff = int(getattr(cfg, "mail_backoff", 60))
+                msg["next_try"] = time.time() + min(
+                    backoff * 2 ** (msg["attempts"] - 1), MAIL_BACKOFF_MAX)
+                mail_write(path, msg)
+                next_try = msg["next_try"]
+                log.log_warn("mail_attempt:  Message not sent, attempt %s:"
+                             " %s: %s" % (msg["attempts"], msg["subj"], err))
+
+    return next_try
+
+
+def mail_flush(spool_dir, cfg, log):
+
+    """Function:  mail_flush
+
+    Description:  Make a delivery attempt of each message in the mail spool
+        which is due for an attempt.
+
+    Arguments:
+        (input) spool_dir -> Directory of the mail spool
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) next_try -> Time of the next attempt due or None
+
+    """
+
+    next_try = None
+
+    for name in sorted(os.listdir(spool_dir)):
+        path = os.path.join(spool_dir, name)
+
+        if not name.endswith(".mail"):
+            continue
+
+        try:
+            with open(path) as f_msg:
+                due = json.load(f_msg)["next_try"]
+
+            if due <= time.time():
+                due = mail_attempt(path, cfg, log)
+
+        except (KeyError, ValueError) as err:
+            log.log_err("mail_flush:  Invalid message %s: %s" % (path, err))
+            due = None
+
+            try:
+                os.rename(path, os.path.splitext(path)[0] + ".failed")
+
+            except OSError as err2:
+                # Message already moved by another sender
+                if os.path.isfile(path):
+                    log.log_warn("mail_flush:  Message %s not moved: %s"
+                                 % (path, err2))
+
+        except (IOError, OSError) as err:
+            # Message already delivered by another sender
+            if os.path.isfile(path):
+                log.log_warn("mail_flush:  Message %s: %s" % (path, err))
+
+            due = None
+
+        if due is not None and (next_try is None or due < next_try):
+            next_try = due
+
+    return next_try
+
+
+def mail_sender(queue, cfg, log):
+
+    """Function:  mail_sender
+
+    Description:  Background thread which sends the messages in the mail
+        spool.  The spool is scanned when a message is queued, when the next
+        retry is due and every MAIL_POLL seconds for the messages queued by
+        worker processes.  A last scan is made when the sender is stopped.
+
+    Arguments:
+        (input) queue -> Dictionary of the mail spool and sender
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+
+    """
+
+    while True:
+        stop = queue["stop"].is_set()
+
+        try:
+            next_try = mail_flush(queue["spool_dir"], cfg, log)
+
+        except (IOError, OSError) as err:
+            log.log_warn("mail_sender:  Unable to scan mail spool: %s"
+                         % (err))
+            next_try = None
+
+        if stop:
+            break
+
+        wait = MAIL_POLL
+
+        if next_try is not None:
+            wait = max(0, min(next_try - time.time(), MAIL_POLL))
+
+        queue["wake"].wait(wait)
+        queue["wake"].clear()
+
+
 def post_body(gitr, body=None):
 
     """Function:  post_body
@@ -336,357 +924,3617 @@ def prepare_mail(gitr, status, line_list=None, msg=None):
     return subj, body
 
 
-def post_process(                                       # pylint:disable=R0913
-        gitr, cfg, log, status, line_list=None, msg=None):
+def metrics_start(proj_name):
 
-    """Function:  post_process
+    """Function:  metrics_start
 
-    Description:  Post processing of the git repository.
+    Description:  Start the stage timings and counters for the merge of a
+        project.
 
     Arguments:
-        (input) gitr -> Git class instance
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
-        (input) status -> True|False - Status success of command
-        (input) line_list -> List of lines to add to email body
-        (input) msg -> Dictionary of error message from Git command
+        (input) proj_name -> Project directory name
 
     """
 
-    if line_list is not None:
-        line_list = list(line_list)
+    RUN_METRICS.clear()
+    RUN_METRICS.update(
+        {"project": proj_name, "start": time.time(), "stage": None,
+         "failed_stage": None, "stages": {},
+         "counters": {"copy_files": 0, "copy_bytes": 0, "quar_files": 0,
+                      "quar_bytes": 0}})
 
-    if msg is not None:
-        msg = dict(msg)
 
-    if cfg.to_line:
-        subj, body = prepare_mail(gitr, status, line_list, msg)
-        send_mail(cfg.to_line, subj, body)
+def time_stage(stage, func, *args, **kwargs):
 
-    dest_dir = os.path.basename(gitr.git_dir) + "." \
-        + datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d_%H%M%S")
+    """Function:  time_stage
 
-    if status:
-        log.log_info("post_process:  Project was moved to: %s."
-                     % (os.path.join(cfg.archive_dir, dest_dir)))
-        gen_libs.mv_file2(
-            gitr.git_dir, os.path.join(cfg.archive_dir, dest_dir))
+    Description:  Run a stage of the merge and add its elapsed time to the
+        stage timings.
 
-    else:
-        log.log_info("post_process:  Project was moved to: %s."
-                     % (os.path.join(cfg.err_dir, dest_dir)))
-        gen_libs.mv_file2(gitr.git_dir, os.path.join(cfg.err_dir, dest_dir))
+    Arguments:
+        (input) stage -> Name of the stage
+        (input) func -> Function to run
+        (input) *args -> Positional arguments for the function
+        (input) **kwargs -> Keyword arguments for the function
+        (output) data -> Return value of the function
 
+    """
 
-def post_check(gitr, cfg, log):
+    RUN_METRICS["stage"] = stage
+    start = time.time()
 
-    """Function:  post_check
+    try:
+        data = func(*args, **kwargs)
 
-    Description:  Check to see the local Git is in sync with the remote Git.
+    finally:
+        stages = RUN_METRICS.setdefault("stages", {})
+        stages[stage] = stages.get(stage, 0.0) + time.time() - start
+
+    return data
+
+
+def add_counter(name, value):
+
+    """Function:  add_counter
+
+    Description:  Add a value to a counter of the merge.
 
     Arguments:
-        (input) gitr -> Git class instance
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
+        (input) name -> Name of the counter
+        (input) value -> Value to add to the counter
 
     """
 
-    log.log_info("post_check:  Post checking...")
+    counters = RUN_METRICS.setdefault("counters", {})
+    counters[name] = counters.get(name, 0) + value
 
-    ahead = gitr.is_commits_ahead(gitr.branch)
-    behind = gitr.is_commits_behind(gitr.branch)
 
-    if ahead or behind:
-        log.log_err("post_check:  Local repo is not in sync with remote repo")
+def dir_usage(dir_path):
 
-        if ahead:
-            log.log_err("post_check: Local repo is %s commits ahead of remote."
-                        % (ahead))
-            line_list = ["Local repo is %s commits ahead of remote." % (ahead)]
+    """Function:  dir_usage
 
-        else:
-            log.log_err("post_check:  Local repo is %s commits behind remote."
-                        % (behind))
-            line_list = ["Local repo is %s commits behind remote." % (behind)]
+    Description:  Count the files and bytes in a directory tree.  Symbolic
+        links are counted but not followed.
 
-        post_process(gitr, cfg, log, False, line_list)
+    Arguments:
+        (input) dir_path -> Directory path
+        (output) files -> Number of files
+        (output) size -> Number of bytes
 
-    else:
-        log.log_info("post_check:  Processing of: %s completed."
-                     % (gitr.git_dir))
-        line_list = ["Processing of: %s completed." % (gitr.git_dir)]
-        post_process(gitr, cfg, log, True, line_list)
+    """
 
+    files = 0
+    size = 0
 
-def quarantine_files(gitr, cfg, log, status=None):
+    for root, _, names in os.walk(dir_path):
+        for name in names:
+            try:
+                size += os.lstat(os.path.join(root, name)).st_size
+                files += 1
 
-    """Function:  quarantine_files
+            except OSError:
+                pass
+
+    return files, size
 
-    Description:  Copy files out of Git repo into a quarantine directory.
+
+def metrics_summary(cfg, log):
+
+    """Function:  metrics_summary
+
+    Description:  Log the summary line of the stage timings and counters of
+        the merge and append it as a JSON record to the metrics_file.
 
     Arguments:
-        (input) gitr -> Git class instance
         (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
-        (input) status -> added|modified - Status of the file for quarantine
+        (output) record -> Dictionary of the merge metrics
 
     """
 
-    dtg = datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d_%H%M%S")
-    q_dir = gitr.repo_name + "-" + dtg
-    file_list = []
-    subj = "No Subject"
+    status = MERGE_STATUS.get(RUN_METRICS.get("project"), False)
+    record = {
+        "project": RUN_METRICS.get("project"), "status": status,
+        "failed_stage": None if status else
+        RUN_METRICS.get("failed_stage") or RUN_METRICS.get("stage"),
+        "start": datetime.datetime.fromtimestamp(
+            RUN_METRICS.get("start", time.time())).isoformat(),
+        "total": round(time.time() - RUN_METRICS.get("start", time.time()), 3),
+        "stages": dict((stage, round(value, 3)) for stage, value in
+                       RUN_METRICS.get("stages", {}).items()),
+        "counters": dict(RUN_METRICS.get("counters", {}))}
 
-    if status == "added":
-        file_list = list(gitr.new_files)
+    log.log_info(
+        "metrics_summary:  %s status=%s total=%.3fs failed_stage=%s %s %s"
+        % (record["project"], record["status"], record["total"],
+           record["failed_stage"],
+           " ".join(["%s=%.3fs" % (stage, record["stages"][stage])
+                     for stage in sorted(record["stages"])]),
+           " ".join(["%s=%s" % (name, record["counters"][name])
+                     for name in sorted(record["counters"])])))
 
-    elif status == "modified":
-        file_list = list(gitr.chg_files)
+    if getattr(cfg, "metrics_file", None):
+        try:
+            # A single append per record, safe with multiple workers
+            with open(cfg.metrics_file, "a") as f_hdlr:
+                f_hdlr.write(json.dumps(record, sort_keys=True) + "\n")
 
-    if file_list:
-        gen_libs.chk_crt_dir(os.path.join(cfg.quar_dir, q_dir), create=True)
-        subj = "File quaratine in Git Repo: %s" % (gitr.repo_name)
-        body = []
-        body.append("Git Repo: %s" % (gitr.repo_name))
+        except (IOError, OSError) as err:
+            log.log_warn("metrics_summary:  Unable to write to %s: %s"
+                         % (cfg.metrics_file, err))
 
-    for item in file_list:
-        log.log_info("quarantine_files:  File '%s' was quarantined." % (item))
-        log.log_info("quarantine_files:  Reason -> File was '%s'" % (status))
-        dir_path = os.path.dirname(item)
+    return record
 
-        if dir_path and not os.path.exists(os.path.join(cfg.quar_dir, q_dir,
-                                                        dir_path)):
-            os.makedirs(os.path.join(cfg.quar_dir, q_dir, dir_path))
 
-        gen_libs.cp_file(item, gitr.git_dir, os.path.join(cfg.quar_dir, q_dir,
-                                                          dir_path))
-        f_type = "File"
+def prom_text(state):
 
-        log.log_info("quarantine_files:  %s '%s' was moved to: %s"
-                     % (f_type, item, os.path.join(cfg.quar_dir, q_dir)))
-        body.append("%s '%s' was moved to: %s"
-                    % (f_type, item, os.path.join(cfg.quar_dir, q_dir)))
-        body.append("\tReason:  %s was '%s'" % (f_type, status))
+    """Function:  prom_text
 
-    if cfg.to_line and file_list:
-        body = post_body(gitr, body)
-        send_mail(cfg.to_line, subj, body)
+    Description:  Format the cumulative merge metrics in the Prometheus
+        text exposition format.
 
+    Arguments:
+        (input) state -> Dictionary of the cumulative merge metrics
+        (output) Text of the metrics
 
-def quarantine(gitr, cfg, log):
+    """
 
-    """Function:  quarantine
+    lines = []
+    totals = [
+        ("merges_attempted_total", "counter", "Merges attempted.",
+         "attempted"),
+        ("merges_succeeded_total", "counter", "Merges succeeded.",
+         "succeeded"),
+        ("archived_files_total", "counter",
+         "Files in the projects archived before the merge.", "copy_files"),
+        ("archived_bytes_total", "counter",
+         "Bytes in the projects archived before the merge.", "copy_bytes"),
+        ("quarantined_files_total", "counter", "Files quarantined.",
+         "quar_files"),
+        ("quarantined_bytes_total", "counter", "Bytes quarantined.",
+         "quar_bytes"),
+        ("last_run_timestamp_seconds", "gauge",
+         "Time of the last merge.", "last_run"),
+        ("last_success_timestamp_seconds", "gauge",
+         "Time of the last successful merge.", "last_success")]
+
+    for name, mtype, mhelp, key in totals:
+        lines.append("# HELP merge_repo_%s %s" % (name, mhelp))
+        lines.append("# TYPE merge_repo_%s %s" % (name, mtype))
+        lines.append("merge_repo_%s %s" % (name, state.get(key, 0)))
+
+    lines.append("# HELP merge_repo_merges_failed_total Merges failed by"
+                 " stage.")
+    lines.append("# TYPE merge_repo_merges_failed_total counter")
+
+    for stage in sorted(state.get("failed", {})):
+        lines.append('merge_repo_merges_failed_total{stage="%s"} %s'
+                     % (stage, state["failed"][stage]))
+
+    lines.append("# HELP merge_repo_stage_duration_seconds Duration of each"
+                 " merge stage.")
+    lines.append("# TYPE merge_repo_stage_duration_seconds histogram")
+
+    for stage in sorted(state.get("stages", {})):
+        hist = state["stages"][stage]
+
+        for bound, count in zip(PROM_BUCKETS, hist["buckets"]):
+            lines.append(
+                'merge_repo_stage_duration_seconds_bucket{stage="%s",le="%s"}'
+                ' %s' % (stage, bound, count))
+
+        lines.append(
+            'merge_repo_stage_duration_seconds_bucket{stage="%s",le="+Inf"}'
+            ' %s' % (stage, hist["count"]))
+        lines.append('merge_repo_stage_duration_seconds_sum{stage="%s"} %s'
+                     % (stage, round(hist["sum"], 3)))
+        lines.append('merge_repo_stage_duration_seconds_count{stage="%s"} %s'
+                     % (stage, hist["count"]))
+
+    return "\n".join(lines) + "\n"
+
+
+def add_record(state, record):
+
+    """Function:  add_record
+
+    Description:  Add the metrics of a merge to the cumulative merge
+        metrics.
+
+    Arguments:
+        (input) state -> Dictionary of the cumulative merge metrics
+        (input) record -> Dictionary of the merge metrics
+        (output) state -> Dictionary of the updated cumulative merge metrics
+
+    """
+
+    state["attempted"] = state.get("attempted", 0) + 1
+    state["last_run"] = int(time.time())
+
+    if record["status"]:
+        state["succeeded"] = state.get("succeeded", 0) + 1
+        state["last_success"] = state["last_run"]
+
+    else:
+        failed = state.setdefault("failed", {})
+        stage = record["failed_stage"] or "unknown"
+        failed[stage] = failed.get(stage, 0) + 1
+
+    for name in record["counters"]:
+        state[name] = state.get(name, 0) + record["counters"][name]
+
+    for stage in record["stages"]:
+        hist = state.setdefault("stages", {}).setdefault(
+            stage, {"buckets": [0] * len(PROM_BUCKETS), "sum": 0.0,
+                    "count": 0})
+        hist["sum"] += record["stages"][stage]
+        hist["count"] += 1
+
+        for indx, bound in enumerate(PROM_BUCKETS):
+            if record["stages"][stage] <= bound:
+                hist["buckets"][indx] += 1
+
+    return state
+
+
+def export_metrics(cfg, log, record):
+
+    """Function:  export_metrics
+
+    Description:  Add the metrics of a merge to the cumulative merge metrics
+        and write them to the prom_file setting for the node_exporter
+        textfile collector.  The cumulative metrics are kept in a .json
+        state file next to the prom_file and the prom_file is replaced
+        atomically, so the collector never reads a partial file.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) record -> Dictionary of the merge metrics
+        (output) status -> True|False - Metrics were exported
+
+    """
+
+    status = True
+    state_file = cfg.prom_file + ".json"
+
+    try:
+        # Serialize updates of the state file between worker processes
+        with open(state_file, "a+") as f_state:
+            fcntl.flock(f_state, fcntl.LOCK_EX)
+            f_state.seek(0)
+            data = f_state.read()
+            state = add_record(json.loads(data) if data else {}, record)
+            f_state.seek(0)
+            f_state.truncate()
+            f_state.write(json.dumps(state, sort_keys=True))
+            f_state.flush()
+
+            # Write and rename in the same directory to replace atomically
+            fdesc, tmp_file = tempfile.mkstemp(
+                prefix=".merge_repo.", suffix=".tmp",
+                dir=os.path.dirname(os.path.abspath(cfg.prom_file)))
+
+            with os.fdopen(fdesc, "w") as f_hdlr:
+                f_hdlr.write(prom_text(state))
+
+            os.chmod(tmp_file, 0o644)
+            os.rename(tmp_file, cfg.prom_file)
+
+    except (IOError, OSError, ValueError) as err:
+        log.log_warn("export_metrics:  Unable to export metrics to %s: %s"
+                     % (cfg.prom_file, err))
+        status = False
+
+    return status
+
+
+def post_process(                                       # pylint:disable=R0913
+        gitr, cfg, log, status, line_list=None, msg=None):
+
+    """Function:  post_process
+
+    Description:  Post processing of the git repository.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) status -> True|False - Status success of command
+        (input) line_list -> List of lines to add to email body
+        (input) msg -> Dictionary of error message from Git command
+
+    """
+
+    if line_list is not None:
+        line_list = list(line_list)
+
+    if msg is not None:
+        msg = dict(msg)
+
+    if not status:
+        RUN_METRICS["failed_stage"] = RUN_METRICS.get("stage")
+
+    if cfg.to_line:
+        subj, body = prepare_mail(gitr, status, line_list, msg)
+        time_stage("mail", send_mail, cfg.to_line, subj, body)
+
+    dest_dir = os.path.join(
+        cfg.archive_dir if status else cfg.err_dir,
+        os.path.basename(gitr.git_dir) + "." + datetime.datetime.strftime(
+            datetime.datetime.now(), "%Y%m%d_%H%M%S"))
+    MERGE_STATUS[os.path.basename(gitr.git_dir)] = status
+
+    if getattr(cfg, "mirror_dir", None):
+        time_stage("dissociate", dissociate, gitr, log)
+
+    if getattr(cfg, "archive_format", "dir") == "bundle"                \
+       and time_stage("final_archive", archive_project, gitr.git_dir,
+                      dest_dir, cfg, log):
+        log.log_info("post_process:  Project was archived to: %s."
+                     % (dest_dir))
+        time_stage("final_archive", shutil.rmtree, gitr.git_dir)
+
+    else:
+        log.log_info("post_process:  Project was moved to: %s."
+                     % (dest_dir))
+        time_stage("final_move", gen_libs.mv_file2, gitr.git_dir, dest_dir)
+
+
+def get_ahead_behind(gitr):
+
+    """Function:  get_ahead_behind
+
+    Description:  Count the commits the local branch is ahead and behind the
+        remote-tracking branch with a single local rev-list.  Falls back to
+        the GitMerge checks if the remote-tracking branch does not exist.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (output) ahead -> Number of commits local is ahead of remote
+        (output) behind -> Number of commits local is behind remote
+
+    """
+
+    try:
+        ahead, behind = gitr.gitrepo.git.rev_list(
+            "--left-right", "--count",
+            "%s...origin/%s" % (gitr.branch, gitr.branch)).split()
+        ahead, behind = int(ahead), int(behind)
+
+    except git.exc.GitCommandError:
+        ahead = gitr.is_commits_ahead(gitr.branch)
+        behind = gitr.is_commits_behind(gitr.branch)
+
+    return ahead, behind
+
+
+def parse_push(data):
+
+    """Function:  parse_push
+
+    Description:  Parse the output of a git push --porcelain into the status
+        flag of each ref updated on the remote.
+
+    Arguments:
+        (input) data -> Output from git push --porcelain
+        (output) refs -> Dictionary of remote ref names and status flags
+
+    """
+
+    refs = {}
+
+    for line in data.splitlines():
+        fields = line.split("\t")
+
+        if len(fields) >= 2 and ":" in fields[1]:
+            refs[fields[1].split(":", 1)[1]] = fields[0]
+
+    return refs
+
+
+def post_check(gitr, cfg, log, refs=None):
+
+    """Function:  post_check
+
+    Description:  Check to see the local Git is in sync with the remote Git.
+        Uses the ref updates reported by the push, if passed, and a local
+        count of commits against the remote-tracking branch.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) refs -> Dictionary of remote ref names and push status flags
+
+    """
+
+    log.log_info("post_check:  Post checking...")
+
+    branch_ref = "refs/heads/" + gitr.branch
+
+    # Push flags:  fast-forward, forced, new and up to date
+    if refs is not None and refs.get(branch_ref) not in [" ", "+", "*", "="]:
+        log.log_err("post_check:  Push of %s not accepted by remote: %s"
+                    % (branch_ref, refs.get(branch_ref)))
+        line_list = ["Push of %s not accepted by remote." % (branch_ref)]
+        post_process(gitr, cfg, log, False, line_list)
+
+    else:
+        ahead, behind = get_ahead_behind(gitr)
+
+        if ahead or behind:
+            log.log_err(
+                "post_check:  Local repo is not in sync with remote repo")
+
+            if ahead:
+                log.log_err(
+                    "post_check: Local repo is %s commits ahead of remote."
+                    % (ahead))
+                line_list = [
+                    "Local repo is %s commits ahead of remote." % (ahead)]
+
+            else:
+                log.log_err(
+                    "post_check:  Local repo is %s commits behind remote."
+                    % (behind))
+                line_list = [
+                    "Local repo is %s commits behind remote." % (behind)]
+
+            post_process(gitr, cfg, log, False, line_list)
+
+        else:
+            log.log_info("post_check:  Processing of: %s completed."
+                         % (gitr.git_dir))
+            line_list = ["Processing of: %s completed." % (gitr.git_dir)]
+            post_process(gitr, cfg, log, True, line_list)
+
+
+def quarantine_files(gitr, cfg, log, status=None):
+
+    """Function:  quarantine_files
+
+    Description:  Copy files out of Git repo into a quarantine directory.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) status -> added|modified - Status of the file for quarantine
+
+    """
+
+    dtg = datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d_%H%M%S")
+    q_dir = gitr.repo_name + "-" + dtg
+    file_list = []
+    subj = "No Subject"
+
+    if status == "added":
+        file_list = list(gitr.new_files)
+
+    elif status == "modified":
+        file_list = list(gitr.chg_files)
+
+    if file_list:
+        gen_libs.chk_crt_dir(os.path.join(cfg.quar_dir, q_dir), create=True)
+        subj = "File quaratine in Git Repo: %s" % (gitr.repo_name)
+        body = []
+        body.append("Git Repo: %s" % (gitr.repo_name))
+
+    for item in file_list:
+        log.log_info("quarantine_files:  File '%s' was quarantined." % (item))
+        log.log_info("quarantine_files:  Reason -> File was '%s'" % (status))
+        dir_path = os.path.dirname(item)
+
+        if dir_path and not os.path.exists(os.path.join(cfg.quar_dir, q_dir,
+                                                        dir_path)):
+            os.makedirs(os.path.join(cfg.quar_dir, q_dir, dir_path))
+
+        gen_libs.cp_file(item, gitr.git_dir, os.path.join(cfg.quar_dir, q_dir,
+                                                          dir_path))
+        f_type = "File"
+        q_file = os.path.join(gitr.git_dir, item)
+        add_counter("quar_files", 1)
+        add_counter("quar_bytes", os.path.getsize(q_file)
+                    if os.path.isfile(q_file) else 0)
+
+        log.log_info("quarantine_files:  %s '%s' was moved to: %s"
+                     % (f_type, item, os.path.join(cfg.quar_dir, q_dir)))
+        body.append("%s '%s' was moved to: %s"
+                    % (f_type, item, os.path.join(cfg.quar_dir, q_dir)))
+        body.append("\tReason:  %s was '%s'" % (f_type, status))
+
+    if cfg.to_line and file_list:
+        body = post_body(gitr, body)
+        send_mail(cfg.to_line, subj, body)
+
+
+def quarantine(gitr, cfg, log):
+
+    """Function:  quarantine
 
     Description:  Get dirty and untracked files and quarantine them.
 
     Arguments:
-        (input) gitr -> Git class instance
-        (input) cfg -> Configuration settings module for the program
-        (input) log -> Log class instance
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+
+    """
+
+    if gitr.chg_files:
+        log.log_info("quarantine:  Quarantine modified files")
+        quarantine_files(gitr, cfg, log, status="modified")
+
+    if gitr.new_files:
+        log.log_info("quarantine:  Quarantine added files")
+        quarantine_files(gitr, cfg, log, status="added")
+
+    if gitr.rm_files:
+        log.log_info("quarantine:  Removed files detected")
+        log.log_info("quarantine:  Files detected:  %s" % (gitr.rm_files))
+
+        if cfg.to_line:
+            subj = "Removed files detected in Git Repo: %s" % (gitr.repo_name)
+            body = []
+            body.append("Git Repo: %s" % (gitr.repo_name))
+            body.append("Removed files detected: %s" % (gitr.rm_files))
+            body = post_body(gitr, body)
+            send_mail(cfg.to_line, subj, body)
+
+
+def get_push_tags(gitr):
+
+    """Function:  get_push_tags
+
+    Description:  Compare the local tags against the tags advertised by the
+        remote Git repository and return the tags which are missing or
+        different on the remote.  The remote tags are read once with a
+        single ls-remote.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (output) tags -> Sorted list of tag refs to push
+        (output) skipped -> Number of tags already on the remote
+
+    """
+
+    local_tags = {}
+    remote_tags = {}
+
+    for line in gitr.gitrepo.git.for_each_ref(
+            "--format=%(objectname) %(refname)", "refs/tags").splitlines():
+        sha, ref = line.split(" ", 1)
+        local_tags[ref] = sha
+
+    try:
+        for line in gitr.gitrepo.git.ls_remote(
+                "--tags", "origin").splitlines():
+            sha, ref = line.split("\t", 1)
+
+            # Peeled entries of annotated tags are not compared
+            if not ref.endswith("^{}"):
+                remote_tags[ref] = sha
+
+    except git.exc.GitCommandError:
+        remote_tags = {}
+
+    tags = sorted(ref for ref, sha in local_tags.items()
+                  if remote_tags.get(ref) != sha)
+
+    return tags, len(local_tags) - len(tags)
+
+
+def git_error(err):
+
+    """Function:  git_error
+
+    Description:  Convert a GitCommandError into an error message dictionary.
+        GitPython wraps the command's standard error in a "stderr: '...'"
+        line and keeps the command as a list, both are returned as the plain
+        strings Git produced.
+
+    Arguments:
+        (input) err -> GitCommandError instance
+        (output) msg -> Dictionary of error message from the Git command
+
+    """
+
+    stderr = err.stderr or ""
+    prefix = "\n  stderr: '"
+
+    if stderr.startswith(prefix) and stderr.endswith("'"):
+        stderr = stderr[len(prefix):-1]
+
+    command = err.command
+
+    if isinstance(command, (list, tuple)):
+        command = " ".join(command)
+
+    return {"status": err.status, "stderr": stderr.strip(),
+            "command": command}
+
+
+def push_tags(gitr, tags):
+
+    """Function:  push_tags
+
+    Description:  Push the listed tags to the remote Git repository.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) tags -> List of tag refs to push
+        (output) status -> True|False - Success of the push
+        (output) msg -> Dictionary of error message from the Git command
+
+    """
+
+    status = True
+    msg = {}
+
+    try:
+        if tags:
+            gitr.gitrepo.git.push("--porcelain", "origin", *tags)
+
+    except git.exc.GitCommandError as err:
+        status = False
+        msg = git_error(err)
+
+    return status, msg
+
+
+def push_atomic(gitr, tags):
+
+    """Function:  push_atomic
+
+    Description:  Push the branch and the tags to the remote Git repository
+        in a single atomic push.  Either all of the refs are updated on the
+        remote or none of them are.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) tags -> List of tag refs to push
+        (output) status -> True|False - Success of the push
+        (output) msg -> Dictionary of error message from the Git command
+        (output) refs -> Dictionary of remote ref names and push status flags
+
+    """
+
+    status = True
+    msg = {}
+    refs = {}
+
+    try:
+        refs = parse_push(gitr.gitrepo.git.push(
+            "--atomic", "--porcelain", "origin",
+            "refs/heads/%s:refs/heads/%s" % (gitr.branch, gitr.branch),
+            *tags))
+
+    except git.exc.GitCommandError as err:
+        status = False
+        msg = git_error(err)
+
+    return status, msg, refs
+
+
+def push_branch(gitr, retries=5):
+
+    """Function:  push_branch
+
+    Description:  Push the branch to the remote Git repository.  A push
+        failing with a status of 128 is retried every 5 seconds, as
+        GitMerge.git_pu does.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) retries -> Number of times to retry the push
+        (output) status -> True|False - Success of the push
+        (output) msg -> Dictionary of error message from the Git command
+        (output) refs -> Dictionary of remote ref names and push status flags
+
+    """
+
+    status, msg, refs = True, {}, {}
+
+    for cnt in range(retries + 1):
+        try:
+            refs = parse_push(gitr.gitrepo.git.push(
+                "--porcelain", "origin",
+                "refs/heads/%s:refs/heads/%s" % (gitr.branch, gitr.branch)))
+            status, msg = True, {}
+            break
+
+        except git.exc.GitCommandError as err:
+            status, msg = False, git_error(err)
+
+            if err.status != 128 or cnt == retries:
+                break
+
+            time.sleep(5)
+
+    return status, msg, refs
+
+
+def resolve_theirs(gitr, stages, tmp_dir):
+
+    """Function:  resolve_theirs
+
+    Description:  Resolve a conflicted path of an index merge in favour of
+        the incoming side.  The file contents are merged with the incoming
+        side taking the conflicting hunks, any other conflict takes the
+        incoming side's version and a path removed by the incoming side is
+        removed.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) stages -> Dictionary of stage numbers and (mode, oid) tuples
+        (input) tmp_dir -> Directory for the temporary merge files
+        (output) entry -> (mode, oid) tuple of the resolved path or None
+
+    """
+
+    entry = stages.get("3")
+
+    if entry and "2" in stages and entry[0].startswith("100")           \
+       and stages["2"][0].startswith("100"):
+        files = []
+
+        for stage in ["2", "1", "3"]:
+            files.append(os.path.join(tmp_dir, "stage" + stage))
+
+            with open(files[-1], "wb") as f_hdlr:
+                if stage in stages:
+                    gitr.gitrepo.git.cat_file(
+                        "blob", stages[stage][1], output_stream=f_hdlr)
+
+        try:
+            gitr.gitrepo.git.merge_file("--theirs", *files)
+            entry = (entry[0], gitr.gitrepo.git.hash_object("-w", files[0]))
+
+        except git.exc.GitCommandError:
+            # Binary files cannot be merged, take the incoming side
+            pass
+
+    return entry
+
+
+def parse_merge_tree(data):
+
+    """Function:  parse_merge_tree
+
+    Description:  Parse the NUL separated output of git merge-tree
+        --write-tree -z into the merged tree and the stages of each
+        conflicted path.
+
+    Arguments:
+        (input) data -> Output of the merge-tree command
+        (output) tree -> Object id of the merged tree
+        (output) conflicts -> Dictionary of paths and their stages
+
+    """
+
+    data = data.split("\0")
+    conflicts = {}
+
+    for item in data[1:]:
+        if not item:
+            break
+
+        info, path = item.split("\t", 1)
+        mode, oid, stage = info.split()
+        conflicts.setdefault(path, {})[stage] = (mode, oid)
+
+    return data[0], conflicts
+
+
+def index_merge(gitr, allow=False):                     # pylint:disable=R0914
+
+    """Function:  index_merge
+
+    Description:  Merge the incoming HEAD into the remote branch without
+        checking out the branch.  The merge is built with merge-tree,
+        read-tree and commit-tree in a temporary index with the incoming
+        side taking precedence and only the branch ref is updated.  The
+        working tree is not touched.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) allow -> True|False - Allow merge of unrelated histories
+        (output) status -> True|False - Success of the merge
+        (output) msg -> Dictionary of error message from the Git command
+
+    """
+
+    status = True
+    msg = {}
+    remote = "refs/remotes/origin/%s" % (gitr.branch)
+    cmd = ["--write-tree", "-z", remote, "HEAD"]
+    tmp_dir = tempfile.mkdtemp(prefix="merge-repo-idx.")
+
+    if allow:
+        cmd.insert(0, "--allow-unrelated-histories")
+
+    try:
+        # Exit status of 1 is a merge with conflicts to be resolved
+        rcode, data, err = gitr.gitrepo.git.merge_tree(
+            *cmd, with_extended_output=True, with_exceptions=False)
+
+        if rcode not in [0, 1]:
+            raise git.exc.GitCommandError(
+                ["git", "merge-tree"] + cmd, rcode, err)
+
+        tree, conflicts = parse_merge_tree(data)
+
+        with gitr.gitrepo.git.custom_environment(
+                GIT_INDEX_FILE=os.path.join(tmp_dir, "index")):
+            gitr.gitrepo.git.read_tree(tree)
+
+            for path, stages in conflicts.items():
+                entry = resolve_theirs(gitr, stages, tmp_dir)
+
+                if entry:
+                    gitr.gitrepo.git.update_index(
+                        "--add", "--cacheinfo",
+                        "%s,%s,%s" % (entry[0], entry[1], path))
+
+                else:
+                    gitr.gitrepo.git.update_index("--force-remove", "--", path)
+
+            tree = gitr.gitrepo.git.write_tree()
+
+        # No branch is renamed in this mode, the incoming side is HEAD
+        commit = gitr.gitrepo.git.commit_tree(
+            tree, "-p", remote, "-p", "HEAD", "-m",
+            "Merge commit '%s' into %s"
+            % (gitr.gitrepo.head.commit.hexsha, gitr.branch))
+        gitr.gitrepo.git.update_ref("refs/heads/%s" % (gitr.branch), commit)
+
+    except git.exc.GitCommandError as err:
+        status = False
+        msg = git_error(err)
+
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return status, msg
+
+
+def merge_project(gitr, cfg, log, **kwargs):             # pylint:disable=R0914
+
+    """Function:  merge_project
+
+    Description:  Merge, and push the project to the remote Git repo.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) **kwargs:
+            allow -> True|False - Allow merge of unrelated histories
+
+    """
+
+    log.log_info("merge_project:  Fetching and setting up branches.")
+    index_mode = getattr(cfg, "merge_mode", "worktree") == "index"
+
+    if index_mode:
+        log.log_info("merge_project:  Merging in a temporary index.")
+        status1, msg1 = time_stage(
+            "merge", index_merge, gitr, allow=kwargs.get("allow", False))
+
+    else:
+        status1, msg1 = time_stage(
+            "merge", gitr.priority_merge, allow=kwargs.get("allow", False))
+
+    if status1:
+        tags, skipped = time_stage("tags", get_push_tags, gitr)
+        log.log_info("merge_project:  Tags to push: %s, skipped: %s"
+                     % (len(tags), skipped))
+
+        # Index merge leaves the head detached, push the branch by refspec
+        if getattr(cfg, "atomic_push", False) or index_mode:
+            log.log_info(
+                "merge_project:  Pushing changes and tags atomically.")
+            status2, msg2, refs = time_stage("push", push_atomic, gitr, tags)
+
+            if status2:
+                time_stage("post_check", post_check, gitr, cfg, log, refs=refs)
+
+            else:
+                log.log_err("merge_project:  Fail to push to remote git.")
+                log.log_err("merge_project:  Status 2 Message: %s" % (msg2))
+                line_list = ["Failure to push to remote git."]
+                post_process(gitr, cfg, log, status2, line_list, msg2)
+
+        else:
+            log.log_info("merge_project:  Pushing changes to remote Git.")
+            status2, msg2, refs = time_stage("push", push_branch, gitr)
+
+            if status2:
+                log.log_info("merge_project:  Pushing tags to remote Git.")
+                status3, msg3 = time_stage("push", push_tags, gitr, tags)
+
+                if status3:
+                    time_stage("post_check", post_check, gitr, cfg, log,
+                               refs=refs)
+
+                else:
+                    log.log_err(
+                        "merge_project:  Fail to push tags to remote git.")
+                    log.log_err(
+                        "merge_project:  Status 3 Message: %s" % (msg3))
+                    line_list = ["Failure to push tags to remote git."]
+                    post_process(gitr, cfg, log, status3, line_list, msg3)
+
+            else:
+                log.log_err("merge_project:  Fail to push to remote git.")
+                log.log_err("merge_project:  Status 2 Message: %s" % (msg2))
+                line_list = ["Failure to push to remote git."]
+                post_process(gitr, cfg, log, status2, line_list, msg2)
+
+    else:
+        incoming = "HEAD" if index_mode else "branch %s" % (gitr.mod_branch)
+        log.log_err("merge_project:  Failure to merge %s into %s."
+                    % (incoming, gitr.branch))
+        log.log_err("merge_project:  Status 1 Message: %s" % (msg1))
+        line_list = ["Failure to merge %s into %s." % (incoming, gitr.branch)]
+        post_process(gitr, cfg, log, status1, line_list, msg1)
+
+
+def refresh_mirror(gitr, cfg, log):
+
+    """Function:  refresh_mirror
+
+    Description:  Create or incrementally refresh the bare mirror of the
+        remote Git repository in the mirror_dir directory.  The project
+        itself is not changed.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) mirror -> Path name of the mirror
+
+    """
+
+    mirror = os.path.join(cfg.mirror_dir, gitr.repo_name + ".git")
+
+    # Serialize updates of the same mirror between worker processes
+    with open(mirror + ".lock", "w") as f_lock:
+        fcntl.flock(f_lock, fcntl.LOCK_EX)
+
+        if not os.path.isdir(mirror):
+            log.log_info("refresh_mirror:  Creating mirror: %s" % (mirror))
+            git.Repo.init(mirror, bare=True)
+
+        log.log_info("refresh_mirror:  Refreshing mirror: %s" % (mirror))
+        git.Git(mirror).fetch(
+            gitr.url, "+refs/heads/%s:refs/heads/%s"
+            % (gitr.branch, gitr.branch), "+refs/tags/*:refs/tags/*")
+
+    return mirror
+
+
+def prefetch_mirror(gitr, cfg, log):
+
+    """Function:  prefetch_mirror
+
+    Description:  Refresh the mirror of the remote Git repository while the
+        archive snapshot of the project is being made.  The mirror is then
+        not refreshed again by update_mirror.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+
+    """
+
+    try:
+        MIRROR_FRESH.add(refresh_mirror(gitr, cfg, log))
+
+    except (git.exc.GitCommandError, OSError, IOError) as err:
+        log.log_warn("prefetch_mirror:  Mirror not refreshed: %s" % (err))
+
+
+def update_mirror(gitr, cfg, log):
+
+    """Function:  update_mirror
+
+    Description:  Create or incrementally refresh the bare mirror of the
+        remote Git repository in the mirror_dir directory and add the
+        mirror's objects as alternates to the project.  The project's fetch
+        then only transfers objects which are not already in the mirror.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) status -> True|False - Mirror is in use by the project
+
+    """
+
+    status = True
+    mirror = os.path.join(cfg.mirror_dir, gitr.repo_name + ".git")
+    alt_file = os.path.join(gitr.git_dir, ".git", "objects", "info",
+                            "alternates")
+
+    try:
+        if mirror in MIRROR_FRESH:
+            log.log_info("update_mirror:  Mirror already refreshed: %s"
+                         % (mirror))
+            MIRROR_FRESH.discard(mirror)
+
+        else:
+            refresh_mirror(gitr, cfg, log)
+
+        alternates = []
+
+        if os.path.isfile(alt_file):
+            with open(alt_file) as f_hdlr:
+                alternates = f_hdlr.read().splitlines()
+
+        if os.path.join(mirror, "objects") not in alternates:
+            with open(alt_file, "a") as f_hdlr:
+                f_hdlr.write(os.path.join(mirror, "objects") + "\n")
+
+    except (git.exc.GitCommandError, OSError, IOError) as err:
+        log.log_warn("update_mirror:  Mirror not used: %s" % (err))
+        status = False
+
+    return status
+
+
+def dissociate(gitr, log):
+
+    """Function:  dissociate
+
+    Description:  Copy the objects borrowed from the mirror into the project
+        and remove the alternates, so the archived project does not depend on
+        the mirror.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) log -> Log class instance
+
+    """
+
+    alt_file = os.path.join(gitr.git_dir, ".git", "objects", "info",
+                            "alternates")
+
+    if os.path.isfile(alt_file):
+        log.log_info("dissociate:  Copying objects from mirror")
+
+        try:
+            gitr.gitrepo.git.repack("-a", "-d")
+            os.remove(alt_file)
+
+        except (git.exc.GitCommandError, OSError) as err:
+            log.log_warn("dissociate:  Project still uses mirror: %s" % (err))
+
+
+def fetch_branch(gitr, cfg):
+
+    """Function:  fetch_branch
+
+    Description:  Fetch only the configured branch from the remote Git
+        repository into its remote-tracking branch.  The incoming HEAD is
+        used as the negotiation tip so only commits reachable from it are
+        offered to the remote as common commits.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (output) status -> True|False - Success of the fetch
+        (output) msg -> Dictionary of error message from the Git command
+
+    """
+
+    status = True
+    msg = {}
+    cmd = ["--negotiation-tip=HEAD", "origin",
+           "+refs/heads/%s:refs/remotes/origin/%s"
+           % (gitr.branch, gitr.branch)]
+
+    # Tags pointing into the fetched branch are followed by default
+    if not getattr(cfg, "fetch_tags", True):
+        cmd.insert(0, "--no-tags")
+
+    try:
+        gitr.gitrepo.git.fetch(*cmd)
+
+    except git.exc.GitCommandError as err:
+        status = False
+        msg = git_error(err)
+
+    return status, msg
+
+
+def is_same_tree(gitr):
+
+    """Function:  is_same_tree
+
+    Description:  Check if the tree of the incoming HEAD is the same as the
+        tree of the fetched remote branch.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (output) status -> True|False - Trees are the same
+
+    """
+
+    try:
+        status = gitr.gitrepo.git.rev_parse("HEAD^{tree}") \
+            == gitr.gitrepo.git.rev_parse(
+                "refs/remotes/origin/%s^{tree}" % (gitr.branch))
+
+    except git.exc.GitCommandError:
+        status = False
+
+    return status
+
+
+def is_related(gitr):
+
+    """Function:  is_related
+
+    Description:  Check if the incoming HEAD and the remote branch have a
+        common merge base.  A missing remote branch is not classified as
+        unrelated and is left to the merge to report.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (output) status -> True|False - Histories are related
+
+    """
+
+    status = True
+
+    try:
+        gitr.gitrepo.git.merge_base(
+            "HEAD", "refs/remotes/origin/%s" % (gitr.branch))
+
+    except git.exc.GitCommandError as err:
+        # Exit status of 1 is no merge base, anything else is an error
+        status = err.status != 1
+
+    return status
+
+
+def process_project(gitr, cfg, log, **kwargs):    # pylint:disable=R0912
+
+    """Function:  process_project
+
+    Description:  Prepare for the merge of the project.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) **kwargs:
+            allow -> True|False - Allow merge of unrelated histories
+
+    """
+
+    log.log_info("process_project:  Fetching and setting up branches.")
+
+    if getattr(cfg, "mirror_dir", None):
+        time_stage("mirror", update_mirror, gitr, cfg, log)
+
+    if getattr(cfg, "fetch_mode", "all") == "branch":
+        log.log_info("process_project:  Fetching only branch: %s"
+                     % (gitr.branch))
+        status1, msg1 = time_stage("fetch", fetch_branch, gitr, cfg)
+
+    else:
+        status1, msg1 = time_stage("fetch", gitr.git_fetch)
+
+    if status1 and not kwargs.get("allow", False)                        \
+       and getattr(cfg, "unrelated", "fail") == "allow"                  \
+       and not is_related(gitr):
+        log.log_info("process_project:  Unrelated histories, allowing merge"
+                     " of unrelated histories.")
+        kwargs["allow"] = True
+
+    if status1 and is_same_tree(gitr):
+        log.log_info("process_project:  No changes, tree is the same as: %s."
+                     % (gitr.branch))
+        line_list = ["No changes, tree is the same as remote branch: %s."
+                     % (gitr.branch)]
+        post_process(gitr, cfg, log, True, line_list)
+
+    elif status1 and not kwargs.get("allow", False) and not is_related(gitr):
+        log.log_err("process_project:  Unrelated histories with branch: %s."
+                    % (gitr.branch))
+        line_list = [
+            "Unrelated histories with remote branch: %s." % (gitr.branch),
+            "Rerun with -u option or set unrelated to allow."]
+        post_process(gitr, cfg, log, False, line_list)
+
+    elif status1 and getattr(cfg, "merge_mode", "worktree") == "index":
+        merge_project(gitr, cfg, log, **kwargs)
+
+    elif status1:
+        log.log_info("process_project:  Renaming branch to: %s."
+                     % (gitr.mod_branch))
+        status2, msg2 = time_stage("rename", gitr.rename_br)
+
+        if status2:
+            log.log_info("process_project:  Checking out branch: %s."
+                         % (gitr.branch))
+            status3, msg3 = time_stage("checkout", gitr.git_co)
+
+            if status3:
+                merge_project(gitr, cfg, log, **kwargs)
+
+            else:
+                log.log_err("process_project:  Fail to checkout branch: %s."
+                            % (gitr.branch))
+                log.log_err("process_project:  Status 3 Message: %s" % (msg3))
+                line_list = ["Failure to checkout branch: %s." % (gitr.branch)]
+                post_process(gitr, cfg, log, status3, line_list, msg3)
+
+        else:
+            log.log_err("process_project:  Fail rename branch to: %s."
+                        % (gitr.mod_branch))
+            log.log_err("process_project:  Status 2 Message: %s" % (msg2))
+            line_list = ["Failure rename branch to: %s." % (gitr.mod_branch)]
+            post_process(gitr, cfg, log, status2, line_list, msg2)
+
+    else:
+        log.log_err("process_project:  Fail to fetch from remote Git repo.")
+        log.log_err("process_project:  Status 1 Message: %s" % (msg1))
+        line_list = ["Failure to fetch from remote Git repo."]
+        post_process(gitr, cfg, log, status1, line_list, msg1)
+
+
+def get_status(gitr):
+
+    """Function:  get_status
+
+    Description:  Scan the working tree once with git status and return a
+        snapshot of the dirty, new and removed files.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (output) GitStatus instance:
+            dirty -> True|False - Tracked files differ from HEAD
+            chg_files -> Tuple of modified files in the working tree
+            new_files -> Tuple of untracked files
+            rm_files -> Tuple of deleted files in the working tree
+
+    """
+
+    dirty = False
+    chg_files = []
+    new_files = []
+    rm_files = []
+    entries = gitr.gitrepo.git.status(
+        "--porcelain=v2", "-z", "--untracked-files=all").split("\0")
+
+    while entries:
+        entry = entries.pop(0)
+
+        if entry.startswith("? "):
+            new_files.append(entry[2:])
+
+        elif entry[:2] in ["1 ", "2 ", "u "]:
+            dirty = True
+
+            # Field count before the path:  ordinary, renamed, unmerged
+            path = entry.split(" ", {"1": 8, "2": 9, "u": 10}[entry[0]])[-1]
+
+            # Renamed entries are followed by the original path
+            if entry[0] == "2":
+                entries.pop(0)
+
+            if entry[3] == "M":
+                chg_files.append(path)
+
+            elif entry[3] == "D":
+                rm_files.append(path)
+
+    return GitStatus(dirty, tuple(chg_files), tuple(new_files),
+                     tuple(rm_files))
+
+
+def process_changes(gitr, cfg, log):
+
+    """Function:  process_changes
+
+    Description:  Locate and process dirty and untracked files.  The working
+        tree is scanned once and only scanned again if files were processed.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) status -> GitStatus instance of the current working tree
+
+    """
+
+    status = get_status(gitr)
+
+    if status.dirty or status.new_files:
+        gitr.chg_files = list(status.chg_files)
+        gitr.new_files = list(status.new_files)
+        gitr.rm_files = list(status.rm_files)
+        log.log_info("process_changes:  Quarantine process running")
+        quarantine(gitr, cfg, log)
+        log.log_info("process_changes:  Processing dirty files option: %s"
+                     % (cfg.dirty))
+        gitr.process_dirty(option=cfg.dirty)
+        log.log_info("process_changes:  Processing untracked files option: %s"
+                     % (cfg.untracked))
+        gitr.process_untracked(option=cfg.untracked)
+
+        # Processing changed the working tree, snapshot is no longer valid
+        status = get_status(gitr)
+
+    return status
+
+
+def detach_head(gitr, log):
+
+    """Function:  detach_head
+
+    Description:  Detach the head from a git project, move the head to the
+        latest commit id and remove the existing branch.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) log -> Log class instance
+        (output) status -> True|False - Status of detaching head in project
+        (output) err_msg -> Error messages detected, if any
+
+    """
+
+    status = True
+    err_msg = None
+
+    if len(gitr.gitrepo.branches) == 0:
+        log.log_info("detach_head:  Head already detached")
+
+    elif len(gitr.gitrepo.branches) == 1:
+        log.log_info("detach_head:  Detaching head...")
+        current_br = gitr.get_br_name()
+        head_status = gitr.detach_head()
+
+        if head_status:
+            log.log_info("detach_head:  Possible problem detected")
+            status = False
+            err_msg = "WARN: Message detected: %s" % (head_status)
+
+        else:
+            log.log_info("detach_head:  Removing branch: %s" % (current_br))
+            status, err_msg = gitr.remove_branch(current_br, no_chk=True)
+
+    else:
+        log.log_warn("detach_head:  Multiple branches detected: %s"
+                     % (gitr.gitrepo.branches))
+        status = False
+        err_msg = "WARN:  Multiple branches detected: %s" \
+                  % (gitr.gitrepo.branches)
+
+    return status, err_msg
+
+
+def get_worktree_state(git_dir):
+
+    """Function:  get_worktree_state
+
+    Description:  Get the state of a Git repository's working tree which is
+        not held in the repository's commits.
+
+    Arguments:
+        (input) git_dir -> Directory path to git repository
+        (output) state -> Dictionary of the working tree state:
+            head -> Commit id of HEAD
+            branch -> Branch name of HEAD or None if HEAD is detached
+            changed -> List of files changed or added since HEAD
+            deleted -> List of files deleted since HEAD
+            others -> List of untracked and ignored files
+
+    """
+
+    gitrepo = git.Repo(git_dir)
+    state = {"head": gitrepo.head.commit.hexsha, "branch": None}
+
+    if not gitrepo.head.is_detached:
+        state["branch"] = gitrepo.active_branch.name
+
+    state["changed"] = [item for item in gitrepo.git.diff(
+        "HEAD", "--name-only", "--no-renames", "-z",
+        "--diff-filter=d").split("\0") if item]
+    state["deleted"] = [item for item in gitrepo.git.diff(
+        "HEAD", "--name-only", "--no-renames", "-z",
+        "--diff-filter=D").split("\0") if item]
+    state["others"] = [item for item in gitrepo.git.ls_files(
+        "--others", "-z").split("\0") if item]
+
+    return state
+
+
+def find_program(name):
+
+    """Function:  find_program
+
+    Description:  Search the PATH directories for an executable program.
+        Used in place of shutil.which which is not in Python 2.7.
+
+    Arguments:
+        (input) name -> Program name
+        (output) Path name of the program or None if not found
+
+    """
+
+    for path_dir in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        prog = os.path.join(path_dir, name)
+
+        if os.path.isfile(prog) and os.access(prog, os.X_OK):
+            return prog
+
+    return None
+
+
+def open_tar(tar_file, mode, compress):
+
+    """Function:  open_tar
+
+    Description:  Open a streaming tar file compressed with gzip or zstd.  The
+        zstd compression is done by the zstd program.
+
+    Arguments:
+        (input) tar_file -> Tar file path
+        (input) mode -> r|w - Read or write the tar file
+        (input) compress -> gzip|zstd - Compression of the tar file
+        (output) tar -> TarFile instance
+        (output) proc -> Popen instance of the zstd program or None
+
+    """
+
+    # The zstd process is returned to the caller and ended by close_tar
+    proc = None
+
+    if compress == "zstd" and mode == "w":
+        proc = subprocess.Popen(                        # pylint:disable=R1732
+            ["zstd", "-q", "-f", "-o", tar_file], stdin=subprocess.PIPE)
+        tar = tarfile.open(fileobj=proc.stdin, mode="w|")
+
+    elif compress == "zstd":
+        proc = subprocess.Popen(                        # pylint:disable=R1732
+            ["zstd", "-q", "-d", "-c", tar_file], stdout=subprocess.PIPE)
+        tar = tarfile.open(fileobj=proc.stdout, mode="r|")
+
+    else:
+        tar = tarfile.open(                             # pylint:disable=R1732
+            tar_file, mode + "|gz")
+
+    return tar, proc
+
+
+def close_tar(tar, proc):
+
+    """Function:  close_tar
+
+    Description:  Close a tar file opened by open_tar.
+
+    Arguments:
+        (input) tar -> TarFile instance
+        (input) proc -> Popen instance of the zstd program or None
+
+    """
+
+    tar.close()
+
+    if proc:
+        if proc.stdin:
+            proc.stdin.close()
+
+        if proc.wait():
+            raise IOError("zstd exited with status: %s" % (proc.returncode))
+
+
+def archive_bundle(git_dir, dest_base, compress="gzip"):
+
+    """Function:  archive_bundle
+
+    Description:  Archive a Git repository as a Git bundle of all refs, a
+        compressed tar file of the working tree state and .git/config file,
+        and a manifest file used to restore the repository.
+
+    Arguments:
+        (input) git_dir -> Directory path to git repository
+        (input) dest_base -> Archive path name without file extensions
+        (input) compress -> gzip|zstd - Compression of the tar file
+        (output) file_list -> List of archive files created
+
+    """
+
+    if compress == "zstd" and not find_program("zstd"):
+        compress = "gzip"
+
+    tar_file = dest_base + (".tar.zst" if compress == "zstd" else ".tar.gz")
+    state = get_worktree_state(git_dir)
+    state["compress"] = compress
+    git.Repo(git_dir).git.bundle("create", dest_base + ".bundle", "HEAD",
+                                 "--all")
+    tar, proc = open_tar(tar_file, "w", compress)
+
+    try:
+        tar.add(os.path.join(git_dir, ".git", "config"),
+                arcname=os.path.join(".git", "config"))
+
+        for item in state["changed"] + state["others"]:
+            tar.add(os.path.join(git_dir, item), arcname=item,
+                    recursive=False)
+
+    finally:
+        close_tar(tar, proc)
+
+    with open(dest_base + ".json", "w") as f_hdlr:
+        json.dump(state, f_hdlr, indent=4)
+
+    return [dest_base + ".bundle", tar_file, dest_base + ".json"]
+
+
+def archive_project(git_dir, dest_base, cfg, log):
+
+    """Function:  archive_project
+
+    Description:  Archive a Git repository using the bundle archive format.
+
+    Arguments:
+        (input) git_dir -> Directory path to git repository
+        (input) dest_base -> Archive path name without file extensions
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) status -> True|False - Archive was created
+
+    """
+
+    status = True
+
+    try:
+        file_list = archive_bundle(
+            git_dir, dest_base, getattr(cfg, "archive_compress", "gzip"))
+        log.log_info("archive_project:  Archive files created: %s"
+                     % (file_list))
+
+    except (git.exc.GitCommandError, ValueError, OSError, IOError,
+            tarfile.TarError) as err:
+        log.log_warn("archive_project:  Unable to archive %s as bundle: %s"
+                     % (git_dir, err))
+
+        for ext in [".bundle", ".tar.gz", ".tar.zst", ".json"]:
+            if os.path.isfile(dest_base + ext):
+                os.remove(dest_base + ext)
+
+        status = False
+
+    if status:
+        add_counter("copy_files", len(file_list))
+        add_counter("copy_bytes",
+                    sum(os.path.getsize(item) for item in file_list))
+
+    return status
+
+
+def snapshot_file(src_file, dst_file, strategy):
+
+    """Function:  snapshot_file
+
+    Description:  Snapshot a single file using the snapshot strategy.  A
+        reflink or hardlink that is not supported falls back to a full copy.
+
+    Arguments:
+        (input) src_file -> Source file path
+        (input) dst_file -> Destination file path
+        (input) strategy -> reflink|hardlink|copy - Snapshot strategy
+        (output) Snapshot method used for the file:  reflink|hardlink|copy
+
+    """
+
+    if strategy == "reflink":
+        try:
+            with open(src_file, "rb") as f_src:
+                with open(dst_file, "wb") as f_dst:
+                    fcntl.ioctl(f_dst.fileno(), FICLONE, f_src.fileno())
+
+            shutil.copystat(src_file, dst_file)
+            return "reflink"
+
+        except (IOError, OSError):
+            pass
+
+    elif strategy == "hardlink":
+        try:
+            os.link(src_file, dst_file)
+            return "hardlink"
+
+        except OSError:
+            pass
+
+    shutil.copy2(src_file, dst_file)
+
+    return "copy"
+
+
+def snapshot_dir(src_dir, dst_dir, strategy):          # pylint:disable=R0914
+
+    """Function:  snapshot_dir
+
+    Description:  Snapshot a project directory tree.  With the hardlink
+        strategy only the immutable files under .git/objects are linked, all
+        other files are copied.  Symbolic links are kept as links.
+
+    Arguments:
+        (input) src_dir -> Source directory path
+        (input) dst_dir -> Destination directory path
+        (input) strategy -> reflink|hardlink|copy - Snapshot strategy
+        (output) counts -> Dictionary of snapshot method and number of files
+        (output) size -> Number of bytes in the files and symbolic links
+
+    """
+
+    counts = {"reflink": 0, "hardlink": 0, "copy": 0, "symlink": 0}
+    size = 0
+    obj_dir = os.path.join(src_dir, ".git", "objects")
+    dir_list = []
+
+    for root, dirs, files in os.walk(src_dir):
+        dst_root = os.path.normpath(
+            os.path.join(dst_dir, os.path.relpath(root, src_dir)))
+        os.makedirs(dst_root)
+        dir_list.append((root, dst_root))
+        file_set = set(files)
+
+        for name in sorted(dirs + files):
+            src_file = os.path.join(root, name)
+            dst_file = os.path.join(dst_root, name)
+
+            if os.path.islink(src_file):
+                os.symlink(os.readlink(src_file), dst_file)
+                counts["symlink"] += 1
+                size += os.lstat(src_file).st_size
+
+            elif name in file_set:
+                size += os.path.getsize(src_file)
+                file_strategy = strategy
+
+                # Only Git object and pack files are never modified in place
+                if strategy == "hardlink" and (
+                        not root.startswith(obj_dir)
+                        or root.startswith(os.path.join(obj_dir, "info"))):
+                    file_strategy = "copy"
+
+                counts[snapshot_file(src_file, dst_file, file_strategy)] += 1
+
+    # Directory times are set after their contents are in place
+    for root, dst_root in reversed(dir_list):
+        shutil.copystat(root, dst_root)
+
+    return counts, size
+
+
+def archive_original(args, cfg, log):
+
+    """Function:  archive_original
+
+    Description:  Make the .Original archive snapshot of the project
+        directory using the configured archive format and snapshot strategy.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) arch_dir -> Path name of the archive snapshot
+
+    """
+
+    strategy = getattr(cfg, "snapshot", "copy")
+    arch_dir = os.path.join(
+        cfg.archive_dir, os.path.basename(args.get_val("-p")) +
+        ".Original." + datetime.datetime.strftime(
+            datetime.datetime.now(), "%Y%m%d_%H%M%S"))
+
+    if strategy not in ["reflink", "hardlink", "copy"]:
+        log.log_warn("archive_original:  Unknown snapshot strategy: %s"
+                     % (strategy))
+        strategy = "copy"
+
+    if getattr(cfg, "archive_format", "dir") != "bundle"                \
+       or not archive_project(args.get_val("-p"), arch_dir, cfg, log):
+        log.log_info("archive_original:  Snapshot strategy: %s" % (strategy))
+
+        # The full copy has no per-file hook, so the copy itself is counted
+        if strategy == "copy":
+            gen_libs.cp_dir(args.get_val("-p"), arch_dir)
+            files, size = dir_usage(arch_dir)
+
+        else:
+            counts, size = snapshot_dir(args.get_val("-p"), arch_dir,
+                                        strategy)
+            log.log_info("archive_original:  Files by snapshot method: %s"
+                         % (counts))
+            files = sum(counts.values())
+
+        add_counter("copy_files", files)
+        add_counter("copy_bytes", size)
+
+    return arch_dir
+
+
+def snapshot_thread(snapshot, cfg, log):
+
+    """Function:  snapshot_thread
+
+    Description:  Make the archive snapshot of a project in a background
+        thread.  The snapshot time is added to the archive stage timing.
+
+    Arguments:
+        (input) snapshot -> Dictionary of the background snapshot
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+
+    """
+
+    start = time.time()
+
+    try:
+        snapshot["arch_dir"] = archive_original(snapshot["args"], cfg, log)
+
+    except Exception as err:                            # pylint:disable=W0703
+        snapshot["error"] = err
+
+    stages = RUN_METRICS.setdefault("stages", {})
+    stages["archive"] = stages.get("archive", 0.0) + time.time() - start
+
+
+def start_snapshot(args, cfg, log):
+
+    """Function:  start_snapshot
+
+    Description:  Start the archive snapshot of the project in a background
+        thread, so the remote check and mirror fetch run at the same time.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) snapshot -> Dictionary of the background snapshot
+
+    """
+
+    snapshot = {"args": args, "arch_dir": None, "error": None}
+    snapshot["thread"] = threading.Thread(
+        target=snapshot_thread, args=(snapshot, cfg, log))
+    snapshot["thread"].daemon = True
+    snapshot["thread"].start()
+    log.log_info("start_snapshot:  Archive snapshot started in background")
+
+    return snapshot
+
+
+def wait_snapshot(snapshot):
+
+    """Function:  wait_snapshot
+
+    Description:  Wait for the background archive snapshot to complete.  An
+        exception raised by the snapshot is raised again.
+
+    Arguments:
+        (input) snapshot -> Dictionary of the background snapshot
+        (output) arch_dir -> Path name of the archive snapshot
+
+    """
+
+    snapshot["thread"].join()
+
+    if snapshot["error"] is not None:
+        raise snapshot["error"]
+
+    return snapshot["arch_dir"]
+
+
+def discard_snapshot(snapshot, log):
+
+    """Function:  discard_snapshot
+
+    Description:  Wait for the background archive snapshot and remove it,
+        as the project failed the preflight checks.
+
+    Arguments:
+        (input) snapshot -> Dictionary of the background snapshot
+        (input) log -> Log class instance
+
+    """
+
+    try:
+        arch_dir = wait_snapshot(snapshot)
+
+        if arch_dir and os.path.isdir(arch_dir):
+            shutil.rmtree(arch_dir)
+
+        for ext in [".bundle", ".tar.gz", ".tar.zst", ".json"]:
+            if arch_dir and os.path.isfile(arch_dir + ext):
+                os.remove(arch_dir + ext)
+
+        log.log_info("discard_snapshot:  Removed archive snapshot: %s"
+                     % (arch_dir))
+
+    except Exception as err:                            # pylint:disable=W0703
+        log.log_warn("discard_snapshot:  Archive snapshot not removed: %s"
+                     % (err))
+
+
+def get_url(args, cfg):
+
+    """Function:  get_url
+
+    Description:  Build the Git url of the remote repository.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (output) url -> Git url of the remote repository
+
+    """
+
+    # Use alias for servername
+    if args.arg_exist("-a"):
+        url = cfg.prefix + args.get_val("-r")
+
+    else:
+        url = cfg.prefix + cfg.git_server
+
+    return url + ":" + cfg.git_project + "/" + args.get_val("-r") + ".git"
+
+
+def preflight(args, cfg, log):
+
+    """Function:  preflight
+
+    Description:  Run the validity checks against the project directory in
+        place before any copy or move of the project is done.  Checks the
+        project is a Git repository and the remote Git repository exists.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) status -> True|False - Project passed the checks
+        (output) gitr -> Git class instance of the project directory or None
+            if the project directory is not a Git repository
+
+    """
+
+    status = False
+    gitr = None
+    log.log_info("preflight:  Checking: %s" % (args.get_val("-p")))
+
+    if is_git_repo(args.get_val("-p")):
+        url = get_url(args, cfg)
+        gitr = git_class.GitMerge(
+            args.get_val("-r"), args.get_val("-p"), url, cfg.branch,
+            cfg.mod_branch)
+        gitr.create_gitrepo()
+
+        # Remote repository already found by the remote check of the batch
+        status = url in REMOTE_CHECK or gitr.is_remote()
+        REMOTE_CHECK.discard(url)
+
+    return status, gitr
+
+
+def merge(args, cfg, log):
+
+    """Function:  merge
+
+    Description:  Controls the merging of a local repository with a remote
+        repository, but having the local repository as the priority
+        repository.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+
+    """
+
+    log.log_info("merge:  Starting merge of:  %s" % (args.get_val("-r")))
+    metrics_start(os.path.basename(args.get_val("-p")))
+    snapshot = None
+
+    # Pipelined:  The snapshot overlaps the remote check and mirror fetch
+    if getattr(cfg, "pipeline", False) and is_git_repo(args.get_val("-p")):
+        snapshot = start_snapshot(args, cfg, log)
+
+    status, gitr = time_stage("preflight", preflight, args, cfg, log)
+
+    if snapshot and not status:
+        discard_snapshot(snapshot, log)
+
+    if status:
+        if snapshot:
+            if getattr(cfg, "mirror_dir", None):
+                time_stage("prefetch", prefetch_mirror, gitr, cfg, log)
+
+            # The project is not changed until the snapshot is complete
+            arch_dir = time_stage("snapshot_wait", wait_snapshot, snapshot)
+
+        else:
+            arch_dir = time_stage("archive", archive_original, args, cfg,
+                                  log)
+
+        log.log_info("merge:  Original repo dir copied to:  %s" % (arch_dir))
+        time_stage("move", gen_libs.mv_file2, args.get_val("-p"),
+                   cfg.work_dir)
+        git_dir = os.path.join(
+            cfg.work_dir, os.path.basename(args.get_val("-p")))
+        log.log_info("merge:  Updating Git config file")
+        giti = git_class.GitConfig(git_dir)
+        giti.set_user(cfg.name)
+        giti.set_email(cfg.email)
+        log.log_info("merge:  Processing: %s directory" % (git_dir))
+        gitr = git_class.GitMerge(
+            args.get_val("-r"), git_dir, gitr.url, cfg.branch, cfg.mod_branch)
+        gitr.create_gitrepo()
+        gitr.set_remote()
+        cleanup_repo(gitr, cfg, log, allow=args.arg_exist("-u"))
+
+    elif gitr:
+        log.log_err("merge:  %s does not exist at remote repo." % (gitr.url))
+        line_list = ["Remote git repository does not exist"]
+        post_process(gitr, cfg, log, False, line_list)
+
+    else:
+        git_dir = args.get_val("-p")
+        log.log_err("merge:  %s is not a local Git repository" % (git_dir))
+        MERGE_STATUS[os.path.basename(git_dir)] = False
+
+        if cfg.to_line:
+            subj = "Merge error for: " + git_dir
+            body = ["Local directory is not a Git repository.",
+                    "Project Dir: " + git_dir]
+            body.append(
+                "DTG: " + datetime.datetime.strftime(
+                    datetime.datetime.now(), "%Y-%m-%d %H:%M:%S"))
+            send_mail(cfg.to_line, subj, body)
+
+        dest_dir = os.path.basename(git_dir) + "." \
+            + datetime.datetime.strftime(
+                datetime.datetime.now(), "%Y%m%d_%H%M%S")
+        gen_libs.mv_file2(git_dir, os.path.join(cfg.err_dir, dest_dir))
+
+    record = metrics_summary(cfg, log)
+
+    if getattr(cfg, "prom_file", None):
+        export_metrics(cfg, log, record)
+
+
+def cleanup_repo(gitr, cfg, log, **kwargs):
+
+    """Function:  cleanup_repo
+
+    Description:  Checks to ensure head is detached and there are not any dirty
+        or untracked changes before merging repository.
+
+    Arguments:
+        (input) gitr -> Git class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) **kwargs:
+            allow -> True|False - Allow merge of unrelated histories
+
+    """
+
+    git_status = time_stage("changes", process_changes, gitr, cfg, log)
+
+    if not git_status.dirty and not git_status.new_files:
+        status, err_msg = time_stage("detach", detach_head, gitr, log)
+
+        if status:
+            log.log_info("merge:  Processing project...")
+            process_project(gitr, cfg, log, **kwargs)
+
+        else:
+            log.log_err("merge:  Problem detected in detaching head.")
+            log.log_err("merge: Message: %s" % (err_msg))
+            line_list = [err_msg]
+            post_process(gitr, cfg, log, False, line_list)
+
+    else:
+        log.log_err("merge:  Still dirty entries in local repo.")
+        line_list = ["There is still dirty entries in local repo."]
+        post_process(gitr, cfg, log, False, line_list)
+
+
+def get_proj_list(args):
+
+    """Function:  get_proj_list
+
+    Description:  Compile the list of project directories to be merged from
+        the -p option and the sub-directories of the -b drop directory.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) proj_list -> List of project directory paths
+
+    """
+
+    proj_list = args.get_val("-p", def_val=[])
+
+    if isinstance(proj_list, list):
+        proj_list = list(proj_list)
+
+    else:
+        proj_list = [proj_list]
+
+    if args.arg_exist("-b"):
+        drop_dir = args.get_val("-b")
+
+        for item in sorted(os.listdir(drop_dir)):
+            proj_dir = os.path.join(drop_dir, item)
+
+            # Skip hidden entries, these are drops still being transferred
+            if not item.startswith(".") and os.path.isdir(proj_dir):
+                proj_list.append(proj_dir)
+
+    return proj_list
+
+
+def run_merge(args, cfg, log):
+
+    """Function:  run_merge
+
+    Description:  Run the merge of a single project while holding the program
+        lock for that project.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) status -> True|False|None - Merge status of project, None if
+            the project was locked by another instance
+
+    """
+
+    proj_name = os.path.basename(args.get_val("-p"))
+
+    try:
+        prog_lock = gen_class.ProgramLock(sys.argv, args.get_val("-r"))
+        MERGE_STATUS.pop(proj_name, None)
+        merge(args, cfg, log)
+        del prog_lock
+        status = MERGE_STATUS.pop(proj_name, False)
+
+    except gen_class.SingleInstanceException:
+        log.log_warn("run_merge:  Lock in place for merge with id of: %s"
+                     % (args.get_val("-r")))
+        status = None
+
+    return status
+
+
+def merge_proj_dir(args, cfg, log, proj_dir):
+
+    """Function:  merge_proj_dir
+
+    Description:  Merge a single project directory within a batch run.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) proj_dir -> Project directory path
+        (output) status -> True|False|None - Merge status of project
+
+    """
+
+    if not os.path.isdir(proj_dir):
+        log.log_err("merge_proj_dir:  %s is not a directory" % (proj_dir))
+        return False
+
+    repo_args = copy.deepcopy(args)
+    repo_args.insert_arg("-p", proj_dir)
+    repo_args.insert_arg("-r", os.path.basename(proj_dir))
+
+    try:
+        status = run_merge(repo_args, cfg, log)
+
+    except Exception as err:                            # pylint:disable=W0703
+        log.log_err("merge_proj_dir:  Merge of %s raised: %s"
+                    % (proj_dir, err))
+        status = False
+
+    log.log_info("merge_proj_dir:  Merge status of %s: %s"
+                 % (proj_dir, status))
+
+    return status
+
+
+def fork_context():
+
+    """Function:  fork_context
+
+    Description:  Return the fork start method of multiprocessing.  The
+        worker processes are given the configuration module and Log
+        instance, which can only be passed to a forked process.  Newer
+        Python 3 versions no longer use fork by default.
+
+    Arguments:
+        (output) context -> Fork context or the multiprocessing module
+
+    """
+
+    # Python 2.7 has no start methods and always forks
+    if hasattr(multiprocessing, "get_context"):
+        return multiprocessing.get_context("fork")
+
+    return multiprocessing
+
+
+def init_worker(args, cfg, log):
+
+    """Function:  init_worker
+
+    Description:  Initialize a worker process in the merge pool.  Each worker
+        is given its own sub-directory of the work directory, named after the
+        pool's parent process and the worker process.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+
+    """
+
+    # The configuration module is a copy owned by the forked worker
+    cfg.work_dir = os.path.join(
+        cfg.work_dir, "worker_%s_%s" % (os.getppid(), os.getpid()))
+    gen_libs.chk_crt_dir(cfg.work_dir, create=True, write=True, read=True)
+    WORKER_ENV["args"] = args
+    WORKER_ENV["cfg"] = cfg
+    WORKER_ENV["log"] = log
+
+
+def worker_merge(proj_dir):
+
+    """Function:  worker_merge
+
+    Description:  Merge a project directory within a worker process.
+
+    Arguments:
+        (input) proj_dir -> Project directory path
+        (output) proj_dir -> Project directory path
+        (output) status -> True|False|None - Merge status of project
+
+    """
+
+    status = merge_proj_dir(WORKER_ENV["args"], WORKER_ENV["cfg"],
+                            WORKER_ENV["log"], proj_dir)
+
+    return proj_dir, status
+
+
+def pool_merge(args, cfg, log, proj_list, workers):
+
+    """Function:  pool_merge
+
+    Description:  Merge a list of projects in parallel using a pool of worker
+        processes.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) proj_list -> List of project directory paths
+        (input) workers -> Number of worker processes
+        (output) results -> Dictionary of project directory and merge status
+
+    """
+
+    results = {}
+    proj_list = list(proj_list)
+    workers = min(workers, len(proj_list))
+    log.log_info("pool_merge:  Starting %s worker processes" % (workers))
+
+    # Import the Git stack once before the worker processes are forked
+    git_class.load()
+    pool = fork_context().Pool(
+        processes=workers, initializer=init_worker,
+        initargs=(args, cfg, log),
+        maxtasksperchild=int(getattr(cfg, "worker_max_jobs", 0)) or None)
+
+    try:
+        for proj_dir, status in pool.imap_unordered(worker_merge, proj_list):
+            results[proj_dir] = status
+
+    finally:
+        pool.close()
+        pool.join()
+
+        # Other runs may share work_dir, only this pool's directories go
+        for item in os.listdir(cfg.work_dir):
+            if item.startswith("worker_%s_" % (os.getpid())):
+                try:
+                    os.rmdir(os.path.join(cfg.work_dir, item))
+
+                except OSError:
+                    log.log_warn("pool_merge:  Unable to remove: %s"
+                                 % (os.path.join(cfg.work_dir, item)))
+
+    return results
+
+
+def async_git(cmd_list, limit):
+
+    """Function:  async_git
+
+    Description:  Run a list of Git commands as asyncio subprocesses in a
+        single event loop, with at most limit commands running at once.  As
+        each command completes the next one is started.
+
+    Arguments:
+        (input) cmd_list -> List of commands, each a list of arguments
+        (input) limit -> Maximum number of commands running at once
+        (output) results -> List of tuples of return code and standard error
+            in the order of cmd_list, the return code is None if the command
+            could not be run
+
+    """
+
+    results = [None] * len(cmd_list)
+    pending = collections.deque(enumerate(cmd_list))
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    done = loop.create_future()
+
+    def start_next():
+
+        """Function:  start_next
+
+        Description:  Start the next pending command or complete the run
+            once all commands have finished.  Callbacks are used instead of
+            await to keep the program Python 2 compatible.
+
+        Arguments:
+
+        """
+
+        if pending:
+            index, cmd = pending.popleft()
+            future = asyncio.ensure_future(asyncio.create_subprocess_exec(
+                *cmd, stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE), loop=loop)
+            future.add_done_callback(functools.partial(started, index))
+
+        elif None not in results and not done.done():
+            done.set_result(results)
+
+    def started(index, future):
+
+        """Function:  started
+
+        Description:  Read the output of a started command.
+
+        Arguments:
+            (input) index -> Index of the command
+            (input) future -> Future of the subprocess creation
+
+        """
+
+        try:
+            proc = future.result()
+            comm = asyncio.ensure_future(proc.communicate(), loop=loop)
+            comm.add_done_callback(functools.partial(finished, index, proc))
+
+        except Exception as err:                        # pylint:disable=W0703
+            results[index] = (None, str(err))
+            start_next()
+
+    def finished(index, proc, future):
+
+        """Function:  finished
+
+        Description:  Record the result of a finished command and start the
+            next one.
+
+        Arguments:
+            (input) index -> Index of the command
+            (input) proc -> Subprocess of the command
+            (input) future -> Future of the subprocess communicate
+
+        """
+
+        try:
+            results[index] = (proc.returncode,
+                              future.result()[1].decode("utf-8", "replace"))
+
+        except Exception as err:                        # pylint:disable=W0703
+            results[index] = (None, str(err))
+
+        start_next()
+
+    try:
+        for _ in range(min(limit, len(cmd_list))):
+            start_next()
+
+        if cmd_list:
+            loop.run_until_complete(done)
+
+    finally:
+        loop.close()
+        asyncio.set_event_loop(None)
+
+    return results
+
+
+def mirror_check(cfg, log, project, checks, locks):
+
+    """Function:  mirror_check
+
+    Description:  Lock the mirror of a project, create it if missing and add
+        its fetch command to the remote checks.  A mirror locked by another
+        process is left for update_mirror.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) project -> Tuple of project directory path and remote url
+        (input) checks -> Dictionary of Git commands and the set and item
+            to record a successful command in
+        (input) locks -> List of the open mirror lock files
+
+    """
+
+    mirror = os.path.join(cfg.mirror_dir,
+                          os.path.basename(project[0]) + ".git")
+    cmd = ("git", "--git-dir", mirror, "fetch", "--quiet", project[1],
+           "+refs/heads/%s:refs/heads/%s" % (cfg.branch, cfg.branch),
+           "+refs/tags/*:refs/tags/*")
+
+    if cmd in checks:
+        return
+
+    try:
+        # The lock is held until remote_check has run the fetch
+        f_lock = open(mirror + ".lock", "w")        # pylint:disable=R1732
+        locks.append(f_lock)
+        fcntl.flock(f_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        if not os.path.isdir(mirror):
+            git.Repo.init(mirror, bare=True)
+
+        checks[cmd] = (MIRROR_FRESH, mirror)
+
+    except (git.exc.GitCommandError, OSError, IOError) as err:
+        log.log_warn("mirror_check:  Mirror not refreshed: %s" % (err))
+
+
+def remote_check(args, cfg, log, proj_list):             # pylint:disable=R0914
+
+    """Function:  remote_check
+
+    Description:  Check the remote Git repositories of a list of projects
+        exist and refresh their mirrors before the projects are merged.  The
+        git ls-remote and mirror fetch commands of all the projects run
+        concurrently in this process, so their network waits overlap.  A
+        mirror locked by another process is left for update_mirror.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) proj_list -> List of project directory paths
+
+    """
+
+    jobs = int(getattr(cfg, "async_jobs", 0) or 0)
+
+    if asyncio and jobs > 1 and len(proj_list) > 1:
+        start = time.time()
+        checks = collections.OrderedDict()
+        locks = []
+
+        for proj_dir in proj_list:
+            repo_args = copy.deepcopy(args)
+            repo_args.insert_arg("-r", os.path.basename(proj_dir))
+            url = get_url(repo_args, cfg)
+            checks[("git", "ls-remote", "--heads", url, cfg.branch)] = \
+                (REMOTE_CHECK, url)
+
+            if getattr(cfg, "mirror_dir", None):
+                mirror_check(cfg, log, (proj_dir, url), checks, locks)
+
+        try:
+            results = async_git([list(cmd) for cmd in checks], jobs)
+
+        except (OSError, RuntimeError) as err:
+            log.log_warn("remote_check:  Remote check not run: %s" % (err))
+            results = [(None, str(err))] * len(checks)
+
+        finally:
+            for f_lock in locks:
+                f_lock.close()
+
+        for (found, item), (code, err) in zip(checks.values(), results):
+            if code == 0:
+                found.add(item)
+
+            else:
+                log.log_warn("remote_check:  git %s failed for %s: %s"
+                             % ("ls-remote" if found is REMOTE_CHECK
+                                else "fetch", item,
+                                (err.strip().splitlines() or [""])[0]))
+
+        log.log_info("remote_check:  Remotes found: %s  Mirrors refreshed: %s"
+                     "  Time: %.2f seconds"
+                     % (len(REMOTE_CHECK), len(MIRROR_FRESH),
+                        time.time() - start))
+
+
+def merge_list(args, cfg, log, proj_list):
+
+    """Function:  merge_list
+
+    Description:  Merge a list of projects.  The projects are merged in
+        parallel if more than one worker is configured.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) proj_list -> List of project directory paths
+        (output) results -> Dictionary of project directory and merge status
+
+    """
+
+    results = {}
+    proj_list = list(proj_list)
+    workers = int(getattr(cfg, "workers", 1))
+    remote_check(args, cfg, log, proj_list)
+
+    if workers > 1 and len(proj_list) > 1:
+        results = pool_merge(args, cfg, log, proj_list, workers)
+
+    else:
+        for proj_dir in proj_list:
+
+            # A stopped daemon leaves the other projects in the spool_dir
+            if DAEMON_STOP["signum"]:
+                log.log_info("merge_list:  Daemon stopping, not merged: %s"
+                             % (proj_dir))
+                continue
+
+            results[proj_dir] = merge_proj_dir(args, cfg, log, proj_dir)
+
+    # Checks not used by a merge are not kept for the next run
+    REMOTE_CHECK.clear()
+    MIRROR_FRESH.clear()
+
+    return results
+
+
+def worker_rss():
+
+    """Function:  worker_rss
+
+    Description:  Return the resident memory of the current process.
+
+    Arguments:
+        (output) rss -> Resident memory in megabytes or None if not available
+
+    """
+
+    try:
+        with open("/proc/self/statm") as f_hdlr:
+            pages = int(f_hdlr.read().split()[1])
+
+        rss = pages * os.sysconf("SC_PAGE_SIZE") / 1048576.0
+
+    except (IOError, OSError, ValueError, IndexError):
+        rss = None
+
+    return rss
+
+
+def merge_item(args, cfg, log, item):
+
+    """Function:  merge_item
+
+    Description:  Merge an item sent to a pre-forked worker, either a
+        spool project directory or a submitted job.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) item -> Tuple of item index, project directory, job
+            dictionary and the remote urls and mirrors checked by the
+            daemon, the job is None for a project directory
+        (output) index -> Index of the item
+        (output) status -> True|False|None - Merge status of project
+
+    """
+
+    index, proj_dir, job, checks = item
+    REMOTE_CHECK.update(checks[0])
+    MIRROR_FRESH.update(checks[1])
+
+    try:
+        if job:
+            status = run_job(args, cfg, log, job)
+
+        else:
+            status = merge_proj_dir(args, cfg, log, proj_dir)
+
+    finally:
+        # Checks of the other items are not kept for the next item
+        REMOTE_CHECK.clear()
+        MIRROR_FRESH.clear()
+
+    return index, status
+
+
+def prefork_worker(args, cfg, log, conn, limits):
+
+    """Function:  prefork_worker
+
+    Description:  Main loop of a pre-forked worker process.  Takes projects
+        and submitted jobs from the daemon until told to stop, the daemon
+        has gone away or it is due to be recycled by the job or memory
+        limit.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) conn -> Worker end of the pipe to the daemon
+        (input) limits -> Tuple of the maximum jobs and maximum memory in MB,
+            0 for no limit
+
+    """
+
+    max_jobs, max_mem = limits
+    init_worker(args, cfg, log)
+    ppid = os.getppid()
+    job_cnt = 0
+    rss = None
+    recycle = False
+
+    while not recycle and not DAEMON_STOP["signum"] \
+            and os.getppid() == ppid:
+        try:
+            has_item = conn.poll(30)
+
+        # Python 2.7 does not retry a poll interrupted by a signal
+        except (IOError, OSError):
+            has_item = False
+
+        if has_item:
+            try:
+                item = conn.recv()
+
+            except (EOFError, OSError):
+                item = None
+
+            if item is None:
+                break
+
+            index, status = merge_item(args, cfg, log, item)
+            job_cnt += 1
+            rss = worker_rss()
+            recycle = bool((max_jobs and job_cnt >= max_jobs)
+                           or (max_mem and rss and rss > max_mem))
+            conn.send((index, status, recycle))
+
+    # An item sent before the worker stopped is returned as not merged
+    if DAEMON_STOP["signum"] and not recycle:
+        try:
+            if conn.poll():
+                index = conn.recv()[0]
+                conn.send((index, None, True))
+
+        except (EOFError, OSError, IOError, TypeError):
+            pass
+
+    if recycle:
+        log.log_info("prefork_worker:  Worker %s recycled after %s jobs,"
+                     " resident memory: %s MB"
+                     % (os.getpid(), job_cnt,
+                        "%.1f" % (rss) if rss else "unknown"))
+
+
+def prefork_spawn(pool):
+
+    """Function:  prefork_spawn
+
+    Description:  Fork a new worker process into the pre-forked pool.  The
+        daemon keeps its end of a pipe to each worker.
+
+    Arguments:
+        (input) pool -> Dictionary of the pre-forked pool
+        (output) pid -> Process id of the new worker
+
+    """
+
+    context = fork_context()
+    conn, child_conn = context.Pipe()
+    proc = context.Process(
+        target=prefork_worker,
+        args=(pool["args"], pool["cfg"], pool["log"], child_conn,
+              pool["limits"]))
+    proc.daemon = True
+    proc.start()
+
+    # Only the worker holds its end, so a worker exit is seen as end of file
+    child_conn.close()
+    pool["procs"][proc.pid] = proc
+    pool["conns"][proc.pid] = conn
+
+    return proc.pid
+
+
+def prefork_start(args, cfg, log, workers):
+
+    """Function:  prefork_start
+
+    Description:  Start the pre-forked pool of worker processes.  The Git
+        stack is imported before the workers are forked, so each worker
+        starts with the imported modules and loaded configuration.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) workers -> Number of worker processes
+        (output) pool -> Dictionary of the pre-forked pool
+
+    """
+
+    git_class.load()
+    pool = {"args": args, "cfg": cfg, "log": log, "procs": {}, "conns": {},
+            "limits": (int(getattr(cfg, "worker_max_jobs", 0) or 0),
+                       float(getattr(cfg, "worker_max_mem", 0) or 0))}
+
+    for _ in range(workers):
+        prefork_spawn(pool)
+
+    log.log_info("prefork_start:  Started %s worker processes, max jobs: %s"
+                 "  max memory: %s MB" % (workers, pool["limits"][0],
+                                          pool["limits"][1]))
+
+    return pool
+
+
+def prefork_reap(pool, log, pid, spawn=True):
+
+    """Function:  prefork_reap
+
+    Description:  Wait for a worker process to exit, remove its work
+        sub-directory and fork a replacement worker.
+
+    Arguments:
+        (input) pool -> Dictionary of the pre-forked pool
+        (input) log -> Log class instance
+        (input) pid -> Process id of the worker
+        (input) spawn -> True|False - Fork a replacement worker
+
+    """
+
+    proc = pool["procs"].pop(pid)
+    pool["conns"].pop(pid).close()
+    proc.join(60)
+
+    if proc.is_alive():
+        log.log_warn("prefork_reap:  Terminating worker: %s" % (pid))
+        proc.terminate()
+        proc.join(10)
+
+    # The worker completes its merge on a SIGTERM, a hung worker is killed
+    if proc.is_alive():
+        log.log_warn("prefork_reap:  Killing worker: %s" % (pid))
+        os.kill(pid, signal.SIGKILL)
+        proc.join()
+
+    work_dir = os.path.join(pool["cfg"].work_dir,
+                            "worker_%s_%s" % (os.getpid(), pid))
+
+    try:
+        if os.path.isdir(work_dir):
+            os.rmdir(work_dir)
+
+    except OSError:
+        log.log_warn("prefork_reap:  Unable to remove: %s" % (work_dir))
+
+    if spawn and not DAEMON_STOP["signum"]:
+        log.log_info("prefork_reap:  Worker %s replaced by: %s"
+                     % (pid, prefork_spawn(pool)))
+
+
+def prefork_merge(pool, log, items):
+
+    """Function:  prefork_merge
+
+    Description:  Merge a list of projects and submitted jobs using the
+        pre-forked worker processes.  Each idle worker is sent the next
+        item.  A worker which exits during a merge is replaced and its
+        project is marked as failed.
+
+    Arguments:
+        (input) pool -> Dictionary of the pre-forked pool
+        (input) log -> Log class instance
+        (input) items -> List of tuples of project directory and job
+            dictionary, the job is None for a project directory
+        (output) statuses -> List of merge statuses in the order of items
+
+    """
+
+    results = {}
+    running = {}
+    pending = list(enumerate(items))
+
+    # The workers were forked before the remote check of this round
+    checks = (list(REMOTE_CHECK), list(MIRROR_FRESH))
+
+    while len(results) < len(items):
+
+        # A stopped daemon only completes the merges in progress
+        if DAEMON_STOP["signum"] and pending:
+            log.log_info("prefork_merge:  Daemon stopping, %s items not"
+                         " merged" % (len(pending)))
+
+            for index, _ in pending:
+                results[index] = None
+
+            pending = []
+
+        for pid in list(pool["procs"]):
+            if pending and pid not in running:
+                index, (proj_dir, job) = pending[0]
+
+                try:
+                    pool["conns"][pid].send((index, proj_dir, job, checks))
+                    running[pid] = pending.pop(0)[0]
+
+                except (OSError, IOError, ValueError):
+                    log.log_err("prefork_merge:  Worker %s not available"
+                                % (pid))
+                    prefork_reap(pool, log, pid)
+
+        ready = wait_ready([pool["conns"][pid] for pid in running]) \
+            if running else []
+
+        for pid in [item for item in running
+                    if pool["conns"][item] in ready]:
+            try:
+                index, status, recycle = pool["conns"][pid].recv()
+
+            except (EOFError, OSError):
+                index, status, recycle = running[pid], False, True
+                log.log_err("prefork_merge:  Worker %s exited during merge"
+                            " of: %s" % (pid, items[index][0]))
+
+            results[index] = status
+            del running[pid]
+
+            if recycle:
+                prefork_reap(pool, log, pid)
+
+    return [results[index] for index in range(len(items))]
+
+
+def prefork_round(pool, log, ready, jobs):
+
+    """Function:  prefork_round
+
+    Description:  Merge the spool projects and the submitted jobs of one
+        daemon round using the pre-forked worker processes and send the
+        merge statuses to the waiting clients.  The remote repositories of
+        the round are checked by remote_check before the merges.
+
+    Arguments:
+        (input) pool -> Dictionary of the pre-forked pool
+        (input) log -> Log class instance
+        (input) ready -> List of spool project directories
+        (input) jobs -> Dictionary of the job queue
+        (output) results -> Dictionary of spool project directory and merge
+            status
+
+    """
+
+    with jobs["lock"]:
+        queued = jobs["queue"]
+        jobs["queue"] = []
+        jobs["running"].extend(queued)
+
+    # The client sockets stay in the daemon process
+    items = [(proj_dir, None) for proj_dir in ready] + [
+        (job["-p"], dict((key, val) for key, val in job.items()
+                         if key != "conns")) for job in queued]
+    remote_check(pool["args"], pool["cfg"], log,
+                 [proj_dir for proj_dir, _ in items])
+    statuses = prefork_merge(pool, log, items)
+
+    # Checks not used by a merge are not kept for the next round
+    REMOTE_CHECK.clear()
+    MIRROR_FRESH.clear()
+
+    for job, status in zip(queued, statuses[len(ready):]):
+        log.log_info("prefork_round:  Job %s merge status: %s"
+                     % (job["job_id"], status))
+        job_done(jobs, job, status)
+
+    return dict(zip(ready, statuses[:len(ready)]))
+
+
+def prefork_stop(pool, log):
+
+    """Function:  prefork_stop
+
+    Description:  Stop the pre-forked worker processes once their current
+        merges have completed.
+
+    Arguments:
+        (input) pool -> Dictionary of the pre-forked pool
+        (input) log -> Log class instance
+
+    """
+
+    log.log_info("prefork_stop:  Stopping %s worker processes"
+                 % (len(pool["procs"])))
+
+    for pid in list(pool["procs"]):
+        try:
+            pool["conns"][pid].send(None)
+
+        except (OSError, IOError, ValueError):
+            pass
+
+    for pid in list(pool["procs"]):
+        prefork_reap(pool, log, pid, spawn=False)
+
+
+def batch_merge(args, cfg, log):
+
+    """Function:  batch_merge
+
+    Description:  Merge a number of projects within a single run of the
+        program.  Each project is run through the merge process and has its
+        own merge status.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) results -> Dictionary of project directory and merge status
+
+    """
+
+    proj_list = get_proj_list(args)
+    log.log_info("batch_merge:  Projects to be merged: %s" % (len(proj_list)))
+    results = merge_list(args, cfg, log, proj_list)
+    log.log_info(
+        "batch_merge:  Completed: %s  Failed: %s  Locked: %s"
+        % (list(results.values()).count(True),
+           list(results.values()).count(False),
+           list(results.values()).count(None)))
+
+    return results
+
+
+def inotify_watch(dir_path):
+
+    """Function:  inotify_watch
+
+    Description:  Set up a Linux inotify watch for entries being created or
+        moved into a directory.
+
+    Arguments:
+        (input) dir_path -> Directory path to watch
+        (output) fdesc -> Inotify file descriptor or None if not available
+
+    """
+
+    # Only the daemon watches the spool directory
+    import ctypes.util                          # pylint:disable=C0415
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6",
+                           use_errno=True)
+        fdesc = libc.inotify_init1(os.O_NONBLOCK | IN_CLOEXEC)
+
+    except (OSError, AttributeError):
+        return None
+
+    if fdesc < 0:
+        return None
+
+    if not isinstance(dir_path, bytes):
+        dir_path = dir_path.encode("utf-8")
+
+    if libc.inotify_add_watch(fdesc, dir_path, IN_WATCH_MASK) < 0:
+        os.close(fdesc)
+        fdesc = None
+
+    return fdesc
+
+
+def wait_ready(rlist, timeout=None):
+
+    """Function:  wait_ready
+
+    Description:  Wait for a list of file descriptors or connections to be
+        ready for reading.  A wait interrupted by a signal returns no ready
+        items, as Python 2.7 does not retry the select.
+
+    Arguments:
+        (input) rlist -> List of file descriptors or connections
+        (input) timeout -> Maximum number of seconds to wait or None
+        (output) ready -> List of the items ready for reading
+
+    """
+
+    try:
+        ready = select.select(rlist, [], [], timeout)[0]
+
+    except select.error as err:
+        if err.args[0] != errno.EINTR:
+            raise
+
+        ready = []
+
+    return ready
+
+
+def wait_spool(fdesc, timeout, wake_fd=None):
+
+    """Function:  wait_spool
+
+    Description:  Wait for activity in the spool directory, a submitted job
+        or for the timeout to expire.  Without an inotify watch or job wake up
+        pipe this is a sleep between polls.
+
+    Arguments:
+        (input) fdesc -> Inotify file descriptor or None
+        (input) timeout -> Maximum number of seconds to wait
+        (input) wake_fd -> Read end of the job wake up pipe or None
+
+    """
+
+    fd_list = [item for item in [fdesc, wake_fd] if item is not None]
+
+    if not fd_list:
+        time.sleep(timeout)
+
+    else:
+        for item in wait_ready(fd_list, timeout):
+
+            # Drain the pending events, the spool directory is rescanned
+            try:
+                while os.read(item, 4096):
+                    pass
+
+            except OSError:
+                pass
+
+
+def dir_mtime(dir_path):
+
+    """Function:  dir_mtime
+
+    Description:  Return the modification time of a directory.
+
+    Arguments:
+        (input) dir_path -> Directory path
+        (output) Modification time or None if the directory does not exist
+
+    """
+
+    try:
+        return os.stat(dir_path).st_mtime
+
+    except OSError:
+        return None
+
+
+def scan_spool(spool_dir, settle):
+
+    """Function:  scan_spool
+
+    Description:  Scan the spool directory for project directories.  A
+        project directory is ready once it has not been modified for the
+        settle time.  Hidden entries are still being transferred.
+
+    Arguments:
+        (input) spool_dir -> Spool directory path
+        (input) settle -> Number of seconds a directory must be unchanged
+        (output) ready -> Sorted list of project directories ready to merge
+        (output) pending -> Dictionary of project directory and mtime of the
+            directories not yet ready
+
+    """
+
+    ready = []
+    pending = {}
+    now = time.time()
+
+    for name in os.listdir(spool_dir):
+        path = os.path.join(spool_dir, name)
+
+        if name.startswith(".") or not os.path.isdir(path):
+            continue
+
+        try:
+            mtime = os.stat(path).st_mtime
+
+        # Directory removed since the listing
+        except OSError:
+            continue
+
+        if now - mtime < settle:
+            pending[path] = mtime
+
+        else:
+            ready.append(path)
+
+    return sorted(ready), pending
+
+
+def stop_daemon(signum, frame):                         # pylint:disable=W0613
+
+    """Function:  stop_daemon
+
+    Description:  Signal handler to stop the merge daemon.  The daemon and
+        its workers stop once the merges in progress are completed, so a
+        project is never left part way through a merge.  The daemon's wait
+        for the spool directory is woken up.
+
+    Arguments:
+        (input) signum -> Signal number
+        (input) frame -> Current stack frame
+
+    """
+
+    DAEMON_STOP["signum"] = signum
+
+    # Workers inherit the handler, only the daemon wakes up its own wait
+    if DAEMON_STOP["pid"] == os.getpid() and DAEMON_STOP["wake"] is not None:
+        try:
+            os.write(DAEMON_STOP["wake"], b"\0")
+
+        except OSError:
+            pass
+
+
+def job_reply(conn, data):
+
+    """Function:  job_reply
+
+    Description:  Send a reply line to a job client.  A client which has gone
+        away is ignored.
+
+    Arguments:
+        (input) conn -> Client socket
+        (input) data -> Dictionary of the reply
+
+    """
+
+    try:
+        conn.sendall((json.dumps(data) + "\n").encode("utf-8"))
+
+    except (socket.error, OSError):
+        pass
+
+
+def job_done(jobs, job, status):
+
+    """Function:  job_done
+
+    Description:  Remove a job from the running jobs, then send its final
+        merge status to its waiting clients and close their connections.
+
+    Arguments:
+        (input) jobs -> Dictionary of the job queue
+        (input) job -> Dictionary of the job
+        (input) status -> True|False|None - Merge status of project
+
+    """
+
+    # No client is added to the job once it is no longer running
+    with jobs["lock"]:
+        jobs["running"] = [item for item in jobs["running"]
+                           if item is not job]
+
+    for conn in job.get("conns", []):
+        job_reply(conn, {"job_id": job["job_id"], "status": status})
+        conn.close()
+
+
+def job_request(args, jobs, conn):
+
+    """Function:  job_request
+
+    Description:  Read a job submitted by a client, check it is for the
+        daemon's configuration file and queue it.  A job for a project
+        directory which is already queued or being merged is not queued
+        again, the client gets the job id of that job instead and waits on
+        it.
+
+    Arguments:
+        (input) args -> ArgParser class instance of the daemon
+        (input) jobs -> Dictionary of the job queue
+        (input) conn -> Client socket
+
+    """
+
+    keep = False
+
+    try:
+        conn.settimeout(5)
+        job = json.loads(conn.makefile("r").readline())
+        wait = job.get("wait")
+
+        if job.get("-c") != args.get_val("-c")                          \
+           or os.path.abspath(job.get("-d", "")) \
+           != os.path.abspath(args.get_val("-d")):
+            job_reply(conn, {"status": "rejected", "error": "Configuration"
+                             " file does not match the daemon"})
+
+        else:
+            with jobs["lock"]:
+                queued = [item for item in jobs["queue"] + jobs["running"]
+                          if item["-p"] == job["-p"]]
+
+                if queued:
+                    job = queued[0]
+                    reply = {"job_id": job["job_id"], "status": "duplicate"}
+
+                else:
+                    job["job_id"] = uuid.uuid4().hex[:12]
+                    job["conns"] = []
+                    jobs["queue"].append(job)
+                    reply = {"job_id": job["job_id"], "status": "queued"}
+
+                job_reply(conn, reply)
+
+                if wait:
+                    job["conns"].append(conn)
+                    keep = True
+
+            try:
+                os.write(jobs["wake"], b"j")
+
+            except OSError:
+                # Wake up pipe is full, the daemon is already woken up
+                pass
+
+    except (socket.error, OSError, ValueError, KeyError) as err:
+        job_reply(conn, {"status": "rejected", "error": str(err)})
+
+    if not keep:
+        conn.close()
+
+
+def job_listen(args, jobs, lsock):
+
+    """Function:  job_listen
+
+    Description:  Accept the clients submitting jobs on the daemon socket.
+        Runs in its own thread so clients get their job ids while a merge
+        is running.
+
+    Arguments:
+        (input) args -> ArgParser class instance of the daemon
+        (input) jobs -> Dictionary of the job queue
+        (input) lsock -> Listening Unix socket
+
+    """
+
+    while True:
+        try:
+            conn, _ = lsock.accept()
+
+        except (socket.error, OSError):
+            # Socket closed by the daemon
+            break
+
+        job_request(args, jobs, conn)
+
+
+def open_socket(sock_path, log):
+
+    """Function:  open_socket
+
+    Description:  Open the daemon's listening Unix socket.  A socket file
+        left by a daemon which is no longer running is replaced.
+
+    Arguments:
+        (input) sock_path -> Path of the Unix socket
+        (input) log -> Log class instance
+        (output) lsock -> Listening socket or None if not available
+
+    """
+
+    lsock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        if os.path.exists(sock_path):
+            try:
+                lsock.connect(sock_path)
+                log.log_err("open_socket:  Daemon already listening on: %s"
+                            % (sock_path))
+                lsock.close()
+                lsock = None
+
+            except (socket.error, OSError):
+                lsock.close()
+                lsock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                os.remove(sock_path)
+
+        if lsock:
+            lsock.bind(sock_path)
+            os.chmod(sock_path, 0o660)
+            lsock.listen(64)
+            log.log_info("open_socket:  Listening for jobs on: %s"
+                         % (sock_path))
+
+    except (socket.error, OSError) as err:
+        log.log_err("open_socket:  Unable to listen on %s: %s"
+                    % (sock_path, err))
+        lsock.close()
+        lsock = None
+
+    return lsock
+
+
+def run_job(args, cfg, log, job):
+
+    """Function:  run_job
+
+    Description:  Merge the project of a submitted job with the job's
+        options.
+
+    Arguments:
+        (input) args -> ArgParser class instance of the daemon
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (input) job -> Dictionary of the job
+        (output) status -> True|False|None - Merge status of project
+
+    """
+
+    to_line = cfg.to_line
+    job_args = copy.deepcopy(args)
+    job_args.insert_arg("-p", job["-p"])
+    job_args.insert_arg("-r", job.get("-r") or os.path.basename(job["-p"]))
+
+    for opt in ["-a", "-u"]:
+        if job.get(opt):
+            job_args.insert_arg(opt, True)
+
+    if job.get("-n"):
+        cfg.to_line = None
+
+    log.log_info("run_job:  Job %s merging: %s" % (job["job_id"], job["-p"]))
+
+    try:
+        status = run_merge(job_args, cfg, log)
+
+    except Exception as err:                            # pylint:disable=W0703
+        log.log_err("run_job:  Merge of %s raised: %s" % (job["-p"], err))
+        status = False
+
+    finally:
+        cfg.to_line = to_line
+
+    log.log_info("run_job:  Job %s merge status: %s" % (job["job_id"], status))
+
+    return status
+
+
+def submit_job(args):
+
+    """Function:  submit_job
+
+    Description:  Client mode:  Submit the merge of the projects as jobs to
+        the merge daemon over its Unix socket.  The configuration file is
+        not loaded and no log is opened.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) results -> Dictionary of project directory and job reply
 
     """
 
-    if gitr.chg_files:
-        log.log_info("quarantine:  Quarantine modified files")
-        quarantine_files(gitr, cfg, log, status="modified")
+    results = {}
+    proj_list = [os.path.abspath(item) for item in get_proj_list(args)]
 
-    if gitr.new_files:
-        log.log_info("quarantine:  Quarantine added files")
-        quarantine_files(gitr, cfg, log, status="added")
+    for proj_dir in proj_list:
+        job = {"-c": args.get_val("-c"),
+               "-d": os.path.abspath(args.get_val("-d")), "-p": proj_dir,
+               "-r": args.get_val("-r") if len(proj_list) == 1 else None,
+               "wait": args.arg_exist("-w")}
 
-    if gitr.rm_files:
-        log.log_info("quarantine:  Removed files detected")
-        log.log_info("quarantine:  Files detected:  %s" % (gitr.rm_files))
+        for opt in ["-a", "-n", "-u"]:
+            job[opt] = args.arg_exist(opt)
 
-        if cfg.to_line:
-            subj = "Removed files detected in Git Repo: %s" % (gitr.repo_name)
-            body = []
-            body.append("Git Repo: %s" % (gitr.repo_name))
-            body.append("Removed files detected: %s" % (gitr.rm_files))
-            body = post_body(gitr, body)
-            send_mail(cfg.to_line, subj, body)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
 
+        try:
+            sock.connect(args.get_val("-Q"))
+            sock.sendall((json.dumps(job) + "\n").encode("utf-8"))
+            f_sock = sock.makefile("r")
+            reply = json.loads(f_sock.readline())
+            print("%s:  Job id: %s  Status: %s"
+                  % (proj_dir, reply.get("job_id"), reply.get("status")))
 
-def merge_project(gitr, cfg, log, **kwargs):
+            if reply.get("job_id") and job["wait"]:
+                reply = json.loads(f_sock.readline())
+                print("%s:  Job id: %s  Merge status: %s"
+                      % (proj_dir, reply.get("job_id"), reply.get("status")))
 
-    """Function:  merge_project
+        except (socket.error, OSError, ValueError) as err:
+            reply = {"status": "error", "error": str(err)}
+            print("Error:  Unable to submit %s to %s: %s"
+                  % (proj_dir, args.get_val("-Q"), err))
 
-    Description:  Merge, and push the project to the remote Git repo.
+        finally:
+            sock.close()
+
+        results[proj_dir] = reply
+
+    return results
+
+
+def daemon_start(args, cfg, log):
+
+    """Function:  daemon_start
+
+    Description:  Set up the daemon's wake up pipe and SIGTERM handler, start
+        the pre-forked worker processes and open the job socket with its
+        listener thread.
 
     Arguments:
-        (input) gitr -> Git class instance
+        (input) args -> ArgParser class instance
         (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
-        (input) **kwargs:
-            allow -> True|False - Allow merge of unrelated histories
+        (output) daemon -> Dictionary of the wake up pipe, pre-forked pool,
+            job queue and job socket
 
     """
 
-    log.log_info("merge_project:  Fetching and setting up branches.")
-    status1, msg1 = gitr.priority_merge(allow=kwargs.get("allow", False))
+    daemon = {"pool": None, "lsock": None}
 
-    if status1:
-        log.log_info("merge_project:  Pushing changes to remote Git.")
-        status2, msg2 = gitr.git_pu()
+    # The wake up pipe is written to by submitted jobs and by stop_daemon
+    wake_fd, wake_w = os.pipe()
+    fcntl.fcntl(wake_fd, fcntl.F_SETFL, os.O_NONBLOCK)
+    fcntl.fcntl(wake_w, fcntl.F_SETFL, os.O_NONBLOCK)
+    daemon["wake_fd"] = wake_fd
+    DAEMON_STOP.update({"signum": None, "pid": os.getpid(), "wake": wake_w})
+    signal.signal(signal.SIGTERM, stop_daemon)
 
-        if status2:
-            log.log_info("merge_project:  Pushing tags to remote Git.")
-            status3, msg3 = gitr.git_pu(tags=True)
+    # Workers are forked before the listener thread is started
+    if int(getattr(cfg, "workers", 1)) > 1:
+        daemon["pool"] = prefork_start(args, cfg, log, int(cfg.workers))
 
-            if status3:
-                post_check(gitr, cfg, log)
+    daemon["jobs"] = {"lock": threading.Lock(), "queue": [], "running": [],
+                      "wake": wake_w}
 
-            else:
-                log.log_err("merge_project:  Fail to push tags to remote git.")
-                log.log_err("merge_project:  Status 3 Message: %s" % (msg3))
-                line_list = ["Failure to push tags to remote git."]
-                post_process(gitr, cfg, log, status3, line_list, msg3)
+    if getattr(cfg, "daemon_socket", None):
+        daemon["lsock"] = open_socket(cfg.daemon_socket, log)
 
-        else:
-            log.log_err("merge_project:  Fail to push to remote git.")
-            log.log_err("merge_project:  Status 2 Message: %s" % (msg2))
-            line_list = ["Failure to push to remote git."]
-            post_process(gitr, cfg, log, status2, line_list, msg2)
+    if daemon["lsock"]:
+        listener = threading.Thread(
+            target=job_listen, args=(args, daemon["jobs"], daemon["lsock"]))
+        listener.daemon = True
+        listener.start()
 
-    else:
-        log.log_err("merge_project:  Failure to merge branch %s into %s."
-                    % (gitr.mod_branch, gitr.branch))
-        log.log_err("merge_project:  Status 1 Message: %s" % (msg1))
-        line_list = ["Failure to merge branch %s into %s." % (gitr.mod_branch,
-                                                              gitr.branch)]
-        post_process(gitr, cfg, log, status1, line_list, msg1)
+    return daemon
 
 
-def process_project(gitr, cfg, log, **kwargs):
+def daemon_stop(cfg, log, daemon):
 
-    """Function:  process_project
+    """Function:  daemon_stop
 
-    Description:  Prepare for the merge of the project.
+    Description:  Close the daemon's job socket, send a not merged status to
+        the jobs not started, close the wake up pipe and stop the
+        pre-forked worker processes.
 
     Arguments:
-        (input) gitr -> Git class instance
         (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
-        (input) **kwargs:
-            allow -> True|False - Allow merge of unrelated histories
+        (input) daemon -> Dictionary of the wake up pipe, pre-forked pool,
+            job queue and job socket
 
     """
 
-    log.log_info("process_project:  Fetching and setting up branches.")
-    status1, msg1 = gitr.git_fetch()
+    jobs = daemon["jobs"]
+    DAEMON_STOP["wake"] = None
 
-    if status1:
-        log.log_info("process_project:  Renaming branch to: %s."
-                     % (gitr.mod_branch))
-        status2, msg2 = gitr.rename_br()
+    if daemon["lsock"]:
+        daemon["lsock"].close()
 
-        if status2:
-            log.log_info("process_project:  Checking out branch: %s."
-                         % (gitr.branch))
-            status3, msg3 = gitr.git_co()
+        if os.path.exists(cfg.daemon_socket):
+            os.remove(cfg.daemon_socket)
 
-            if status3:
-                merge_project(gitr, cfg, log, **kwargs)
+    # Jobs not started are not merged
+    with jobs["lock"]:
+        queued = jobs["queue"]
+        jobs["queue"] = []
 
-            else:
-                log.log_err("process_project:  Fail to checkout branch: %s."
-                            % (gitr.branch))
-                log.log_err("process_project:  Status 3 Message: %s" % (msg3))
-                line_list = ["Failure to checkout branch: %s." % (gitr.branch)]
-                post_process(gitr, cfg, log, status3, line_list, msg3)
+    for job in queued:
+        job_done(jobs, job, None)
 
-        else:
-            log.log_err("process_project:  Fail rename branch to: %s."
-                        % (gitr.mod_branch))
-            log.log_err("process_project:  Status 2 Message: %s" % (msg2))
-            line_list = ["Failure rename branch to: %s." % (gitr.mod_branch)]
-            post_process(gitr, cfg, log, status2, line_list, msg2)
+    os.close(daemon["wake_fd"])
+    os.close(jobs["wake"])
 
-    else:
-        log.log_err("process_project:  Fail to fetch from remote Git repo.")
-        log.log_err("process_project:  Status 1 Message: %s" % (msg1))
-        line_list = ["Failure to fetch from remote Git repo."]
-        post_process(gitr, cfg, log, status1, line_list, msg1)
+    if daemon["pool"]:
+        prefork_stop(daemon["pool"], log)
 
 
-def process_changes(gitr, cfg, log):
+def daemon_round(args, cfg, log, daemon, ready):
 
-    """Function:  process_changes
+    """Function:  daemon_round
 
-    Description:  Locate and process dirty and untracked files.
+    Description:  Merge the spool projects and the submitted jobs of one
+        daemon round, using the pre-forked worker processes if the daemon
+        has them.
 
     Arguments:
-        (input) gitr -> Git class instance
+        (input) args -> ArgParser class instance
         (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
+        (input) daemon -> Dictionary of the wake up pipe, pre-forked pool,
+            job queue and job socket
+        (input) ready -> List of spool project directories
+        (output) results -> Dictionary of spool project directory and merge
+            status
 
     """
 
-    if gitr.is_dirty() or gitr.is_untracked():
-        gitr.get_dirty()
-        gitr.get_untracked()
-        log.log_info("process_changes:  Quarantine process running")
-        quarantine(gitr, cfg, log)
-        log.log_info("process_changes:  Processing dirty files option: %s"
-                     % (cfg.dirty))
-        gitr.process_dirty(option=cfg.dirty)
-        log.log_info("process_changes:  Processing untracked files option: %s"
-                     % (cfg.untracked))
-        gitr.process_untracked(option=cfg.untracked)
+    jobs = daemon["jobs"]
 
+    if daemon["pool"]:
+        return prefork_round(daemon["pool"], log, ready, jobs)
 
-def detach_head(gitr, log):
+    results = merge_list(args, cfg, log, ready)
 
-    """Function:  detach_head
+    while jobs["queue"] and not DAEMON_STOP["signum"]:
+        with jobs["lock"]:
+            job = jobs["queue"].pop(0)
+            jobs["running"].append(job)
+
+        job_done(jobs, job, run_job(args, cfg, log, job))
+
+    return results
 
-    Description:  Detach the head from a git project, move the head to the
-        latest commit id and remove the existing branch.
+
+def daemon_merge(args, cfg, log):
+
+    """Function:  daemon_merge
+
+    Description:  Run as a daemon which watches the spool directory and merges
+        each project directory that is placed into it.  The configuration, log
+        and imported modules are kept between merges.
 
     Arguments:
-        (input) gitr -> Git class instance
+        (input) args -> ArgParser class instance
+        (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
-        (output) status -> True|False - Status of detaching head in project
-        (output) err_msg -> Error messages detected, if any
 
     """
 
-    status = True
-    err_msg = None
+    interval = int(getattr(cfg, "spool_interval", 60))
+    settle = int(getattr(cfg, "spool_settle", 30))
+    status, err_msg = gen_libs.chk_crt_dir(cfg.spool_dir, write=True,
+                                           read=True)
 
-    if len(gitr.gitrepo.branches) == 0:
-        log.log_info("detach_head:  Head already detached")
+    if not status:
+        log.log_err("daemon_merge:  %s" % (err_msg))
+        return
 
-    elif len(gitr.gitrepo.branches) == 1:
-        log.log_info("detach_head:  Detaching head...")
-        current_br = gitr.get_br_name()
-        head_status = gitr.detach_head()
+    fdesc = inotify_watch(cfg.spool_dir)
+    log.log_info("daemon_merge:  Watching %s using %s"
+                 % (cfg.spool_dir, "polling" if fdesc is None else "inotify"))
+    failed = {}
+    daemon = daemon_start(args, cfg, log)
 
-        if head_status:
-            log.log_info("detach_head:  Possible problem detected")
-            status = False
-            err_msg = "WARN: Message detected: %s" % (head_status)
+    try:
+        while not DAEMON_STOP["signum"]:
+            ready, pending = scan_spool(cfg.spool_dir, settle)
 
-        else:
-            log.log_info("detach_head:  Removing branch: %s" % (current_br))
-            status, err_msg = gitr.remove_branch(current_br, no_chk=True)
+            # Failed directories are only retried after they are modified and
+            #   directories removed since the scan are dropped
+            ready = [item for item in ready
+                     if dir_mtime(item) not in [None, failed.get(item)]]
+
+            if ready:
+                log.log_info("daemon_merge:  Projects to be merged: %s"
+                             % (ready))
+
+            results = daemon_round(args, cfg, log, daemon, ready)
+
+            for proj_dir, status in results.items():
+                mtime = dir_mtime(proj_dir) if status is False else None
+
+                if mtime is not None:
+                    failed[proj_dir] = mtime
+
+                else:
+                    failed.pop(proj_dir, None)
+
+            if not DAEMON_STOP["signum"]:
+                wait_spool(fdesc,
+                           min(interval, settle) if pending else interval,
+                           daemon["wake_fd"])
+
+    except KeyboardInterrupt:
+        DAEMON_STOP["signum"] = signal.SIGINT
+
+    finally:
+        log.log_info("daemon_merge:  Stopping daemon")
+
+        if fdesc is not None:
+            os.close(fdesc)
+
+        daemon_stop(cfg, log, daemon)
+
+
+def restore_archive(bundle_file, target_dir):
+
+    """Function:  restore_archive
+
+    Description:  Restore a Git repository from a bundle archive created by
+        archive_bundle.
+
+    Arguments:
+        (input) bundle_file -> Path name of the archive's bundle file
+        (input) target_dir -> Directory path to restore the repository to
+
+    """
+
+    dest_base = os.path.splitext(bundle_file)[0]
+
+    with open(dest_base + ".json") as f_hdlr:
+        state = json.load(f_hdlr)
+
+    # HEAD is fetched as well, a detached HEAD is in no other ref
+    gitrepo = git.Repo.init(target_dir)
+    gitrepo.git.fetch(bundle_file, "refs/*:refs/*", "HEAD",
+                      "--update-head-ok")
+
+    if state["branch"]:
+        gitrepo.git.checkout("-f", state["branch"])
 
     else:
-        log.log_warn("detach_head:  Multiple branches detected: %s"
-                     % (gitr.gitrepo.branches))
-        status = False
-        err_msg = "WARN:  Multiple branches detected: %s" \
-                  % (gitr.gitrepo.branches)
+        gitrepo.git.checkout("-f", "--detach", state["head"])
 
-    return status, err_msg
+    tar_file = dest_base + (
+        ".tar.zst" if state["compress"] == "zstd" else ".tar.gz")
+    tar, proc = open_tar(tar_file, "r", state["compress"])
 
+    try:
+        tar.extractall(target_dir)
 
-def merge(args, cfg, log):
+    finally:
+        close_tar(tar, proc)
 
-    """Function:  merge
+    for item in state["deleted"]:
+        if os.path.lexists(os.path.join(target_dir, item)):
+            os.remove(os.path.join(target_dir, item))
 
-    Description:  Controls the merging of a local repository with a remote
-        repository, but having the local repository as the priority
-        repository.
+
+def restore(args, cfg, log):                            # pylint:disable=W0613
+
+    """Function:  restore
+
+    Description:  Restore a Git repository from a bundle archive.  The
+        repository is restored to the -t directory or to the archive's path
+        name without the file extension.
 
     Arguments:
         (input) args -> ArgParser class instance
@@ -695,97 +4543,157 @@ def merge(args, cfg, log):
 
     """
 
-    log.log_info("merge:  Starting merge of:  %s" % (args.get_val("-r")))
-    arch_dir = os.path.join(
-        cfg.archive_dir, os.path.basename(args.get_val("-p")) + ".Original." +
-        datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d_%H%M%S"))
-    gen_libs.cp_dir(args.get_val("-p"), arch_dir)
-    log.log_info("merge:  Original repo dir copied to:  %s" % (arch_dir))
-    gen_libs.mv_file2(args.get_val("-p"), cfg.work_dir)
-    git_dir = os.path.join(cfg.work_dir, os.path.basename(args.get_val("-p")))
-
-    if is_git_repo(git_dir):
-        log.log_info("merge:  Updating Git config file")
-        giti = git_class.GitConfig(git_dir)
-        giti.set_user(cfg.name)
-        giti.set_email(cfg.email)
-        log.log_info("merge:  Processing: %s directory" % (git_dir))
+    bundle_file = args.get_val("-R")
+    target_dir = args.get_val(
+        "-t", def_val=os.path.splitext(bundle_file)[0])
+    log.log_info("restore:  Restoring %s to %s" % (bundle_file, target_dir))
 
-        # Use alias for servername
-        if args.arg_exist("-a"):
-            url = cfg.prefix + args.get_val("-r")
+    if os.path.exists(target_dir):
+        log.log_err("restore:  %s already exists" % (target_dir))
+        print("Error:  %s already exists" % (target_dir))
 
-        else:
-            url = cfg.prefix + cfg.git_server
+    else:
+        try:
+            restore_archive(bundle_file, target_dir)
+            log.log_info("restore:  Restore completed")
+            print("Restored archive to: %s" % (target_dir))
 
-        url = url + ":" + cfg.git_project + "/" + args.get_val("-r") + ".git"
-        gitr = git_class.GitMerge(
-            args.get_val("-r"), git_dir, url, cfg.branch, cfg.mod_branch)
-        gitr.create_gitrepo()
-        gitr.set_remote()
+        except (git.exc.GitCommandError, ValueError, KeyError, OSError,
+                IOError, tarfile.TarError) as err:
+            log.log_err("restore:  Restore failed: %s" % (err))
+            print("Error:  Restore failed: %s" % (err))
 
-        if gitr.is_remote():
-            cleanup_repo(gitr, cfg, log, allow=args.arg_exist("-u"))
 
-        else:
-            log.log_err("merge:  %s does not exist at remote repo."
-                        % (gitr.url))
-            line_list = ["Remote git repository does not exist"]
-            post_process(gitr, cfg, log, False, line_list)
+def ssh_mux_start(cfg, log):
+
+    """Function:  ssh_mux_start
+
+    Description:  Set up SSH connection multiplexing for the Git commands.
+        Each server or alias gets a single ControlMaster connection which is
+        reused by the ls-remote, fetch and push commands of all projects.
+
+    Arguments:
+        (input) cfg -> Configuration settings module for the program
+        (input) log -> Log class instance
+        (output) ctl_dir -> Directory of the control sockets or None
+
+    """
+
+    ctl_dir = None
+
+    if not getattr(cfg, "ssh_mux", False):
+        log.log_info("ssh_mux_start:  SSH multiplexing is disabled")
+
+    elif "GIT_SSH_COMMAND" in os.environ or "GIT_SSH" in os.environ:
+        log.log_warn("ssh_mux_start:  GIT_SSH_COMMAND or GIT_SSH already set,"
+                     " SSH multiplexing not used")
 
     else:
-        log.log_err("merge:  %s is not a local Git repository" % (git_dir))
+        # Short path as sockets are limited to about 100 characters, %n is
+        #   the server or alias name so each deploy key has its own master
+        ctl_dir = tempfile.mkdtemp(prefix="merge-repo-ssh.")
+        os.environ["GIT_SSH_COMMAND"] = \
+            "ssh -o ControlMaster=auto -o ControlPath='%s/%%r@%%n:%%p'" \
+            " -o ControlPersist=%s" % (
+                ctl_dir, getattr(cfg, "ssh_persist", 300))
+        log.log_info("ssh_mux_start:  SSH multiplexing in: %s" % (ctl_dir))
 
-        if cfg.to_line:
-            subj = "Merge error for: " + git_dir
-            body = ["Local directory is not a Git repository.",
-                    "Project Dir: " + git_dir]
-            body.append(
-                "DTG: " + datetime.datetime.strftime(
-                    datetime.datetime.now(), "%Y-%m-%d %H:%M:%S"))
-            send_mail(cfg.to_line, subj, body)
+    return ctl_dir
 
-        dest_dir = os.path.basename(git_dir) + "." \
-            + datetime.datetime.strftime(
-                datetime.datetime.now(), "%Y%m%d_%H%M%S")
-        gen_libs.mv_file2(git_dir, os.path.join(cfg.err_dir, dest_dir))
 
+def ssh_mux_stop(ctl_dir, log):
 
-def cleanup_repo(gitr, cfg, log, **kwargs):
+    """Function:  ssh_mux_stop
 
-    """Function:  cleanup_repo
+    Description:  Close the SSH ControlMaster connections and remove the
+        control socket directory.
 
-    Description:  Checks to ensure head is detached and there are not any dirty
-        or untracked changes before merging repository.
+    Arguments:
+        (input) ctl_dir -> Directory of the control sockets or None
+        (input) log -> Log class instance
+
+    """
+
+    if ctl_dir:
+        os.environ.pop("GIT_SSH_COMMAND", None)
+
+        with open(os.devnull, "w") as f_null:
+            for item in os.listdir(ctl_dir):
+                log.log_info("ssh_mux_stop:  Closing connection: %s" % (item))
+                subprocess.call(
+                    ["ssh", "-o", "ControlPath=" + os.path.join(ctl_dir, item),
+                     "-O", "exit", item], stdout=f_null, stderr=f_null)
+
+        shutil.rmtree(ctl_dir, ignore_errors=True)
+
+
+def mail_start(cfg, log):
+
+    """Function:  mail_start
+
+    Description:  Set up the mail spool and start the background sender of
+        the email notifications.  Messages left in the spool by an earlier
+        run are sent as well.
 
     Arguments:
-        (input) gitr -> Git class instance
         (input) cfg -> Configuration settings module for the program
         (input) log -> Log class instance
-        (input) **kwargs:
-            allow -> True|False - Allow merge of unrelated histories
+        (output) queue -> Dictionary of the mail spool and sender or None
 
     """
 
-    process_changes(gitr, cfg, log)
+    queue = None
+    spool_dir = getattr(cfg, "mail_spool", None)
+
+    if not spool_dir:
+        log.log_info("mail_start:  Email notifications are sent directly")
 
-    if not gitr.is_dirty() and not gitr.is_untracked():
-        status, err_msg = detach_head(gitr, log)
+    else:
+        status, err_msg = gen_libs.chk_crt_dir(
+            spool_dir, create=True, write=True, read=True)
 
         if status:
-            log.log_info("merge:  Processing project...")
-            process_project(gitr, cfg, log, **kwargs)
+            queue = {"spool_dir": spool_dir, "pid": os.getpid(),
+                     "wake": threading.Event(), "stop": threading.Event()}
+            queue["thread"] = threading.Thread(
+                target=mail_sender, args=(queue, cfg, log))
+            queue["thread"].daemon = True
+            queue["thread"].start()
+            MAIL_QUEUE.update(queue)
+            log.log_info("mail_start:  Mail spool in: %s" % (spool_dir))
 
         else:
-            log.log_err("merge:  Problem detected in detaching head.")
-            log.log_err("merge: Message: %s" % (err_msg))
-            line_list = [err_msg]
-            post_process(gitr, cfg, log, False, line_list)
+            log.log_warn("mail_start:  Mail spool not used, email"
+                         " notifications are sent directly: %s" % (err_msg))
+
+    return queue
 
-    else:
-        log.log_err("merge:  Still dirty entries in local repo.")
-        line_list = ["There is still dirty entries in local repo."]
-        post_process(gitr, cfg, log, False, line_list)
+
+def mail_stop(queue, log):
+
+    """Function:  mail_stop
+
+    Description:  Stop the background sender of the email notifications
+        after a last delivery attempt of the queued messages.  Messages not
+        sent stay in the mail spool for the next run.
+
+    Arguments:
+        (input) queue -> Dictionary of the mail spool and sender or None
+        (input) log -> Log class instance
+
+    """
+
+    if queue:
+        MAIL_QUEUE.clear()
+        queue["stop"].set()
+        queue["wake"].set()
+        queue["thread"].join(MAIL_POLL * 3)
+        left = [name for name in os.listdir(queue["spool_dir"])
+                if name.endswith(".mail")]
+
+        if left:
+            log.log_warn("mail_stop:  %s message(s) left in the mail spool"
+                         % (len(left)))
 
 
 def run_program(args, func_dict, **kwargs):
@@ -814,16 +4722,28 @@ def run_program(args, func_dict, **kwargs):
             cfg.log_file, cfg.log_file, "INFO",
             "%(asctime)s %(levelname)s %(message)s", "%Y-%m-%dT%H:%M:%SZ")
         str_val = "=" * 80
-        log.log_info("%s Initialized" % (args.get_val("-r")))
+        log.log_info("%s Initialized" % (args.get_val("-r", def_val="Batch")))
         log.log_info("%s" % (str_val))
-        log.log_info("Project:  %s" % (args.get_val("-r")))
-        log.log_info("Project Directory:  %s" % (args.get_val("-p")))
+        log.log_info("Project:  %s" % (args.get_val("-r", def_val="Batch")))
+        log.log_info("Project Directory:  %s"
+                     % (args.get_val("-p", def_val=args.get_val("-b"))))
         log.log_info("%s" % (str_val))
 
-        # Intersect args_array & func_dict to find which functions to call.
-        for opt in set(args.get_args_keys()) & set(func_dict.keys()):
-            func_dict[opt](args, cfg, log, **kwargs)
+        ctl_dir = ssh_mux_start(cfg, log)
+        queue = mail_start(cfg, log)
+
+        try:
+            # Intersect args_array & func_dict to find which functions to call.
+            for opt in set(args.get_args_keys()) & set(func_dict.keys()):
+                func_dict[opt](args, cfg, log, **kwargs)
+
+        finally:
+            mail_stop(queue, log)
+            ssh_mux_stop(ctl_dir, log)
 
+        log.log_info("run_program:  Import times: %s" % (", ".join(
+            ["%s=%.3fs" % (name, IMPORT_TIMES[name])
+             for name in sorted(IMPORT_TIMES)])))
         log.log_close()
 
     else:
@@ -844,6 +4764,7 @@ def main(**kwargs):
     Variables:
         dir_perms_chk -> contains directories and their octal permissions
         func_dict -> dictionary list for the function calls or other options
+        opt_multi_list -> contains the options that will have multiple values
         opt_req_list -> contains options that are required for the program
         opt_val_list -> contains options which require values
 
@@ -855,33 +4776,76 @@ def main(**kwargs):
     """
 
     sys.argv = kwargs.get("argv_list", sys.argv)
-    dir_perms_chk = {"-d": 5, "-p": 5}
+    dir_perms_chk = {"-b": 5, "-d": 5, "-p": 5}
     func_dict = {"-M": merge}
+    opt_multi_list = ["-p"]
     opt_req_list = ["-c", "-d", "-p", "-r"]
-    opt_val_list = ["-c", "-d", "-p", "-r"]
+    opt_val_list = ["-b", "-c", "-d", "-p", "-Q", "-r", "-R", "-t"]
 
     # Process argument list from command line
-    args = gen_class.ArgParser(sys.argv, opt_val=opt_val_list)
+    args = gen_class.ArgParser(
+        sys.argv, opt_val=opt_val_list, multi_val=opt_multi_list)
 
     if args.arg_parse2()                                            \
        and not gen_libs.help_func(args, __version__, help_message):
 
+        # Single project directory passed
+        if isinstance(args.get_val("-p"), list)                     \
+           and len(args.get_val("-p")) == 1:
+            args.insert_arg("-p", args.get_val("-p")[0])
+
+        batch = args.arg_exist("-b") or isinstance(args.get_val("-p"), list)
+
+        # Restore mode:  Repository is restored from a bundle archive
+        if args.arg_exist("-R"):
+            dir_perms_chk.pop("-p", None)
+            func_dict = {"-R": restore}
+            opt_req_list = ["-c", "-d"]
+            batch = False
+            args.insert_arg("-r", "restore")
+
+        # Daemon mode:  Project directories are taken from the spool_dir
+        elif args.arg_exist("-D"):
+            dir_perms_chk.pop("-p")
+            func_dict = {"-M": daemon_merge}
+            opt_req_list = ["-c", "-d"]
+
+            # Only a single daemon instance is locked in place
+            batch = False
+            args.insert_arg("-r", "daemon")
+
+        # Batch mode:  Project directories are checked in batch_merge
+        elif batch:
+            dir_perms_chk.pop("-p")
+            func_dict = {"-M": batch_merge}
+            opt_req_list = ["-c", "-d"]
+
         # Set Repo Name if not passed
-        if not args.arg_exist("-r") and args.arg_exist("-p"):
+        elif not args.arg_exist("-r") and args.arg_exist("-p"):
             args.insert_arg("-r", os.path.basename(args.get_val("-p")))
 
         if args.arg_require(opt_req=opt_req_list)           \
            and args.arg_dir_chk(dir_perms_chk=dir_perms_chk):
 
-            try:
-                prog_lock = gen_class.ProgramLock(
-                    sys.argv, args.get_val("-r", def_val=""))
+            # Client mode:  Jobs are merged and locked by the merge daemon
+            if args.arg_exist("-Q")                                 \
+               and not (args.arg_exist("-D") or args.arg_exist("-R")):
+                submit_job(args)
+
+            # Each project is locked separately in batch mode
+            elif batch:
                 run_program(args, func_dict)
-                del prog_lock
 
-            except gen_class.SingleInstanceException:
-                print("WARNING:  lock in place for merge with id of: %s"
-                      % (args.get_val("-r", def_val="")))
+            else:
+                try:
+                    prog_lock = gen_class.ProgramLock(
+                        sys.argv, args.get_val("-r", def_val=""))
+                    run_program(args, func_dict)
+                    del prog_lock
+
+                except gen_class.SingleInstanceException:
+                    print("WARNING:  lock in place for merge with id of: %s"
+                          % (args.get_val("-r", def_val="")))
 
 
 if __name__ == "__main__":
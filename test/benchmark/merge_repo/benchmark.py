@@ -0,0 +1,422 @@
+# Classification (U)
+
+"""Program:  benchmark.py
+
+    Description:  Benchmark of the merge_repo.py merge pipeline.  Generates a
+        synthetic incoming project and a local bare Git repository standing
+        in for the remote Git repository, runs the real merge end to end
+        through merge_repo.main and reports the timings of each merge stage
+        from the merge metrics file.
+
+    Usage:
+        test/benchmark/merge_repo/benchmark.py
+            [-F files] [-N commits] [-D dirty] [-U untracked] [-T tags]
+            [-B binary_kb] [-I iterations] [-W work_dir] [-K]
+            [-S setting=value [setting=value ...]] [-J json_file]
+
+    Arguments:
+        -F files => Number of text files in the project.  Default: 1000
+        -N commits => Number of commits in the project.  Default: 10
+        -D dirty => Number of dirty tracked files.  Default: 0
+        -U untracked => Number of untracked files.  Default: 0
+        -T tags => Number of tags in the project.  Default: 5
+        -B binary_kb => Size of a binary file added by each commit in KB.
+            Default: 0 (no binary files)
+        -I iterations => Number of merges to run.  Default: 3
+        -W work_dir => Directory in which the temporary benchmark directory
+            is made.  Default is the system temporary directory.
+        -K => Keep the benchmark directory when done.
+        -S setting=value => Configuration settings to override, such as
+            merge_mode='"index"' or fetch_mode='"branch"'.  The value is a
+            Python expression.
+        -J json_file => Write the results to a JSON file.
+
+    Notes:
+        The remote Git url of merge_repo.py is mapped onto the local bare
+        repositories with a url.<base>.insteadOf setting in a .gitconfig file
+        in the benchmark's HOME directory, so no network is used.
+        Run from the base directory where merge_repo.py is located.
+
+    Example:
+        test/benchmark/merge_repo/benchmark.py -F 5000 -N 20 -D 10 -U 10
+
+"""
+
+# Libraries and Global Variables
+from __future__ import print_function
+from __future__ import absolute_import
+
+# Standard
+import sys
+import os
+import json
+import random
+import shutil
+import subprocess
+import tempfile
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import lib.gen_class as gen_class           # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+REPO_NAME = "bench-repo"
+CFG_NAME = "bench_merge"
+
+
+def git_cmd(cwd, *args):
+
+    """Function:  git_cmd
+
+    Description:  Run a Git command for the generation of the repositories.
+
+    Arguments:
+        (input) cwd -> Directory to run the Git command in
+        (input) *args -> Git command and its arguments
+
+    """
+
+    subprocess.check_call(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@localhost",
+         "-c", "init.defaultBranch=develop"] + list(args),
+        cwd=cwd, stdout=subprocess.PIPE)
+
+
+def write_file(file_path, data):
+
+    """Function:  write_file
+
+    Description:  Write a file, creating its directory if needed.
+
+    Arguments:
+        (input) file_path -> File path
+        (input) data -> Text or bytes to write
+
+    """
+
+    if not os.path.isdir(os.path.dirname(file_path)):
+        os.makedirs(os.path.dirname(file_path))
+
+    with open(file_path, "wb" if isinstance(data, bytes) else "w") as f_hdlr:
+        f_hdlr.write(data)
+
+
+def text_name(indx):
+
+    """Function:  text_name
+
+    Description:  Relative path of a generated text file, 100 files per
+        directory.
+
+    Arguments:
+        (input) indx -> Index of the file
+        (output) Relative file path
+
+    """
+
+    return os.path.join("dir%04d" % (indx // 100), "file%06d.txt" % (indx))
+
+
+def gen_repos(bench_dir, settings):
+
+    """Function:  gen_repos
+
+    Description:  Generate the bare remote repository and the incoming
+        project.  The remote gets one commit after the project is cloned and
+        the project gets one commit, so the merge is a real merge.
+
+    Arguments:
+        (input) bench_dir -> Benchmark directory
+        (input) settings -> Dictionary of the generation settings
+        (output) proj_dir -> Path of the incoming project
+
+    """
+
+    remote = os.path.join(bench_dir, "remotes", REPO_NAME + ".git")
+    seed = os.path.join(bench_dir, "seed")
+    proj_dir = os.path.join(bench_dir, "incoming", REPO_NAME)
+    rand = random.Random(settings["files"])
+
+    for item in [remote, seed, proj_dir]:
+        if os.path.exists(item):
+            shutil.rmtree(item)
+
+    git_cmd(bench_dir, "init", "-q", "--bare", remote)
+    git_cmd(remote, "symbolic-ref", "HEAD", "refs/heads/develop")
+    git_cmd(bench_dir, "init", "-q", seed)
+    git_cmd(seed, "checkout", "-q", "-b", "develop")
+
+    for indx in range(settings["files"]):
+        write_file(os.path.join(seed, text_name(indx)),
+                   "line %s\n" % (indx) * 20)
+
+    for commit in range(settings["commits"]):
+        for indx in rand.sample(range(settings["files"]),
+                                max(1, settings["files"] // 100)):
+            write_file(os.path.join(seed, text_name(indx)),
+                       "commit %s line %s\n" % (commit, indx) * 20)
+
+        if settings["binary_kb"]:
+            write_file(os.path.join(seed, "bin", "blob%04d.bin" % (commit)),
+                       os.urandom(settings["binary_kb"] * 1024))
+
+        git_cmd(seed, "add", "-A")
+        git_cmd(seed, "commit", "-q", "-m", "Commit %s" % (commit))
+
+        if commit >= settings["commits"] - settings["tags"]:
+            git_cmd(seed, "tag", "v1.%s" % (commit))
+
+    git_cmd(seed, "push", "-q", "--tags", remote, "develop")
+    git_cmd(bench_dir, "clone", "-q", "-b", "develop", remote, proj_dir)
+
+    # Remote moves on after the project was taken
+    write_file(os.path.join(seed, text_name(0)), "remote change\n")
+    git_cmd(seed, "commit", "-q", "-a", "-m", "Remote change")
+    git_cmd(seed, "push", "-q", remote, "develop")
+
+    # Incoming changes, committed, dirty and untracked
+    write_file(os.path.join(proj_dir, text_name(settings["files"] - 1)),
+               "incoming change\n")
+    git_cmd(proj_dir, "commit", "-q", "-a", "-m", "Incoming change")
+    git_cmd(proj_dir, "tag", "v2.0")
+
+    for indx in range(min(settings["dirty"], settings["files"])):
+        write_file(os.path.join(proj_dir, text_name(indx)), "dirty\n")
+
+    for indx in range(settings["untracked"]):
+        write_file(os.path.join(proj_dir, "untracked", "new%06d.txt"
+                                % (indx)), "untracked\n")
+
+    return proj_dir
+
+
+def write_cfg(bench_dir, overrides):
+
+    """Function:  write_cfg
+
+    Description:  Write the merge_repo configuration file and the Git url
+        mapping of the remote Git url onto the local bare repositories.
+
+    Arguments:
+        (input) bench_dir -> Benchmark directory
+        (input) overrides -> List of setting=value configuration overrides
+        (output) cfg_dir -> Directory of the configuration file
+
+    """
+
+    cfg_dir = os.path.join(bench_dir, "config")
+    lines = [
+        'git_project="proj"', 'git_server="bench"', 'prefix=""',
+        'to_line=None', 'name="gituser"', 'email="gituser@localhost"',
+        'branch="develop"', 'mod_branch="mod_release"', 'dirty="revert"',
+        'untracked="remove"', 'ssh_mux=False', 'workers=1']
+
+    for name in ["work_dir", "err_dir", "archive_dir", "quar_dir"]:
+        if not os.path.isdir(os.path.join(bench_dir, name)):
+            os.makedirs(os.path.join(bench_dir, name))
+
+        lines.append('%s="%s"' % (name, os.path.join(bench_dir, name)))
+
+    if not os.path.isdir(cfg_dir):
+        os.makedirs(cfg_dir)
+
+    lines.append('log_file="%s"' % (os.path.join(bench_dir, "merge.log")))
+    lines.append('metrics_file="%s"'
+                 % (os.path.join(bench_dir, "metrics.json")))
+    write_file(os.path.join(cfg_dir, CFG_NAME + ".py"),
+               "\n".join(lines + list(overrides)) + "\n")
+    write_file(os.path.join(bench_dir, ".gitconfig"),
+               '[url "%s/"]\n\tinsteadOf = bench:proj/\n'
+               % (os.path.join(bench_dir, "remotes")))
+
+    return cfg_dir
+
+
+def run_merge(bench_dir, cfg_dir, proj_dir):
+
+    """Function:  run_merge
+
+    Description:  Run a merge of the project through merge_repo.main and
+        return its metrics record.
+
+    Arguments:
+        (input) bench_dir -> Benchmark directory
+        (input) cfg_dir -> Directory of the configuration file
+        (input) proj_dir -> Path of the incoming project
+        (output) record -> Dictionary of the merge metrics
+        (output) elapsed -> Wall clock seconds of the run
+
+    """
+
+    metrics_file = os.path.join(bench_dir, "metrics.json")
+    start = time.time()
+    merge_repo.main(argv_list=[
+        "merge_repo.py", "-c", CFG_NAME, "-d", cfg_dir, "-p", proj_dir,
+        "-r", REPO_NAME, "-M", "-n"])
+    elapsed = time.time() - start
+    record = {}
+
+    if os.path.isfile(metrics_file):
+        with open(metrics_file) as f_hdlr:
+            lines = f_hdlr.read().splitlines()
+
+        record = json.loads(lines[-1]) if lines else {}
+
+    return record, elapsed
+
+
+def summarize(records):
+
+    """Function:  summarize
+
+    Description:  Summarize the stage timings of the merges as minimum,
+        median and maximum seconds.
+
+    Arguments:
+        (input) records -> List of merge metrics records
+        (output) summary -> Dictionary of stage and (min, median, max)
+
+    """
+
+    summary = {}
+    stages = set()
+
+    for record in records:
+        stages.update(record.get("stages", {}))
+
+    for stage in stages:
+        values = sorted([record.get("stages", {}).get(stage, 0.0)
+                         for record in records])
+        summary[stage] = (values[0], values[len(values) // 2], values[-1])
+
+    return summary
+
+
+def print_report(settings, records, walls):
+
+    """Function:  print_report
+
+    Description:  Print the benchmark report.
+
+    Arguments:
+        (input) settings -> Dictionary of the generation settings
+        (input) records -> List of merge metrics records
+        (input) walls -> List of wall clock seconds of the merges
+
+    """
+
+    summary = summarize(records)
+    print("Benchmark:  %s" % (", ".join(
+        ["%s=%s" % (key, settings[key]) for key in sorted(settings)])))
+    print("Merges:  %s  Succeeded:  %s"
+          % (len(records), len([rec for rec in records if rec.get("status")])))
+    print("%-16s %10s %10s %10s" % ("Stage", "Min", "Median", "Max"))
+
+    for stage in sorted(summary, key=lambda item: -summary[item][1]):
+        print("%-16s %10.3f %10.3f %10.3f" % ((stage,) + summary[stage]))
+
+    walls = sorted(walls)
+    print("%-16s %10.3f %10.3f %10.3f"
+          % ("wall", walls[0], walls[len(walls) // 2], walls[-1]))
+
+    for record in records:
+        if not record.get("status"):
+            print("Failed merge at stage:  %s" % (record.get("failed_stage")))
+
+
+def run_benchmark(args):
+
+    """Function:  run_benchmark
+
+    Description:  Generate the repositories and run the merges.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+
+    """
+
+    settings = {
+        "files": int(args.get_val("-F", def_val=1000)),
+        "commits": int(args.get_val("-N", def_val=10)),
+        "dirty": int(args.get_val("-D", def_val=0)),
+        "untracked": int(args.get_val("-U", def_val=0)),
+        "tags": int(args.get_val("-T", def_val=5)),
+        "binary_kb": int(args.get_val("-B", def_val=0))}
+    overrides = args.get_val("-S", def_val=[])
+    overrides = [overrides] if not isinstance(overrides, list) else overrides
+    records = []
+    walls = []
+
+    work_dir = None
+
+    if args.arg_exist("-W"):
+        work_dir = os.path.abspath(args.get_val("-W"))
+
+        if not os.path.isdir(work_dir):
+            os.makedirs(work_dir)
+
+    # Only the directory made here is removed, never the -W directory
+    bench_dir = tempfile.mkdtemp(prefix="merge-repo-bench.", dir=work_dir)
+
+    # Git and merge_repo.py pick up the url mapping from HOME
+    os.environ["HOME"] = bench_dir
+    cfg_dir = write_cfg(bench_dir, overrides)
+
+    try:
+        for _ in range(int(args.get_val("-I", def_val=3))):
+            proj_dir = gen_repos(bench_dir, settings)
+            record, elapsed = run_merge(bench_dir, cfg_dir, proj_dir)
+            records.append(record)
+            walls.append(elapsed)
+
+        print_report(settings, records, walls)
+
+        if args.arg_exist("-J"):
+            with open(args.get_val("-J"), "w") as f_hdlr:
+                json.dump({"settings": settings, "overrides": overrides,
+                           "records": records, "walls": walls,
+                           "summary": summarize(records)}, f_hdlr,
+                          indent=2, sort_keys=True)
+
+    finally:
+        if not args.arg_exist("-K"):
+            shutil.rmtree(bench_dir, ignore_errors=True)
+
+        else:
+            print("Benchmark files kept in:  %s" % (bench_dir))
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Initializes program-wide used variables and processes command
+        line arguments and values.
+
+    Variables:
+        opt_multi_list -> contains the options that will have multiple values
+        opt_val_list -> contains options which require values
+
+    Arguments:
+        (input) argv -> Arguments from the command line
+
+    """
+
+    opt_multi_list = ["-S"]
+    opt_val_list = ["-B", "-D", "-F", "-I", "-J", "-N", "-S", "-T", "-U",
+                    "-W"]
+
+    # Process argument list from command line
+    args = gen_class.ArgParser(
+        sys.argv, opt_val=opt_val_list, multi_val=opt_multi_list)
+
+    if args.arg_parse2():
+        run_benchmark(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# Classification (U)
+
+"""Program:  add_counter.py
+
+    Description:  Unit testing of add_counter in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/add_counter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_new_counter
+        test_existing_counter
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.RUN_METRICS.clear()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.RUN_METRICS.clear()
+
+    def test_new_counter(self):
+
+        """Function:  test_new_counter
+
+        Description:  Test with a counter not yet set.
+
+        Arguments:
+
+        """
+
+        merge_repo.add_counter("quar_files", 1)
+
+        self.assertEqual(merge_repo.RUN_METRICS["counters"],
+                         {"quar_files": 1})
+
+    def test_existing_counter(self):
+
+        """Function:  test_existing_counter
+
+        Description:  Test with a counter already set.
+
+        Arguments:
+
+        """
+
+        merge_repo.RUN_METRICS["counters"] = {"copy_bytes": 100}
+        merge_repo.add_counter("copy_bytes", 50)
+
+        self.assertEqual(merge_repo.RUN_METRICS["counters"],
+                         {"copy_bytes": 150})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Classification (U)
+
+"""Program:  add_record.py
+
+    Description:  Unit testing of add_record in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/add_record.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_first_record
+        test_failed_record
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.record = {"status": True, "failed_stage": None,
+                       "stages": {"fetch": 0.7},
+                       "counters": {"copy_files": 3, "copy_bytes": 100}}
+        self.state = {"attempted": 4, "copy_bytes": 50, "last_run": 100,
+                      "stages": {"fetch": {"buckets": [1] * 9, "sum": 0.05,
+                                           "count": 1}}}
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=200.5))
+    def test_first_record(self):
+
+        """Function:  test_first_record
+
+        Description:  Test with a successful merge and no previous metrics.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.add_record({}, self.record),
+            {"attempted": 1, "succeeded": 1, "last_run": 200,
+             "last_success": 200, "copy_files": 3, "copy_bytes": 100,
+             "stages": {"fetch": {"buckets": [0, 0, 1, 1, 1, 1, 1, 1, 1],
+                                  "sum": 0.7, "count": 1}}})
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=200.5))
+    def test_failed_record(self):
+
+        """Function:  test_failed_record
+
+        Description:  Test with a failed merge added to previous metrics.
+
+        Arguments:
+
+        """
+
+        self.record["status"] = False
+        self.record["failed_stage"] = "push"
+
+        state = merge_repo.add_record(self.state, self.record)
+
+        self.assertEqual(state["attempted"], 5)
+        self.assertEqual(state["last_run"], 200)
+        self.assertNotIn("last_success", state)
+        self.assertEqual(state["failed"], {"push": 1})
+        self.assertEqual(state["copy_bytes"], 150)
+        self.assertEqual(state["stages"]["fetch"]["count"], 2)
+        self.assertEqual(state["stages"]["fetch"]["buckets"],
+                         [1, 1, 2, 2, 2, 2, 2, 2, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  archive_bundle.py
+
+    Description:  Unit testing of archive_bundle in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/archive_bundle.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_gzip
+        test_zstd
+        test_zstd_missing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.git_dir = "/directory/git_repo"
+        self.dest_base = "/archive_dir/git_repo.20260101_120000"
+        self.state = {
+            "head": "abc123", "branch": "master", "changed": ["file1"],
+            "deleted": [], "others": ["file2"]}
+        self.tar = mock.Mock()
+        self.results = [self.dest_base + ".bundle",
+                        self.dest_base + ".tar.gz", self.dest_base + ".json"]
+        self.results2 = [self.dest_base + ".bundle",
+                         self.dest_base + ".tar.zst",
+                         self.dest_base + ".json"]
+
+    @mock.patch("merge_repo.json.dump", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    @mock.patch("merge_repo.close_tar", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open_tar")
+    @mock.patch("merge_repo.git.Repo")
+    @mock.patch("merge_repo.get_worktree_state")
+    def test_gzip(self, mock_state, mock_repo, mock_tar):
+
+        """Function:  test_gzip
+
+        Description:  Test with gzip compression.
+
+        Arguments:
+
+        """
+
+        mock_state.return_value = self.state
+        mock_tar.return_value = (self.tar, None)
+
+        self.assertEqual(
+            merge_repo.archive_bundle(self.git_dir, self.dest_base),
+            self.results)
+        self.assertTrue(mock_repo.return_value.git.bundle.called)
+        self.assertEqual(self.tar.add.call_count, 3)
+
+    @mock.patch("merge_repo.find_program", mock.Mock(return_value="zstd"))
+    @mock.patch("merge_repo.json.dump", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    @mock.patch("merge_repo.close_tar", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open_tar")
+    @mock.patch("merge_repo.git.Repo", mock.Mock())
+    @mock.patch("merge_repo.get_worktree_state")
+    def test_zstd(self, mock_state, mock_tar):
+
+        """Function:  test_zstd
+
+        Description:  Test with zstd compression.
+
+        Arguments:
+
+        """
+
+        mock_state.return_value = self.state
+        mock_tar.return_value = (self.tar, mock.Mock())
+
+        self.assertEqual(
+            merge_repo.archive_bundle(self.git_dir, self.dest_base, "zstd"),
+            self.results2)
+
+    @mock.patch("merge_repo.find_program", mock.Mock(return_value=None))
+    @mock.patch("merge_repo.json.dump", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    @mock.patch("merge_repo.close_tar", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open_tar")
+    @mock.patch("merge_repo.git.Repo", mock.Mock())
+    @mock.patch("merge_repo.get_worktree_state")
+    def test_zstd_missing(self, mock_state, mock_tar):
+
+        """Function:  test_zstd_missing
+
+        Description:  Test with zstd program not installed.
+
+        Arguments:
+
+        """
+
+        mock_state.return_value = self.state
+        mock_tar.return_value = (self.tar, None)
+
+        self.assertEqual(
+            merge_repo.archive_bundle(self.git_dir, self.dest_base, "zstd"),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,298 @@
+# Classification (U)
+
+"""Program:  archive_original.py
+
+    Description:  Unit testing of archive_original in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/archive_original.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        insert_arg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.archive_dir = "/data/merge-repo/archive_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default_copy
+        test_unknown_strategy
+        test_reflink
+        test_archive_dir
+        test_bundle
+        test_bundle_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "config_file", "-d": "config_dir", "-r": "repo-name",
+            "-p": "/directory/repo-name", "-M": True}
+        self.counts = {"reflink": 2, "hardlink": 0, "copy": 1, "symlink": 0}
+
+    @mock.patch("merge_repo.add_counter")
+    @mock.patch("merge_repo.dir_usage")
+    @mock.patch("merge_repo.snapshot_dir")
+    @mock.patch("merge_repo.gen_libs.cp_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_default_copy(                              # pylint:disable=R0913
+            self, mock_log, mock_copy, mock_snap, mock_usage, mock_counter):
+
+        """Function:  test_default_copy
+
+        Description:  Test with no snapshot setting in configuration.
+
+        Arguments:
+
+        """
+
+        mock_copy.return_value = True
+        mock_usage.return_value = (3, 60)
+
+        arch_dir = merge_repo.archive_original(self.args, self.cfg, mock_log)
+
+        self.assertTrue(mock_copy.called)
+        self.assertFalse(mock_snap.called)
+        mock_usage.assert_called_once_with(arch_dir)
+        self.assertEqual(mock_counter.call_args_list,
+                         [mock.call("copy_files", 3),
+                          mock.call("copy_bytes", 60)])
+
+    @mock.patch("merge_repo.add_counter", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.dir_usage", mock.Mock(return_value=(3, 60)))
+    @mock.patch("merge_repo.snapshot_dir")
+    @mock.patch("merge_repo.gen_libs.cp_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_unknown_strategy(self, mock_log, mock_copy, mock_snap):
+
+        """Function:  test_unknown_strategy
+
+        Description:  Test with an unknown snapshot strategy.
+
+        Arguments:
+
+        """
+
+        self.cfg.snapshot = "unknown"
+
+        mock_copy.return_value = True
+
+        merge_repo.archive_original(self.args, self.cfg, mock_log)
+
+        self.assertTrue(mock_copy.called)
+        self.assertFalse(mock_snap.called)
+
+    @mock.patch("merge_repo.add_counter")
+    @mock.patch("merge_repo.dir_usage")
+    @mock.patch("merge_repo.snapshot_dir")
+    @mock.patch("merge_repo.gen_libs.cp_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_reflink(                                   # pylint:disable=R0913
+            self, mock_log, mock_copy, mock_snap, mock_usage, mock_counter):
+
+        """Function:  test_reflink
+
+        Description:  Test with reflink snapshot strategy.
+
+        Arguments:
+
+        """
+
+        self.cfg.snapshot = "reflink"
+
+        mock_snap.return_value = (self.counts, 60)
+
+        merge_repo.archive_original(self.args, self.cfg, mock_log)
+
+        self.assertFalse(mock_copy.called)
+        self.assertFalse(mock_usage.called)
+        self.assertEqual(mock_snap.call_args[0][2], "reflink")
+        self.assertEqual(mock_counter.call_args_list,
+                         [mock.call("copy_files", 3),
+                          mock.call("copy_bytes", 60)])
+
+    @mock.patch("merge_repo.add_counter", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.dir_usage", mock.Mock(return_value=(3, 60)))
+    @mock.patch("merge_repo.gen_libs.cp_dir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_archive_dir(self, mock_log):
+
+        """Function:  test_archive_dir
+
+        Description:  Test with archive directory path returned.
+
+        Arguments:
+
+        """
+
+        arch_dir = merge_repo.archive_original(self.args, self.cfg, mock_log)
+
+        self.assertTrue(arch_dir.startswith(
+            "/data/merge-repo/archive_dir/repo-name.Original."))
+
+    @mock.patch("merge_repo.archive_project")
+    @mock.patch("merge_repo.gen_libs.cp_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_bundle(self, mock_log, mock_copy, mock_arch):
+
+        """Function:  test_bundle
+
+        Description:  Test with bundle archive format.
+
+        Arguments:
+
+        """
+
+        self.cfg.archive_format = "bundle"
+
+        mock_arch.return_value = True
+
+        merge_repo.archive_original(self.args, self.cfg, mock_log)
+
+        self.assertFalse(mock_copy.called)
+
+    @mock.patch("merge_repo.add_counter", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.dir_usage", mock.Mock(return_value=(3, 60)))
+    @mock.patch("merge_repo.archive_project")
+    @mock.patch("merge_repo.gen_libs.cp_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_bundle_failed(self, mock_log, mock_copy, mock_arch):
+
+        """Function:  test_bundle_failed
+
+        Description:  Test with bundle archive failing.
+
+        Arguments:
+
+        """
+
+        self.cfg.archive_format = "bundle"
+
+        mock_arch.return_value = False
+
+        merge_repo.archive_original(self.args, self.cfg, mock_log)
+
+        self.assertTrue(mock_copy.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  archive_project.py
+
+    Description:  Unit testing of archive_project in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/archive_project.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.archive_dir = "/data/merge-repo/archive_dir"
+        self.archive_compress = "gzip"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_archived
+        test_archive_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.git_dir = "/directory/git_repo"
+        self.dest_base = "/archive_dir/git_repo.20260101_120000"
+
+    @mock.patch("merge_repo.os.path.getsize", mock.Mock(return_value=40))
+    @mock.patch("merge_repo.add_counter")
+    @mock.patch("merge_repo.archive_bundle")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_archived(self, mock_log, mock_arch, mock_counter):
+
+        """Function:  test_archived
+
+        Description:  Test with project archived as a bundle.
+
+        Arguments:
+
+        """
+
+        mock_arch.return_value = [self.dest_base + ".bundle",
+                                  self.dest_base + ".tar.gz"]
+
+        self.assertTrue(merge_repo.archive_project(
+            self.git_dir, self.dest_base, self.cfg, mock_log))
+        self.assertEqual(mock_counter.call_args_list,
+                         [mock.call("copy_files", 2),
+                          mock.call("copy_bytes", 80)])
+
+    @mock.patch("merge_repo.add_counter")
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.path.isfile")
+    @mock.patch("merge_repo.archive_bundle")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_archive_failed(self, mock_log, mock_arch, mock_isfile,
+                            mock_remove, mock_counter):
+
+        """Function:  test_archive_failed
+
+        Description:  Test with bundle archive failing.
+
+        Arguments:
+
+        """
+
+        mock_arch.side_effect = OSError("Error Message")
+        mock_isfile.side_effect = [True, True, False, False]
+
+        self.assertFalse(merge_repo.archive_project(
+            self.git_dir, self.dest_base, self.cfg, mock_log))
+        self.assertEqual(mock_remove.call_count, 2)
+        self.assertFalse(mock_counter.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  async_git.py
+
+    Description:  Unit testing of async_git in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/async_git.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+@unittest.skipIf(merge_repo.asyncio is None, "Requires asyncio")
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_commands
+        test_commands_run
+        test_command_not_found
+        test_limit
+        test_concurrent
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cmd = [sys.executable, "-c",
+                    "import sys; sys.stderr.write('Error'); sys.exit(1)"]
+        self.cmd2 = [sys.executable, "-c", "import sys; sys.exit(0)"]
+        self.cmd3 = ["/nonexistent/git"]
+        self.cmd4 = [sys.executable, "-c", "import time; time.sleep(0.2)"]
+
+    def test_no_commands(self):
+
+        """Function:  test_no_commands
+
+        Description:  Test with no commands to run.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.async_git([], 4), [])
+
+    def test_commands_run(self):
+
+        """Function:  test_commands_run
+
+        Description:  Test with the results in the order of the commands.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.async_git([self.cmd, self.cmd2], 4),
+                         [(1, "Error"), (0, "")])
+
+    def test_command_not_found(self):
+
+        """Function:  test_command_not_found
+
+        Description:  Test with a command which cannot be run.
+
+        Arguments:
+
+        """
+
+        results = merge_repo.async_git([self.cmd3, self.cmd2], 4)
+
+        self.assertIsNone(results[0][0])
+        self.assertEqual(results[1], (0, ""))
+
+    def test_limit(self):
+
+        """Function:  test_limit
+
+        Description:  Test with one command run at a time.
+
+        Arguments:
+
+        """
+
+        start = time.time()
+        merge_repo.async_git([self.cmd4] * 3, 1)
+
+        self.assertGreaterEqual(time.time() - start, 0.6)
+
+    def test_concurrent(self):
+
+        """Function:  test_concurrent
+
+        Description:  Test with the commands run at the same time.
+
+        Arguments:
+
+        """
+
+        start = time.time()
+        merge_repo.async_git([self.cmd4] * 3, 3)
+
+        self.assertLess(time.time() - start, 0.6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,279 @@
+# Classification (U)
+
+"""Program:  batch_merge.py
+
+    Description:  Unit testing of batch_merge in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/batch_merge.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        insert_arg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_projects
+        test_not_directory
+        test_merge_exception
+        test_merge_locked
+        test_multiple_projects
+        test_workers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "config_file", "-d": "config_dir", "-M": True,
+            "-p": ["/directory/repo-name", "/directory/repo-name2"]}
+        self.proj_list = ["/directory/repo-name", "/directory/repo-name2"]
+        self.results = {"/directory/repo-name": True,
+                        "/directory/repo-name2": False}
+        self.results2 = {"/directory/repo-name": False,
+                         "/directory/repo-name2": False}
+        self.results3 = {"/directory/repo-name": None,
+                         "/directory/repo-name2": True}
+
+    @mock.patch("merge_repo.get_proj_list", mock.Mock(return_value=[]))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_no_projects(self, mock_log):
+
+        """Function:  test_no_projects
+
+        Description:  Test with no projects to merge.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.batch_merge(self.args, self.cfg, mock_log), {})
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_not_directory(self, mock_log, mock_list):
+
+        """Function:  test_not_directory
+
+        Description:  Test with project paths that are not directories.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.proj_list
+
+        self.assertEqual(
+            merge_repo.batch_merge(self.args, self.cfg, mock_log),
+            self.results2)
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_merge_exception(self, mock_log, mock_list, mock_merge):
+
+        """Function:  test_merge_exception
+
+        Description:  Test with the merge of a project raising an exception.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.proj_list
+        mock_merge.side_effect = [True, OSError("Error Message")]
+
+        self.assertEqual(
+            merge_repo.batch_merge(self.args, self.cfg, mock_log),
+            self.results)
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_merge_locked(self, mock_log, mock_list, mock_merge):
+
+        """Function:  test_merge_locked
+
+        Description:  Test with a project locked by another instance.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.proj_list
+        mock_merge.side_effect = [None, True]
+
+        self.assertEqual(
+            merge_repo.batch_merge(self.args, self.cfg, mock_log),
+            self.results3)
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_multiple_projects(self, mock_log, mock_list, mock_merge):
+
+        """Function:  test_multiple_projects
+
+        Description:  Test with multiple projects merged.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.proj_list
+        mock_merge.side_effect = [True, False]
+
+        self.assertEqual(
+            merge_repo.batch_merge(self.args, self.cfg, mock_log),
+            self.results)
+
+    @mock.patch("merge_repo.pool_merge")
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_workers(self, mock_log, mock_list, mock_pool):
+
+        """Function:  test_workers
+
+        Description:  Test with projects merged by multiple workers.
+
+        Arguments:
+
+        """
+
+        self.cfg.workers = 2
+
+        mock_list.return_value = self.proj_list
+        mock_pool.return_value = self.results
+
+        self.assertEqual(
+            merge_repo.batch_merge(self.args, self.cfg, mock_log),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,6 +27,24 @@ import version                                  # pylint:disable=E0401,C0413
 __version__ = version.__version__
 
 
+def process_changes(gitr, cfg, log):
+
+    """Function:  process_changes
+
+    Description:  This is a function stub for merge_repo.process_changes.
+
+    Arguments:
+
+    """
+
+    new_files = ("file_name",) if gitr.untracked else ()
+
+    if cfg and log:
+        new_files = tuple(new_files)
+
+    return merge_repo.GitStatus(gitr.dirty, (), new_files, ())
+
+
 class GitMerge(object):                                 # pylint:disable=R0205
 
     """Class:  GitMerge
@@ -208,7 +226,8 @@ class UnitTest(unittest.TestCase):
         self.gitr = GitMerge()
         self.cfg = CfgTest()
 
-    @mock.patch("merge_repo.process_changes", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.process_changes",
+                mock.Mock(side_effect=process_changes))
     @mock.patch("merge_repo.post_process", mock.Mock(return_value=True))
     @mock.patch("merge_repo.gen_class.Logger")
     def test_both_true(self, mock_log):
@@ -229,7 +248,8 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             merge_repo.cleanup_repo(self.gitr, self.cfg, mock_log))
 
-    @mock.patch("merge_repo.process_changes", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.process_changes",
+                mock.Mock(side_effect=process_changes))
     @mock.patch("merge_repo.post_process", mock.Mock(return_value=True))
     @mock.patch("merge_repo.gen_class.Logger")
     def test_is_untracked_true(self, mock_log):
@@ -250,7 +270,8 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             merge_repo.cleanup_repo(self.gitr, self.cfg, mock_log))
 
-    @mock.patch("merge_repo.process_changes", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.process_changes",
+                mock.Mock(side_effect=process_changes))
     @mock.patch("merge_repo.post_process", mock.Mock(return_value=True))
     @mock.patch("merge_repo.gen_class.Logger")
     def test_is_dirty_true(self, mock_log):
@@ -271,7 +292,8 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             merge_repo.cleanup_repo(self.gitr, self.cfg, mock_log))
 
-    @mock.patch("merge_repo.process_changes", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.process_changes",
+                mock.Mock(side_effect=process_changes))
     @mock.patch("merge_repo.process_project", mock.Mock(return_value=True))
     @mock.patch("merge_repo.post_process", mock.Mock(return_value=True))
     @mock.patch("merge_repo.detach_head")
@@ -296,7 +318,8 @@ class UnitTest(unittest.TestCase):
             merge_repo.cleanup_repo(self.gitr, self.cfg, mock_log))
 
     @mock.patch("merge_repo.process_project", mock.Mock(return_value=True))
-    @mock.patch("merge_repo.process_changes", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.process_changes",
+                mock.Mock(side_effect=process_changes))
     @mock.patch("merge_repo.detach_head")
     @mock.patch("merge_repo.gen_class.Logger")
     def test_detach_head_true(self, mock_log, mock_head):
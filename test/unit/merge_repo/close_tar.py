@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  close_tar.py
+
+    Description:  Unit testing of close_tar in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/close_tar.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_process
+        test_process
+        test_process_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tar = mock.Mock()
+        self.proc = mock.Mock()
+        self.proc.wait.return_value = 0
+
+    def test_no_process(self):
+
+        """Function:  test_no_process
+
+        Description:  Test with no zstd process.
+
+        Arguments:
+
+        """
+
+        merge_repo.close_tar(self.tar, None)
+
+        self.assertTrue(self.tar.close.called)
+
+    def test_process(self):
+
+        """Function:  test_process
+
+        Description:  Test with zstd process.
+
+        Arguments:
+
+        """
+
+        merge_repo.close_tar(self.tar, self.proc)
+
+        self.assertTrue(self.proc.stdin.close.called)
+        self.assertTrue(self.proc.wait.called)
+
+    def test_process_failed(self):
+
+        """Function:  test_process_failed
+
+        Description:  Test with zstd process exiting with an error.
+
+        Arguments:
+
+        """
+
+        self.proc.wait.return_value = 1
+
+        self.assertRaises(
+            IOError, merge_repo.close_tar, self.tar, self.proc)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,6 +25,98 @@ coverage run -a --source=merge_repo test/unit/merge_repo/quarantine.py
 coverage run -a --source=merge_repo test/unit/merge_repo/post_body.py
 coverage run -a --source=merge_repo test/unit/merge_repo/help_message.py
 coverage run -a --source=merge_repo test/unit/merge_repo/run_program.py
+coverage run -a --source=merge_repo test/unit/merge_repo/get_proj_list.py
+coverage run -a --source=merge_repo test/unit/merge_repo/run_merge.py
+coverage run -a --source=merge_repo test/unit/merge_repo/batch_merge.py
+coverage run -a --source=merge_repo test/unit/merge_repo/merge_proj_dir.py
+coverage run -a --source=merge_repo test/unit/merge_repo/init_worker.py
+coverage run -a --source=merge_repo test/unit/merge_repo/worker_merge.py
+coverage run -a --source=merge_repo test/unit/merge_repo/pool_merge.py
+coverage run -a --source=merge_repo test/unit/merge_repo/merge_list.py
+coverage run -a --source=merge_repo test/unit/merge_repo/inotify_watch.py
+coverage run -a --source=merge_repo test/unit/merge_repo/wait_spool.py
+coverage run -a --source=merge_repo test/unit/merge_repo/scan_spool.py
+coverage run -a --source=merge_repo test/unit/merge_repo/stop_daemon.py
+coverage run -a --source=merge_repo test/unit/merge_repo/daemon_merge.py
+coverage run -a --source=merge_repo test/unit/merge_repo/get_url.py
+coverage run -a --source=merge_repo test/unit/merge_repo/preflight.py
+coverage run -a --source=merge_repo test/unit/merge_repo/snapshot_file.py
+coverage run -a --source=merge_repo test/unit/merge_repo/snapshot_dir.py
+coverage run -a --source=merge_repo test/unit/merge_repo/archive_original.py
+coverage run -a --source=merge_repo test/unit/merge_repo/get_worktree_state.py
+coverage run -a --source=merge_repo test/unit/merge_repo/open_tar.py
+coverage run -a --source=merge_repo test/unit/merge_repo/close_tar.py
+coverage run -a --source=merge_repo test/unit/merge_repo/archive_bundle.py
+coverage run -a --source=merge_repo test/unit/merge_repo/archive_project.py
+coverage run -a --source=merge_repo test/unit/merge_repo/restore_archive.py
+coverage run -a --source=merge_repo test/unit/merge_repo/restore.py
+coverage run -a --source=merge_repo test/unit/merge_repo/get_status.py
+coverage run -a --source=merge_repo test/unit/merge_repo/ssh_mux_start.py
+coverage run -a --source=merge_repo test/unit/merge_repo/ssh_mux_stop.py
+coverage run -a --source=merge_repo test/unit/merge_repo/push_atomic.py
+coverage run -a --source=merge_repo test/unit/merge_repo/get_push_tags.py
+coverage run -a --source=merge_repo test/unit/merge_repo/push_tags.py
+coverage run -a --source=merge_repo test/unit/merge_repo/get_ahead_behind.py
+coverage run -a --source=merge_repo test/unit/merge_repo/parse_push.py
+coverage run -a --source=merge_repo test/unit/merge_repo/fetch_branch.py
+coverage run -a --source=merge_repo test/unit/merge_repo/update_mirror.py
+coverage run -a --source=merge_repo test/unit/merge_repo/dissociate.py
+coverage run -a --source=merge_repo test/unit/merge_repo/is_same_tree.py
+coverage run -a --source=merge_repo test/unit/merge_repo/index_merge.py
+coverage run -a --source=merge_repo test/unit/merge_repo/resolve_theirs.py
+coverage run -a --source=merge_repo test/unit/merge_repo/is_related.py
+coverage run -a --source=merge_repo test/unit/merge_repo/metrics_start.py
+coverage run -a --source=merge_repo test/unit/merge_repo/time_stage.py
+coverage run -a --source=merge_repo test/unit/merge_repo/add_counter.py
+coverage run -a --source=merge_repo test/unit/merge_repo/dir_usage.py
+coverage run -a --source=merge_repo test/unit/merge_repo/metrics_summary.py
+coverage run -a --source=merge_repo test/unit/merge_repo/prom_text.py
+coverage run -a --source=merge_repo test/unit/merge_repo/export_metrics.py
+coverage run -a --source=merge_repo test/unit/merge_repo/lazy_module.py
+coverage run -a --source=merge_repo test/unit/merge_repo/job_reply.py
+coverage run -a --source=merge_repo test/unit/merge_repo/job_request.py
+coverage run -a --source=merge_repo test/unit/merge_repo/job_listen.py
+coverage run -a --source=merge_repo test/unit/merge_repo/open_socket.py
+coverage run -a --source=merge_repo test/unit/merge_repo/run_job.py
+coverage run -a --source=merge_repo test/unit/merge_repo/submit_job.py
+coverage run -a --source=merge_repo test/unit/merge_repo/job_done.py
+coverage run -a --source=merge_repo test/unit/merge_repo/worker_rss.py
+coverage run -a --source=merge_repo test/unit/merge_repo/prefork_worker.py
+coverage run -a --source=merge_repo test/unit/merge_repo/prefork_spawn.py
+coverage run -a --source=merge_repo test/unit/merge_repo/prefork_start.py
+coverage run -a --source=merge_repo test/unit/merge_repo/prefork_reap.py
+coverage run -a --source=merge_repo test/unit/merge_repo/prefork_merge.py
+coverage run -a --source=merge_repo test/unit/merge_repo/prefork_round.py
+coverage run -a --source=merge_repo test/unit/merge_repo/prefork_stop.py
+coverage run -a --source=merge_repo test/unit/merge_repo/async_git.py
+coverage run -a --source=merge_repo test/unit/merge_repo/remote_check.py
+coverage run -a --source=merge_repo test/unit/merge_repo/refresh_mirror.py
+coverage run -a --source=merge_repo test/unit/merge_repo/prefetch_mirror.py
+coverage run -a --source=merge_repo test/unit/merge_repo/snapshot_thread.py
+coverage run -a --source=merge_repo test/unit/merge_repo/start_snapshot.py
+coverage run -a --source=merge_repo test/unit/merge_repo/wait_snapshot.py
+coverage run -a --source=merge_repo test/unit/merge_repo/discard_snapshot.py
+coverage run -a --source=merge_repo test/unit/merge_repo/mail_write.py
+coverage run -a --source=merge_repo test/unit/merge_repo/mail_enqueue.py
+coverage run -a --source=merge_repo test/unit/merge_repo/mail_deliver.py
+coverage run -a --source=merge_repo test/unit/merge_repo/mail_attempt.py
+coverage run -a --source=merge_repo test/unit/merge_repo/mail_flush.py
+coverage run -a --source=merge_repo test/unit/merge_repo/mail_sender.py
+coverage run -a --source=merge_repo test/unit/merge_repo/mail_start.py
+coverage run -a --source=merge_repo test/unit/merge_repo/mail_stop.py
+coverage run -a --source=merge_repo test/unit/merge_repo/fork_context.py
+coverage run -a --source=merge_repo test/unit/merge_repo/wait_ready.py
+coverage run -a --source=merge_repo test/unit/merge_repo/find_program.py
+coverage run -a --source=merge_repo test/unit/merge_repo/git_error.py
+coverage run -a --source=merge_repo test/unit/merge_repo/dir_mtime.py
+coverage run -a --source=merge_repo test/unit/merge_repo/push_branch.py
+coverage run -a --source=merge_repo test/unit/merge_repo/parse_merge_tree.py
+coverage run -a --source=merge_repo test/unit/merge_repo/add_record.py
+coverage run -a --source=merge_repo test/unit/merge_repo/merge_item.py
+coverage run -a --source=merge_repo test/unit/merge_repo/daemon_start.py
+coverage run -a --source=merge_repo test/unit/merge_repo/daemon_stop.py
+coverage run -a --source=merge_repo test/unit/merge_repo/daemon_round.py
+coverage run -a --source=merge_repo test/unit/merge_repo/mirror_check.py
 coverage run -a --source=merge_repo test/unit/merge_repo/main.py
 
 echo ""
@@ -0,0 +1,579 @@
+# Classification (U)
+
+"""Program:  daemon_merge.py
+
+    Description:  Unit testing of daemon_merge in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/daemon_merge.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+        self.spool_dir = "/data/merge-repo/spool_dir"
+        self.spool_interval = 60
+        self.spool_settle = 30
+
+
+class WaitSpool(object):                        # pylint:disable=R0903,R0205
+
+    """Class:  WaitSpool
+
+    Description:  Class stub holder for wait_spool which sends the daemon a
+        SIGTERM on a given call.
+
+    Methods:
+        __init__
+        __call__
+
+    """
+
+    def __init__(self, calls=1):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) calls -> Number of the call which stops the daemon
+
+        """
+
+        self.calls = calls
+
+    def __call__(self, fdesc, timeout, wake_fd):
+
+        """Method:  __call__
+
+        Description:  Method stub holder for merge_repo.wait_spool.
+
+        Arguments:
+
+        """
+
+        self.calls -= 1
+
+        if self.calls <= 0:
+            merge_repo.stop_daemon(15, None)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_spool_dir_error
+        test_no_projects
+        test_projects_merged
+        test_failed_not_retried
+        test_project_removed
+        test_pending_wait
+        test_inotify_closed
+        test_socket_not_opened
+        test_socket_job
+        test_prefork_pool
+        test_stop_after_merge
+        test_queued_job_not_run
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.proj_dir = "/data/merge-repo/spool_dir/repo-name"
+        self.stat = os.stat_result((0, 0, 0, 0, 0, 0, 0, 0, 100, 0))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.DAEMON_STOP.update(
+            {"signum": None, "pid": None, "wake": None})
+
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_spool_dir_error(self, mock_log, mock_dir, mock_watch):
+
+        """Function:  test_spool_dir_error
+
+        Description:  Test with spool directory not accessible.
+
+        Arguments:
+
+        """
+
+        mock_dir.return_value = (False, "Error Message")
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        self.assertFalse(mock_watch.called)
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_no_projects(                               # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait):
+
+        """Function:  test_no_projects
+
+        Description:  Test with no projects in the spool directory.
+
+        Arguments:
+
+        """
+
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([], {})
+        mock_merge.return_value = {}
+        mock_wait.side_effect = WaitSpool(2)
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_wait.assert_called_with(None, 60, mock.ANY)
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.stat")
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_projects_merged(                           # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait, mock_stat):
+
+        """Function:  test_projects_merged
+
+        Description:  Test with a project merged from the spool directory.
+
+        Arguments:
+
+        """
+
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([self.proj_dir], {})
+        mock_merge.return_value = {self.proj_dir: True}
+        mock_wait.side_effect = KeyboardInterrupt
+        mock_stat.return_value = self.stat
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_merge.assert_called_once_with(
+            "Args", self.cfg, mock_log, [self.proj_dir])
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.stat")
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_failed_not_retried(                        # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait, mock_stat):
+
+        """Function:  test_failed_not_retried
+
+        Description:  Test with a failed project not retried until modified.
+
+        Arguments:
+
+        """
+
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([self.proj_dir], {})
+        mock_merge.side_effect = [{self.proj_dir: False}, {}]
+        mock_wait.side_effect = WaitSpool(2)
+        mock_stat.return_value = self.stat
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_merge.assert_called_with("Args", self.cfg, mock_log, [])
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.stat")
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_project_removed(                           # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait, mock_stat):
+
+        """Function:  test_project_removed
+
+        Description:  Test with a project removed from the spool directory
+            after the scan.
+
+        Arguments:
+
+        """
+
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([self.proj_dir], {})
+        mock_merge.return_value = {}
+        mock_wait.side_effect = KeyboardInterrupt
+        mock_stat.side_effect = OSError("No such file or directory")
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_merge.assert_called_once_with("Args", self.cfg, mock_log, [])
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_pending_wait(                              # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait):
+
+        """Function:  test_pending_wait
+
+        Description:  Test with wait limited to the settle time.
+
+        Arguments:
+
+        """
+
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([], {self.proj_dir: 990})
+        mock_merge.return_value = {}
+        mock_wait.side_effect = WaitSpool()
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_wait.assert_called_with(None, 30, mock.ANY)
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.close")
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_inotify_closed(                            # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait, mock_close):
+
+        """Function:  test_inotify_closed
+
+        Description:  Test with inotify watch closed on daemon stop.
+
+        Arguments:
+
+        """
+
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = 5
+        mock_scan.return_value = ([], {})
+        mock_merge.return_value = {}
+        mock_wait.side_effect = WaitSpool()
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_close.assert_any_call(5)
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.threading.Thread")
+    @mock.patch("merge_repo.open_socket")
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_socket_not_opened(                         # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait, mock_sock, mock_thread):
+
+        """Function:  test_socket_not_opened
+
+        Description:  Test with the daemon socket not able to be opened.
+
+        Arguments:
+
+        """
+
+        self.cfg.daemon_socket = "/data/merge-repo/merge.sock"
+
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([], {})
+        mock_merge.return_value = {}
+        mock_wait.side_effect = WaitSpool()
+        mock_sock.return_value = None
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_wait.assert_called_with(None, 60, mock.ANY)
+        self.assertFalse(mock_thread.called)
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.threading.Thread", mock.Mock())
+    @mock.patch("merge_repo.job_done")
+    @mock.patch("merge_repo.run_job")
+    @mock.patch("merge_repo.open_socket")
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_socket_job(                                # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait, mock_sock, mock_job, mock_done):
+
+        """Function:  test_socket_job
+
+        Description:  Test with a job submitted over the daemon socket.
+
+        Arguments:
+
+        """
+
+        self.cfg.daemon_socket = "/data/merge-repo/merge.sock"
+        job = {"-p": self.proj_dir, "job_id": "0123456789ab"}
+
+        def queue_job(args, jobs, lsock):
+
+            """Function:  queue_job
+
+            Description:  Queue a job when the listener thread is created.
+
+            Arguments:
+
+            """
+
+            if args and lsock:
+                jobs["queue"].append(job)
+
+            return mock.Mock()
+
+        merge_repo.threading.Thread.side_effect = \
+            lambda target, args: queue_job(*args)
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([], {})
+        mock_merge.return_value = {}
+        mock_wait.side_effect = WaitSpool()
+        mock_sock.return_value = mock.Mock()
+        mock_job.return_value = True
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_job.assert_called_once_with("Args", self.cfg, mock_log, job)
+        self.assertEqual(mock_done.call_args[0][0]["running"], [job])
+        self.assertEqual(mock_done.call_args[0][1:], (job, True))
+        mock_sock.return_value.close.assert_called_once_with()
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.prefork_stop")
+    @mock.patch("merge_repo.prefork_round")
+    @mock.patch("merge_repo.prefork_start")
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_prefork_pool(                              # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait, mock_start, mock_round, mock_stop):
+
+        """Function:  test_prefork_pool
+
+        Description:  Test with projects merged by the pre-forked workers.
+
+        Arguments:
+
+        """
+
+        self.cfg.workers = 2
+
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([], {})
+        mock_wait.side_effect = WaitSpool()
+        mock_start.return_value = "Pool"
+        mock_round.return_value = {}
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_start.assert_called_once_with("Args", self.cfg, mock_log, 2)
+        mock_round.assert_called_once_with("Pool", mock_log, [], mock.ANY)
+        self.assertEqual(mock_round.call_args[0][3]["running"], [])
+        mock_stop.assert_called_once_with("Pool", mock_log)
+        self.assertFalse(mock_merge.called)
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_stop_after_merge(                          # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait):
+
+        """Function:  test_stop_after_merge
+
+        Description:  Test with a SIGTERM during a merge stopping the daemon
+            once the merge is complete.
+
+        Arguments:
+
+        """
+
+        def merge_list(args, cfg, log, proj_list):
+
+            """Function:  merge_list
+
+            Description:  Receive a SIGTERM during the merge.
+
+            Arguments:
+
+            """
+
+            merge_repo.stop_daemon(15, None)
+
+            return dict((proj_dir, bool(args and cfg and log))
+                        for proj_dir in proj_list)
+
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([], {})
+        mock_merge.side_effect = merge_list
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        mock_merge.assert_called_once_with("Args", self.cfg, mock_log, [])
+        self.assertFalse(mock_wait.called)
+        self.assertIsNone(merge_repo.DAEMON_STOP["wake"])
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.threading.Thread", mock.Mock())
+    @mock.patch("merge_repo.job_done")
+    @mock.patch("merge_repo.run_job")
+    @mock.patch("merge_repo.open_socket")
+    @mock.patch("merge_repo.wait_spool")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.scan_spool")
+    @mock.patch("merge_repo.inotify_watch")
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_queued_job_not_run(                        # pylint:disable=R0913
+            self, mock_log, mock_dir, mock_watch, mock_scan, mock_merge,
+            mock_wait, mock_sock, mock_job, mock_done):
+
+        """Function:  test_queued_job_not_run
+
+        Description:  Test with a job queued when the daemon is stopped sent
+            a not merged status.
+
+        Arguments:
+
+        """
+
+        self.cfg.daemon_socket = "/data/merge-repo/merge.sock"
+        job = {"-p": self.proj_dir, "job_id": "0123456789ab"}
+
+        def queue_job(args, jobs, lsock):
+
+            """Function:  queue_job
+
+            Description:  Queue a job when the listener thread is created.
+
+            Arguments:
+
+            """
+
+            if args and lsock:
+                jobs["queue"].append(job)
+
+            return mock.Mock()
+
+        merge_repo.threading.Thread.side_effect = \
+            lambda target, args: queue_job(*args)
+        mock_dir.return_value = (True, None)
+        mock_watch.return_value = None
+        mock_scan.return_value = ([], {})
+        mock_merge.side_effect = \
+            lambda *args: merge_repo.stop_daemon(15, None) or {}
+        mock_sock.return_value = mock.Mock()
+
+        self.assertFalse(merge_repo.daemon_merge("Args", self.cfg, mock_log))
+        self.assertFalse(mock_job.called)
+        self.assertFalse(mock_wait.called)
+        mock_done.assert_called_once_with(mock.ANY, job, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# Classification (U)
+
+"""Program:  daemon_round.py
+
+    Description:  Unit testing of daemon_round in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/daemon_round.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_prefork_pool
+        test_serial_jobs
+        test_daemon_stopping
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ready = ["/spool_dir/repo1"]
+        self.job = {"-p": "/directory/repo2", "job_id": "0123456789ab"}
+        self.jobs = {"lock": threading.Lock(), "queue": [self.job],
+                     "running": []}
+        self.daemon = {"pool": None, "jobs": self.jobs}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.DAEMON_STOP["signum"] = None
+
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.prefork_round")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_prefork_pool(self, mock_log, mock_round, mock_merge):
+
+        """Function:  test_prefork_pool
+
+        Description:  Test with the round merged by the pre-forked workers.
+
+        Arguments:
+
+        """
+
+        self.daemon["pool"] = "Pool"
+        mock_round.return_value = {"/spool_dir/repo1": True}
+
+        self.assertEqual(
+            merge_repo.daemon_round("Args", "Cfg", mock_log, self.daemon,
+                                    self.ready), {"/spool_dir/repo1": True})
+        mock_round.assert_called_once_with("Pool", mock_log, self.ready,
+                                           self.jobs)
+        self.assertFalse(mock_merge.called)
+
+    @mock.patch("merge_repo.job_done")
+    @mock.patch("merge_repo.run_job")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_serial_jobs(self, mock_log, mock_merge, mock_job, mock_done):
+
+        """Function:  test_serial_jobs
+
+        Description:  Test with the round merged in the daemon process.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = {"/spool_dir/repo1": False}
+        mock_job.return_value = True
+
+        self.assertEqual(
+            merge_repo.daemon_round("Args", "Cfg", mock_log, self.daemon,
+                                    self.ready), {"/spool_dir/repo1": False})
+        mock_job.assert_called_once_with("Args", "Cfg", mock_log, self.job)
+        mock_done.assert_called_once_with(self.jobs, self.job, True)
+        self.assertEqual(self.jobs["queue"], [])
+        self.assertEqual(self.jobs["running"], [self.job])
+
+    @mock.patch("merge_repo.run_job")
+    @mock.patch("merge_repo.merge_list")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_daemon_stopping(self, mock_log, mock_merge, mock_job):
+
+        """Function:  test_daemon_stopping
+
+        Description:  Test with the queued jobs left once the daemon is
+            stopping.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = {}
+        merge_repo.DAEMON_STOP["signum"] = 15
+
+        merge_repo.daemon_round("Args", "Cfg", mock_log, self.daemon,
+                                self.ready)
+
+        self.assertFalse(mock_job.called)
+        self.assertEqual(self.jobs["queue"], [self.job])
+
+
+if __name__ == "__main__":
+    unittest.main()
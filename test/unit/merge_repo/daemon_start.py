@@ -0,0 +1,164 @@
+# Classification (U)
+
+"""Program:  daemon_start.py
+
+    Description:  Unit testing of daemon_start in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/daemon_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.daemon_socket = None
+        self.workers = 1
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_serial_daemon
+        test_prefork_socket
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.daemon = None
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if self.daemon:
+            os.close(self.daemon["wake_fd"])
+            os.close(self.daemon["jobs"]["wake"])
+
+        merge_repo.DAEMON_STOP.update(
+            {"signum": None, "pid": None, "wake": None})
+
+    @mock.patch("merge_repo.threading.Thread")
+    @mock.patch("merge_repo.open_socket")
+    @mock.patch("merge_repo.prefork_start")
+    @mock.patch("merge_repo.signal.signal")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_serial_daemon(                             # pylint:disable=R0913
+            self, mock_log, mock_signal, mock_start, mock_sock,
+            mock_thread):
+
+        """Function:  test_serial_daemon
+
+        Description:  Test with no worker processes and no job socket.
+
+        Arguments:
+
+        """
+
+        self.daemon = merge_repo.daemon_start("Args", self.cfg, mock_log)
+
+        self.assertIsNone(self.daemon["pool"])
+        self.assertIsNone(self.daemon["lsock"])
+        self.assertEqual(self.daemon["jobs"]["queue"], [])
+        self.assertEqual(self.daemon["jobs"]["running"], [])
+        self.assertEqual(merge_repo.DAEMON_STOP["wake"],
+                         self.daemon["jobs"]["wake"])
+        self.assertIsNone(merge_repo.DAEMON_STOP["signum"])
+        mock_signal.assert_called_once_with(
+            merge_repo.signal.SIGTERM, merge_repo.stop_daemon)
+        self.assertFalse(mock_start.called)
+        self.assertFalse(mock_sock.called)
+        self.assertFalse(mock_thread.called)
+
+    @mock.patch("merge_repo.signal.signal", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.threading.Thread")
+    @mock.patch("merge_repo.open_socket")
+    @mock.patch("merge_repo.prefork_start")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_prefork_socket(self, mock_log, mock_start, mock_sock,
+                            mock_thread):
+
+        """Function:  test_prefork_socket
+
+        Description:  Test with worker processes and a job socket.
+
+        Arguments:
+
+        """
+
+        self.cfg.workers = 2
+        self.cfg.daemon_socket = "/data/merge-repo/merge.sock"
+        mock_start.return_value = "Pool"
+        mock_sock.return_value = "Socket"
+
+        self.daemon = merge_repo.daemon_start("Args", self.cfg, mock_log)
+
+        self.assertEqual(self.daemon["pool"], "Pool")
+        self.assertEqual(self.daemon["lsock"], "Socket")
+        mock_start.assert_called_once_with("Args", self.cfg, mock_log, 2)
+        mock_thread.assert_called_once_with(
+            target=merge_repo.job_listen,
+            args=("Args", self.daemon["jobs"], "Socket"))
+        mock_thread.return_value.start.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
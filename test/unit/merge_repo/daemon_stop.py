@@ -0,0 +1,142 @@
+# Classification (U)
+
+"""Program:  daemon_stop.py
+
+    Description:  Unit testing of daemon_stop in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/daemon_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.daemon_socket = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_serial_daemon
+        test_prefork_socket
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.job = {"-p": "/directory/repo-name", "job_id": "0123456789ab"}
+        self.daemon = {"wake_fd": 3, "pool": None, "lsock": None,
+                       "jobs": {"lock": threading.Lock(), "queue": [],
+                                "running": [], "wake": 4}}
+
+    @mock.patch("merge_repo.prefork_stop")
+    @mock.patch("merge_repo.job_done")
+    @mock.patch("merge_repo.os.close")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_serial_daemon(self, mock_log, mock_close, mock_done,
+                           mock_stop):
+
+        """Function:  test_serial_daemon
+
+        Description:  Test with no worker processes and no queued jobs.
+
+        Arguments:
+
+        """
+
+        merge_repo.DAEMON_STOP["wake"] = 4
+
+        merge_repo.daemon_stop(self.cfg, mock_log, self.daemon)
+
+        self.assertIsNone(merge_repo.DAEMON_STOP["wake"])
+        self.assertEqual(mock_close.call_args_list,
+                         [mock.call(3), mock.call(4)])
+        self.assertFalse(mock_done.called)
+        self.assertFalse(mock_stop.called)
+
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.close", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.prefork_stop")
+    @mock.patch("merge_repo.job_done")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_prefork_socket(self, mock_log, mock_done, mock_stop,
+                            mock_remove):
+
+        """Function:  test_prefork_socket
+
+        Description:  Test with worker processes, a job socket and a job
+            not started.
+
+        Arguments:
+
+        """
+
+        self.cfg.daemon_socket = "/data/merge-repo/merge.sock"
+        self.daemon["pool"] = "Pool"
+        self.daemon["lsock"] = mock.Mock()
+        self.daemon["jobs"]["queue"].append(self.job)
+
+        merge_repo.daemon_stop(self.cfg, mock_log, self.daemon)
+
+        self.daemon["lsock"].close.assert_called_once_with()
+        mock_remove.assert_called_once_with("/data/merge-repo/merge.sock")
+        mock_done.assert_called_once_with(self.daemon["jobs"], self.job, None)
+        self.assertEqual(self.daemon["jobs"]["queue"], [])
+        mock_stop.assert_called_once_with("Pool", mock_log)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# Classification (U)
+
+"""Program:  dir_mtime.py
+
+    Description:  Unit testing of dir_mtime in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/dir_mtime.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_mtime
+        test_removed
+
+    """
+
+    @mock.patch("merge_repo.os.stat")
+    def test_mtime(self, mock_stat):
+
+        """Function:  test_mtime
+
+        Description:  Test with the directory's modification time returned.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = os.stat_result(
+            (0, 0, 0, 0, 0, 0, 0, 0, 100, 0))
+
+        self.assertEqual(merge_repo.dir_mtime("/spool_dir/repo-name"), 100)
+
+    @mock.patch("merge_repo.os.stat")
+    def test_removed(self, mock_stat):
+
+        """Function:  test_removed
+
+        Description:  Test with the directory removed.
+
+        Arguments:
+
+        """
+
+        mock_stat.side_effect = OSError("No such file or directory")
+
+        self.assertIsNone(merge_repo.dir_mtime("/spool_dir/repo-name"))
+
+
+if __name__ == "__main__":
+    unittest.main()
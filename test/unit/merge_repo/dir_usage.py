@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  dir_usage.py
+
+    Description:  Unit testing of dir_usage in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/dir_usage.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Stat(object):                             # pylint:disable=R0903,R0205
+
+    """Class:  Stat
+
+    Description:  Class which is a representation of an os.stat result.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, size):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the Stat class.
+
+        Arguments:
+
+        """
+
+        self.st_size = size
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_dir
+        test_files
+        test_file_removed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.walk = [("/dir", ["sub"], ["file1", "file2"]),
+                     ("/dir/sub", [], ["file3"])]
+
+    @mock.patch("merge_repo.os.walk", mock.Mock(return_value=[]))
+    def test_empty_dir(self):
+
+        """Function:  test_empty_dir
+
+        Description:  Test with an empty or missing directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.dir_usage("/dir"), (0, 0))
+
+    @mock.patch("merge_repo.os.lstat")
+    @mock.patch("merge_repo.os.walk")
+    def test_files(self, mock_walk, mock_stat):
+
+        """Function:  test_files
+
+        Description:  Test with files in sub-directories.
+
+        Arguments:
+
+        """
+
+        mock_walk.return_value = self.walk
+        mock_stat.side_effect = [Stat(10), Stat(20), Stat(30)]
+
+        self.assertEqual(merge_repo.dir_usage("/dir"), (3, 60))
+
+    @mock.patch("merge_repo.os.lstat")
+    @mock.patch("merge_repo.os.walk")
+    def test_file_removed(self, mock_walk, mock_stat):
+
+        """Function:  test_file_removed
+
+        Description:  Test with a file removed during the count.
+
+        Arguments:
+
+        """
+
+        mock_walk.return_value = self.walk
+        mock_stat.side_effect = [Stat(10), OSError("No such file"), Stat(30)]
+
+        self.assertEqual(merge_repo.dir_usage("/dir"), (2, 40))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  discard_snapshot.py
+
+    Description:  Unit testing of discard_snapshot in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/discard_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_directory_removed
+        test_file_removed
+        test_snapshot_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.arch_dir = "/data/merge-repo/archive_dir/repo-name"
+        self.snapshot = {"args": "args", "arch_dir": None, "error": None,
+                         "thread": mock.Mock()}
+
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.shutil.rmtree")
+    @mock.patch("merge_repo.wait_snapshot")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_directory_removed(                         # pylint:disable=R0913
+            self, mock_log, mock_wait, mock_rmtree, mock_remove):
+
+        """Function:  test_directory_removed
+
+        Description:  Test with the archive snapshot directory removed.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = self.arch_dir
+
+        merge_repo.discard_snapshot(self.snapshot, mock_log)
+
+        mock_rmtree.assert_called_once_with(self.arch_dir)
+        self.assertFalse(mock_remove.called)
+
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.path.isfile")
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.shutil.rmtree")
+    @mock.patch("merge_repo.wait_snapshot")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_file_removed(                              # pylint:disable=R0913
+            self, mock_log, mock_wait, mock_rmtree, mock_isfile,
+            mock_remove):
+
+        """Function:  test_file_removed
+
+        Description:  Test with the archive snapshot bundle removed.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = self.arch_dir
+        mock_isfile.side_effect = lambda name: name.endswith(".bundle")
+
+        merge_repo.discard_snapshot(self.snapshot, mock_log)
+
+        mock_remove.assert_called_once_with(self.arch_dir + ".bundle")
+        self.assertFalse(mock_rmtree.called)
+
+    @mock.patch("merge_repo.shutil.rmtree")
+    @mock.patch("merge_repo.wait_snapshot")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_snapshot_failed(self, mock_log, mock_wait, mock_rmtree):
+
+        """Function:  test_snapshot_failed
+
+        Description:  Test with the archive snapshot raising an exception.
+
+        Arguments:
+
+        """
+
+        mock_wait.side_effect = OSError("Error Message")
+
+        merge_repo.discard_snapshot(self.snapshot, mock_log)
+
+        self.assertFalse(mock_rmtree.called)
+        self.assertTrue(mock_log.log_warn.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  dissociate.py
+
+    Description:  Unit testing of dissociate in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/dissociate.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.git_dir = "/data/merge-repo/work_dir/repo-name"
+        self.gitrepo = mock.Mock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_alternates
+        test_alternates
+        test_repack_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_no_alternates(self, mock_log, mock_remove):
+
+        """Function:  test_no_alternates
+
+        Description:  Test with project not using the mirror.
+
+        Arguments:
+
+        """
+
+        merge_repo.dissociate(self.gitr, mock_log)
+
+        self.assertFalse(self.gitr.gitrepo.git.repack.called)
+        self.assertFalse(mock_remove.called)
+
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_alternates(self, mock_log, mock_remove):
+
+        """Function:  test_alternates
+
+        Description:  Test with project using the mirror.
+
+        Arguments:
+
+        """
+
+        merge_repo.dissociate(self.gitr, mock_log)
+
+        self.gitr.gitrepo.git.repack.assert_called_once_with("-a", "-d")
+        mock_remove.assert_called_once_with(os.path.join(
+            self.gitr.git_dir, ".git", "objects", "info", "alternates"))
+
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_repack_failed(self, mock_log, mock_remove):
+
+        """Function:  test_repack_failed
+
+        Description:  Test with the repack failing.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.repack.side_effect = \
+            merge_repo.git.exc.GitCommandError("git repack", 1)
+
+        merge_repo.dissociate(self.gitr, mock_log)
+
+        self.assertFalse(mock_remove.called)
+        self.assertTrue(mock_log.log_warn.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+# Classification (U)
+
+"""Program:  export_metrics.py
+
+    Description:  Unit testing of export_metrics in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/export_metrics.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.prom_file = "/data/textfile/merge_repo.prom"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_first_merge
+        test_failed_merge
+        test_existing_state
+        test_write_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.record = {"status": True, "failed_stage": None,
+                       "stages": {"fetch": 0.7},
+                       "counters": {"copy_files": 3, "copy_bytes": 100}}
+        self.state = '{"attempted": 4, "copy_bytes": 50, "stages": {"fetch":' \
+            ' {"buckets": [1, 1, 1, 1, 1, 1, 1, 1, 1], "sum": 0.05,' \
+            ' "count": 1}}, "succeeded": 4}'
+
+    @mock.patch("merge_repo.prom_text", mock.Mock(return_value="text"))
+    @mock.patch("merge_repo.os.rename")
+    @mock.patch("merge_repo.os.chmod", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.fdopen", mock.mock_open())
+    @mock.patch("merge_repo.tempfile.mkstemp",
+                mock.Mock(return_value=(5, "/data/textfile/.merge_repo.tmp")))
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_first_merge(self, mock_log, mock_rename):
+
+        """Function:  test_first_merge
+
+        Description:  Test with no existing state file.
+
+        Arguments:
+
+        """
+
+        with mock.patch("merge_repo.open", mock.mock_open(read_data=""),
+                        create=True) as mock_open:
+            self.assertTrue(
+                merge_repo.export_metrics(self.cfg, mock_log, self.record))
+
+        state = merge_repo.json.loads(
+            mock_open().write.call_args[0][0])
+        self.assertEqual(state["attempted"], 1)
+        self.assertEqual(state["succeeded"], 1)
+        self.assertEqual(state["copy_bytes"], 100)
+        self.assertEqual(state["stages"]["fetch"]["buckets"],
+                         [0, 0, 1, 1, 1, 1, 1, 1, 1])
+        mock_rename.assert_called_once_with(
+            "/data/textfile/.merge_repo.tmp", self.cfg.prom_file)
+
+    @mock.patch("merge_repo.prom_text", mock.Mock(return_value="text"))
+    @mock.patch("merge_repo.os.rename", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.chmod", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.fdopen", mock.mock_open())
+    @mock.patch("merge_repo.tempfile.mkstemp",
+                mock.Mock(return_value=(5, "/data/textfile/.merge_repo.tmp")))
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_failed_merge(self, mock_log):
+
+        """Function:  test_failed_merge
+
+        Description:  Test with a failed merge.
+
+        Arguments:
+
+        """
+
+        self.record["status"] = False
+        self.record["failed_stage"] = "push"
+
+        with mock.patch("merge_repo.open", mock.mock_open(read_data=""),
+                        create=True) as mock_open:
+            self.assertTrue(
+                merge_repo.export_metrics(self.cfg, mock_log, self.record))
+
+        state = merge_repo.json.loads(
+            mock_open().write.call_args[0][0])
+        self.assertEqual(state["failed"], {"push": 1})
+        self.assertNotIn("succeeded", state)
+
+    @mock.patch("merge_repo.prom_text", mock.Mock(return_value="text"))
+    @mock.patch("merge_repo.os.rename", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.chmod", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.fdopen", mock.mock_open())
+    @mock.patch("merge_repo.tempfile.mkstemp",
+                mock.Mock(return_value=(5, "/data/textfile/.merge_repo.tmp")))
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_existing_state(self, mock_log):
+
+        """Function:  test_existing_state
+
+        Description:  Test with an existing state file.
+
+        Arguments:
+
+        """
+
+        with mock.patch("merge_repo.open",
+                        mock.mock_open(read_data=self.state),
+                        create=True) as mock_open:
+            self.assertTrue(
+                merge_repo.export_metrics(self.cfg, mock_log, self.record))
+
+        state = merge_repo.json.loads(
+            mock_open().write.call_args[0][0])
+        self.assertEqual(state["attempted"], 5)
+        self.assertEqual(state["copy_bytes"], 150)
+        self.assertEqual(state["stages"]["fetch"]["count"], 2)
+        self.assertEqual(state["stages"]["fetch"]["buckets"],
+                         [1, 1, 2, 2, 2, 2, 2, 2, 2])
+
+    @mock.patch("merge_repo.open", mock.Mock(side_effect=IOError("Denied")),
+                create=True)
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_write_error(self, mock_log):
+
+        """Function:  test_write_error
+
+        Description:  Test with the state file not writable.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            merge_repo.export_metrics(self.cfg, mock_log, self.record))
+        self.assertTrue(mock_log.log_warn.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
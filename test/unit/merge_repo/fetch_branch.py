@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  fetch_branch.py
+
+    Description:  Unit testing of fetch_branch in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/fetch_branch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+        self.gitrepo = mock.Mock()
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fetch_tags
+        test_no_tags
+        test_fetch_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+        self.cfg = CfgTest()
+        self.refspec = "+refs/heads/develop:refs/remotes/origin/develop"
+
+    def test_fetch_tags(self):
+
+        """Function:  test_fetch_tags
+
+        Description:  Test with tags followed by the fetch.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.fetch_branch(self.gitr, self.cfg), (True, {}))
+        self.gitr.gitrepo.git.fetch.assert_called_once_with(
+            "--negotiation-tip=HEAD", "origin", self.refspec)
+
+    def test_no_tags(self):
+
+        """Function:  test_no_tags
+
+        Description:  Test with fetch_tags set to False.
+
+        Arguments:
+
+        """
+
+        self.cfg.fetch_tags = False
+
+        merge_repo.fetch_branch(self.gitr, self.cfg)
+
+        self.gitr.gitrepo.git.fetch.assert_called_once_with(
+            "--no-tags", "--negotiation-tip=HEAD", "origin", self.refspec)
+
+    def test_fetch_failed(self):
+
+        """Function:  test_fetch_failed
+
+        Description:  Test with the fetch failing.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.fetch.side_effect = \
+            merge_repo.git.exc.GitCommandError("git fetch", 128)
+
+        status, msg = merge_repo.fetch_branch(self.gitr, self.cfg)
+
+        self.assertFalse(status)
+        self.assertEqual(msg["status"], 128)
+
+
+if __name__ == "__main__":
+    unittest.main()
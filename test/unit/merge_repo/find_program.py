@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  find_program.py
+
+    Description:  Unit testing of find_program in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/find_program.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_found
+        test_not_executable
+        test_not_found
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.path = os.pathsep.join(["/usr/local/bin", "/usr/bin"])
+
+    @mock.patch("merge_repo.os.access", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isfile")
+    def test_found(self, mock_isfile):
+
+        """Function:  test_found
+
+        Description:  Test with the program in a later PATH directory.
+
+        Arguments:
+
+        """
+
+        mock_isfile.side_effect = [False, True]
+
+        with mock.patch.dict(merge_repo.os.environ, {"PATH": self.path}):
+            self.assertEqual(merge_repo.find_program("zstd"), "/usr/bin/zstd")
+
+    @mock.patch("merge_repo.os.access", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=True))
+    def test_not_executable(self):
+
+        """Function:  test_not_executable
+
+        Description:  Test with the program not executable.
+
+        Arguments:
+
+        """
+
+        with mock.patch.dict(merge_repo.os.environ, {"PATH": self.path}):
+            self.assertIsNone(merge_repo.find_program("zstd"))
+
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=False))
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test with the program not installed.
+
+        Arguments:
+
+        """
+
+        with mock.patch.dict(merge_repo.os.environ, {"PATH": self.path}):
+            self.assertIsNone(merge_repo.find_program("zstd"))
+
+
+if __name__ == "__main__":
+    unittest.main()
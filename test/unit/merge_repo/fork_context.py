@@ -0,0 +1,72 @@
+# Classification (U)
+
+"""Program:  fork_context.py
+
+    Description:  Unit testing of fork_context in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/fork_context.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_fork_context
+        test_no_context
+
+    """
+
+    @unittest.skipIf(not hasattr(merge_repo.multiprocessing, "get_context"),
+                     "Python 2.7 has no multiprocessing start methods")
+    def test_fork_context(self):
+
+        """Function:  test_fork_context
+
+        Description:  Test with the fork start method returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.fork_context().get_start_method(), "fork")
+
+    @mock.patch("merge_repo.multiprocessing", mock.Mock(spec=["Pool"]))
+    def test_no_context(self):
+
+        """Function:  test_no_context
+
+        Description:  Test with multiprocessing having no start methods.
+
+        Arguments:
+
+        """
+
+        self.assertIs(merge_repo.fork_context(), merge_repo.multiprocessing)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  get_ahead_behind.py
+
+    Description:  Unit testing of get_ahead_behind in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/get_ahead_behind.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+        self.gitrepo = mock.Mock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_in_sync
+        test_ahead_behind
+        test_no_tracking_branch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+        self.gitr.is_commits_ahead = mock.Mock(return_value=1)
+        self.gitr.is_commits_behind = mock.Mock(return_value=0)
+
+    def test_in_sync(self):
+
+        """Function:  test_in_sync
+
+        Description:  Test with local branch in sync with remote.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.rev_list.return_value = "0\t0"
+
+        self.assertEqual(merge_repo.get_ahead_behind(self.gitr), (0, 0))
+        self.gitr.gitrepo.git.rev_list.assert_called_once_with(
+            "--left-right", "--count", "develop...origin/develop")
+
+    def test_ahead_behind(self):
+
+        """Function:  test_ahead_behind
+
+        Description:  Test with local branch ahead and behind remote.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.rev_list.return_value = "2\t3"
+
+        self.assertEqual(merge_repo.get_ahead_behind(self.gitr), (2, 3))
+
+    def test_no_tracking_branch(self):
+
+        """Function:  test_no_tracking_branch
+
+        Description:  Test with no remote-tracking branch.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.rev_list.side_effect = \
+            merge_repo.git.exc.GitCommandError("git rev-list", 128)
+
+        self.assertEqual(merge_repo.get_ahead_behind(self.gitr), (1, 0))
+        self.assertTrue(self.gitr.is_commits_behind.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+# Classification (U)
+
+"""Program:  get_proj_list.py
+
+    Description:  Unit testing of get_proj_list in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/get_proj_list.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_single_project
+        test_multiple_projects
+        test_drop_dir
+        test_drop_dir_hidden
+        test_drop_dir_and_project
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "config_file", "-d": "config_dir", "-M": True}
+        self.dir_list = ["repo-name3", ".repo-name4", "file_name"]
+        self.results = ["/directory/repo-name"]
+        self.results2 = ["/directory/repo-name", "/directory/repo-name2"]
+        self.results3 = ["/drop_dir/repo-name3"]
+        self.results4 = ["/directory/repo-name", "/drop_dir/repo-name3"]
+
+    def test_single_project(self):
+
+        """Function:  test_single_project
+
+        Description:  Test with a single project directory.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-p"] = "/directory/repo-name"
+
+        self.assertEqual(merge_repo.get_proj_list(self.args), self.results)
+
+    def test_multiple_projects(self):
+
+        """Function:  test_multiple_projects
+
+        Description:  Test with multiple project directories.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-p"] = [
+            "/directory/repo-name", "/directory/repo-name2"]
+
+        self.assertEqual(merge_repo.get_proj_list(self.args), self.results2)
+
+    @mock.patch("merge_repo.os.path.isdir")
+    @mock.patch("merge_repo.os.listdir")
+    def test_drop_dir(self, mock_list, mock_isdir):
+
+        """Function:  test_drop_dir
+
+        Description:  Test with a drop directory.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = "/drop_dir"
+
+        mock_list.return_value = self.dir_list
+        mock_isdir.side_effect = [False, True]
+
+        self.assertEqual(merge_repo.get_proj_list(self.args), self.results3)
+
+    @mock.patch("merge_repo.os.path.isdir")
+    @mock.patch("merge_repo.os.listdir")
+    def test_drop_dir_hidden(self, mock_list, mock_isdir):
+
+        """Function:  test_drop_dir_hidden
+
+        Description:  Test with only hidden directories in drop directory.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = "/drop_dir"
+
+        mock_list.return_value = [".repo-name4"]
+        mock_isdir.return_value = True
+
+        self.assertEqual(merge_repo.get_proj_list(self.args), [])
+
+    @mock.patch("merge_repo.os.path.isdir")
+    @mock.patch("merge_repo.os.listdir")
+    def test_drop_dir_and_project(self, mock_list, mock_isdir):
+
+        """Function:  test_drop_dir_and_project
+
+        Description:  Test with a drop directory and a project directory.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = "/drop_dir"
+        self.args.args_array["-p"] = "/directory/repo-name"
+
+        mock_list.return_value = self.dir_list
+        mock_isdir.side_effect = [False, True]
+
+        self.assertEqual(merge_repo.get_proj_list(self.args), self.results4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+# Classification (U)
+
+"""Program:  get_push_tags.py
+
+    Description:  Unit testing of get_push_tags in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/get_push_tags.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+        self.gitrepo = mock.Mock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_tags
+        test_new_tags
+        test_changed_tag
+        test_annotated_tag
+        test_ls_remote_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+        self.gitr.gitrepo.git.for_each_ref.return_value = \
+            "aaa111 refs/tags/v1\nbbb222 refs/tags/v2\nccc333 refs/tags/v3"
+        self.gitr.gitrepo.git.ls_remote.return_value = \
+            "aaa111\trefs/tags/v1\nbbb222\trefs/tags/v2"
+
+    def test_no_tags(self):
+
+        """Function:  test_no_tags
+
+        Description:  Test with no local tags.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.for_each_ref.return_value = ""
+
+        self.assertEqual(merge_repo.get_push_tags(self.gitr), ([], 0))
+
+    def test_new_tags(self):
+
+        """Function:  test_new_tags
+
+        Description:  Test with a tag missing on the remote.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.get_push_tags(self.gitr),
+                         (["refs/tags/v3"], 2))
+
+    def test_changed_tag(self):
+
+        """Function:  test_changed_tag
+
+        Description:  Test with a tag different on the remote.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.ls_remote.return_value = \
+            "aaa111\trefs/tags/v1\nddd444\trefs/tags/v2\nccc333\trefs/tags/v3"
+
+        self.assertEqual(merge_repo.get_push_tags(self.gitr),
+                         (["refs/tags/v2"], 2))
+
+    def test_annotated_tag(self):
+
+        """Function:  test_annotated_tag
+
+        Description:  Test with the peeled entry of an annotated tag.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.ls_remote.return_value = \
+            "aaa111\trefs/tags/v1\nbbb222\trefs/tags/v2\n" \
+            + "eee555\trefs/tags/v2^{}\nccc333\trefs/tags/v3"
+
+        self.assertEqual(merge_repo.get_push_tags(self.gitr), ([], 3))
+
+    def test_ls_remote_failed(self):
+
+        """Function:  test_ls_remote_failed
+
+        Description:  Test with ls-remote failing, all tags are pushed.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.ls_remote.side_effect = \
+            merge_repo.git.exc.GitCommandError("git ls-remote", 128)
+
+        self.assertEqual(
+            merge_repo.get_push_tags(self.gitr),
+            (["refs/tags/v1", "refs/tags/v2", "refs/tags/v3"], 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+# Classification (U)
+
+"""Program:  get_status.py
+
+    Description:  Unit testing of get_status in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/get_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.gitrepo = mock.Mock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_clean
+        test_modified
+        test_deleted
+        test_untracked
+        test_renamed
+        test_staged
+        test_unmerged
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+        self.ordinary = "1 %s N... 100644 100644 100644 abc123 abc123 %s"
+
+    def test_clean(self):
+
+        """Function:  test_clean
+
+        Description:  Test with a clean working tree.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.status.return_value = ""
+
+        self.assertEqual(merge_repo.get_status(self.gitr),
+                         merge_repo.GitStatus(False, (), (), ()))
+
+    def test_modified(self):
+
+        """Function:  test_modified
+
+        Description:  Test with a modified file with spaces in its name.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.status.return_value = \
+            self.ordinary % (".M", "dir/file name") + "\0"
+
+        self.assertEqual(
+            merge_repo.get_status(self.gitr),
+            merge_repo.GitStatus(True, ("dir/file name",), (), ()))
+
+    def test_deleted(self):
+
+        """Function:  test_deleted
+
+        Description:  Test with a deleted file.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.status.return_value = \
+            self.ordinary % (".D", "file1") + "\0"
+
+        self.assertEqual(merge_repo.get_status(self.gitr),
+                         merge_repo.GitStatus(True, (), (), ("file1",)))
+
+    def test_untracked(self):
+
+        """Function:  test_untracked
+
+        Description:  Test with untracked files.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.status.return_value = "? file1\0? dir/file2\0"
+
+        self.assertEqual(
+            merge_repo.get_status(self.gitr),
+            merge_repo.GitStatus(False, (), ("file1", "dir/file2"), ()))
+
+    def test_renamed(self):
+
+        """Function:  test_renamed
+
+        Description:  Test with a renamed file followed by its original path.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.status.return_value = \
+            "2 R. N... 100644 100644 100644 abc123 abc123 R100 file2\0" \
+            + "file1\0? file3\0"
+
+        self.assertEqual(merge_repo.get_status(self.gitr),
+                         merge_repo.GitStatus(True, (), ("file3",), ()))
+
+    def test_staged(self):
+
+        """Function:  test_staged
+
+        Description:  Test with a change staged in the index only.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.status.return_value = \
+            self.ordinary % ("M.", "file1") + "\0"
+
+        self.assertEqual(merge_repo.get_status(self.gitr),
+                         merge_repo.GitStatus(True, (), (), ()))
+
+    def test_unmerged(self):
+
+        """Function:  test_unmerged
+
+        Description:  Test with an unmerged file.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.status.return_value = \
+            "u UU N... 100644 100644 100644 100644 abc123 abc123 abc123 " \
+            + "file1\0"
+
+        self.assertEqual(merge_repo.get_status(self.gitr),
+                         merge_repo.GitStatus(True, (), (), ()))
+
+
+if __name__ == "__main__":
+    unittest.main()
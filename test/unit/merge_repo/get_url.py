@@ -0,0 +1,180 @@
+# Classification (U)
+
+"""Program:  get_url.py
+
+    Description:  Unit testing of get_url in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/get_url.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        insert_arg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.prefix = "git@"
+        self.git_server = "domain"
+        self.git_project = "project"
+        self.branch = "branch_name"
+        self.mod_branch = "mod_branch"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_git_server
+        test_git_alias_option
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "config_file", "-d": "config_dir", "-r": "repo-name",
+            "-p": "/directory/repo-name", "-M": True}
+
+    def test_git_server(self):
+
+        """Function:  test_git_server
+
+        Description:  Test with url using the git server.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.get_url(self.args, self.cfg),
+                         "git@domain:project/repo-name.git")
+
+    def test_git_alias_option(self):
+
+        """Function:  test_git_alias_option
+
+        Description:  Test with url using the repository name as an alias.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = True
+
+        self.assertEqual(merge_repo.get_url(self.args, self.cfg),
+                         "git@repo-name:project/repo-name.git")
+
+
+if __name__ == "__main__":
+    unittest.main()
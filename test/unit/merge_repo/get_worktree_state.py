@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  get_worktree_state.py
+
+    Description:  Unit testing of get_worktree_state in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/get_worktree_state.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_branch
+        test_detached_head
+        test_no_changes
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.git_dir = "/directory/git_repo"
+        self.gitrepo = mock.Mock()
+        self.gitrepo.head.commit.hexsha = "abc123"
+        self.gitrepo.head.is_detached = False
+        self.gitrepo.active_branch.name = "master"
+        self.gitrepo.git.diff.side_effect = ["file1\0file2\0", "file3\0"]
+        self.gitrepo.git.ls_files.return_value = "file4\0"
+        self.results = {
+            "head": "abc123", "branch": "master",
+            "changed": ["file1", "file2"], "deleted": ["file3"],
+            "others": ["file4"]}
+
+    @mock.patch("merge_repo.git.Repo")
+    def test_branch(self, mock_repo):
+
+        """Function:  test_branch
+
+        Description:  Test with HEAD on a branch.
+
+        Arguments:
+
+        """
+
+        mock_repo.return_value = self.gitrepo
+
+        self.assertEqual(
+            merge_repo.get_worktree_state(self.git_dir), self.results)
+
+    @mock.patch("merge_repo.git.Repo")
+    def test_detached_head(self, mock_repo):
+
+        """Function:  test_detached_head
+
+        Description:  Test with a detached HEAD.
+
+        Arguments:
+
+        """
+
+        self.gitrepo.head.is_detached = True
+        self.results["branch"] = None
+
+        mock_repo.return_value = self.gitrepo
+
+        self.assertEqual(
+            merge_repo.get_worktree_state(self.git_dir), self.results)
+
+    @mock.patch("merge_repo.git.Repo")
+    def test_no_changes(self, mock_repo):
+
+        """Function:  test_no_changes
+
+        Description:  Test with no changes in the working tree.
+
+        Arguments:
+
+        """
+
+        self.gitrepo.git.diff.side_effect = ["", ""]
+        self.gitrepo.git.ls_files.return_value = ""
+
+        mock_repo.return_value = self.gitrepo
+
+        state = merge_repo.get_worktree_state(self.git_dir)
+
+        self.assertEqual(
+            (state["changed"], state["deleted"], state["others"]),
+            ([], [], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
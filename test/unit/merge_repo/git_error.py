@@ -0,0 +1,123 @@
+# Classification (U)
+
+"""Program:  git_error.py
+
+    Description:  Unit testing of git_error in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/git_error.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitCommandError(Exception):
+
+    """Class:  GitCommandError
+
+    Description:  Class stub holder for git.exc.GitCommandError class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, command, status, stderr):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        super(GitCommandError, self).__init__(command)
+        self.command = command
+        self.status = status
+        self.stderr = stderr
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_gitpython_error
+        test_no_stderr
+        test_plain_error
+
+    """
+
+    def test_gitpython_error(self):
+
+        """Function:  test_gitpython_error
+
+        Description:  Test with the error as raised by GitPython.
+
+        Arguments:
+
+        """
+
+        err = GitCommandError(
+            ["git", "push", "origin"], 1,
+            "\n  stderr: 'error: failed to push some refs\n'")
+
+        self.assertEqual(
+            merge_repo.git_error(err),
+            {"status": 1, "stderr": "error: failed to push some refs",
+             "command": "git push origin"})
+
+    def test_no_stderr(self):
+
+        """Function:  test_no_stderr
+
+        Description:  Test with no standard error from the command.
+
+        Arguments:
+
+        """
+
+        err = GitCommandError(["git", "fetch"], 128, "")
+
+        self.assertEqual(
+            merge_repo.git_error(err),
+            {"status": 128, "stderr": "", "command": "git fetch"})
+
+    def test_plain_error(self):
+
+        """Function:  test_plain_error
+
+        Description:  Test with the error already in plain strings.
+
+        Arguments:
+
+        """
+
+        err = GitCommandError("git push", 1, "push failed")
+
+        self.assertEqual(
+            merge_repo.git_error(err),
+            {"status": 1, "stderr": "push failed", "command": "git push"})
+
+
+if __name__ == "__main__":
+    unittest.main()
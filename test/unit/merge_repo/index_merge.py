@@ -0,0 +1,230 @@
+# Classification (U)
+
+"""Program:  index_merge.py
+
+    Description:  Unit testing of index_merge in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/index_merge.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+        self.mod_branch = "mod_release"
+        self.gitrepo = mock.Mock()
+        self.gitrepo.git = mock.MagicMock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_clean_merge
+        test_allow_unrelated
+        test_conflict_resolved
+        test_conflict_removed
+        test_merge_tree_fails
+        test_command_fails
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+        self.gitr.gitrepo.git.write_tree.return_value = "tree2"
+        self.gitr.gitrepo.git.commit_tree.return_value = "commit1"
+        self.gitr.gitrepo.head.commit.hexsha = "abc123"
+        self.conflict = "tree1\x00100644 oid1 1\tfile1" \
+            "\x00100644 oid2 2\tfile1\x00100644 oid3 3\tfile1" \
+            "\x00\x00Auto-merging file1"
+        self.merge_msg = "Merge commit 'abc123' into develop"
+
+    @mock.patch("merge_repo.shutil.rmtree", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.tempfile.mkdtemp",
+                mock.Mock(return_value="/tmp/idx"))
+    def test_clean_merge(self):
+
+        """Function:  test_clean_merge
+
+        Description:  Test with a merge without conflicts.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_tree.return_value = (0, "tree1\0", "")
+
+        self.assertEqual(merge_repo.index_merge(self.gitr), (True, {}))
+        self.gitr.gitrepo.git.read_tree.assert_called_once_with("tree1")
+        self.assertFalse(self.gitr.gitrepo.git.update_index.called)
+        self.gitr.gitrepo.git.commit_tree.assert_called_once_with(
+            "tree2", "-p", "refs/remotes/origin/develop", "-p", "HEAD", "-m",
+            self.merge_msg)
+        self.gitr.gitrepo.git.update_ref.assert_called_once_with(
+            "refs/heads/develop", "commit1")
+
+    @mock.patch("merge_repo.shutil.rmtree", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.tempfile.mkdtemp",
+                mock.Mock(return_value="/tmp/idx"))
+    def test_allow_unrelated(self):
+
+        """Function:  test_allow_unrelated
+
+        Description:  Test with merge of unrelated histories allowed.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_tree.return_value = (0, "tree1\0", "")
+
+        self.assertEqual(merge_repo.index_merge(self.gitr, allow=True),
+                         (True, {}))
+        self.assertEqual(
+            self.gitr.gitrepo.git.merge_tree.call_args[0][0],
+            "--allow-unrelated-histories")
+
+    @mock.patch("merge_repo.resolve_theirs",
+                mock.Mock(return_value=("100644", "oid4")))
+    @mock.patch("merge_repo.shutil.rmtree", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.tempfile.mkdtemp",
+                mock.Mock(return_value="/tmp/idx"))
+    def test_conflict_resolved(self):
+
+        """Function:  test_conflict_resolved
+
+        Description:  Test with a conflict resolved to the incoming side.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_tree.return_value = (
+            1, self.conflict, "")
+
+        self.assertEqual(merge_repo.index_merge(self.gitr), (True, {}))
+        self.gitr.gitrepo.git.update_index.assert_called_once_with(
+            "--add", "--cacheinfo", "100644,oid4,file1")
+        self.assertTrue(self.gitr.gitrepo.git.update_ref.called)
+
+    @mock.patch("merge_repo.resolve_theirs", mock.Mock(return_value=None))
+    @mock.patch("merge_repo.shutil.rmtree", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.tempfile.mkdtemp",
+                mock.Mock(return_value="/tmp/idx"))
+    def test_conflict_removed(self):
+
+        """Function:  test_conflict_removed
+
+        Description:  Test with a conflict removed by the incoming side.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_tree.return_value = (
+            1, self.conflict, "")
+
+        self.assertEqual(merge_repo.index_merge(self.gitr), (True, {}))
+        self.gitr.gitrepo.git.update_index.assert_called_once_with(
+            "--force-remove", "--", "file1")
+
+    @mock.patch("merge_repo.shutil.rmtree", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.tempfile.mkdtemp",
+                mock.Mock(return_value="/tmp/idx"))
+    def test_merge_tree_fails(self):
+
+        """Function:  test_merge_tree_fails
+
+        Description:  Test with merge-tree failing.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_tree.return_value = (
+            128, "", "fatal: refusing to merge unrelated histories")
+
+        status, msg = merge_repo.index_merge(self.gitr)
+
+        self.assertFalse(status)
+        self.assertEqual(msg["status"], 128)
+        self.assertFalse(self.gitr.gitrepo.git.update_ref.called)
+
+    @mock.patch("merge_repo.shutil.rmtree")
+    @mock.patch("merge_repo.tempfile.mkdtemp",
+                mock.Mock(return_value="/tmp/idx"))
+    def test_command_fails(self, mock_rm):
+
+        """Function:  test_command_fails
+
+        Description:  Test with a Git command failing.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_tree.return_value = (0, "tree1\0", "")
+        self.gitr.gitrepo.git.commit_tree.side_effect = \
+            merge_repo.git.exc.GitCommandError("git commit-tree", 128)
+
+        status, msg = merge_repo.index_merge(self.gitr)
+
+        self.assertFalse(status)
+        self.assertEqual(msg["command"], "git commit-tree")
+        self.assertFalse(self.gitr.gitrepo.git.update_ref.called)
+        mock_rm.assert_called_once_with("/tmp/idx", ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
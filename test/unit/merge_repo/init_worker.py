@@ -0,0 +1,200 @@
+# Classification (U)
+
+"""Program:  init_worker.py
+
+    Description:  Unit testing of init_worker in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/init_worker.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        insert_arg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_worker_dir
+        test_worker_env
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.args = ArgParser()
+        self.work_dir = os.path.join(
+            "/data/merge-repo/work_dir",
+            "worker_%s_%s" % (os.getppid(), os.getpid()))
+
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_worker_dir(self, mock_log, mock_dir):
+
+        """Function:  test_worker_dir
+
+        Description:  Test with the worker sub-directory set up.
+
+        Arguments:
+
+        """
+
+        mock_dir.return_value = (True, None)
+
+        merge_repo.init_worker(self.args, self.cfg, mock_log)
+
+        self.assertEqual(self.cfg.work_dir, self.work_dir)
+
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_worker_env(self, mock_log, mock_dir):
+
+        """Function:  test_worker_env
+
+        Description:  Test with the worker settings saved.
+
+        Arguments:
+
+        """
+
+        mock_dir.return_value = (True, None)
+
+        merge_repo.init_worker(self.args, self.cfg, mock_log)
+
+        self.assertEqual(
+            merge_repo.WORKER_ENV,
+            {"args": self.args, "cfg": self.cfg, "log": mock_log})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.WORKER_ENV.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+# Classification (U)
+
+"""Program:  inotify_watch.py
+
+    Description:  Unit testing of inotify_watch in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/inotify_watch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CDLL(object):                                     # pylint:disable=R0205
+
+    """Class:  CDLL
+
+    Description:  Class stub holder for the ctypes.CDLL class.
+
+    Methods:
+        __init__
+        inotify_init1
+        inotify_add_watch
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.fdesc = 5
+        self.wdesc = 1
+        self.path = None
+
+    def inotify_init1(self, flags):
+
+        """Method:  inotify_init1
+
+        Description:  Method stub holder for libc inotify_init1.
+
+        Arguments:
+
+        """
+
+        if flags:
+            return self.fdesc
+
+        return -1
+
+    def inotify_add_watch(self, fdesc, path, mask):
+
+        """Method:  inotify_add_watch
+
+        Description:  Method stub holder for libc inotify_add_watch.
+
+        Arguments:
+
+        """
+
+        self.path = path
+
+        if fdesc and mask:
+            return self.wdesc
+
+        return -1
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_libc
+        test_init_failed
+        test_watch_failed
+        test_watch_path
+        test_watch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.libc = CDLL()
+        self.spool_dir = "/data/merge-repo/spool_dir"
+
+    @mock.patch("ctypes.util.find_library",
+                mock.Mock(return_value="libc.so.6"))
+    @mock.patch("ctypes.CDLL")
+    def test_no_libc(self, mock_cdll):
+
+        """Function:  test_no_libc
+
+        Description:  Test with libc not able to be loaded.
+
+        Arguments:
+
+        """
+
+        mock_cdll.side_effect = OSError("Not found")
+
+        self.assertIsNone(merge_repo.inotify_watch(self.spool_dir))
+
+    @mock.patch("ctypes.util.find_library",
+                mock.Mock(return_value="libc.so.6"))
+    @mock.patch("ctypes.CDLL")
+    def test_init_failed(self, mock_cdll):
+
+        """Function:  test_init_failed
+
+        Description:  Test with inotify_init1 failing.
+
+        Arguments:
+
+        """
+
+        self.libc.fdesc = -1
+
+        mock_cdll.return_value = self.libc
+
+        self.assertIsNone(merge_repo.inotify_watch(self.spool_dir))
+
+    @mock.patch("ctypes.util.find_library",
+                mock.Mock(return_value="libc.so.6"))
+    @mock.patch("merge_repo.os.close", mock.Mock(return_value=True))
+    @mock.patch("ctypes.CDLL")
+    def test_watch_failed(self, mock_cdll):
+
+        """Function:  test_watch_failed
+
+        Description:  Test with inotify_add_watch failing.
+
+        Arguments:
+
+        """
+
+        self.libc.wdesc = -1
+
+        mock_cdll.return_value = self.libc
+
+        self.assertIsNone(merge_repo.inotify_watch(self.spool_dir))
+
+    @mock.patch("ctypes.util.find_library",
+                mock.Mock(return_value="libc.so.6"))
+    @mock.patch("ctypes.CDLL")
+    def test_watch_path(self, mock_cdll):
+
+        """Function:  test_watch_path
+
+        Description:  Test with directory path passed as bytes.
+
+        Arguments:
+
+        """
+
+        mock_cdll.return_value = self.libc
+
+        merge_repo.inotify_watch(self.spool_dir)
+
+        self.assertEqual(self.libc.path, self.spool_dir.encode("utf-8"))
+
+    @mock.patch("ctypes.util.find_library",
+                mock.Mock(return_value="libc.so.6"))
+    @mock.patch("ctypes.CDLL")
+    def test_watch(self, mock_cdll):
+
+        """Function:  test_watch
+
+        Description:  Test with inotify watch set up.
+
+        Arguments:
+
+        """
+
+        mock_cdll.return_value = self.libc
+
+        self.assertEqual(merge_repo.inotify_watch(self.spool_dir), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
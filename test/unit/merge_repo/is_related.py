@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  is_related.py
+
+    Description:  Unit testing of is_related in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/is_related.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+        self.gitrepo = mock.Mock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_related
+        test_unrelated
+        test_no_remote_branch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+
+    def test_related(self):
+
+        """Function:  test_related
+
+        Description:  Test with a merge base.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_base.return_value = "abc123"
+
+        self.assertTrue(merge_repo.is_related(self.gitr))
+        self.gitr.gitrepo.git.merge_base.assert_called_once_with(
+            "HEAD", "refs/remotes/origin/develop")
+
+    def test_unrelated(self):
+
+        """Function:  test_unrelated
+
+        Description:  Test with no merge base.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_base.side_effect = \
+            merge_repo.git.exc.GitCommandError("git merge-base", 1)
+
+        self.assertFalse(merge_repo.is_related(self.gitr))
+
+    def test_no_remote_branch(self):
+
+        """Function:  test_no_remote_branch
+
+        Description:  Test with no remote branch.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_base.side_effect = \
+            merge_repo.git.exc.GitCommandError("git merge-base", 128)
+
+        self.assertTrue(merge_repo.is_related(self.gitr))
+
+
+if __name__ == "__main__":
+    unittest.main()
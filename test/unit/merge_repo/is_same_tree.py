@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  is_same_tree.py
+
+    Description:  Unit testing of is_same_tree in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/is_same_tree.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+        self.gitrepo = mock.Mock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_same_tree
+        test_different_tree
+        test_no_remote_branch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+
+    def test_same_tree(self):
+
+        """Function:  test_same_tree
+
+        Description:  Test with the same trees.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.rev_parse.side_effect = ["abc123", "abc123"]
+
+        self.assertTrue(merge_repo.is_same_tree(self.gitr))
+        self.gitr.gitrepo.git.rev_parse.assert_called_with(
+            "refs/remotes/origin/develop^{tree}")
+
+    def test_different_tree(self):
+
+        """Function:  test_different_tree
+
+        Description:  Test with different trees.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.rev_parse.side_effect = ["abc123", "def456"]
+
+        self.assertFalse(merge_repo.is_same_tree(self.gitr))
+
+    def test_no_remote_branch(self):
+
+        """Function:  test_no_remote_branch
+
+        Description:  Test with no remote branch.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.rev_parse.side_effect = [
+            "abc123", merge_repo.git.exc.GitCommandError("git rev-parse", 128)]
+
+        self.assertFalse(merge_repo.is_same_tree(self.gitr))
+
+
+if __name__ == "__main__":
+    unittest.main()
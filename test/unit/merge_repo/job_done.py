@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  job_done.py
+
+    Description:  Unit testing of job_done in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/job_done.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_clients
+        test_clients_replied
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = mock.Mock()
+        self.conn2 = mock.Mock()
+        self.job = {"-p": "/directory/repo-name", "job_id": "0123456789ab",
+                    "conns": []}
+        self.job2 = {"-p": "/directory/repo2", "job_id": "ba9876543210",
+                     "conns": []}
+        self.jobs = {"lock": threading.Lock(), "queue": [],
+                     "running": [self.job2, self.job]}
+
+    @mock.patch("merge_repo.job_reply")
+    def test_no_clients(self, mock_reply):
+
+        """Function:  test_no_clients
+
+        Description:  Test with no clients waiting for the job.
+
+        Arguments:
+
+        """
+
+        self.job.pop("conns")
+
+        self.assertFalse(merge_repo.job_done(self.jobs, self.job, True))
+        self.assertFalse(mock_reply.called)
+
+    @mock.patch("merge_repo.job_reply")
+    def test_clients_replied(self, mock_reply):
+
+        """Function:  test_clients_replied
+
+        Description:  Test with the merge status sent to each waiting client.
+
+        Arguments:
+
+        """
+
+        self.job["conns"] = [self.conn, self.conn2]
+
+        self.assertFalse(merge_repo.job_done(self.jobs, self.job, True))
+        mock_reply.assert_called_with(
+            self.conn2, {"job_id": "0123456789ab", "status": True})
+        self.assertEqual(mock_reply.call_count, 2)
+        self.conn.close.assert_called_once_with()
+        self.conn2.close.assert_called_once_with()
+        self.assertEqual(self.jobs["running"], [self.job2])
+
+
+if __name__ == "__main__":
+    unittest.main()
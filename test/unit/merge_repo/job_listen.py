@@ -0,0 +1,94 @@
+# Classification (U)
+
+"""Program:  job_listen.py
+
+    Description:  Unit testing of job_listen in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/job_listen.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_socket_closed
+        test_client_accepted
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.jobs = {"queue": []}
+        self.lsock = mock.Mock()
+        self.conn = mock.Mock()
+
+    @mock.patch("merge_repo.job_request")
+    def test_socket_closed(self, mock_req):
+
+        """Function:  test_socket_closed
+
+        Description:  Test with the socket closed before any client.
+
+        Arguments:
+
+        """
+
+        self.lsock.accept.side_effect = OSError("Bad file descriptor")
+
+        self.assertFalse(
+            merge_repo.job_listen("Args", self.jobs, self.lsock))
+        self.assertFalse(mock_req.called)
+
+    @mock.patch("merge_repo.job_request")
+    def test_client_accepted(self, mock_req):
+
+        """Function:  test_client_accepted
+
+        Description:  Test with a client accepted and its job read.
+
+        Arguments:
+
+        """
+
+        self.lsock.accept.side_effect = [
+            (self.conn, ""), OSError("Bad file descriptor")]
+
+        self.assertFalse(
+            merge_repo.job_listen("Args", self.jobs, self.lsock))
+        mock_req.assert_called_once_with("Args", self.jobs, self.conn)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# Classification (U)
+
+"""Program:  job_reply.py
+
+    Description:  Unit testing of job_reply in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/job_reply.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_reply_sent
+        test_client_gone
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = mock.Mock()
+        self.data = {"status": "queued"}
+        self.line = b'{"status": "queued"}\n'
+
+    def test_reply_sent(self):
+
+        """Function:  test_reply_sent
+
+        Description:  Test with the reply sent as a single line.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(merge_repo.job_reply(self.conn, self.data))
+        self.conn.sendall.assert_called_once_with(self.line)
+
+    def test_client_gone(self):
+
+        """Function:  test_client_gone
+
+        Description:  Test with the client gone away.
+
+        Arguments:
+
+        """
+
+        self.conn.sendall.side_effect = OSError("Broken pipe")
+
+        self.assertFalse(merge_repo.job_reply(self.conn, self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+# Classification (U)
+
+"""Program:  job_request.py
+
+    Description:  Unit testing of job_request in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/job_request.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-c": "merge", "-d": "/config_dir", "-D": True}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_job_queued
+        test_job_duplicate
+        test_job_wait
+        test_job_running
+        test_config_mismatch
+        test_bad_request
+        test_wake_pipe_full
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.conn = mock.Mock()
+        self.jobs = {"lock": mock.MagicMock(), "queue": [], "running": [],
+                     "wake": 7}
+        self.job = '{"-c": "merge", "-d": "/config_dir", "-p": "/proj"}\n'
+        self.job2 = '{"-c": "merge", "-d": "/config_dir", "-p": "/proj",' \
+            ' "wait": true}\n'
+        self.job3 = '{"-c": "merge2", "-d": "/config_dir", "-p": "/proj"}\n'
+        self.queued = {"-p": "/proj", "job_id": "0123456789ab", "conns": []}
+
+    @mock.patch("merge_repo.os.write")
+    @mock.patch("merge_repo.job_reply")
+    def test_job_queued(self, mock_reply, mock_write):
+
+        """Function:  test_job_queued
+
+        Description:  Test with a job queued.
+
+        Arguments:
+
+        """
+
+        self.conn.makefile.return_value.readline.return_value = self.job
+
+        self.assertFalse(
+            merge_repo.job_request(self.args, self.jobs, self.conn))
+        self.assertEqual(len(self.jobs["queue"]), 1)
+        mock_reply.assert_called_once_with(
+            self.conn, {"job_id": self.jobs["queue"][0]["job_id"],
+                        "status": "queued"})
+        mock_write.assert_called_once_with(7, b"j")
+        self.conn.close.assert_called_once_with()
+
+    @mock.patch("merge_repo.os.write", mock.Mock(return_value=1))
+    @mock.patch("merge_repo.job_reply")
+    def test_job_duplicate(self, mock_reply):
+
+        """Function:  test_job_duplicate
+
+        Description:  Test with a job for a project already queued.
+
+        Arguments:
+
+        """
+
+        self.jobs["queue"].append(self.queued)
+        self.conn.makefile.return_value.readline.return_value = self.job
+
+        self.assertFalse(
+            merge_repo.job_request(self.args, self.jobs, self.conn))
+        self.assertEqual(self.jobs["queue"], [self.queued])
+        mock_reply.assert_called_once_with(
+            self.conn, {"job_id": "0123456789ab", "status": "duplicate"})
+
+    @mock.patch("merge_repo.os.write", mock.Mock(return_value=1))
+    @mock.patch("merge_repo.job_reply", mock.Mock())
+    def test_job_wait(self):
+
+        """Function:  test_job_wait
+
+        Description:  Test with the client waiting for the merge status.
+
+        Arguments:
+
+        """
+
+        self.jobs["queue"].append(self.queued)
+        self.conn.makefile.return_value.readline.return_value = self.job2
+
+        self.assertFalse(
+            merge_repo.job_request(self.args, self.jobs, self.conn))
+        self.assertEqual(self.queued["conns"], [self.conn])
+        self.assertFalse(self.conn.close.called)
+
+    @mock.patch("merge_repo.os.write", mock.Mock(return_value=1))
+    @mock.patch("merge_repo.job_reply")
+    def test_job_running(self, mock_reply):
+
+        """Function:  test_job_running
+
+        Description:  Test with a waiting client for a project already being
+            merged.
+
+        Arguments:
+
+        """
+
+        self.jobs["running"].append(self.queued)
+        self.conn.makefile.return_value.readline.return_value = self.job2
+
+        self.assertFalse(
+            merge_repo.job_request(self.args, self.jobs, self.conn))
+        self.assertEqual(self.jobs["queue"], [])
+        self.assertEqual(self.queued["conns"], [self.conn])
+        mock_reply.assert_called_once_with(
+            self.conn, {"job_id": "0123456789ab", "status": "duplicate"})
+        self.assertFalse(self.conn.close.called)
+
+    @mock.patch("merge_repo.os.write")
+    @mock.patch("merge_repo.job_reply")
+    def test_config_mismatch(self, mock_reply, mock_write):
+
+        """Function:  test_config_mismatch
+
+        Description:  Test with a job for another configuration file.
+
+        Arguments:
+
+        """
+
+        self.conn.makefile.return_value.readline.return_value = self.job3
+
+        self.assertFalse(
+            merge_repo.job_request(self.args, self.jobs, self.conn))
+        self.assertEqual(self.jobs["queue"], [])
+        self.assertEqual(mock_reply.call_args[0][1]["status"], "rejected")
+        self.assertFalse(mock_write.called)
+
+    @mock.patch("merge_repo.job_reply")
+    def test_bad_request(self, mock_reply):
+
+        """Function:  test_bad_request
+
+        Description:  Test with a request which is not a job.
+
+        Arguments:
+
+        """
+
+        self.conn.makefile.return_value.readline.return_value = "Not JSON\n"
+
+        self.assertFalse(
+            merge_repo.job_request(self.args, self.jobs, self.conn))
+        self.assertEqual(self.jobs["queue"], [])
+        self.assertEqual(mock_reply.call_args[0][1]["status"], "rejected")
+        self.conn.close.assert_called_once_with()
+
+    @mock.patch("merge_repo.os.write")
+    @mock.patch("merge_repo.job_reply")
+    def test_wake_pipe_full(self, mock_reply, mock_write):
+
+        """Function:  test_wake_pipe_full
+
+        Description:  Test with the wake up pipe full.
+
+        Arguments:
+
+        """
+
+        self.conn.makefile.return_value.readline.return_value = self.job
+        mock_write.side_effect = OSError("Resource unavailable")
+
+        self.assertFalse(
+            merge_repo.job_request(self.args, self.jobs, self.conn))
+        self.assertEqual(len(self.jobs["queue"]), 1)
+        self.assertEqual(mock_reply.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
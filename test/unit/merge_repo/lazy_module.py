@@ -0,0 +1,191 @@
+# Classification (U)
+
+"""Program:  lazy_module.py
+
+    Description:  Unit testing of LazyModule class in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/lazy_module.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_loaded
+        test_load
+        test_load_once
+        test_getattr
+        test_setattr
+        test_delattr
+        test_relative_name
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.module = mock.Mock()
+        self.module.attr1 = "value1"
+        self.lazy = merge_repo.LazyModule("lazy_mod")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.IMPORT_TIMES.pop("lazy_mod", None)
+
+    @mock.patch("merge_repo.importlib.import_module")
+    def test_not_loaded(self, mock_import):
+
+        """Function:  test_not_loaded
+
+        Description:  Test with the module not used yet.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.lazy.module)
+        self.assertFalse(mock_import.called)
+
+    @mock.patch("merge_repo.importlib.import_module")
+    def test_load(self, mock_import):
+
+        """Function:  test_load
+
+        Description:  Test with the module loaded.
+
+        Arguments:
+
+        """
+
+        mock_import.return_value = self.module
+
+        self.assertEqual(self.lazy.load(), self.module)
+        mock_import.assert_called_once_with("lazy_mod", None)
+        self.assertIn("lazy_mod", merge_repo.IMPORT_TIMES)
+
+    @mock.patch("merge_repo.importlib.import_module")
+    def test_load_once(self, mock_import):
+
+        """Function:  test_load_once
+
+        Description:  Test with the module loaded twice.
+
+        Arguments:
+
+        """
+
+        mock_import.return_value = self.module
+
+        self.lazy.load()
+        self.lazy.load()
+
+        self.assertEqual(mock_import.call_count, 1)
+
+    @mock.patch("merge_repo.importlib.import_module")
+    def test_getattr(self, mock_import):
+
+        """Function:  test_getattr
+
+        Description:  Test with an attribute of the module.
+
+        Arguments:
+
+        """
+
+        mock_import.return_value = self.module
+
+        self.assertEqual(self.lazy.attr1, "value1")
+
+    @mock.patch("merge_repo.importlib.import_module")
+    def test_setattr(self, mock_import):
+
+        """Function:  test_setattr
+
+        Description:  Test with an attribute set on the module.
+
+        Arguments:
+
+        """
+
+        mock_import.return_value = self.module
+        self.lazy.attr1 = "value2"
+
+        self.assertEqual(self.module.attr1, "value2")
+
+    @mock.patch("merge_repo.importlib.import_module")
+    def test_delattr(self, mock_import):
+
+        """Function:  test_delattr
+
+        Description:  Test with an attribute deleted from the module.
+
+        Arguments:
+
+        """
+
+        mock_import.return_value = self.module
+        del self.lazy.attr1
+
+        self.assertNotIn("attr1", self.module.__dict__)
+
+    @mock.patch("merge_repo.importlib.import_module")
+    def test_relative_name(self, mock_import):
+
+        """Function:  test_relative_name
+
+        Description:  Test with a module name relative to a package.
+
+        Arguments:
+
+        """
+
+        mock_import.return_value = self.module
+        lazy = merge_repo.LazyModule(".lazy_mod", "package")
+        lazy.load()
+
+        mock_import.assert_called_once_with(".lazy_mod", "package")
+        self.assertIn("lazy_mod", merge_repo.IMPORT_TIMES)
+
+
+if __name__ == "__main__":
+    unittest.main()
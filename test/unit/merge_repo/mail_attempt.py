@@ -0,0 +1,275 @@
+# Classification (U)
+
+"""Program:  mail_attempt.py
+
+    Description:  Unit testing of mail_attempt in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/mail_attempt.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mail_spool = "/data/merge-repo/mail_spool"
+        self.mail_retries = 5
+        self.mail_backoff = 60
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_message_sent
+        test_message_locked
+        test_message_replaced
+        test_send_retried
+        test_backoff_max
+        test_retries_exhausted
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.path = "/data/merge-repo/mail_spool/100000000_abc.mail"
+        self.failed = "/data/merge-repo/mail_spool/100000000_abc.failed"
+        self.msg = {"to_line": "name@domain", "subj": "Subject",
+                    "body": ["Line 1"], "frm_line": "gituser@server",
+                    "queued": 50.0, "attempts": 0, "next_try": 0}
+        self.stat = mock.Mock(st_ino=10)
+        self.stat2 = mock.Mock(st_ino=11)
+
+    def open_msg(self, attempts=0):
+
+        """Function:  open_msg
+
+        Description:  Return a mock open of the message file.
+
+        Arguments:
+
+        """
+
+        self.msg["attempts"] = attempts
+
+        return mock.mock_open(read_data=json.dumps(self.msg))
+
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.stat")
+    @mock.patch("merge_repo.os.fstat")
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.mail_deliver")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_message_sent(                              # pylint:disable=R0913
+            self, mock_log, mock_deliver, mock_fstat, mock_stat,
+            mock_remove):
+
+        """Function:  test_message_sent
+
+        Description:  Test with the message sent and removed from the spool.
+
+        Arguments:
+
+        """
+
+        mock_fstat.return_value = self.stat
+        mock_stat.return_value = self.stat
+
+        with mock.patch("merge_repo.open", self.open_msg(), create=True):
+            self.assertIsNone(
+                merge_repo.mail_attempt(self.path, self.cfg, mock_log))
+
+        mock_deliver.assert_called_once_with(self.msg)
+        mock_remove.assert_called_once_with(self.path)
+
+    @mock.patch("merge_repo.fcntl.flock")
+    @mock.patch("merge_repo.mail_deliver")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_message_locked(self, mock_log, mock_deliver, mock_flock):
+
+        """Function:  test_message_locked
+
+        Description:  Test with the message locked by another sender.
+
+        Arguments:
+
+        """
+
+        mock_flock.side_effect = IOError("Resource temporarily unavailable")
+
+        with mock.patch("merge_repo.open", self.open_msg(), create=True):
+            self.assertIsNone(
+                merge_repo.mail_attempt(self.path, self.cfg, mock_log))
+
+        self.assertFalse(mock_deliver.called)
+
+    @mock.patch("merge_repo.os.stat")
+    @mock.patch("merge_repo.os.fstat")
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.mail_deliver")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_message_replaced(                          # pylint:disable=R0913
+            self, mock_log, mock_deliver, mock_fstat, mock_stat):
+
+        """Function:  test_message_replaced
+
+        Description:  Test with the message replaced by another sender since
+            it was opened.
+
+        Arguments:
+
+        """
+
+        mock_fstat.return_value = self.stat
+        mock_stat.return_value = self.stat2
+
+        with mock.patch("merge_repo.open", self.open_msg(), create=True):
+            self.assertIsNone(
+                merge_repo.mail_attempt(self.path, self.cfg, mock_log))
+
+        self.assertFalse(mock_deliver.called)
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.mail_write")
+    @mock.patch("merge_repo.os.stat")
+    @mock.patch("merge_repo.os.fstat")
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.mail_deliver")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_send_retried(                              # pylint:disable=R0913
+            self, mock_log, mock_deliver, mock_fstat, mock_stat,
+            mock_write):
+
+        """Function:  test_send_retried
+
+        Description:  Test with the failed message rescheduled.
+
+        Arguments:
+
+        """
+
+        mock_fstat.return_value = self.stat
+        mock_stat.return_value = self.stat
+        mock_deliver.side_effect = IOError("Connection refused")
+
+        with mock.patch("merge_repo.open", self.open_msg(1), create=True):
+            self.assertEqual(
+                merge_repo.mail_attempt(self.path, self.cfg, mock_log), 220.0)
+
+        self.assertEqual(mock_write.call_args[0][1]["attempts"], 2)
+        self.assertTrue(mock_log.log_warn.called)
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.mail_write", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.stat")
+    @mock.patch("merge_repo.os.fstat")
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.mail_deliver")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_backoff_max(                               # pylint:disable=R0913
+            self, mock_log, mock_deliver, mock_fstat, mock_stat):
+
+        """Function:  test_backoff_max
+
+        Description:  Test with the retry backoff limited to
+            MAIL_BACKOFF_MAX.
+
+        Arguments:
+
+        """
+
+        self.cfg.mail_retries = 10
+        mock_fstat.return_value = self.stat
+        mock_stat.return_value = self.stat
+        mock_deliver.side_effect = IOError("Connection refused")
+
+        with mock.patch("merge_repo.open", self.open_msg(7), create=True):
+            self.assertEqual(
+                merge_repo.mail_attempt(self.path, self.cfg, mock_log),
+                100.0 + merge_repo.MAIL_BACKOFF_MAX)
+
+    @mock.patch("merge_repo.mail_write")
+    @mock.patch("merge_repo.os.rename")
+    @mock.patch("merge_repo.os.stat")
+    @mock.patch("merge_repo.os.fstat")
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.mail_deliver")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_retries_exhausted(                         # pylint:disable=R0913
+            self, mock_log, mock_deliver, mock_fstat, mock_stat,
+            mock_rename, mock_write):
+
+        """Function:  test_retries_exhausted
+
+        Description:  Test with the message renamed to .failed after
+            mail_retries attempts.
+
+        Arguments:
+
+        """
+
+        mock_fstat.return_value = self.stat
+        mock_stat.return_value = self.stat
+        mock_deliver.side_effect = IOError("Connection refused")
+
+        with mock.patch("merge_repo.open", self.open_msg(4), create=True):
+            self.assertIsNone(
+                merge_repo.mail_attempt(self.path, self.cfg, mock_log))
+
+        mock_rename.assert_called_once_with(self.path, self.failed)
+        self.assertFalse(mock_write.called)
+        self.assertTrue(mock_log.log_err.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
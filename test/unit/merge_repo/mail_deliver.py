@@ -0,0 +1,93 @@
+# Classification (U)
+
+"""Program:  mail_deliver.py
+
+    Description:  Unit testing of mail_deliver in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/mail_deliver.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_message_sent
+        test_send_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.msg = {"to_line": "name@domain", "subj": "Subject",
+                    "body": ["Line 1", "Line 2"],
+                    "frm_line": "gituser@server"}
+
+    @mock.patch("merge_repo.gen_class.Mail")
+    def test_message_sent(self, mock_mail):
+
+        """Function:  test_message_sent
+
+        Description:  Test with the message compiled and sent.
+
+        Arguments:
+
+        """
+
+        merge_repo.mail_deliver(self.msg)
+
+        mock_mail.assert_called_once_with(
+            "name@domain", "Subject", "gituser@server")
+        self.assertEqual(mock_mail.return_value.add_2_msg.call_count, 2)
+        mock_mail.return_value.send_mail.assert_called_once_with()
+
+    @mock.patch("merge_repo.gen_class.Mail")
+    def test_send_failed(self, mock_mail):
+
+        """Function:  test_send_failed
+
+        Description:  Test with the mail server raising an exception.
+
+        Arguments:
+
+        """
+
+        mock_mail.return_value.send_mail.side_effect = \
+            IOError("Connection refused")
+
+        self.assertRaises(IOError, merge_repo.mail_deliver, self.msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
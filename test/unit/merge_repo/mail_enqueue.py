@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  mail_enqueue.py
+
+    Description:  Unit testing of mail_enqueue in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/mail_enqueue.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_message_queued
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.spool_dir = "/data/merge-repo/mail_spool"
+        self.path = "/data/merge-repo/mail_spool/100000000_abc.mail"
+        self.body = ["Line 1", "Line 2"]
+        self.msg = {"to_line": "name@domain", "subj": "Subject",
+                    "body": self.body, "frm_line": "gituser@server",
+                    "queued": 100.0, "attempts": 0, "next_try": 0}
+
+    @mock.patch("merge_repo.socket.gethostname",
+                mock.Mock(return_value="server"))
+    @mock.patch("merge_repo.getpass.getuser",
+                mock.Mock(return_value="gituser"))
+    @mock.patch("merge_repo.uuid.uuid4", mock.Mock(return_value=mock.Mock(
+        hex="abc")))
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.mail_write")
+    def test_message_queued(self, mock_write):
+
+        """Function:  test_message_queued
+
+        Description:  Test with the message queued in the mail spool.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.mail_enqueue(
+                self.spool_dir, "name@domain", "Subject", iter(self.body)),
+            self.path)
+        mock_write.assert_called_once_with(self.path, self.msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
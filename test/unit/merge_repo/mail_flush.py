@@ -0,0 +1,283 @@
+# Classification (U)
+
+"""Program:  mail_flush.py
+
+    Description:  Unit testing of mail_flush in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/mail_flush.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mail_spool = "/data/merge-repo/mail_spool"
+        self.mail_retries = 5
+        self.mail_backoff = 60
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_message_due
+        test_message_not_due
+        test_next_try
+        test_other_files
+        test_invalid_message
+        test_invalid_not_moved
+        test_invalid_moved_by_other
+        test_message_gone
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.spool_dir = "/data/merge-repo/mail_spool"
+        self.path = "/data/merge-repo/mail_spool/100000000_abc.mail"
+        self.due = mock.mock_open(read_data='{"next_try": 0}')
+        self.not_due = mock.mock_open(read_data='{"next_try": 200.0}')
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.os.listdir",
+                mock.Mock(return_value=["100000000_abc.mail"]))
+    @mock.patch("merge_repo.mail_attempt")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_message_due(self, mock_log, mock_attempt):
+
+        """Function:  test_message_due
+
+        Description:  Test with a message due for a delivery attempt.
+
+        Arguments:
+
+        """
+
+        mock_attempt.return_value = None
+
+        with mock.patch("merge_repo.open", self.due, create=True):
+            self.assertIsNone(
+                merge_repo.mail_flush(self.spool_dir, self.cfg, mock_log))
+
+        mock_attempt.assert_called_once_with(self.path, self.cfg, mock_log)
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.os.listdir",
+                mock.Mock(return_value=["100000000_abc.mail"]))
+    @mock.patch("merge_repo.mail_attempt")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_message_not_due(self, mock_log, mock_attempt):
+
+        """Function:  test_message_not_due
+
+        Description:  Test with a message waiting for its retry.
+
+        Arguments:
+
+        """
+
+        with mock.patch("merge_repo.open", self.not_due, create=True):
+            self.assertEqual(
+                merge_repo.mail_flush(self.spool_dir, self.cfg, mock_log),
+                200.0)
+
+        self.assertFalse(mock_attempt.called)
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.os.listdir",
+                mock.Mock(return_value=["2_abc.mail", "1_abc.mail"]))
+    @mock.patch("merge_repo.mail_attempt")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_next_try(self, mock_log, mock_attempt):
+
+        """Function:  test_next_try
+
+        Description:  Test with the earliest retry of the messages returned.
+
+        Arguments:
+
+        """
+
+        mock_attempt.side_effect = [250.0, 150.0]
+
+        with mock.patch("merge_repo.open", self.due, create=True):
+            self.assertEqual(
+                merge_repo.mail_flush(self.spool_dir, self.cfg, mock_log),
+                150.0)
+
+        self.assertEqual(
+            mock_attempt.call_args_list[0][0][0],
+            os.path.join(self.spool_dir, "1_abc.mail"))
+
+    @mock.patch("merge_repo.os.listdir", mock.Mock(
+        return_value=["1_abc.failed", ".merge_repo.xyz.tmp"]))
+    @mock.patch("merge_repo.mail_attempt")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_other_files(self, mock_log, mock_attempt):
+
+        """Function:  test_other_files
+
+        Description:  Test with the failed and temporary files skipped.
+
+        Arguments:
+
+        """
+
+        with mock.patch("merge_repo.open", self.due, create=True) as mock_op:
+            self.assertIsNone(
+                merge_repo.mail_flush(self.spool_dir, self.cfg, mock_log))
+
+        self.assertFalse(mock_op.called)
+        self.assertFalse(mock_attempt.called)
+
+    @mock.patch("merge_repo.os.rename")
+    @mock.patch("merge_repo.os.listdir",
+                mock.Mock(return_value=["100000000_abc.mail"]))
+    @mock.patch("merge_repo.mail_attempt")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_invalid_message(self, mock_log, mock_attempt, mock_rename):
+
+        """Function:  test_invalid_message
+
+        Description:  Test with an invalid message renamed to .failed.
+
+        Arguments:
+
+        """
+
+        with mock.patch("merge_repo.open", mock.mock_open(read_data="{"),
+                        create=True):
+            self.assertIsNone(
+                merge_repo.mail_flush(self.spool_dir, self.cfg, mock_log))
+
+        mock_rename.assert_called_once_with(
+            self.path, "/data/merge-repo/mail_spool/100000000_abc.failed")
+        self.assertFalse(mock_attempt.called)
+        self.assertTrue(mock_log.log_err.called)
+
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.rename")
+    @mock.patch("merge_repo.os.listdir",
+                mock.Mock(return_value=["100000000_abc.mail"]))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_invalid_not_moved(self, mock_log, mock_rename):
+
+        """Function:  test_invalid_not_moved
+
+        Description:  Test with an invalid message which cannot be renamed.
+
+        Arguments:
+
+        """
+
+        mock_rename.side_effect = OSError("Permission denied")
+
+        with mock.patch("merge_repo.open", mock.mock_open(read_data="{"),
+                        create=True):
+            self.assertIsNone(
+                merge_repo.mail_flush(self.spool_dir, self.cfg, mock_log))
+
+        self.assertTrue(mock_log.log_err.called)
+        mock_log.log_warn.assert_called_once_with(
+            "mail_flush:  Message %s not moved: Permission denied"
+            % (self.path))
+
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.os.rename")
+    @mock.patch("merge_repo.os.listdir",
+                mock.Mock(return_value=["100000000_abc.mail"]))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_invalid_moved_by_other(self, mock_log, mock_rename):
+
+        """Function:  test_invalid_moved_by_other
+
+        Description:  Test with an invalid message moved by another sender.
+
+        Arguments:
+
+        """
+
+        mock_rename.side_effect = OSError("No such file or directory")
+
+        with mock.patch("merge_repo.open", mock.mock_open(read_data="{"),
+                        create=True):
+            self.assertIsNone(
+                merge_repo.mail_flush(self.spool_dir, self.cfg, mock_log))
+
+        self.assertFalse(mock_log.log_warn.called)
+
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.os.listdir",
+                mock.Mock(return_value=["100000000_abc.mail"]))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_message_gone(self, mock_log):
+
+        """Function:  test_message_gone
+
+        Description:  Test with the message delivered by another sender.
+
+        Arguments:
+
+        """
+
+        with mock.patch("merge_repo.open", create=True) as mock_op:
+            mock_op.side_effect = IOError("No such file or directory")
+
+            self.assertIsNone(
+                merge_repo.mail_flush(self.spool_dir, self.cfg, mock_log))
+
+        self.assertFalse(mock_log.log_warn.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
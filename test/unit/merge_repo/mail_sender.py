@@ -0,0 +1,169 @@
+# Classification (U)
+
+"""Program:  mail_sender.py
+
+    Description:  Unit testing of mail_sender in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/mail_sender.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mail_spool = "/data/merge-repo/mail_spool"
+        self.mail_retries = 5
+        self.mail_backoff = 60
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sender_stopped
+        test_wait_retry
+        test_wait_poll
+        test_scan_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.queue = {"spool_dir": "/data/merge-repo/mail_spool",
+                      "wake": mock.Mock(), "stop": mock.Mock()}
+
+    @mock.patch("merge_repo.mail_flush")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_sender_stopped(self, mock_log, mock_flush):
+
+        """Function:  test_sender_stopped
+
+        Description:  Test with a last scan of the spool when stopped.
+
+        Arguments:
+
+        """
+
+        self.queue["stop"].is_set.return_value = True
+
+        merge_repo.mail_sender(self.queue, self.cfg, mock_log)
+
+        mock_flush.assert_called_once_with(
+            self.queue["spool_dir"], self.cfg, mock_log)
+        self.assertFalse(self.queue["wake"].wait.called)
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.mail_flush")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_wait_retry(self, mock_log, mock_flush):
+
+        """Function:  test_wait_retry
+
+        Description:  Test with the sender waiting for the next retry.
+
+        Arguments:
+
+        """
+
+        self.queue["stop"].is_set.side_effect = [False, True]
+        mock_flush.return_value = 102.0
+
+        merge_repo.mail_sender(self.queue, self.cfg, mock_log)
+
+        self.assertEqual(mock_flush.call_count, 2)
+        self.queue["wake"].wait.assert_called_once_with(2.0)
+        self.queue["wake"].clear.assert_called_once_with()
+
+    @mock.patch("merge_repo.mail_flush")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_wait_poll(self, mock_log, mock_flush):
+
+        """Function:  test_wait_poll
+
+        Description:  Test with the sender waiting for the next spool scan.
+
+        Arguments:
+
+        """
+
+        self.queue["stop"].is_set.side_effect = [False, True]
+        mock_flush.return_value = None
+
+        merge_repo.mail_sender(self.queue, self.cfg, mock_log)
+
+        self.queue["wake"].wait.assert_called_once_with(
+            merge_repo.MAIL_POLL)
+
+    @mock.patch("merge_repo.mail_flush")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_scan_failed(self, mock_log, mock_flush):
+
+        """Function:  test_scan_failed
+
+        Description:  Test with the spool scan raising an exception.
+
+        Arguments:
+
+        """
+
+        self.queue["stop"].is_set.side_effect = [False, True]
+        mock_flush.side_effect = [OSError("Permission denied"), None]
+
+        merge_repo.mail_sender(self.queue, self.cfg, mock_log)
+
+        self.assertTrue(mock_log.log_warn.called)
+        self.assertEqual(mock_flush.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
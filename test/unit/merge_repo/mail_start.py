@@ -0,0 +1,156 @@
+# Classification (U)
+
+"""Program:  mail_start.py
+
+    Description:  Unit testing of mail_start in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/mail_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mail_spool = "/data/merge-repo/mail_spool"
+        self.mail_retries = 5
+        self.mail_backoff = 60
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_spool
+        test_sender_started
+        test_spool_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.MAIL_QUEUE.clear()
+
+    @mock.patch("merge_repo.threading.Thread")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_no_spool(self, mock_log, mock_thread):
+
+        """Function:  test_no_spool
+
+        Description:  Test with the mail_spool setting not set.
+
+        Arguments:
+
+        """
+
+        self.cfg.mail_spool = None
+
+        self.assertIsNone(merge_repo.mail_start(self.cfg, mock_log))
+        self.assertFalse(mock_thread.called)
+        self.assertEqual(merge_repo.MAIL_QUEUE, {})
+
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("merge_repo.threading.Thread")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_sender_started(self, mock_log, mock_thread):
+
+        """Function:  test_sender_started
+
+        Description:  Test with the background sender started.
+
+        Arguments:
+
+        """
+
+        queue = merge_repo.mail_start(self.cfg, mock_log)
+
+        self.assertEqual(queue["spool_dir"], self.cfg.mail_spool)
+        self.assertEqual(queue["pid"], os.getpid())
+        self.assertTrue(queue["thread"].daemon)
+        mock_thread.return_value.start.assert_called_once_with()
+        self.assertEqual(merge_repo.MAIL_QUEUE["spool_dir"],
+                         self.cfg.mail_spool)
+
+    @mock.patch("merge_repo.gen_libs.chk_crt_dir",
+                mock.Mock(return_value=(False, "Directory not writable")))
+    @mock.patch("merge_repo.threading.Thread")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_spool_failed(self, mock_log, mock_thread):
+
+        """Function:  test_spool_failed
+
+        Description:  Test with the mail spool directory not usable.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(merge_repo.mail_start(self.cfg, mock_log))
+        self.assertFalse(mock_thread.called)
+        self.assertTrue(mock_log.log_warn.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
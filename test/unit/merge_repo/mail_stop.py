@@ -0,0 +1,117 @@
+# Classification (U)
+
+"""Program:  mail_stop.py
+
+    Description:  Unit testing of mail_stop in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/mail_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_queue
+        test_sender_stopped
+        test_messages_left
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.queue = {"spool_dir": "/data/merge-repo/mail_spool",
+                      "pid": os.getpid(), "wake": mock.Mock(),
+                      "stop": mock.Mock(), "thread": mock.Mock()}
+
+    @mock.patch("merge_repo.os.listdir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_no_queue(self, mock_log, mock_list):
+
+        """Function:  test_no_queue
+
+        Description:  Test with no mail spool in use.
+
+        Arguments:
+
+        """
+
+        merge_repo.mail_stop(None, mock_log)
+
+        self.assertFalse(mock_list.called)
+
+    @mock.patch("merge_repo.os.listdir", mock.Mock(return_value=[]))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_sender_stopped(self, mock_log):
+
+        """Function:  test_sender_stopped
+
+        Description:  Test with the sender stopped after the last scan.
+
+        Arguments:
+
+        """
+
+        merge_repo.MAIL_QUEUE.update(self.queue)
+
+        merge_repo.mail_stop(self.queue, mock_log)
+
+        self.queue["stop"].set.assert_called_once_with()
+        self.queue["wake"].set.assert_called_once_with()
+        self.queue["thread"].join.assert_called_once_with(
+            merge_repo.MAIL_POLL * 3)
+        self.assertEqual(merge_repo.MAIL_QUEUE, {})
+        self.assertFalse(mock_log.log_warn.called)
+
+    @mock.patch("merge_repo.os.listdir", mock.Mock(
+        return_value=["1_abc.mail", "2_abc.failed"]))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_messages_left(self, mock_log):
+
+        """Function:  test_messages_left
+
+        Description:  Test with messages left in the spool for the next run.
+
+        Arguments:
+
+        """
+
+        merge_repo.mail_stop(self.queue, mock_log)
+
+        mock_log.log_warn.assert_called_once_with(
+            "mail_stop:  1 message(s) left in the mail spool")
+
+
+if __name__ == "__main__":
+    unittest.main()
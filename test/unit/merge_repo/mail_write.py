@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  mail_write.py
+
+    Description:  Unit testing of mail_write in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/mail_write.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_message_written
+        test_rename_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.path = "/data/merge-repo/mail_spool/100000000_abc.mail"
+        self.tmp_file = "/data/merge-repo/mail_spool/.merge_repo.xyz.tmp"
+        self.msg = {"to_line": "name@domain", "subj": "Subject",
+                    "body": ["Line 1"], "attempts": 0, "next_try": 0}
+
+    @mock.patch("merge_repo.os.rename")
+    @mock.patch("merge_repo.os.fsync", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.fdopen", new_callable=mock.mock_open)
+    @mock.patch("merge_repo.tempfile.mkstemp")
+    def test_message_written(self, mock_temp, mock_open, mock_rename):
+
+        """Function:  test_message_written
+
+        Description:  Test with the message written and renamed into place.
+
+        Arguments:
+
+        """
+
+        mock_temp.return_value = (5, self.tmp_file)
+
+        merge_repo.mail_write(self.path, self.msg)
+
+        mock_open.assert_called_once_with(5, "w")
+        mock_rename.assert_called_once_with(self.tmp_file, self.path)
+        self.assertEqual(
+            mock_temp.call_args[1]["dir"], "/data/merge-repo/mail_spool")
+
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.rename")
+    @mock.patch("merge_repo.os.fsync", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.fdopen", mock.mock_open())
+    @mock.patch("merge_repo.tempfile.mkstemp")
+    def test_rename_failed(self, mock_temp, mock_rename, mock_remove):
+
+        """Function:  test_rename_failed
+
+        Description:  Test with the temporary file removed when the rename
+            fails.
+
+        Arguments:
+
+        """
+
+        mock_temp.return_value = (5, self.tmp_file)
+        mock_rename.side_effect = OSError("No space left on device")
+
+        self.assertRaises(
+            OSError, merge_repo.mail_write, self.path, self.msg)
+        mock_remove.assert_called_once_with(self.tmp_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -200,6 +200,13 @@ class UnitTest(unittest.TestCase):
         test_run_program
         test_programlock_true
         test_programlock_false
+        test_programlock_id
+        test_single_project_list
+        test_batch_projects
+        test_batch_drop_dir
+        test_daemon_mode
+        test_restore_mode
+        test_client_mode
 
     """
 
@@ -489,6 +496,160 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(merge_repo.main())
 
+    @mock.patch("merge_repo.run_program", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_libs")
+    @mock.patch("merge_repo.gen_class.ArgParser")
+    @mock.patch("merge_repo.gen_class.ProgramLock")
+    def test_single_project_list(self, mock_class, mock_arg, mock_lib):
+
+        """Function:  test_single_project_list
+
+        Description:  Test with a single project directory in a list.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-p"] = ["repo_path"]
+
+        mock_class.return_value = self.proglock
+        mock_arg.return_value = self.args
+        mock_lib.help_func.return_value = False
+
+        self.assertFalse(merge_repo.main())
+        self.assertEqual(self.args.get_val("-p"), "repo_path")
+
+    @mock.patch("merge_repo.run_program")
+    @mock.patch("merge_repo.gen_libs")
+    @mock.patch("merge_repo.gen_class.ArgParser")
+    def test_batch_projects(self, mock_arg, mock_lib, mock_run):
+
+        """Function:  test_batch_projects
+
+        Description:  Test with multiple project directories.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-p"] = ["repo_path", "repo_path2"]
+        self.args.args_array.pop("-r")
+
+        mock_arg.return_value = self.args
+        mock_lib.help_func.return_value = False
+        mock_run.return_value = True
+
+        self.assertFalse(merge_repo.main())
+        mock_run.assert_called_once_with(
+            self.args, {"-M": merge_repo.batch_merge})
+
+    @mock.patch("merge_repo.run_program")
+    @mock.patch("merge_repo.gen_libs")
+    @mock.patch("merge_repo.gen_class.ArgParser")
+    def test_batch_drop_dir(self, mock_arg, mock_lib, mock_run):
+
+        """Function:  test_batch_drop_dir
+
+        Description:  Test with a drop directory.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = "drop_dir"
+        self.args.args_array.pop("-p")
+        self.args.args_array.pop("-r")
+
+        mock_arg.return_value = self.args
+        mock_lib.help_func.return_value = False
+        mock_run.return_value = True
+
+        self.assertFalse(merge_repo.main())
+        self.assertEqual(self.args.opt_req, ["-c", "-d"])
+
+
+    @mock.patch("merge_repo.run_program")
+    @mock.patch("merge_repo.gen_libs")
+    @mock.patch("merge_repo.gen_class.ArgParser")
+    @mock.patch("merge_repo.gen_class.ProgramLock")
+    def test_daemon_mode(self, mock_class, mock_arg, mock_lib, mock_run):
+
+        """Function:  test_daemon_mode
+
+        Description:  Test with daemon mode option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-D"] = True
+        self.args.args_array.pop("-p")
+        self.args.args_array.pop("-r")
+
+        mock_class.return_value = self.proglock
+        mock_arg.return_value = self.args
+        mock_lib.help_func.return_value = False
+        mock_run.return_value = True
+
+        self.assertFalse(merge_repo.main())
+        mock_run.assert_called_once_with(
+            self.args, {"-M": merge_repo.daemon_merge})
+
+    @mock.patch("merge_repo.run_program")
+    @mock.patch("merge_repo.gen_libs")
+    @mock.patch("merge_repo.gen_class.ArgParser")
+    @mock.patch("merge_repo.gen_class.ProgramLock")
+    def test_restore_mode(self, mock_class, mock_arg, mock_lib, mock_run):
+
+        """Function:  test_restore_mode
+
+        Description:  Test with restore option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-R"] = "/archive_dir/repo-name.bundle"
+        self.args.args_array.pop("-M")
+        self.args.args_array.pop("-p")
+        self.args.args_array.pop("-r")
+
+        mock_class.return_value = self.proglock
+        mock_arg.return_value = self.args
+        mock_lib.help_func.return_value = False
+        mock_run.return_value = True
+
+        self.assertFalse(merge_repo.main())
+        mock_run.assert_called_once_with(
+            self.args, {"-R": merge_repo.restore})
+
+    @mock.patch("merge_repo.submit_job")
+    @mock.patch("merge_repo.run_program")
+    @mock.patch("merge_repo.gen_libs")
+    @mock.patch("merge_repo.gen_class.ArgParser")
+    @mock.patch("merge_repo.gen_class.ProgramLock")
+    def test_client_mode(                               # pylint:disable=R0913
+            self, mock_class, mock_arg, mock_lib, mock_run, mock_submit):
+
+        """Function:  test_client_mode
+
+        Description:  Test with the job submitted to the merge daemon.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Q"] = "/data/merge-repo/merge.sock"
+
+        mock_arg.return_value = self.args
+        mock_lib.help_func.return_value = False
+        mock_submit.return_value = {}
+
+        self.assertFalse(merge_repo.main())
+        mock_submit.assert_called_once_with(self.args)
+        self.assertFalse(mock_run.called)
+        self.assertFalse(mock_class.called)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -133,6 +133,9 @@ class UnitTest(unittest.TestCase):
         test_is_remote_false
         test_is_git_repo_true
         test_is_git_repo_false
+        test_preflight_no_copy
+        test_pipeline
+        test_pipeline_preflight_false
 
     """
 
@@ -247,6 +250,8 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(merge_repo.merge(self.args, self.cfg, mock_log))
 
+    @mock.patch("merge_repo.get_status", mock.Mock(
+        return_value=merge_repo.GitStatus(False, (), (), ())))
     @mock.patch("merge_repo.gen_libs.cp_dir", mock.Mock(return_value=True))
     @mock.patch("merge_repo.is_git_repo", mock.Mock(return_value=True))
     @mock.patch("merge_repo.process_project", mock.Mock(return_value=True))
@@ -274,8 +279,6 @@ class UnitTest(unittest.TestCase):
         mock_git.GitMerge.create_gitrepo.return_value = True
         mock_git.GitMerge.set_remote.return_value = True
         mock_git.GitMerge.is_remote.return_value = True
-        mock_git.GitMerge.is_dirty.side_effect = [False, False]
-        mock_git.GitMerge.is_untracked.side_effect = [False, False]
 
         self.assertFalse(merge_repo.merge(self.args, self.cfg, mock_log))
 
@@ -545,5 +548,86 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(merge_repo.merge(self.args, self.cfg, mock_log))
 
 
+    @mock.patch("merge_repo.gen_libs.cp_dir")
+    @mock.patch("merge_repo.post_process", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.preflight")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_preflight_no_copy(self, mock_log, mock_pre, mock_copy):
+
+        """Function:  test_preflight_no_copy
+
+        Description:  Test with no archive copy made when preflight fails.
+
+        Arguments:
+
+        """
+
+        mock_pre.return_value = (False, mock.Mock(url="git@domain:repo.git"))
+
+        self.assertFalse(merge_repo.merge(self.args, self.cfg, mock_log))
+        self.assertFalse(mock_copy.called)
+
+    @mock.patch("merge_repo.cleanup_repo", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.is_git_repo", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.git_class", mock.Mock())
+    @mock.patch("merge_repo.gen_libs", mock.Mock())
+    @mock.patch("merge_repo.archive_original")
+    @mock.patch("merge_repo.prefetch_mirror")
+    @mock.patch("merge_repo.wait_snapshot")
+    @mock.patch("merge_repo.start_snapshot")
+    @mock.patch("merge_repo.preflight")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_pipeline(                                  # pylint:disable=R0913
+            self, mock_log, mock_pre, mock_start, mock_wait, mock_fetch,
+            mock_arch):
+
+        """Function:  test_pipeline
+
+        Description:  Test with the snapshot overlapping the preflight.
+
+        Arguments:
+
+        """
+
+        self.cfg.pipeline = True
+        self.cfg.mirror_dir = "/data/merge-repo/mirror_dir"
+
+        mock_pre.return_value = (True, mock.Mock(url="git@domain:repo.git"))
+        mock_start.return_value = {"thread": None}
+        mock_wait.return_value = "/data/merge-repo/archive_dir/repo-name"
+
+        self.assertFalse(merge_repo.merge(self.args, self.cfg, mock_log))
+        mock_wait.assert_called_once_with({"thread": None})
+        self.assertTrue(mock_fetch.called)
+        self.assertFalse(mock_arch.called)
+
+    @mock.patch("merge_repo.post_process", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.is_git_repo", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.discard_snapshot")
+    @mock.patch("merge_repo.wait_snapshot")
+    @mock.patch("merge_repo.start_snapshot")
+    @mock.patch("merge_repo.preflight")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_pipeline_preflight_false(                  # pylint:disable=R0913
+            self, mock_log, mock_pre, mock_start, mock_wait, mock_discard):
+
+        """Function:  test_pipeline_preflight_false
+
+        Description:  Test with the snapshot discarded when preflight fails.
+
+        Arguments:
+
+        """
+
+        self.cfg.pipeline = True
+
+        mock_pre.return_value = (False, mock.Mock(url="git@domain:repo.git"))
+        mock_start.return_value = {"thread": None}
+
+        self.assertFalse(merge_repo.merge(self.args, self.cfg, mock_log))
+        mock_discard.assert_called_once_with({"thread": None}, mock_log)
+        self.assertFalse(mock_wait.called)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  merge_item.py
+
+    Description:  Unit testing of merge_item in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/merge_item.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_spool_project
+        test_submitted_job
+        test_daemon_checks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.proj_dir = "/data/merge-repo/spool_dir/repo-name"
+        self.job = {"-p": "/directory/repo-name", "job_id": "0123456789ab"}
+
+    @mock.patch("merge_repo.run_job")
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_spool_project(self, mock_log, mock_merge, mock_job):
+
+        """Function:  test_spool_project
+
+        Description:  Test with a spool project directory.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = False
+
+        self.assertEqual(
+            merge_repo.merge_item("Args", "Cfg", mock_log,
+                                  (2, self.proj_dir, None, ([], []))),
+            (2, False))
+        mock_merge.assert_called_once_with("Args", "Cfg", mock_log,
+                                           self.proj_dir)
+        self.assertFalse(mock_job.called)
+
+    @mock.patch("merge_repo.run_job")
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_submitted_job(self, mock_log, mock_merge, mock_job):
+
+        """Function:  test_submitted_job
+
+        Description:  Test with a submitted job.
+
+        Arguments:
+
+        """
+
+        mock_job.return_value = True
+
+        self.assertEqual(
+            merge_repo.merge_item("Args", "Cfg", mock_log,
+                                  (0, self.job["-p"], self.job, ([], []))),
+            (0, True))
+        mock_job.assert_called_once_with("Args", "Cfg", mock_log, self.job)
+        self.assertFalse(mock_merge.called)
+
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_daemon_checks(self, mock_log, mock_merge):
+
+        """Function:  test_daemon_checks
+
+        Description:  Test with the daemon's remote checks used for the
+            merge and not kept after it.
+
+        Arguments:
+
+        """
+
+        mock_merge.side_effect = lambda *args: (
+            "git@server:repo.git" in merge_repo.REMOTE_CHECK
+            and "/mirror_dir/repo.git" in merge_repo.MIRROR_FRESH)
+
+        self.assertEqual(
+            merge_repo.merge_item(
+                "Args", "Cfg", mock_log,
+                (1, self.proj_dir, None, (["git@server:repo.git"],
+                                          ["/mirror_dir/repo.git"]))),
+            (1, True))
+        self.assertEqual(merge_repo.REMOTE_CHECK, set())
+        self.assertEqual(merge_repo.MIRROR_FRESH, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+# Classification (U)
+
+"""Program:  merge_list.py
+
+    Description:  Unit testing of merge_list in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/merge_list.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_list
+        test_single_worker
+        test_multiple_workers
+        test_single_project
+        test_remote_check
+        test_daemon_stopping
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.proj_list = ["/directory/repo-name", "/directory/repo-name2"]
+        self.results = {"/directory/repo-name": True,
+                        "/directory/repo-name2": False}
+        self.results2 = {"/directory/repo-name": True}
+
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_empty_list(self, mock_log):
+
+        """Function:  test_empty_list
+
+        Description:  Test with no projects in the list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.merge_list("Args", self.cfg, mock_log, []), {})
+
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_single_worker(self, mock_log, mock_merge):
+
+        """Function:  test_single_worker
+
+        Description:  Test with projects merged one at a time.
+
+        Arguments:
+
+        """
+
+        mock_merge.side_effect = [True, False]
+
+        self.assertEqual(
+            merge_repo.merge_list("Args", self.cfg, mock_log, self.proj_list),
+            self.results)
+
+    @mock.patch("merge_repo.pool_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_multiple_workers(self, mock_log, mock_pool):
+
+        """Function:  test_multiple_workers
+
+        Description:  Test with projects merged by multiple workers.
+
+        Arguments:
+
+        """
+
+        self.cfg.workers = 2
+
+        mock_pool.return_value = self.results
+
+        self.assertEqual(
+            merge_repo.merge_list("Args", self.cfg, mock_log, self.proj_list),
+            self.results)
+
+    @mock.patch("merge_repo.pool_merge")
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_single_project(self, mock_log, mock_merge, mock_pool):
+
+        """Function:  test_single_project
+
+        Description:  Test with a single project and multiple workers.
+
+        Arguments:
+
+        """
+
+        self.cfg.workers = 2
+
+        mock_merge.return_value = True
+
+        self.assertEqual(
+            merge_repo.merge_list(
+                "Args", self.cfg, mock_log, ["/directory/repo-name"]),
+            self.results2)
+        self.assertFalse(mock_pool.called)
+
+    @mock.patch("merge_repo.remote_check")
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_remote_check(self, mock_log, mock_merge, mock_check):
+
+        """Function:  test_remote_check
+
+        Description:  Test with the remote check run before the merges and
+            its unused checks dropped afterwards.
+
+        Arguments:
+
+        """
+
+        mock_check.side_effect = \
+            lambda args, cfg, log, proj_list: merge_repo.REMOTE_CHECK.add(
+                "git@domain:project/repo-name.git")
+        mock_merge.side_effect = [True, False]
+
+        self.assertEqual(
+            merge_repo.merge_list("Args", self.cfg, mock_log, self.proj_list),
+            self.results)
+        mock_check.assert_called_once_with(
+            "Args", self.cfg, mock_log, self.proj_list)
+        self.assertEqual(merge_repo.REMOTE_CHECK, set())
+
+
+    @mock.patch("merge_repo.remote_check", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_daemon_stopping(self, mock_log, mock_merge):
+
+        """Function:  test_daemon_stopping
+
+        Description:  Test with the projects after a SIGTERM not merged.
+
+        Arguments:
+
+        """
+
+        def merge_proj_dir(args, cfg, log, proj_dir):
+
+            """Function:  merge_proj_dir
+
+            Description:  Receive a SIGTERM during the merge.
+
+            Arguments:
+
+            """
+
+            merge_repo.DAEMON_STOP["signum"] = 15
+
+            return bool(args and cfg and log and proj_dir)
+
+        mock_merge.side_effect = merge_proj_dir
+
+        try:
+            results = merge_repo.merge_list(
+                "Args", self.cfg, mock_log, self.proj_list)
+
+        finally:
+            merge_repo.DAEMON_STOP["signum"] = None
+
+        self.assertEqual(results, {self.proj_list[0]: True})
+        self.assertEqual(mock_merge.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
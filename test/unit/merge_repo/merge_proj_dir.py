@@ -0,0 +1,245 @@
+# Classification (U)
+
+"""Program:  merge_proj_dir.py
+
+    Description:  Unit testing of merge_proj_dir in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/merge_proj_dir.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        insert_arg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_directory
+        test_merge_exception
+        test_merge_locked
+        test_merge_args
+        test_merge_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "config_file", "-d": "config_dir", "-M": True,
+            "-b": "/directory"}
+        self.proj_dir = "/directory/repo-name"
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_not_directory(self, mock_log):
+
+        """Function:  test_not_directory
+
+        Description:  Test with project path that is not a directory.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(merge_repo.merge_proj_dir(
+            self.args, self.cfg, mock_log, self.proj_dir))
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_merge_exception(self, mock_log, mock_merge):
+
+        """Function:  test_merge_exception
+
+        Description:  Test with the merge raising an exception.
+
+        Arguments:
+
+        """
+
+        mock_merge.side_effect = OSError("Error Message")
+
+        self.assertFalse(merge_repo.merge_proj_dir(
+            self.args, self.cfg, mock_log, self.proj_dir))
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_merge_locked(self, mock_log, mock_merge):
+
+        """Function:  test_merge_locked
+
+        Description:  Test with the project locked by another instance.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = None
+
+        self.assertIsNone(merge_repo.merge_proj_dir(
+            self.args, self.cfg, mock_log, self.proj_dir))
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_merge_args(self, mock_log, mock_merge):
+
+        """Function:  test_merge_args
+
+        Description:  Test the project arguments passed to the merge.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = True
+
+        merge_repo.merge_proj_dir(self.args, self.cfg, mock_log, self.proj_dir)
+        repo_args = mock_merge.call_args[0][0]
+
+        self.assertEqual(
+            (repo_args.get_val("-p"), repo_args.get_val("-r"),
+             self.args.arg_exist("-p")),
+            (self.proj_dir, "repo-name", False))
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_merge_status(self, mock_log, mock_merge):
+
+        """Function:  test_merge_status
+
+        Description:  Test with merge status returned.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = True
+
+        self.assertTrue(merge_repo.merge_proj_dir(
+            self.args, self.cfg, mock_log, self.proj_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
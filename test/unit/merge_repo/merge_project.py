@@ -69,6 +69,9 @@ class UnitTest(unittest.TestCase):
         test_status2_false
         test_status1_true
         test_status1_false
+        test_atomic_push
+        test_atomic_push_false
+        test_index_mode
 
     """
 
@@ -88,10 +91,13 @@ class UnitTest(unittest.TestCase):
         self.msg = {}
         self.msg2 = {"Error": "Code"}
 
+    @mock.patch("merge_repo.push_branch")
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_allow_true(self, mock_log, mock_git, mock_post):
+    def test_allow_true(self, mock_log, mock_git, mock_post, mock_push):
 
         """Function:  test_allow_true
 
@@ -103,17 +109,20 @@ class UnitTest(unittest.TestCase):
 
         mock_log.return_value = True
         mock_git.priority_merge.return_value = (self.status, self.msg)
-        mock_git.git_pu.return_value = (self.status2, self.msg2)
+        mock_push.return_value = (self.status2, self.msg2, {})
         mock_post.return_value = True
 
         self.assertFalse(
             merge_repo.merge_project(
                 mock_git, self.cfg, mock_log, allow=True))
 
+    @mock.patch("merge_repo.push_branch")
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_allow_false(self, mock_log, mock_git, mock_post):
+    def test_allow_false(self, mock_log, mock_git, mock_post, mock_push):
 
         """Function:  test_allow_false
 
@@ -125,17 +134,22 @@ class UnitTest(unittest.TestCase):
 
         mock_log.return_value = True
         mock_git.priority_merge.return_value = (self.status, self.msg)
-        mock_git.git_pu.return_value = (self.status2, self.msg2)
+        mock_push.return_value = (self.status2, self.msg2, {})
         mock_post.return_value = True
 
         self.assertFalse(
             merge_repo.merge_project(
                 mock_git, self.cfg, mock_log, allow=False))
 
+    @mock.patch("merge_repo.push_branch")
+    @mock.patch("merge_repo.push_tags",
+                mock.Mock(return_value=(True, {})))
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
     @mock.patch("merge_repo.post_check")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_status3_true(self, mock_log, mock_git, mock_check):
+    def test_status3_true(self, mock_log, mock_git, mock_check, mock_push):
 
         """Function:  test_status3_true
 
@@ -147,17 +161,24 @@ class UnitTest(unittest.TestCase):
 
         mock_log.return_value = True
         mock_git.priority_merge.return_value = (self.status, self.msg)
-        mock_git.git_pu.side_effect = [(self.status, self.msg),
-                                       (self.status, self.msg)]
+        mock_push.return_value = (self.status, self.msg,
+                                  {"refs/heads/master": " "})
         mock_check.return_value = True
 
         self.assertFalse(merge_repo.merge_project(mock_git, self.cfg,
                                                   mock_log))
-
+        mock_check.assert_called_once_with(
+            mock_git, self.cfg, mock_log, refs={"refs/heads/master": " "})
+
+    @mock.patch("merge_repo.push_branch")
+    @mock.patch("merge_repo.push_tags",
+                mock.Mock(return_value=(False, {"Error": "Code"})))
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_status3_false(self, mock_log, mock_git, mock_post):
+    def test_status3_false(self, mock_log, mock_git, mock_post, mock_push):
 
         """Function:  test_status3_false
 
@@ -169,17 +190,21 @@ class UnitTest(unittest.TestCase):
 
         mock_log.return_value = True
         mock_git.priority_merge.return_value = (self.status, self.msg)
-        mock_git.git_pu.side_effect = [(self.status, self.msg),
-                                       (self.status2, self.msg2)]
+        mock_push.return_value = (self.status, self.msg, {})
         mock_post.return_value = True
 
         self.assertFalse(merge_repo.merge_project(mock_git, self.cfg,
                                                   mock_log))
 
+    @mock.patch("merge_repo.push_branch")
+    @mock.patch("merge_repo.push_tags",
+                mock.Mock(return_value=(False, {"Error": "Code"})))
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_status2_true(self, mock_log, mock_git, mock_post):
+    def test_status2_true(self, mock_log, mock_git, mock_post, mock_push):
 
         """Function:  test_status2_true
 
@@ -191,17 +216,19 @@ class UnitTest(unittest.TestCase):
 
         mock_log.return_value = True
         mock_git.priority_merge.return_value = (self.status, self.msg)
-        mock_git.git_pu.side_effect = [(self.status, self.msg),
-                                       (self.status2, self.msg2)]
+        mock_push.return_value = (self.status, self.msg, {})
         mock_post.return_value = True
 
         self.assertFalse(merge_repo.merge_project(mock_git, self.cfg,
                                                   mock_log))
 
+    @mock.patch("merge_repo.push_branch")
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_status2_false(self, mock_log, mock_git, mock_post):
+    def test_status2_false(self, mock_log, mock_git, mock_post, mock_push):
 
         """Function:  test_status2_false
 
@@ -213,16 +240,19 @@ class UnitTest(unittest.TestCase):
 
         mock_log.return_value = True
         mock_git.priority_merge.return_value = (self.status, self.msg)
-        mock_git.git_pu.return_value = (self.status2, self.msg2)
+        mock_push.return_value = (self.status2, self.msg2, {})
         mock_post.return_value = True
 
         self.assertFalse(merge_repo.merge_project(mock_git, self.cfg,
                                                   mock_log))
 
+    @mock.patch("merge_repo.push_branch")
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_status1_true(self, mock_log, mock_git, mock_post):
+    def test_status1_true(self, mock_log, mock_git, mock_post, mock_push):
 
         """Function:  test_status1_true
 
@@ -234,12 +264,14 @@ class UnitTest(unittest.TestCase):
 
         mock_log.return_value = True
         mock_git.priority_merge.return_value = (self.status, self.msg)
-        mock_git.git_pu.return_value = (self.status2, self.msg2)
+        mock_push.return_value = (self.status2, self.msg2, {})
         mock_post.return_value = True
 
         self.assertFalse(merge_repo.merge_project(mock_git, self.cfg,
                                                   mock_log))
 
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
@@ -262,6 +294,97 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(merge_repo.merge_project(mock_git, self.cfg,
                                                   mock_log))
 
+    @mock.patch("merge_repo.push_branch")
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
+    @mock.patch("merge_repo.post_check")
+    @mock.patch("merge_repo.push_atomic")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_atomic_push(                               # pylint:disable=R0913
+            self, mock_log, mock_git, mock_push, mock_check, mock_branch):
+
+        """Function:  test_atomic_push
+
+        Description:  Test with branch and tags pushed atomically.
+
+        Arguments:
+
+        """
+
+        self.cfg.atomic_push = True
+
+        mock_git.priority_merge.return_value = (self.status, self.msg)
+        mock_push.return_value = (self.status, self.msg, {})
+        mock_check.return_value = True
+
+        self.assertFalse(merge_repo.merge_project(mock_git, self.cfg,
+                                                  mock_log))
+        self.assertFalse(mock_branch.called)
+        self.assertTrue(mock_check.called)
+
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
+    @mock.patch("merge_repo.post_process")
+    @mock.patch("merge_repo.push_atomic")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_atomic_push_false(self, mock_log, mock_git, mock_push,
+                               mock_post):
+
+        """Function:  test_atomic_push_false
+
+        Description:  Test with the atomic push failing.
+
+        Arguments:
+
+        """
+
+        self.cfg.atomic_push = True
+
+        mock_git.priority_merge.return_value = (self.status, self.msg)
+        mock_push.return_value = (self.status2, self.msg2, {})
+        mock_post.return_value = True
+
+        self.assertFalse(merge_repo.merge_project(mock_git, self.cfg,
+                                                  mock_log))
+        mock_post.assert_called_once_with(
+            mock_git, self.cfg, mock_log, False,
+            ["Failure to push to remote git."], self.msg2)
+
+    @mock.patch("merge_repo.push_branch")
+    @mock.patch("merge_repo.get_push_tags",
+                mock.Mock(return_value=(["refs/tags/v1"], 2)))
+    @mock.patch("merge_repo.post_check")
+    @mock.patch("merge_repo.push_atomic")
+    @mock.patch("merge_repo.index_merge")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_index_mode(                                # pylint:disable=R0913
+            self, mock_log, mock_git, mock_merge, mock_push, mock_check,
+            mock_branch):
+
+        """Function:  test_index_mode
+
+        Description:  Test with the merge in a temporary index.
+
+        Arguments:
+
+        """
+
+        self.cfg.merge_mode = "index"
+
+        mock_merge.return_value = (self.status, self.msg)
+        mock_push.return_value = (self.status, self.msg, {})
+        mock_check.return_value = True
+
+        self.assertFalse(merge_repo.merge_project(mock_git, self.cfg,
+                                                  mock_log, allow=True))
+        mock_merge.assert_called_once_with(mock_git, allow=True)
+        self.assertFalse(mock_git.priority_merge.called)
+        self.assertFalse(mock_branch.called)
+        self.assertTrue(mock_check.called)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  metrics_start.py
+
+    Description:  Unit testing of metrics_start in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/metrics_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_start
+        test_restart
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.proj_name = "repo-name"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.RUN_METRICS.clear()
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=100.0))
+    def test_start(self):
+
+        """Function:  test_start
+
+        Description:  Test with the start of the metrics.
+
+        Arguments:
+
+        """
+
+        merge_repo.metrics_start(self.proj_name)
+
+        self.assertEqual(merge_repo.RUN_METRICS["project"], self.proj_name)
+        self.assertEqual(merge_repo.RUN_METRICS["start"], 100.0)
+        self.assertEqual(merge_repo.RUN_METRICS["stages"], {})
+        self.assertEqual(merge_repo.RUN_METRICS["counters"]["copy_bytes"], 0)
+
+    def test_restart(self):
+
+        """Function:  test_restart
+
+        Description:  Test with metrics of a previous merge.
+
+        Arguments:
+
+        """
+
+        merge_repo.RUN_METRICS["stages"] = {"fetch": 1.0}
+        merge_repo.metrics_start(self.proj_name)
+
+        self.assertEqual(merge_repo.RUN_METRICS["stages"], {})
+        self.assertIsNone(merge_repo.RUN_METRICS["stage"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# Classification (U)
+
+"""Program:  metrics_summary.py
+
+    Description:  Unit testing of metrics_summary in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/metrics_summary.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.metrics_file = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_success
+        test_failure
+        test_metrics_file
+        test_metrics_file_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        merge_repo.RUN_METRICS.clear()
+        merge_repo.RUN_METRICS.update(
+            {"project": "repo-name", "start": 100.0, "stage": "push",
+             "failed_stage": None, "stages": {"fetch": 1.23456, "push": 2.0},
+             "counters": {"copy_files": 3, "copy_bytes": 60}})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.RUN_METRICS.clear()
+        merge_repo.MERGE_STATUS.pop("repo-name", None)
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=110.0))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_success(self, mock_log):
+
+        """Function:  test_success
+
+        Description:  Test with a successful merge.
+
+        Arguments:
+
+        """
+
+        merge_repo.MERGE_STATUS["repo-name"] = True
+
+        record = merge_repo.metrics_summary(self.cfg, mock_log)
+
+        self.assertTrue(record["status"])
+        self.assertIsNone(record["failed_stage"])
+        self.assertEqual(record["total"], 10.0)
+        self.assertEqual(record["stages"], {"fetch": 1.235, "push": 2.0})
+        self.assertTrue(mock_log.log_info.called)
+
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=110.0))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_failure(self, mock_log):
+
+        """Function:  test_failure
+
+        Description:  Test with a failed merge.
+
+        Arguments:
+
+        """
+
+        merge_repo.MERGE_STATUS["repo-name"] = False
+
+        record = merge_repo.metrics_summary(self.cfg, mock_log)
+
+        self.assertFalse(record["status"])
+        self.assertEqual(record["failed_stage"], "push")
+
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=110.0))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_metrics_file(self, mock_log):
+
+        """Function:  test_metrics_file
+
+        Description:  Test with the record appended to the metrics file.
+
+        Arguments:
+
+        """
+
+        self.cfg.metrics_file = "/data/merge-repo/metrics.json"
+
+        merge_repo.metrics_summary(self.cfg, mock_log)
+
+        merge_repo.open.assert_called_once_with(  # pylint:disable=E1101
+            "/data/merge-repo/metrics.json", "a")
+        self.assertTrue(
+            merge_repo.open().write.call_args[0][0]  # pylint:disable=E1101
+            .endswith("\n"))
+
+    @mock.patch("merge_repo.open", mock.Mock(side_effect=IOError("Denied")),
+                create=True)
+    @mock.patch("merge_repo.time.time", mock.Mock(return_value=110.0))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_metrics_file_error(self, mock_log):
+
+        """Function:  test_metrics_file_error
+
+        Description:  Test with the metrics file not writable.
+
+        Arguments:
+
+        """
+
+        self.cfg.metrics_file = "/data/merge-repo/metrics.json"
+
+        self.assertEqual(
+            merge_repo.metrics_summary(self.cfg, mock_log)["project"],
+            "repo-name")
+        self.assertTrue(mock_log.log_warn.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# Classification (U)
+
+"""Program:  mirror_check.py
+
+    Description:  Unit testing of mirror_check in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/mirror_check.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+        self.mirror_dir = "/data/merge-repo/mirror_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_mirror
+        test_mirror_locked
+        test_mirror_checked
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.project = ("/directory/repo-name", "git@domain:project/repo")
+        self.mirror = "/data/merge-repo/mirror_dir/repo-name.git"
+        self.cmd = ("git", "--git-dir", self.mirror, "fetch", "--quiet",
+                    "git@domain:project/repo",
+                    "+refs/heads/develop:refs/heads/develop",
+                    "+refs/tags/*:refs/tags/*")
+        self.checks = {}
+        self.locks = []
+
+    @mock.patch("merge_repo.git")
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_new_mirror(self, mock_log, mock_open, mock_git):
+
+        """Function:  test_new_mirror
+
+        Description:  Test with the mirror created and its fetch added.
+
+        Arguments:
+
+        """
+
+        merge_repo.mirror_check(self.cfg, mock_log, self.project,
+                                self.checks, self.locks)
+
+        self.assertEqual(self.checks,
+                         {self.cmd: (merge_repo.MIRROR_FRESH, self.mirror)})
+        self.assertEqual(self.locks, [mock_open.return_value])
+        mock_open.assert_called_once_with(self.mirror + ".lock", "w")
+        mock_git.Repo.init.assert_called_once_with(self.mirror, bare=True)
+
+    @mock.patch("merge_repo.fcntl.flock")
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_mirror_locked(self, mock_log, mock_open, mock_flock):
+
+        """Function:  test_mirror_locked
+
+        Description:  Test with the mirror locked by another process.
+
+        Arguments:
+
+        """
+
+        mock_flock.side_effect = OSError("Resource unavailable")
+
+        merge_repo.mirror_check(self.cfg, mock_log, self.project,
+                                self.checks, self.locks)
+
+        self.assertEqual(self.checks, {})
+        self.assertEqual(self.locks, [mock_open.return_value])
+        mock_log.log_warn.assert_called_once_with(
+            "mirror_check:  Mirror not refreshed: Resource unavailable")
+
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_mirror_checked(self, mock_log, mock_open):
+
+        """Function:  test_mirror_checked
+
+        Description:  Test with the mirror fetch already added.
+
+        Arguments:
+
+        """
+
+        self.checks[self.cmd] = (merge_repo.MIRROR_FRESH, self.mirror)
+
+        merge_repo.mirror_check(self.cfg, mock_log, self.project,
+                                self.checks, self.locks)
+
+        self.assertEqual(len(self.checks), 1)
+        self.assertFalse(mock_open.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  open_socket.py
+
+    Description:  Unit testing of open_socket in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/open_socket.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_socket
+        test_stale_socket
+        test_daemon_running
+        test_bind_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sock_path = "/data/merge-repo/merge.sock"
+        self.sock = mock.Mock()
+        self.sock2 = mock.Mock()
+
+    @mock.patch("merge_repo.os.chmod", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.socket.socket")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_new_socket(self, mock_log, mock_sock):
+
+        """Function:  test_new_socket
+
+        Description:  Test with no socket file present.
+
+        Arguments:
+
+        """
+
+        mock_sock.return_value = self.sock
+
+        self.assertEqual(
+            merge_repo.open_socket(self.sock_path, mock_log), self.sock)
+        self.sock.bind.assert_called_once_with(self.sock_path)
+        self.sock.listen.assert_called_once_with(64)
+
+    @mock.patch("merge_repo.os.chmod", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.socket.socket")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_stale_socket(self, mock_log, mock_sock, mock_rm):
+
+        """Function:  test_stale_socket
+
+        Description:  Test with a socket file left by a stopped daemon.
+
+        Arguments:
+
+        """
+
+        self.sock.connect.side_effect = OSError("Connection refused")
+        mock_sock.side_effect = [self.sock, self.sock2]
+
+        self.assertEqual(
+            merge_repo.open_socket(self.sock_path, mock_log), self.sock2)
+        mock_rm.assert_called_once_with(self.sock_path)
+        self.sock2.bind.assert_called_once_with(self.sock_path)
+
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.socket.socket")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_daemon_running(self, mock_log, mock_sock, mock_rm):
+
+        """Function:  test_daemon_running
+
+        Description:  Test with another daemon listening on the socket.
+
+        Arguments:
+
+        """
+
+        mock_sock.return_value = self.sock
+
+        self.assertIsNone(merge_repo.open_socket(self.sock_path, mock_log))
+        self.assertFalse(mock_rm.called)
+        self.assertFalse(self.sock.bind.called)
+
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.socket.socket")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_bind_error(self, mock_log, mock_sock):
+
+        """Function:  test_bind_error
+
+        Description:  Test with the socket not able to be bound.
+
+        Arguments:
+
+        """
+
+        self.sock.bind.side_effect = OSError("Permission denied")
+        mock_sock.return_value = self.sock
+
+        self.assertIsNone(merge_repo.open_socket(self.sock_path, mock_log))
+        self.sock.close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
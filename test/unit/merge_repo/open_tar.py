@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  open_tar.py
+
+    Description:  Unit testing of open_tar in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/open_tar.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_gzip
+        test_zstd_write
+        test_zstd_read
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tar_file = "/archive_dir/repo-name.tar"
+        self.proc = mock.Mock()
+
+    @mock.patch("merge_repo.subprocess.Popen")
+    @mock.patch("merge_repo.tarfile.open")
+    def test_gzip(self, mock_tar, mock_popen):
+
+        """Function:  test_gzip
+
+        Description:  Test with gzip compression.
+
+        Arguments:
+
+        """
+
+        mock_tar.return_value = "TarFile"
+
+        self.assertEqual(
+            merge_repo.open_tar(self.tar_file, "w", "gzip"), ("TarFile", None))
+        mock_tar.assert_called_once_with(self.tar_file, "w|gz")
+        self.assertFalse(mock_popen.called)
+
+    @mock.patch("merge_repo.subprocess.Popen")
+    @mock.patch("merge_repo.tarfile.open")
+    def test_zstd_write(self, mock_tar, mock_popen):
+
+        """Function:  test_zstd_write
+
+        Description:  Test with writing a zstd compressed tar file.
+
+        Arguments:
+
+        """
+
+        mock_tar.return_value = "TarFile"
+        mock_popen.return_value = self.proc
+
+        self.assertEqual(
+            merge_repo.open_tar(self.tar_file, "w", "zstd"),
+            ("TarFile", self.proc))
+        mock_tar.assert_called_once_with(fileobj=self.proc.stdin, mode="w|")
+
+    @mock.patch("merge_repo.subprocess.Popen")
+    @mock.patch("merge_repo.tarfile.open")
+    def test_zstd_read(self, mock_tar, mock_popen):
+
+        """Function:  test_zstd_read
+
+        Description:  Test with reading a zstd compressed tar file.
+
+        Arguments:
+
+        """
+
+        mock_tar.return_value = "TarFile"
+        mock_popen.return_value = self.proc
+
+        self.assertEqual(
+            merge_repo.open_tar(self.tar_file, "r", "zstd"),
+            ("TarFile", self.proc))
+        mock_tar.assert_called_once_with(fileobj=self.proc.stdout, mode="r|")
+
+
+if __name__ == "__main__":
+    unittest.main()
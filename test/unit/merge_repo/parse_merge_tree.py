@@ -0,0 +1,77 @@
+# Classification (U)
+
+"""Program:  parse_merge_tree.py
+
+    Description:  Unit testing of parse_merge_tree in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/parse_merge_tree.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_clean
+        test_conflicts
+
+    """
+
+    def test_clean(self):
+
+        """Function:  test_clean
+
+        Description:  Test with a merge without conflicts.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.parse_merge_tree("tree1\x00"),
+                         ("tree1", {}))
+
+    def test_conflicts(self):
+
+        """Function:  test_conflicts
+
+        Description:  Test with conflicted paths and informational messages.
+
+        Arguments:
+
+        """
+
+        data = "tree1\x00100644 oid1 1\tfile1\x00100644 oid2 2\tfile1" \
+            "\x00100644 oid3 3\tfile1\x00100755 oid4 3\tdir/file2" \
+            "\x00\x001\x00file1\x00Auto-merging\x00Auto-merging file1\n"
+
+        self.assertEqual(
+            merge_repo.parse_merge_tree(data),
+            ("tree1", {"file1": {"1": ("100644", "oid1"),
+                                 "2": ("100644", "oid2"),
+                                 "3": ("100644", "oid3")},
+                       "dir/file2": {"3": ("100755", "oid4")}}))
+
+
+if __name__ == "__main__":
+    unittest.main()
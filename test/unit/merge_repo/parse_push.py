@@ -0,0 +1,87 @@
+# Classification (U)
+
+"""Program:  parse_push.py
+
+    Description:  Unit testing of parse_push in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/parse_push.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_output
+        test_ref_updates
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = "To git@server:project/repo.git\n" \
+            + " \trefs/heads/develop:refs/heads/develop\tabc123..def456\n" \
+            + "*\trefs/tags/v2:refs/tags/v2\t[new tag]\n" \
+            + "!\trefs/tags/v1:refs/tags/v1\t[rejected] (already exists)\n" \
+            + "Done"
+        self.results = {"refs/heads/develop": " ", "refs/tags/v2": "*",
+                        "refs/tags/v1": "!"}
+
+    def test_no_output(self):
+
+        """Function:  test_no_output
+
+        Description:  Test with no output from the push.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.parse_push(""), {})
+
+    def test_ref_updates(self):
+
+        """Function:  test_ref_updates
+
+        Description:  Test with ref updates in the push output.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.parse_push(self.data), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,272 @@
+# Classification (U)
+
+"""Program:  pool_merge.py
+
+    Description:  Unit testing of pool_merge in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/pool_merge.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Pool(object):                                     # pylint:disable=R0205
+
+    """Class:  Pool
+
+    Description:  Class stub holder for multiprocessing.Pool class.
+
+    Methods:
+        __init__
+        imap_unordered
+        close
+        join
+
+    """
+
+    def __init__(self, processes, initializer=None, initargs=(),
+                 maxtasksperchild=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.processes = processes
+        self.initializer = initializer
+        self.initargs = initargs
+        self.maxtasksperchild = maxtasksperchild
+        self.closed = False
+        self.joined = False
+
+    def imap_unordered(self, func, iterable):
+
+        """Method:  imap_unordered
+
+        Description:  Method stub holder for Pool.imap_unordered.
+
+        Arguments:
+
+        """
+
+        return [(item, item.endswith("1")) for item in iterable if func]
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Method stub holder for Pool.close.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+    def join(self):
+
+        """Method:  join
+
+        Description:  Method stub holder for Pool.join.
+
+        Arguments:
+
+        """
+
+        self.joined = True
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pool_merge
+        test_pool_size
+        test_max_jobs
+        test_worker_dir_cleanup
+        test_worker_dir_in_use
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.pool = Pool(2)
+        self.proj_list = ["/directory/repo1", "/directory/repo2"]
+        self.results = {"/directory/repo1": True, "/directory/repo2": False}
+
+    @mock.patch("merge_repo.os.listdir", mock.Mock(return_value=[]))
+    @mock.patch("merge_repo.fork_context",
+                mock.Mock(return_value=merge_repo.multiprocessing))
+    @mock.patch("merge_repo.multiprocessing.Pool")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_pool_merge(self, mock_log, mock_pool):
+
+        """Function:  test_pool_merge
+
+        Description:  Test with projects merged in a pool.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = self.pool
+
+        self.assertEqual(
+            merge_repo.pool_merge("Args", self.cfg, mock_log, self.proj_list,
+                                  4), self.results)
+
+    @mock.patch("merge_repo.os.listdir", mock.Mock(return_value=[]))
+    @mock.patch("merge_repo.fork_context",
+                mock.Mock(return_value=merge_repo.multiprocessing))
+    @mock.patch("merge_repo.multiprocessing.Pool")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_pool_size(self, mock_log, mock_pool):
+
+        """Function:  test_pool_size
+
+        Description:  Test with pool limited to the number of projects.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = self.pool
+
+        merge_repo.pool_merge("Args", self.cfg, mock_log, self.proj_list, 4)
+
+        self.assertEqual(mock_pool.call_args[1]["processes"], 2)
+
+    @mock.patch("merge_repo.os.listdir", mock.Mock(return_value=[]))
+    @mock.patch("merge_repo.fork_context",
+                mock.Mock(return_value=merge_repo.multiprocessing))
+    @mock.patch("merge_repo.multiprocessing.Pool")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_max_jobs(self, mock_log, mock_pool):
+
+        """Function:  test_max_jobs
+
+        Description:  Test with workers replaced after a number of merges.
+
+        Arguments:
+
+        """
+
+        self.cfg.worker_max_jobs = 50
+        mock_pool.return_value = self.pool
+
+        merge_repo.pool_merge("Args", self.cfg, mock_log, self.proj_list, 4)
+
+        self.assertEqual(mock_pool.call_args[1]["maxtasksperchild"], 50)
+
+    @mock.patch("merge_repo.os.rmdir")
+    @mock.patch("merge_repo.os.listdir")
+    @mock.patch("merge_repo.fork_context",
+                mock.Mock(return_value=merge_repo.multiprocessing))
+    @mock.patch("merge_repo.multiprocessing.Pool")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_worker_dir_cleanup(self, mock_log, mock_pool, mock_list,
+                                mock_rmdir):
+
+        """Function:  test_worker_dir_cleanup
+
+        Description:  Test with only this pool's worker sub-directories
+            removed.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = self.pool
+        mock_list.return_value = ["worker_%s_100" % (os.getpid()), "repo3",
+                                  "worker_1_200", "worker_300"]
+
+        merge_repo.pool_merge("Args", self.cfg, mock_log, self.proj_list, 2)
+
+        mock_rmdir.assert_called_once_with(
+            os.path.join(self.cfg.work_dir, "worker_%s_100" % (os.getpid())))
+
+    @mock.patch("merge_repo.os.rmdir")
+    @mock.patch("merge_repo.os.listdir")
+    @mock.patch("merge_repo.fork_context",
+                mock.Mock(return_value=merge_repo.multiprocessing))
+    @mock.patch("merge_repo.multiprocessing.Pool")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_worker_dir_in_use(self, mock_log, mock_pool, mock_list,
+                               mock_rmdir):
+
+        """Function:  test_worker_dir_in_use
+
+        Description:  Test with worker sub-directory not empty.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = self.pool
+        mock_list.return_value = ["worker_%s_100" % (os.getpid())]
+        mock_rmdir.side_effect = OSError("Directory not empty")
+
+        self.assertEqual(
+            merge_repo.pool_merge("Args", self.cfg, mock_log, self.proj_list,
+                                  2), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
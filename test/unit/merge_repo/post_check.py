@@ -65,6 +65,8 @@ class UnitTest(unittest.TestCase):
         test_behind_zero
         test_ahead_one
         test_ahead_zero
+        test_push_accepted
+        test_push_rejected
 
     """
 
@@ -80,11 +82,14 @@ class UnitTest(unittest.TestCase):
 
         self.cfg = CfgTest()
         self.git_results = "/Git/Directory"
+        self.refs = {"refs/heads/develop": " ", "refs/tags/v1": "*"}
+        self.refs2 = {"refs/heads/develop": "!"}
 
+    @mock.patch("merge_repo.get_ahead_behind")
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_behind_one(self, mock_log, mock_git, mock_post):
+    def test_behind_one(self, mock_log, mock_git, mock_post, mock_count):
 
         """Function:  test_behind_one
 
@@ -95,17 +100,17 @@ class UnitTest(unittest.TestCase):
         """
 
         mock_log.return_value = True
-        mock_git.is_commits_ahead.return_value = 0
-        mock_git.is_commits_behind.return_value = 1
+        mock_count.return_value = (0, 1)
         mock_git.git_dir.return_value = self.git_results
         mock_post.return_value = True
 
         self.assertFalse(merge_repo.post_check(mock_git, self.cfg, mock_log))
 
+    @mock.patch("merge_repo.get_ahead_behind")
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_behind_zero(self, mock_log, mock_git, mock_post):
+    def test_behind_zero(self, mock_log, mock_git, mock_post, mock_count):
 
         """Function:  test_behind_zero
 
@@ -116,17 +121,17 @@ class UnitTest(unittest.TestCase):
         """
 
         mock_log.return_value = True
-        mock_git.is_commits_ahead.return_value = 0
-        mock_git.is_commits_behind.return_value = 0
+        mock_count.return_value = (0, 0)
         mock_git.git_dir.return_value = self.git_results
         mock_post.return_value = True
 
         self.assertFalse(merge_repo.post_check(mock_git, self.cfg, mock_log))
 
+    @mock.patch("merge_repo.get_ahead_behind")
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_ahead_one(self, mock_log, mock_git, mock_post):
+    def test_ahead_one(self, mock_log, mock_git, mock_post, mock_count):
 
         """Function:  test_ahead_zero
 
@@ -137,17 +142,17 @@ class UnitTest(unittest.TestCase):
         """
 
         mock_log.return_value = True
-        mock_git.is_commits_ahead.return_value = 1
-        mock_git.is_commits_behind.return_value = 0
+        mock_count.return_value = (1, 0)
         mock_git.git_dir.return_value = self.git_results
         mock_post.return_value = True
 
         self.assertFalse(merge_repo.post_check(mock_git, self.cfg, mock_log))
 
+    @mock.patch("merge_repo.get_ahead_behind")
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_ahead_zero(self, mock_log, mock_git, mock_post):
+    def test_ahead_zero(self, mock_log, mock_git, mock_post, mock_count):
 
         """Function:  test_ahead_zero
 
@@ -158,13 +163,54 @@ class UnitTest(unittest.TestCase):
         """
 
         mock_log.return_value = True
-        mock_git.is_commits_ahead.return_value = 0
-        mock_git.is_commits_behind.return_value = 0
+        mock_count.return_value = (0, 0)
         mock_git.git_dir.return_value = self.git_results
         mock_post.return_value = True
 
         self.assertFalse(merge_repo.post_check(mock_git, self.cfg, mock_log))
 
+    @mock.patch("merge_repo.get_ahead_behind")
+    @mock.patch("merge_repo.post_process")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_push_accepted(self, mock_log, mock_git, mock_post, mock_count):
+
+        """Function:  test_push_accepted
+
+        Description:  Test with branch update accepted by the push.
+
+        Arguments:
+
+        """
+
+        mock_git.branch = "develop"
+        mock_count.return_value = (0, 0)
+
+        self.assertFalse(merge_repo.post_check(
+            mock_git, self.cfg, mock_log, refs=self.refs))
+        self.assertTrue(mock_post.call_args[0][3])
+
+    @mock.patch("merge_repo.get_ahead_behind")
+    @mock.patch("merge_repo.post_process")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_push_rejected(self, mock_log, mock_git, mock_post, mock_count):
+
+        """Function:  test_push_rejected
+
+        Description:  Test with branch update rejected by the push.
+
+        Arguments:
+
+        """
+
+        mock_git.branch = "develop"
+
+        self.assertFalse(merge_repo.post_check(
+            mock_git, self.cfg, mock_log, refs=self.refs2))
+        self.assertFalse(mock_post.call_args[0][3])
+        self.assertFalse(mock_count.called)
+
 
 if __name__ == "__main__":
     unittest.main()
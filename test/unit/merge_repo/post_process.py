@@ -90,6 +90,8 @@ class UnitTest(unittest.TestCase):
         test_linelist_passed
         test_status_false
         test_status_true
+        test_bundle
+        test_bundle_failed
 
     """
 
@@ -225,6 +227,54 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(merge_repo.post_process(self.gitr, self.cfg, mock_log,
                                                  self.status1))
 
+    @mock.patch("merge_repo.shutil.rmtree")
+    @mock.patch("merge_repo.archive_project")
+    @mock.patch("merge_repo.gen_class.Logger")
+    @mock.patch("merge_repo.gen_libs.mv_file2")
+    def test_bundle(self, mock_move, mock_log, mock_arch, mock_rm):
+
+        """Function:  test_bundle
+
+        Description:  Test with project archived as a bundle.
+
+        Arguments:
+
+        """
+
+        self.cfg.to_line = None
+        self.cfg.archive_format = "bundle"
+
+        mock_arch.return_value = True
+
+        self.assertFalse(merge_repo.post_process(self.gitr, self.cfg, mock_log,
+                                                 self.status1))
+        self.assertFalse(mock_move.called)
+        self.assertTrue(mock_rm.called)
+
+    @mock.patch("merge_repo.shutil.rmtree")
+    @mock.patch("merge_repo.archive_project")
+    @mock.patch("merge_repo.gen_class.Logger")
+    @mock.patch("merge_repo.gen_libs.mv_file2")
+    def test_bundle_failed(self, mock_move, mock_log, mock_arch, mock_rm):
+
+        """Function:  test_bundle_failed
+
+        Description:  Test with bundle archive failing.
+
+        Arguments:
+
+        """
+
+        self.cfg.to_line = None
+        self.cfg.archive_format = "bundle"
+
+        mock_arch.return_value = False
+
+        self.assertFalse(merge_repo.post_process(self.gitr, self.cfg, mock_log,
+                                                 self.status2))
+        self.assertTrue(mock_move.called)
+        self.assertFalse(mock_rm.called)
+
 
 if __name__ == "__main__":
     unittest.main()
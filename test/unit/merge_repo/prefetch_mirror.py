@@ -0,0 +1,163 @@
+# Classification (U)
+
+"""Program:  prefetch_mirror.py
+
+    Description:  Unit testing of prefetch_mirror in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/prefetch_mirror.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mirror_dir = "/data/merge-repo/mirror_dir"
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.repo_name = "repo-name"
+        self.url = "git@server:project/repo-name.git"
+        self.branch = "develop"
+        self.git_dir = "/data/merge-repo/work_dir/repo-name"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_mirror_refreshed
+        test_refresh_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.gitr = GitMerge()
+        self.mirror = "/data/merge-repo/mirror_dir/repo-name.git"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.MIRROR_FRESH.clear()
+
+    @mock.patch("merge_repo.refresh_mirror")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_mirror_refreshed(self, mock_log, mock_refresh):
+
+        """Function:  test_mirror_refreshed
+
+        Description:  Test with the mirror marked as refreshed.
+
+        Arguments:
+
+        """
+
+        mock_refresh.return_value = self.mirror
+
+        merge_repo.prefetch_mirror(self.gitr, self.cfg, mock_log)
+
+        self.assertIn(self.mirror, merge_repo.MIRROR_FRESH)
+
+    @mock.patch("merge_repo.refresh_mirror")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_refresh_failed(self, mock_log, mock_refresh):
+
+        """Function:  test_refresh_failed
+
+        Description:  Test with the mirror refresh failing.
+
+        Arguments:
+
+        """
+
+        mock_refresh.side_effect = \
+            merge_repo.git.exc.GitCommandError("git fetch", 128)
+
+        merge_repo.prefetch_mirror(self.gitr, self.cfg, mock_log)
+
+        self.assertNotIn(self.mirror, merge_repo.MIRROR_FRESH)
+        self.assertTrue(mock_log.log_warn.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,262 @@
+# Classification (U)
+
+"""Program:  preflight.py
+
+    Description:  Unit testing of preflight in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/preflight.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        insert_arg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.prefix = "git@"
+        self.git_server = "domain"
+        self.git_project = "project"
+        self.branch = "branch_name"
+        self.mod_branch = "mod_branch"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_git_repo
+        test_is_remote_false
+        test_is_remote_true
+        test_remote_checked
+        test_project_in_place
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "config_file", "-d": "config_dir", "-r": "repo-name",
+            "-p": "/directory/repo-name", "-M": True}
+
+    @mock.patch("merge_repo.git_class")
+    @mock.patch("merge_repo.is_git_repo")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_not_git_repo(self, mock_log, mock_isgit, mock_git):
+
+        """Function:  test_not_git_repo
+
+        Description:  Test with project directory not a Git repository.
+
+        Arguments:
+
+        """
+
+        mock_isgit.return_value = False
+
+        self.assertEqual(merge_repo.preflight(self.args, self.cfg, mock_log),
+                         (False, None))
+        self.assertFalse(mock_git.GitMerge.called)
+
+    @mock.patch("merge_repo.git_class")
+    @mock.patch("merge_repo.is_git_repo")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_is_remote_false(self, mock_log, mock_isgit, mock_git):
+
+        """Function:  test_is_remote_false
+
+        Description:  Test with remote Git repository not existing.
+
+        Arguments:
+
+        """
+
+        mock_isgit.return_value = True
+        mock_git.GitMerge.return_value = merge_repo.git_class.GitMerge
+        mock_git.GitMerge.create_gitrepo.return_value = True
+        mock_git.GitMerge.is_remote.return_value = False
+
+        self.assertEqual(merge_repo.preflight(self.args, self.cfg, mock_log),
+                         (False, merge_repo.git_class.GitMerge))
+
+    @mock.patch("merge_repo.git_class")
+    @mock.patch("merge_repo.is_git_repo")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_is_remote_true(self, mock_log, mock_isgit, mock_git):
+
+        """Function:  test_is_remote_true
+
+        Description:  Test with remote Git repository existing.
+
+        Arguments:
+
+        """
+
+        mock_isgit.return_value = True
+        mock_git.GitMerge.return_value = merge_repo.git_class.GitMerge
+        mock_git.GitMerge.create_gitrepo.return_value = True
+        mock_git.GitMerge.is_remote.return_value = True
+
+        self.assertEqual(merge_repo.preflight(self.args, self.cfg, mock_log),
+                         (True, merge_repo.git_class.GitMerge))
+
+    @mock.patch("merge_repo.git_class")
+    @mock.patch("merge_repo.is_git_repo")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_project_in_place(self, mock_log, mock_isgit, mock_git):
+
+        """Function:  test_project_in_place
+
+        Description:  Test with checks run against the project directory.
+
+        Arguments:
+
+        """
+
+        mock_isgit.return_value = True
+        mock_git.GitMerge.return_value = merge_repo.git_class.GitMerge
+        mock_git.GitMerge.is_remote.return_value = True
+
+        merge_repo.preflight(self.args, self.cfg, mock_log)
+
+        mock_git.GitMerge.assert_called_once_with(
+            "repo-name", "/directory/repo-name",
+            "git@domain:project/repo-name.git", "branch_name", "mod_branch")
+
+    @mock.patch("merge_repo.git_class")
+    @mock.patch("merge_repo.is_git_repo")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_remote_checked(self, mock_log, mock_isgit, mock_git):
+
+        """Function:  test_remote_checked
+
+        Description:  Test with remote found by the remote check.
+
+        Arguments:
+
+        """
+
+        merge_repo.REMOTE_CHECK.add("git@domain:project/repo-name.git")
+        mock_isgit.return_value = True
+        mock_git.GitMerge.return_value = merge_repo.git_class.GitMerge
+
+        self.assertEqual(merge_repo.preflight(self.args, self.cfg, mock_log),
+                         (True, merge_repo.git_class.GitMerge))
+        self.assertFalse(mock_git.GitMerge.is_remote.called)
+        self.assertEqual(merge_repo.REMOTE_CHECK, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
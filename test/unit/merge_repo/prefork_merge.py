@@ -0,0 +1,248 @@
+# Classification (U)
+
+"""Program:  prefork_merge.py
+
+    Description:  Unit testing of prefork_merge in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/prefork_merge.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_items
+        test_items_merged
+        test_worker_recycled
+        test_worker_exited
+        test_worker_not_available
+        test_daemon_stopping
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = mock.Mock()
+        self.conn2 = mock.Mock()
+        self.pool = {"procs": {100: "Proc", 101: "Proc2"},
+                     "conns": {100: self.conn, 101: self.conn2}}
+        self.items = [("/directory/repo1", None),
+                      ("/directory/repo2", {"-p": "/directory/repo2"})]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.REMOTE_CHECK.clear()
+
+    @mock.patch("merge_repo.select.select")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_no_items(self, mock_log, mock_select):
+
+        """Function:  test_no_items
+
+        Description:  Test with nothing to merge.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.prefork_merge(self.pool, mock_log, []),
+                         [])
+        self.assertFalse(mock_select.called)
+
+    @mock.patch("merge_repo.select.select")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_items_merged(self, mock_log, mock_select):
+
+        """Function:  test_items_merged
+
+        Description:  Test with the items merged by the workers.
+
+        Arguments:
+
+        """
+
+        merge_repo.REMOTE_CHECK.add("git@server:repo1.git")
+        mock_select.side_effect = [([self.conn2], [], []),
+                                   ([self.conn], [], [])]
+        self.conn.recv.return_value = (0, True, False)
+        self.conn2.recv.return_value = (1, None, False)
+
+        self.assertEqual(
+            merge_repo.prefork_merge(self.pool, mock_log, self.items),
+            [True, None])
+        self.conn.send.assert_called_once_with(
+            (0, "/directory/repo1", None, (["git@server:repo1.git"], [])))
+        self.conn2.send.assert_called_once_with(
+            (1, "/directory/repo2", {"-p": "/directory/repo2"},
+             (["git@server:repo1.git"], [])))
+
+    @mock.patch("merge_repo.prefork_reap")
+    @mock.patch("merge_repo.select.select")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_worker_recycled(self, mock_log, mock_select, mock_reap):
+
+        """Function:  test_worker_recycled
+
+        Description:  Test with a worker recycled after its merge.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = ([self.conn, self.conn2], [], [])
+        self.conn.recv.return_value = (0, True, True)
+        self.conn2.recv.return_value = (1, True, False)
+
+        self.assertEqual(
+            merge_repo.prefork_merge(self.pool, mock_log, self.items),
+            [True, True])
+        mock_reap.assert_called_once_with(self.pool, mock_log, 100)
+
+    @mock.patch("merge_repo.prefork_reap")
+    @mock.patch("merge_repo.select.select")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_worker_exited(self, mock_log, mock_select, mock_reap):
+
+        """Function:  test_worker_exited
+
+        Description:  Test with a worker exiting during a merge.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = ([self.conn, self.conn2], [], [])
+        self.conn.recv.side_effect = EOFError
+        self.conn2.recv.return_value = (1, True, False)
+
+        self.assertEqual(
+            merge_repo.prefork_merge(self.pool, mock_log, self.items),
+            [False, True])
+        mock_reap.assert_called_once_with(self.pool, mock_log, 100)
+        self.assertTrue(mock_log.log_err.called)
+
+    @mock.patch("merge_repo.select.select")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_worker_not_available(self, mock_log, mock_select):
+
+        """Function:  test_worker_not_available
+
+        Description:  Test with a worker gone before it was sent an item.
+
+        Arguments:
+
+        """
+
+        def reap(pool, log, pid):
+
+            """Function:  reap
+
+            Description:  Stub of prefork_reap without the replacement.
+
+            Arguments:
+
+            """
+
+            if log:
+                pool["procs"].pop(pid)
+                pool["conns"].pop(pid)
+
+        self.conn.send.side_effect = IOError("Broken pipe")
+        mock_select.side_effect = [([self.conn2], [], []),
+                                   ([self.conn2], [], [])]
+        self.conn2.recv.side_effect = [(0, True, False), (1, False, False)]
+
+        with mock.patch("merge_repo.prefork_reap", side_effect=reap):
+            self.assertEqual(
+                merge_repo.prefork_merge(self.pool, mock_log, self.items),
+                [True, False])
+
+        self.assertEqual(self.conn2.send.call_count, 2)
+
+
+    @mock.patch("merge_repo.select.select")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_daemon_stopping(self, mock_log, mock_select):
+
+        """Function:  test_daemon_stopping
+
+        Description:  Test with the items not started after a SIGTERM not
+            merged.
+
+        Arguments:
+
+        """
+
+        def stop(*args):
+
+            """Function:  stop
+
+            Description:  Receive a SIGTERM while waiting for the workers.
+
+            Arguments:
+
+            """
+
+            merge_repo.DAEMON_STOP["signum"] = 15
+
+            return ([self.conn], [], []) if args else ([], [], [])
+
+        del self.pool["procs"][101]
+        mock_select.side_effect = stop
+        self.conn.recv.return_value = (0, True, False)
+
+        try:
+            statuses = merge_repo.prefork_merge(self.pool, mock_log,
+                                                self.items)
+
+        finally:
+            merge_repo.DAEMON_STOP["signum"] = None
+
+        self.assertEqual(statuses, [True, None])
+        self.conn.send.assert_called_once_with(
+            (0, "/directory/repo1", None, ([], [])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+# Classification (U)
+
+"""Program:  prefork_reap.py
+
+    Description:  Unit testing of prefork_reap in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/prefork_reap.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_replaced
+        test_not_replaced
+        test_terminated
+        test_killed
+        test_daemon_stopping
+        test_dir_not_removed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.proc = mock.Mock()
+        self.proc.is_alive.return_value = False
+        self.conn = mock.Mock()
+        self.pool = {"cfg": self.cfg, "procs": {100: self.proc},
+                     "conns": {100: self.conn}}
+        self.work_dir = "/data/merge-repo/work_dir/worker_%s_100" % (
+            os.getpid())
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.rmdir")
+    @mock.patch("merge_repo.prefork_spawn")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_replaced(self, mock_log, mock_spawn, mock_rmdir):
+
+        """Function:  test_replaced
+
+        Description:  Test with the worker replaced.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(merge_repo.prefork_reap(self.pool, mock_log, 100))
+        self.assertEqual(self.pool["procs"], {})
+        self.conn.close.assert_called_once_with()
+        mock_rmdir.assert_called_once_with(self.work_dir)
+        mock_spawn.assert_called_once_with(self.pool)
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.prefork_spawn")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_not_replaced(self, mock_log, mock_spawn):
+
+        """Function:  test_not_replaced
+
+        Description:  Test with the worker not replaced.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            merge_repo.prefork_reap(self.pool, mock_log, 100, spawn=False))
+        self.assertFalse(mock_spawn.called)
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.prefork_spawn", mock.Mock(return_value=101))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_terminated(self, mock_log):
+
+        """Function:  test_terminated
+
+        Description:  Test with a worker which does not exit terminated.
+
+        Arguments:
+
+        """
+
+        self.proc.is_alive.side_effect = [True, False, False]
+
+        self.assertFalse(merge_repo.prefork_reap(self.pool, mock_log, 100))
+        self.proc.terminate.assert_called_once_with()
+
+    @mock.patch("merge_repo.os.kill")
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.prefork_spawn", mock.Mock(return_value=101))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_killed(self, mock_log, mock_kill):
+
+        """Function:  test_killed
+
+        Description:  Test with a worker which does not exit on SIGTERM
+            killed.
+
+        Arguments:
+
+        """
+
+        self.proc.is_alive.return_value = True
+
+        self.assertFalse(merge_repo.prefork_reap(self.pool, mock_log, 100))
+        mock_kill.assert_called_once_with(100, merge_repo.signal.SIGKILL)
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.prefork_spawn")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_daemon_stopping(self, mock_log, mock_spawn):
+
+        """Function:  test_daemon_stopping
+
+        Description:  Test with the worker not replaced as the daemon is
+            stopping.
+
+        Arguments:
+
+        """
+
+        merge_repo.DAEMON_STOP["signum"] = 15
+
+        try:
+            merge_repo.prefork_reap(self.pool, mock_log, 100)
+
+        finally:
+            merge_repo.DAEMON_STOP["signum"] = None
+
+        self.assertFalse(mock_spawn.called)
+
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.rmdir")
+    @mock.patch("merge_repo.prefork_spawn", mock.Mock(return_value=101))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_dir_not_removed(self, mock_log, mock_rmdir):
+
+        """Function:  test_dir_not_removed
+
+        Description:  Test with the worker sub-directory not empty.
+
+        Arguments:
+
+        """
+
+        mock_rmdir.side_effect = OSError("Directory not empty")
+
+        self.assertFalse(merge_repo.prefork_reap(self.pool, mock_log, 100))
+        self.assertTrue(mock_log.log_warn.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
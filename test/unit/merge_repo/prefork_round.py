@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  prefork_round.py
+
+    Description:  Unit testing of prefork_round in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/prefork_round.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_spool_projects
+        test_submitted_jobs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = mock.Mock()
+        self.ready = ["/spool_dir/repo1", "/spool_dir/repo2"]
+        self.job = {"-p": "/directory/repo3", "job_id": "0123456789ab",
+                    "conns": [self.conn]}
+        self.jobs = {"lock": threading.Lock(), "queue": [], "running": []}
+        self.pool = {"args": "Args", "cfg": "Cfg"}
+
+    @mock.patch("merge_repo.remote_check")
+    @mock.patch("merge_repo.job_done")
+    @mock.patch("merge_repo.prefork_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_spool_projects(self, mock_log, mock_merge, mock_done,
+                            mock_check):
+
+        """Function:  test_spool_projects
+
+        Description:  Test with spool projects merged.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = [True, False]
+
+        self.assertEqual(
+            merge_repo.prefork_round(self.pool, mock_log, self.ready,
+                                     self.jobs),
+            {"/spool_dir/repo1": True, "/spool_dir/repo2": False})
+        self.assertFalse(mock_done.called)
+        mock_check.assert_called_once_with("Args", "Cfg", mock_log,
+                                           self.ready)
+
+    @mock.patch("merge_repo.remote_check")
+    @mock.patch("merge_repo.job_done")
+    @mock.patch("merge_repo.prefork_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_submitted_jobs(self, mock_log, mock_merge, mock_done,
+                            mock_check):
+
+        """Function:  test_submitted_jobs
+
+        Description:  Test with submitted jobs merged and replied to.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = [True, None]
+        mock_check.side_effect = \
+            lambda *args: merge_repo.REMOTE_CHECK.add("git@server:repo3.git")
+        self.jobs["queue"].append(self.job)
+
+        self.assertEqual(
+            merge_repo.prefork_round(
+                self.pool, mock_log, self.ready[:1], self.jobs),
+            {"/spool_dir/repo1": True})
+        mock_check.assert_called_once_with(
+            "Args", "Cfg", mock_log, ["/spool_dir/repo1", "/directory/repo3"])
+        mock_merge.assert_called_once_with(
+            self.pool, mock_log, [
+                ("/spool_dir/repo1", None),
+                ("/directory/repo3", {"-p": "/directory/repo3",
+                                      "job_id": "0123456789ab"})])
+        mock_done.assert_called_once_with(self.jobs, self.job, None)
+        self.assertEqual(self.jobs["queue"], [])
+        self.assertEqual(self.jobs["running"], [self.job])
+        self.assertEqual(merge_repo.REMOTE_CHECK, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Classification (U)
+
+"""Program:  prefork_spawn.py
+
+    Description:  Unit testing of prefork_spawn in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/prefork_spawn.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_worker_forked
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pool = {"args": "Args", "cfg": "Cfg", "log": "Log",
+                     "procs": {}, "conns": {}, "limits": (50, 1024.0)}
+        self.conn = mock.Mock()
+        self.child_conn = mock.Mock()
+        self.proc = mock.Mock()
+        self.proc.pid = 100
+
+    @mock.patch("merge_repo.fork_context")
+    def test_worker_forked(self, mock_context):
+
+        """Function:  test_worker_forked
+
+        Description:  Test with a worker forked and added to the pool.
+
+        Arguments:
+
+        """
+
+        mock_proc = mock_context.return_value.Process
+        mock_context.return_value.Pipe.return_value = \
+            (self.conn, self.child_conn)
+        mock_proc.return_value = self.proc
+
+        self.assertEqual(merge_repo.prefork_spawn(self.pool), 100)
+        self.assertEqual(self.pool["procs"], {100: self.proc})
+        self.assertEqual(self.pool["conns"], {100: self.conn})
+        self.assertTrue(self.proc.daemon)
+        self.proc.start.assert_called_once_with()
+        self.child_conn.close.assert_called_once_with()
+        self.assertEqual(
+            mock_proc.call_args[1]["args"],
+            ("Args", "Cfg", "Log", self.child_conn, (50, 1024.0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  prefork_start.py
+
+    Description:  Unit testing of prefork_start in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/prefork_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_limits
+        test_limits
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    @mock.patch("merge_repo.git_class", mock.Mock())
+    @mock.patch("merge_repo.prefork_spawn")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_no_limits(self, mock_log, mock_spawn):
+
+        """Function:  test_no_limits
+
+        Description:  Test with no worker limits in the configuration.
+
+        Arguments:
+
+        """
+
+        pool = merge_repo.prefork_start("Args", self.cfg, mock_log, 3)
+
+        self.assertEqual(pool["limits"], (0, 0.0))
+        self.assertEqual(mock_spawn.call_count, 3)
+        merge_repo.git_class.load.assert_called_once_with()
+
+    @mock.patch("merge_repo.git_class", mock.Mock())
+    @mock.patch("merge_repo.prefork_spawn")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_limits(self, mock_log, mock_spawn):
+
+        """Function:  test_limits
+
+        Description:  Test with worker limits in the configuration.
+
+        Arguments:
+
+        """
+
+        self.cfg.worker_max_jobs = 50
+        self.cfg.worker_max_mem = 1024
+
+        pool = merge_repo.prefork_start("Args", self.cfg, mock_log, 2)
+
+        self.assertEqual(pool["limits"], (50, 1024.0))
+        mock_spawn.assert_called_with(pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  prefork_stop.py
+
+    Description:  Unit testing of prefork_stop in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/prefork_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_workers_stopped
+        test_worker_gone
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = mock.Mock()
+        self.conn2 = mock.Mock()
+        self.pool = {"procs": {100: "Proc", 101: "Proc2"},
+                     "conns": {100: self.conn, 101: self.conn2}}
+
+    @mock.patch("merge_repo.prefork_reap")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_workers_stopped(self, mock_log, mock_reap):
+
+        """Function:  test_workers_stopped
+
+        Description:  Test with each worker told to stop and reaped.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(merge_repo.prefork_stop(self.pool, mock_log))
+        self.conn.send.assert_called_once_with(None)
+        self.conn2.send.assert_called_once_with(None)
+        mock_reap.assert_called_with(self.pool, mock_log, 101, spawn=False)
+        self.assertEqual(mock_reap.call_count, 2)
+
+    @mock.patch("merge_repo.prefork_reap")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_worker_gone(self, mock_log, mock_reap):
+
+        """Function:  test_worker_gone
+
+        Description:  Test with a worker which has already exited.
+
+        Arguments:
+
+        """
+
+        self.conn.send.side_effect = IOError("Broken pipe")
+
+        self.assertFalse(merge_repo.prefork_stop(self.pool, mock_log))
+        self.assertEqual(mock_reap.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+# Classification (U)
+
+"""Program:  prefork_worker.py
+
+    Description:  Unit testing of prefork_worker in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/prefork_worker.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stop
+        test_daemon_gone
+        test_project_merged
+        test_job_merged
+        test_max_jobs
+        test_max_memory
+        test_daemon_stopping
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.conn = mock.Mock()
+        self.conn.poll.return_value = True
+        self.job = {"-p": "/directory/repo-name", "job_id": "0123456789ab"}
+        self.limits = (0, 0)
+
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.init_worker", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_stop(self, mock_log, mock_merge):
+
+        """Function:  test_stop
+
+        Description:  Test with the worker told to stop.
+
+        Arguments:
+
+        """
+
+        self.conn.recv.return_value = None
+
+        self.assertFalse(merge_repo.prefork_worker(
+            "Args", "Cfg", mock_log, self.conn, self.limits))
+        self.assertFalse(mock_merge.called)
+
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.init_worker", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_daemon_gone(self, mock_log, mock_merge):
+
+        """Function:  test_daemon_gone
+
+        Description:  Test with the daemon end of the pipe closed.
+
+        Arguments:
+
+        """
+
+        self.conn.recv.side_effect = EOFError
+
+        self.assertFalse(merge_repo.prefork_worker(
+            "Args", "Cfg", mock_log, self.conn, self.limits))
+        self.assertFalse(mock_merge.called)
+
+    @mock.patch("merge_repo.worker_rss", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.init_worker", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_project_merged(self, mock_log, mock_merge):
+
+        """Function:  test_project_merged
+
+        Description:  Test with a spool project merged.
+
+        Arguments:
+
+        """
+
+        self.conn.recv.side_effect = [
+            (0, "/directory/repo-name", None, ([], [])), None]
+        mock_merge.return_value = True
+
+        self.assertFalse(merge_repo.prefork_worker(
+            "Args", "Cfg", mock_log, self.conn, self.limits))
+        self.conn.send.assert_called_once_with((0, True, False))
+
+    @mock.patch("merge_repo.worker_rss", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.run_job")
+    @mock.patch("merge_repo.init_worker", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_job_merged(self, mock_log, mock_job):
+
+        """Function:  test_job_merged
+
+        Description:  Test with a submitted job merged.
+
+        Arguments:
+
+        """
+
+        self.conn.recv.side_effect = [
+            (1, "/directory/repo-name", self.job, ([], [])), None]
+        mock_job.return_value = False
+
+        self.assertFalse(merge_repo.prefork_worker(
+            "Args", "Cfg", mock_log, self.conn, self.limits))
+        mock_job.assert_called_once_with("Args", "Cfg", mock_log, self.job)
+        self.conn.send.assert_called_once_with((1, False, False))
+
+    @mock.patch("merge_repo.worker_rss", mock.Mock(return_value=None))
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.init_worker", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_max_jobs(self, mock_log, mock_merge):
+
+        """Function:  test_max_jobs
+
+        Description:  Test with the worker recycled after the maximum jobs.
+
+        Arguments:
+
+        """
+
+        self.conn.recv.side_effect = [(0, "/directory/repo1", None, ([], [])),
+                                      (1, "/directory/repo2", None, ([], []))]
+        mock_merge.return_value = True
+
+        self.assertFalse(merge_repo.prefork_worker(
+            "Args", "Cfg", mock_log, self.conn, (2, 0)))
+        self.conn.send.assert_called_with((1, True, True))
+        self.assertEqual(mock_merge.call_count, 2)
+
+    @mock.patch("merge_repo.worker_rss", mock.Mock(return_value=2048.0))
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.init_worker", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_max_memory(self, mock_log, mock_merge):
+
+        """Function:  test_max_memory
+
+        Description:  Test with the worker recycled over the memory limit.
+
+        Arguments:
+
+        """
+
+        self.conn.recv.side_effect = [(0, "/directory/repo1", None, ([], [])),
+                                      (1, "/directory/repo2", None, ([], []))]
+        mock_merge.return_value = True
+
+        self.assertFalse(merge_repo.prefork_worker(
+            "Args", "Cfg", mock_log, self.conn, (0, 1024.0)))
+        self.conn.send.assert_called_once_with((0, True, True))
+
+
+    @mock.patch("merge_repo.worker_rss", mock.Mock(return_value=100.0))
+    @mock.patch("merge_repo.merge_proj_dir")
+    @mock.patch("merge_repo.init_worker", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_daemon_stopping(self, mock_log, mock_merge):
+
+        """Function:  test_daemon_stopping
+
+        Description:  Test with a SIGTERM during a merge, the merge is
+            completed and the next item is returned as not merged.
+
+        Arguments:
+
+        """
+
+        def merge_proj_dir(args, cfg, log, proj_dir):
+
+            """Function:  merge_proj_dir
+
+            Description:  Receive a SIGTERM during the merge.
+
+            Arguments:
+
+            """
+
+            merge_repo.stop_daemon(15, None)
+
+            return bool(args and cfg and log and proj_dir)
+
+        self.conn.recv.side_effect = [
+            (0, "/directory/repo-name", None, ([], [])),
+            (1, "/directory/repo2", None, ([], []))]
+        mock_merge.side_effect = merge_proj_dir
+
+        try:
+            merge_repo.prefork_worker(
+                "Args", "Cfg", mock_log, self.conn, self.limits)
+
+        finally:
+            merge_repo.DAEMON_STOP["signum"] = None
+
+        self.assertEqual(mock_merge.call_count, 1)
+        self.assertEqual(self.conn.send.call_args_list,
+                         [mock.call((0, True, False)),
+                          mock.call((1, None, True))])
+
+
+if __name__ == "__main__":
+    unittest.main()
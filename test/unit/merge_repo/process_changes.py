@@ -68,12 +68,8 @@ class GitMerge(object):                                 # pylint:disable=R0205
 
     Methods:
         __init__
-        is_dirty
-        is_untracked
         process_dirty
         process_untracked
-        get_dirty
-        get_untracked
 
     """
 
@@ -92,33 +88,6 @@ class GitMerge(object):                                 # pylint:disable=R0205
         self.rm_files = []
         self.repo_name = "Repo_Name"
 
-        self.dirty = True
-        self.untracked = True
-
-    def is_dirty(self):
-
-        """Method:  is_dirty
-
-        Description:  Stub holder for the GitMerge.is_dirty method.
-
-        Arguments:
-
-        """
-
-        return self.dirty
-
-    def is_untracked(self):
-
-        """Method:  is_untracked
-
-        Description:  Stub holder for GitMerge.is_untracked method.
-
-        Arguments:
-
-        """
-
-        return self.untracked
-
     def process_dirty(self, option):
 
         """Method:  process_dirty
@@ -153,30 +122,6 @@ class GitMerge(object):                                 # pylint:disable=R0205
 
         return status
 
-    def get_dirty(self):
-
-        """Method:  get_dirty
-
-        Description:  Stub holder for the GitMerge.get_dirty method.
-
-        Arguments:
-
-        """
-
-        return True
-
-    def get_untracked(self):
-
-        """Method:  get_untracked
-
-        Description:  Stub holder for GitMerge.get_untracked method.
-
-        Arguments:
-
-        """
-
-        return True
-
 
 class UnitTest(unittest.TestCase):
 
@@ -205,9 +150,16 @@ class UnitTest(unittest.TestCase):
 
         self.gitr = GitMerge()
         self.cfg = CfgTest()
+        self.clean = merge_repo.GitStatus(False, (), (), ())
+        self.dirty = merge_repo.GitStatus(True, ("file1",), (), ("file2",))
+        self.untracked = merge_repo.GitStatus(False, (), ("file3",), ())
+        self.both = merge_repo.GitStatus(
+            True, ("file1",), ("file3",), ("file2",))
 
+    @mock.patch("merge_repo.quarantine")
+    @mock.patch("merge_repo.get_status")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_not_dirty(self, mock_log):
+    def test_not_dirty(self, mock_log, mock_status, mock_quar):
 
         """Function:  test_not_dirty
 
@@ -217,68 +169,77 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.gitr.dirty = False
-        self.gitr.untracked = False
-        mock_log.return_value = True
+        mock_status.return_value = self.clean
 
-        self.assertFalse(merge_repo.process_changes(self.gitr, self.cfg,
-                                                    mock_log))
+        self.assertEqual(
+            merge_repo.process_changes(self.gitr, self.cfg, mock_log),
+            self.clean)
+        self.assertEqual(mock_status.call_count, 1)
+        self.assertFalse(mock_quar.called)
 
     @mock.patch("merge_repo.quarantine")
+    @mock.patch("merge_repo.get_status")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_is_dirty_true(self, mock_log, mock_quar):
+    def test_is_dirty_true(self, mock_log, mock_status, mock_quar):
 
         """Function:  test_is_dirty_true
 
-        Description:  Test with is_dirty returning True.
+        Description:  Test with dirty files found.
 
         Arguments:
 
         """
 
-        self.gitr.untracked = False
-        mock_log.return_value = True
+        mock_status.side_effect = [self.dirty, self.clean]
         mock_quar.return_value = True
 
-        self.assertFalse(merge_repo.process_changes(self.gitr, self.cfg,
-                                                    mock_log))
+        self.assertEqual(
+            merge_repo.process_changes(self.gitr, self.cfg, mock_log),
+            self.clean)
+        self.assertEqual(self.gitr.chg_files, ["file1"])
+        self.assertEqual(self.gitr.rm_files, ["file2"])
 
     @mock.patch("merge_repo.quarantine")
+    @mock.patch("merge_repo.get_status")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_is_untracked_true(self, mock_log, mock_quar):
+    def test_is_untracked_true(self, mock_log, mock_status, mock_quar):
 
         """Function:  test_is_untracked_true
 
-        Description:  Test with is_dirty returning True.
+        Description:  Test with untracked files found.
 
         Arguments:
 
         """
 
-        self.gitr.dirty = False
-        mock_log.return_value = True
+        mock_status.side_effect = [self.untracked, self.clean]
         mock_quar.return_value = True
 
-        self.assertFalse(merge_repo.process_changes(self.gitr, self.cfg,
-                                                    mock_log))
+        self.assertEqual(
+            merge_repo.process_changes(self.gitr, self.cfg, mock_log),
+            self.clean)
+        self.assertEqual(self.gitr.new_files, ["file3"])
 
     @mock.patch("merge_repo.quarantine")
+    @mock.patch("merge_repo.get_status")
     @mock.patch("merge_repo.gen_class.Logger")
-    def test_both_checks_true(self, mock_log, mock_quar):
+    def test_both_checks_true(self, mock_log, mock_status, mock_quar):
 
         """Function:  test_both_checks_true
 
-        Description:  Test with both checks returning True.
+        Description:  Test with dirty and untracked files found.
 
         Arguments:
 
         """
 
-        mock_log.return_value = True
+        mock_status.side_effect = [self.both, self.clean]
         mock_quar.return_value = True
 
-        self.assertFalse(merge_repo.process_changes(self.gitr, self.cfg,
-                                                    mock_log))
+        self.assertEqual(
+            merge_repo.process_changes(self.gitr, self.cfg, mock_log),
+            self.clean)
+        self.assertEqual(mock_status.call_count, 2)
 
 
 if __name__ == "__main__":
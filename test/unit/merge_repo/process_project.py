@@ -67,6 +67,13 @@ class UnitTest(unittest.TestCase):
         test_status2_false
         test_status1_true
         test_status1_false
+        test_fetch_branch
+        test_mirror
+        test_same_tree
+        test_index_mode
+        test_unrelated_fail
+        test_unrelated_allow
+        test_unrelated_allowed
 
     """
 
@@ -86,6 +93,7 @@ class UnitTest(unittest.TestCase):
         self.msg = {}
         self.msg2 = {"Error": "Code"}
 
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
     @mock.patch("merge_repo.merge_project")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
@@ -108,6 +116,7 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
                                                     mock_log))
 
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
@@ -132,6 +141,7 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
                                                     mock_log))
 
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
@@ -156,6 +166,7 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
                                                     mock_log))
 
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
@@ -179,6 +190,7 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
                                                     mock_log))
 
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
@@ -202,6 +214,7 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
                                                     mock_log))
 
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
     @mock.patch("merge_repo.post_process")
     @mock.patch("merge_repo.git_class.GitMerge")
     @mock.patch("merge_repo.gen_class.Logger")
@@ -222,6 +235,181 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
                                                     mock_log))
 
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.fetch_branch")
+    @mock.patch("merge_repo.post_process")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_fetch_branch(self, mock_log, mock_git, mock_post, mock_fetch):
+
+        """Function:  test_fetch_branch
+
+        Description:  Test with fetch of only the configured branch.
+
+        Arguments:
+
+        """
+
+        self.cfg.fetch_mode = "branch"
+
+        mock_fetch.return_value = (self.status2, self.msg2)
+        mock_post.return_value = True
+
+        self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
+                                                    mock_log))
+        self.assertFalse(mock_git.git_fetch.called)
+
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.update_mirror")
+    @mock.patch("merge_repo.post_process")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_mirror(self, mock_log, mock_git, mock_post, mock_mirror):
+
+        """Function:  test_mirror
+
+        Description:  Test with the mirror cache in use.
+
+        Arguments:
+
+        """
+
+        self.cfg.mirror_dir = "/data/merge-repo/mirror_dir"
+
+        mock_git.git_fetch.return_value = (self.status2, self.msg2)
+        mock_mirror.return_value = True
+        mock_post.return_value = True
+
+        self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
+                                                    mock_log))
+        self.assertTrue(mock_mirror.called)
+
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.merge_project")
+    @mock.patch("merge_repo.post_process")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_same_tree(self, mock_log, mock_git, mock_post, mock_merge):
+
+        """Function:  test_same_tree
+
+        Description:  Test with incoming tree the same as the remote branch.
+
+        Arguments:
+
+        """
+
+        mock_git.git_fetch.return_value = (self.status, self.msg)
+        mock_post.return_value = True
+
+        self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
+                                                    mock_log))
+        self.assertFalse(mock_git.rename_br.called)
+        self.assertFalse(mock_merge.called)
+        self.assertTrue(mock_post.call_args[0][3])
+
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.merge_project")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_index_mode(self, mock_log, mock_git, mock_merge):
+
+        """Function:  test_index_mode
+
+        Description:  Test with the merge in a temporary index.
+
+        Arguments:
+
+        """
+
+        self.cfg.merge_mode = "index"
+
+        mock_git.git_fetch.return_value = (self.status, self.msg)
+        mock_merge.return_value = True
+
+        self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
+                                                    mock_log))
+        self.assertFalse(mock_git.rename_br.called)
+        self.assertFalse(mock_git.git_co.called)
+        self.assertTrue(mock_merge.called)
+
+    @mock.patch("merge_repo.is_related", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.merge_project")
+    @mock.patch("merge_repo.post_process")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_unrelated_fail(self, mock_log, mock_git, mock_post, mock_merge):
+
+        """Function:  test_unrelated_fail
+
+        Description:  Test with unrelated histories and fail policy.
+
+        Arguments:
+
+        """
+
+        mock_git.git_fetch.return_value = (self.status, self.msg)
+        mock_post.return_value = True
+
+        self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
+                                                    mock_log))
+        self.assertFalse(mock_git.rename_br.called)
+        self.assertFalse(mock_merge.called)
+        self.assertFalse(mock_post.call_args[0][3])
+
+    @mock.patch("merge_repo.is_related", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.merge_project")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_unrelated_allow(self, mock_log, mock_git, mock_merge):
+
+        """Function:  test_unrelated_allow
+
+        Description:  Test with unrelated histories and allow policy.
+
+        Arguments:
+
+        """
+
+        self.cfg.unrelated = "allow"
+
+        mock_git.git_fetch.return_value = (self.status, self.msg)
+        mock_git.rename_br.return_value = (self.status, self.msg)
+        mock_git.git_co.return_value = (self.status, self.msg)
+        mock_merge.return_value = True
+
+        self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
+                                                    mock_log))
+        self.assertTrue(mock_merge.call_args[1]["allow"])
+
+    @mock.patch("merge_repo.is_related")
+    @mock.patch("merge_repo.is_same_tree", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.merge_project")
+    @mock.patch("merge_repo.git_class.GitMerge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_unrelated_allowed(self, mock_log, mock_git, mock_merge,
+                               mock_related):
+
+        """Function:  test_unrelated_allowed
+
+        Description:  Test with unrelated histories allowed by -u option.
+
+        Arguments:
+
+        """
+
+        mock_git.git_fetch.return_value = (self.status, self.msg)
+        mock_git.rename_br.return_value = (self.status, self.msg)
+        mock_git.git_co.return_value = (self.status, self.msg)
+        mock_merge.return_value = True
+
+        self.assertFalse(merge_repo.process_project(mock_git, self.cfg,
+                                                    mock_log, allow=True))
+        self.assertFalse(mock_related.called)
+        self.assertTrue(mock_merge.call_args[1]["allow"])
+
 
 if __name__ == "__main__":
     unittest.main()
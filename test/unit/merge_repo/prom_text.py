@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  prom_text.py
+
+    Description:  Unit testing of prom_text in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/prom_text.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_state
+        test_failed
+        test_histogram
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = {
+            "attempted": 2, "succeeded": 1, "failed": {"push": 1},
+            "stages": {"fetch": {"buckets": [1, 1, 2, 2, 2, 2, 2, 2, 2],
+                                 "sum": 0.75, "count": 2}}}
+
+    def test_empty_state(self):
+
+        """Function:  test_empty_state
+
+        Description:  Test with no merges yet.
+
+        Arguments:
+
+        """
+
+        data = merge_repo.prom_text({})
+
+        self.assertIn("merge_repo_merges_attempted_total 0\n", data)
+        self.assertNotIn("_bucket", data)
+        self.assertTrue(data.endswith("\n"))
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test with failed merges by stage.
+
+        Arguments:
+
+        """
+
+        data = merge_repo.prom_text(self.state)
+
+        self.assertIn("merge_repo_merges_attempted_total 2\n", data)
+        self.assertIn("merge_repo_merges_succeeded_total 1\n", data)
+        self.assertIn('merge_repo_merges_failed_total{stage="push"} 1\n',
+                      data)
+
+    def test_histogram(self):
+
+        """Function:  test_histogram
+
+        Description:  Test with the stage latency histogram.
+
+        Arguments:
+
+        """
+
+        data = merge_repo.prom_text(self.state)
+
+        self.assertIn(
+            'merge_repo_stage_duration_seconds_bucket{stage="fetch",le="0.1"}'
+            ' 1\n', data)
+        self.assertIn(
+            'merge_repo_stage_duration_seconds_bucket{stage="fetch",'
+            'le="+Inf"} 2\n', data)
+        self.assertIn('merge_repo_stage_duration_seconds_sum{stage="fetch"}'
+                      ' 0.75\n', data)
+        self.assertIn(
+            'merge_repo_stage_duration_seconds_count{stage="fetch"} 2\n',
+            data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# Classification (U)
+
+"""Program:  push_branch.py
+
+    Description:  Unit testing of push_branch in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/push_branch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+        self.gitrepo = mock.Mock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_push
+        test_push_retry
+        test_push_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+        self.out = "To git@server:project/repo.git\n" \
+            + " \trefs/heads/develop:refs/heads/develop\tabc123..def456\n" \
+            + "Done"
+        self.err = merge_repo.git.exc.GitCommandError(
+            "git push", 1, "push rejected")
+        self.err2 = merge_repo.git.exc.GitCommandError(
+            "git push", 128, "connection reset")
+
+    def test_push(self):
+
+        """Function:  test_push
+
+        Description:  Test with a successful push.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.push.return_value = self.out
+
+        self.assertEqual(
+            merge_repo.push_branch(self.gitr),
+            (True, {}, {"refs/heads/develop": " "}))
+        self.gitr.gitrepo.git.push.assert_called_once_with(
+            "--porcelain", "origin", "refs/heads/develop:refs/heads/develop")
+
+    @mock.patch("merge_repo.time.sleep", mock.Mock(return_value=True))
+    def test_push_retry(self):
+
+        """Function:  test_push_retry
+
+        Description:  Test with a push succeeding after a status of 128.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.push.side_effect = [self.err2, self.out]
+
+        self.assertEqual(
+            merge_repo.push_branch(self.gitr),
+            (True, {}, {"refs/heads/develop": " "}))
+        self.assertEqual(self.gitr.gitrepo.git.push.call_count, 2)
+
+    def test_push_failed(self):
+
+        """Function:  test_push_failed
+
+        Description:  Test with the push failing.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.push.side_effect = self.err
+
+        status, msg, refs = merge_repo.push_branch(self.gitr)
+
+        self.assertFalse(status)
+        self.assertEqual(msg["status"], 1)
+        self.assertEqual(refs, {})
+        self.assertEqual(self.gitr.gitrepo.git.push.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  push_tags.py
+
+    Description:  Unit testing of push_tags in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/push_tags.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.branch = "develop"
+        self.gitrepo = mock.Mock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_tags
+        test_push
+        test_push_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+        self.tags = ["refs/tags/v1", "refs/tags/v2"]
+        self.err = merge_repo.git.exc.GitCommandError(
+            "git push", 1, "tag push failed")
+
+    def test_no_tags(self):
+
+        """Function:  test_no_tags
+
+        Description:  Test with no tags to push.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.push_tags(self.gitr, []), (True, {}))
+        self.assertFalse(self.gitr.gitrepo.git.push.called)
+
+    def test_push(self):
+
+        """Function:  test_push
+
+        Description:  Test with tags pushed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.push_tags(self.gitr, self.tags), (True, {}))
+        self.gitr.gitrepo.git.push.assert_called_once_with(
+            "--porcelain", "origin", "refs/tags/v1", "refs/tags/v2")
+
+    def test_push_failed(self):
+
+        """Function:  test_push_failed
+
+        Description:  Test with the tag push failing.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.push.side_effect = self.err
+
+        status, msg = merge_repo.push_tags(self.gitr, self.tags)
+
+        self.assertFalse(status)
+        self.assertEqual(msg["stderr"], "tag push failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,300 @@
+# Classification (U)
+
+"""Program:  remote_check.py
+
+    Description:  Unit testing of remote_check in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/remote_check.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        insert_arg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.prefix = "git@"
+        self.git_server = "domain"
+        self.git_project = "project"
+        self.branch = "develop"
+        self.async_jobs = 8
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_enabled
+        test_single_project
+        test_remotes_checked
+        test_mirrors_refreshed
+        test_mirror_locked
+        test_not_run
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-c": "merge", "-d": "/config_dir"}
+        self.cfg = CfgTest()
+        self.proj_list = ["/directory/repo1", "/directory/repo2"]
+        self.url = "git@domain:project/repo1.git"
+        self.url2 = "git@domain:project/repo2.git"
+        self.mirror = "/data/merge-repo/mirror_dir/repo1.git"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.REMOTE_CHECK.clear()
+        merge_repo.MIRROR_FRESH.clear()
+
+    @mock.patch("merge_repo.async_git")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_not_enabled(self, mock_log, mock_async):
+
+        """Function:  test_not_enabled
+
+        Description:  Test with async_jobs not set.
+
+        Arguments:
+
+        """
+
+        del self.cfg.async_jobs
+
+        merge_repo.remote_check(self.args, self.cfg, mock_log, self.proj_list)
+        self.assertFalse(mock_async.called)
+
+    @mock.patch("merge_repo.async_git")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_single_project(self, mock_log, mock_async):
+
+        """Function:  test_single_project
+
+        Description:  Test with only one project to merge.
+
+        Arguments:
+
+        """
+
+        merge_repo.remote_check(
+            self.args, self.cfg, mock_log, self.proj_list[:1])
+        self.assertFalse(mock_async.called)
+
+    @mock.patch("merge_repo.asyncio", mock.Mock())
+    @mock.patch("merge_repo.async_git")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_remotes_checked(self, mock_log, mock_async):
+
+        """Function:  test_remotes_checked
+
+        Description:  Test with the remote repositories checked.
+
+        Arguments:
+
+        """
+
+        mock_async.return_value = [(0, ""), (128, "fatal: not found\n")]
+
+        merge_repo.remote_check(self.args, self.cfg, mock_log, self.proj_list)
+        mock_async.assert_called_once_with(
+            [["git", "ls-remote", "--heads", self.url, "develop"],
+             ["git", "ls-remote", "--heads", self.url2, "develop"]], 8)
+        self.assertEqual(merge_repo.REMOTE_CHECK, set([self.url]))
+        mock_log.log_warn.assert_called_once_with(
+            "remote_check:  git ls-remote failed for %s: fatal: not found"
+            % (self.url2))
+
+    @mock.patch("merge_repo.asyncio", mock.Mock())
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.async_git")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_mirrors_refreshed(self, mock_log, mock_async, mock_open):
+
+        """Function:  test_mirrors_refreshed
+
+        Description:  Test with the mirrors refreshed.
+
+        Arguments:
+
+        """
+
+        self.cfg.mirror_dir = "/data/merge-repo/mirror_dir"
+        mock_async.return_value = [(0, "")] * 4
+
+        merge_repo.remote_check(self.args, self.cfg, mock_log, self.proj_list)
+        self.assertEqual(len(mock_async.call_args[0][0]), 4)
+        self.assertIn(self.mirror, merge_repo.MIRROR_FRESH)
+        self.assertEqual(len(merge_repo.MIRROR_FRESH), 2)
+        self.assertEqual(mock_open.return_value.close.call_count, 2)
+
+    @mock.patch("merge_repo.asyncio", mock.Mock())
+    @mock.patch("merge_repo.fcntl.flock")
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.async_git")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_mirror_locked(self, mock_log, mock_async, mock_open,
+                           mock_flock):
+
+        """Function:  test_mirror_locked
+
+        Description:  Test with the mirrors locked by another process.
+
+        Arguments:
+
+        """
+
+        self.cfg.mirror_dir = "/data/merge-repo/mirror_dir"
+        mock_flock.side_effect = OSError("Resource unavailable")
+        mock_async.return_value = [(0, ""), (0, "")]
+
+        merge_repo.remote_check(self.args, self.cfg, mock_log, self.proj_list)
+        self.assertEqual(len(mock_async.call_args[0][0]), 2)
+        self.assertEqual(merge_repo.MIRROR_FRESH, set())
+        self.assertEqual(mock_open.return_value.close.call_count, 2)
+
+    @mock.patch("merge_repo.asyncio", mock.Mock())
+    @mock.patch("merge_repo.async_git")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_not_run(self, mock_log, mock_async):
+
+        """Function:  test_not_run
+
+        Description:  Test with the event loop not able to run.
+
+        Arguments:
+
+        """
+
+        mock_async.side_effect = RuntimeError("No child watcher")
+
+        merge_repo.remote_check(self.args, self.cfg, mock_log, self.proj_list)
+        self.assertEqual(merge_repo.REMOTE_CHECK, set())
+        self.assertEqual(mock_log.log_warn.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
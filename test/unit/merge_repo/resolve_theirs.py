@@ -0,0 +1,173 @@
+# Classification (U)
+
+"""Program:  resolve_theirs.py
+
+    Description:  Unit testing of resolve_theirs in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/resolve_theirs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.gitrepo = mock.Mock()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_content_merge
+        test_binary_merge
+        test_mode_change
+        test_removed
+        test_incoming_only
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gitr = GitMerge()
+        self.gitr.gitrepo.git.hash_object.return_value = "oid4"
+        self.stages = {"1": ("100644", "oid1"), "2": ("100644", "oid2"),
+                       "3": ("100755", "oid3")}
+
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    def test_content_merge(self):
+
+        """Function:  test_content_merge
+
+        Description:  Test with file contents merged.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.resolve_theirs(self.gitr, self.stages, "/tmp/idx"),
+            ("100755", "oid4"))
+        self.gitr.gitrepo.git.merge_file.assert_called_once_with(
+            "--theirs", "/tmp/idx/stage2", "/tmp/idx/stage1",
+            "/tmp/idx/stage3")
+        self.assertEqual(self.gitr.gitrepo.git.cat_file.call_count, 3)
+
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    def test_binary_merge(self):
+
+        """Function:  test_binary_merge
+
+        Description:  Test with binary files which cannot be merged.
+
+        Arguments:
+
+        """
+
+        self.gitr.gitrepo.git.merge_file.side_effect = \
+            merge_repo.git.exc.GitCommandError("git merge-file", 255)
+
+        self.assertEqual(
+            merge_repo.resolve_theirs(self.gitr, self.stages, "/tmp/idx"),
+            ("100755", "oid3"))
+
+    def test_mode_change(self):
+
+        """Function:  test_mode_change
+
+        Description:  Test with the path changed to a symbolic link.
+
+        Arguments:
+
+        """
+
+        self.stages["3"] = ("120000", "oid3")
+
+        self.assertEqual(
+            merge_repo.resolve_theirs(self.gitr, self.stages, "/tmp/idx"),
+            ("120000", "oid3"))
+        self.assertFalse(self.gitr.gitrepo.git.merge_file.called)
+
+    def test_removed(self):
+
+        """Function:  test_removed
+
+        Description:  Test with the path removed by the incoming side.
+
+        Arguments:
+
+        """
+
+        del self.stages["3"]
+
+        self.assertIsNone(
+            merge_repo.resolve_theirs(self.gitr, self.stages, "/tmp/idx"))
+
+    def test_incoming_only(self):
+
+        """Function:  test_incoming_only
+
+        Description:  Test with the path removed by the remote side.
+
+        Arguments:
+
+        """
+
+        del self.stages["2"]
+
+        self.assertEqual(
+            merge_repo.resolve_theirs(self.gitr, self.stages, "/tmp/idx"),
+            ("100755", "oid3"))
+        self.assertFalse(self.gitr.gitrepo.git.merge_file.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+# Classification (U)
+
+"""Program:  restore.py
+
+    Description:  Unit testing of restore in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/restore.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+        insert_arg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_target_exists
+        test_default_target
+        test_target_dir
+        test_restore_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = "Configuration"
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "config_file", "-d": "config_dir",
+            "-R": "/archive_dir/git_repo.20260101_120000.bundle"}
+
+    @mock.patch("merge_repo.restore_archive")
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_target_exists(self, mock_log, mock_restore):
+
+        """Function:  test_target_exists
+
+        Description:  Test with target directory already existing.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            merge_repo.restore(self.args, self.cfg, mock_log)
+
+        self.assertFalse(mock_restore.called)
+
+    @mock.patch("merge_repo.restore_archive")
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_default_target(self, mock_log, mock_restore):
+
+        """Function:  test_default_target
+
+        Description:  Test with default target directory.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            merge_repo.restore(self.args, self.cfg, mock_log)
+
+        mock_restore.assert_called_once_with(
+            "/archive_dir/git_repo.20260101_120000.bundle",
+            "/archive_dir/git_repo.20260101_120000")
+
+    @mock.patch("merge_repo.restore_archive")
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_target_dir(self, mock_log, mock_restore):
+
+        """Function:  test_target_dir
+
+        Description:  Test with target directory passed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = "/directory/git_repo"
+
+        with gen_libs.no_std_out():
+            merge_repo.restore(self.args, self.cfg, mock_log)
+
+        mock_restore.assert_called_once_with(
+            "/archive_dir/git_repo.20260101_120000.bundle",
+            "/directory/git_repo")
+
+    @mock.patch("merge_repo.restore_archive")
+    @mock.patch("merge_repo.os.path.exists", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_restore_failed(self, mock_log, mock_restore):
+
+        """Function:  test_restore_failed
+
+        Description:  Test with restore of the archive failing.
+
+        Arguments:
+
+        """
+
+        mock_restore.side_effect = IOError("Error Message")
+
+        with gen_libs.no_std_out():
+            merge_repo.restore(self.args, self.cfg, mock_log)
+
+        self.assertTrue(mock_log.log_err.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
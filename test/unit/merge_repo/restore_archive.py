@@ -0,0 +1,236 @@
+# Classification (U)
+
+"""Program:  restore_archive.py
+
+    Description:  Unit testing of restore_archive in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/restore_archive.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def real_git():
+
+    """Function:  real_git
+
+    Description:  Return True if GitPython and the git program are installed.
+
+    Arguments:
+
+    """
+
+    try:
+        return isinstance(merge_repo.git.Repo, type)                    \
+            and bool(merge_repo.find_program("git"))
+
+    except ImportError:
+        return False
+
+
+def run_git(git_dir, *cmd):
+
+    """Function:  run_git
+
+    Description:  Run a git command in a repository.
+
+    Arguments:
+        (input) git_dir -> Directory path to git repository
+        (input) *cmd -> Git command and its arguments
+
+    """
+
+    subprocess.check_call(
+        ["git", "-C", git_dir, "-c", "user.name=gituser",
+         "-c", "user.email=gituser@localhost"] + list(cmd),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_branch
+        test_detached_head
+        test_deleted_files
+        test_detached_head_bundle
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.bundle_file = "/archive_dir/git_repo.20260101_120000.bundle"
+        self.target_dir = "/directory/git_repo"
+        self.state = {
+            "head": "abc123", "branch": "master", "changed": ["file1"],
+            "deleted": [], "others": [], "compress": "gzip"}
+        self.tar = mock.Mock()
+        self.tmp_dir = None
+
+    @mock.patch("merge_repo.close_tar", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open_tar")
+    @mock.patch("merge_repo.git.Repo.init")
+    @mock.patch("merge_repo.json.load")
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    def test_branch(self, mock_load, mock_init, mock_tar):
+
+        """Function:  test_branch
+
+        Description:  Test with archive with HEAD on a branch.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.state
+        mock_tar.return_value = (self.tar, None)
+
+        merge_repo.restore_archive(self.bundle_file, self.target_dir)
+
+        mock_init.return_value.git.fetch.assert_called_once_with(
+            self.bundle_file, "refs/*:refs/*", "HEAD", "--update-head-ok")
+        mock_init.return_value.git.checkout.assert_called_once_with(
+            "-f", "master")
+        self.tar.extractall.assert_called_once_with(self.target_dir)
+
+    @mock.patch("merge_repo.close_tar", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open_tar")
+    @mock.patch("merge_repo.git.Repo.init")
+    @mock.patch("merge_repo.json.load")
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    def test_detached_head(self, mock_load, mock_init, mock_tar):
+
+        """Function:  test_detached_head
+
+        Description:  Test with archive with a detached HEAD.
+
+        Arguments:
+
+        """
+
+        self.state["branch"] = None
+
+        mock_load.return_value = self.state
+        mock_tar.return_value = (self.tar, None)
+
+        merge_repo.restore_archive(self.bundle_file, self.target_dir)
+
+        mock_init.return_value.git.checkout.assert_called_once_with(
+            "-f", "--detach", "abc123")
+
+    @mock.patch("merge_repo.os.remove")
+    @mock.patch("merge_repo.os.path.lexists", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.close_tar", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open_tar")
+    @mock.patch("merge_repo.git.Repo.init", mock.Mock())
+    @mock.patch("merge_repo.json.load")
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    def test_deleted_files(self, mock_load, mock_tar, mock_remove):
+
+        """Function:  test_deleted_files
+
+        Description:  Test with archive with deleted files.
+
+        Arguments:
+
+        """
+
+        self.state["deleted"] = ["file2"]
+
+        mock_load.return_value = self.state
+        mock_tar.return_value = (self.tar, None)
+
+        merge_repo.restore_archive(self.bundle_file, self.target_dir)
+
+        mock_remove.assert_called_once_with(
+            os.path.join(self.target_dir, "file2"))
+
+    @unittest.skipIf(not real_git(), "Requires GitPython and git")
+    def test_detached_head_bundle(self):
+
+        """Function:  test_detached_head_bundle
+
+        Description:  Test with a real bundle archive of a repository with a
+            commit only reachable from its detached HEAD.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        git_dir = os.path.join(self.tmp_dir, "git_repo")
+        dest_base = os.path.join(self.tmp_dir, "git_repo.20260101_120000")
+        target_dir = os.path.join(self.tmp_dir, "restored")
+        run_git(self.tmp_dir, "init", "-q", git_dir)
+        run_git(git_dir, "commit", "-q", "--allow-empty", "-m", "first")
+        run_git(git_dir, "checkout", "-q", "--detach")
+
+        with open(os.path.join(git_dir, "file1"), "w") as f_hdlr:
+            f_hdlr.write("detached\n")
+
+        run_git(git_dir, "add", "file1")
+        run_git(git_dir, "commit", "-q", "-m", "detached")
+
+        with open(os.path.join(git_dir, "file1"), "w") as f_hdlr:
+            f_hdlr.write("dirty\n")
+
+        head = merge_repo.git.Repo(git_dir).head.commit.hexsha
+        merge_repo.archive_bundle(git_dir, dest_base)
+        merge_repo.restore_archive(dest_base + ".bundle", target_dir)
+
+        gitrepo = merge_repo.git.Repo(target_dir)
+        self.assertTrue(gitrepo.head.is_detached)
+        self.assertEqual(gitrepo.head.commit.hexsha, head)
+
+        with open(os.path.join(target_dir, "file1")) as f_hdlr:
+            self.assertEqual(f_hdlr.read(), "dirty\n")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if self.tmp_dir:
+            shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
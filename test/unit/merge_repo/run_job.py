@@ -0,0 +1,225 @@
+# Classification (U)
+
+"""Program:  run_job.py
+
+    Description:  Unit testing of run_job in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/run_job.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        insert_arg
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {"-c": "merge", "-d": "/config_dir", "-D": True}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def insert_arg(self, arg_key, arg_val):
+
+        """Method:  insert_arg
+
+        Description:  Method stub holder for gen_class.ArgParser.insert_arg.
+
+        Arguments:
+
+        """
+
+        self.args_array[arg_key] = arg_val
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+        self.to_line = "name@domain"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_job_options
+        test_no_mail
+        test_wait_no_reply
+        test_merge_exception
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = CfgTest()
+        self.conn = mock.Mock()
+        self.job = {"-p": "/directory/repo-name", "-r": None, "-a": True,
+                    "-n": False, "-u": False, "job_id": "0123456789ab",
+                    "conns": []}
+        self.to_line = []
+
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_job_options(self, mock_log, mock_merge):
+
+        """Function:  test_job_options
+
+        Description:  Test with the job's options used for the merge.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = True
+
+        self.assertTrue(
+            merge_repo.run_job(self.args, self.cfg, mock_log, self.job))
+        job_args = mock_merge.call_args[0][0]
+        self.assertEqual(job_args.get_val("-r"), "repo-name")
+        self.assertEqual(job_args.get_val("-p"), "/directory/repo-name")
+        self.assertTrue(job_args.get_val("-a"))
+        self.assertIsNone(job_args.get_val("-u"))
+        self.assertNotIn("-p", self.args.args_array)
+
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_no_mail(self, mock_log, mock_merge):
+
+        """Function:  test_no_mail
+
+        Description:  Test with no email for the job's merge.
+
+        Arguments:
+
+        """
+
+        self.job["-n"] = True
+        mock_merge.side_effect = \
+            lambda args, cfg, log: self.to_line.append(cfg.to_line)
+
+        merge_repo.run_job(self.args, self.cfg, mock_log, self.job)
+        self.assertEqual(self.to_line, [None])
+        self.assertEqual(self.cfg.to_line, "name@domain")
+
+    @mock.patch("merge_repo.job_reply")
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_wait_no_reply(self, mock_log, mock_merge, mock_reply):
+
+        """Function:  test_wait_no_reply
+
+        Description:  Test with the merge status left to job_done for a
+            waiting client.
+
+        Arguments:
+
+        """
+
+        self.job["conns"].append(self.conn)
+        mock_merge.return_value = False
+
+        self.assertFalse(
+            merge_repo.run_job(self.args, self.cfg, mock_log, self.job))
+        self.assertFalse(mock_reply.called)
+        self.assertFalse(self.conn.close.called)
+
+    @mock.patch("merge_repo.run_merge")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_merge_exception(self, mock_log, mock_merge):
+
+        """Function:  test_merge_exception
+
+        Description:  Test with the merge raising an exception.
+
+        Arguments:
+
+        """
+
+        self.job["-n"] = True
+        mock_merge.side_effect = OSError("Error Message")
+
+        self.assertFalse(
+            merge_repo.run_job(self.args, self.cfg, mock_log, self.job))
+        self.assertEqual(self.cfg.to_line, "name@domain")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+# Classification (U)
+
+"""Program:  run_merge.py
+
+    Description:  Unit testing of run_merge in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/run_merge.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def merge(args, cfg, log):
+
+    """Function:  merge
+
+    Description:  This is a function stub for merge_repo.merge.
+
+    Arguments:
+
+    """
+
+    if args and cfg and log:
+        merge_repo.MERGE_STATUS["repo-name"] = True
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class ProgramLock(object):                      # pylint:disable=R0903,R0205
+
+    """Class:  ProgramLock
+
+    Description:  Mock of the gen_class.ProgramLock class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, argv, flavor_id=""):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ProgramLock class.
+
+        Arguments:
+
+        """
+
+        self.lock_created = True
+        self.argv = argv
+        self.flavor_id = flavor_id
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.work_dir = "/data/merge-repo/work_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_merge_status_true
+        test_merge_status_missing
+        test_programlock_false
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "config_file", "-d": "config_dir", "-r": "repo-name",
+            "-p": "/directory/repo-name", "-M": True}
+        self.proglock = ProgramLock(["cmdline"], "repo-name")
+
+    @mock.patch("merge_repo.merge", mock.Mock(side_effect=merge))
+    @mock.patch("merge_repo.gen_class.Logger")
+    @mock.patch("merge_repo.gen_class.ProgramLock")
+    def test_merge_status_true(self, mock_lock, mock_log):
+
+        """Function:  test_merge_status_true
+
+        Description:  Test with merge status set by the merge.
+
+        Arguments:
+
+        """
+
+        mock_lock.return_value = self.proglock
+
+        self.assertTrue(merge_repo.run_merge(self.args, self.cfg, mock_log))
+
+    @mock.patch("merge_repo.merge", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    @mock.patch("merge_repo.gen_class.ProgramLock")
+    def test_merge_status_missing(self, mock_lock, mock_log):
+
+        """Function:  test_merge_status_missing
+
+        Description:  Test with merge status not set by the merge.
+
+        Arguments:
+
+        """
+
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(merge_repo.run_merge(self.args, self.cfg, mock_log))
+
+    @mock.patch("merge_repo.merge", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.gen_class.Logger")
+    @mock.patch("merge_repo.gen_class.ProgramLock")
+    def test_programlock_false(self, mock_lock, mock_log):
+
+        """Function:  test_programlock_false
+
+        Description:  Test with ProgramLock raising an exception.
+
+        Arguments:
+
+        """
+
+        mock_lock.side_effect = \
+            merge_repo.gen_class.SingleInstanceException
+        mock_log.log_warn.return_value = True
+
+        self.assertIsNone(merge_repo.run_merge(self.args, self.cfg, mock_log))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -151,6 +151,8 @@ class UnitTest(unittest.TestCase):
         test_no_email_option
         test_status_flag_true
         test_status_flag_false
+        test_ssh_mux
+        test_mail_queue
 
     """
 
@@ -231,6 +233,50 @@ class UnitTest(unittest.TestCase):
             self.assertFalse(
                 merge_repo.run_program(self.args, self.func_names))
 
+    @mock.patch("merge_repo.ssh_mux_stop")
+    @mock.patch("merge_repo.ssh_mux_start")
+    @mock.patch("merge_repo.gen_class.Logger")
+    @mock.patch("merge_repo.load_cfg")
+    def test_ssh_mux(self, mock_cfg, mock_log, mock_start, mock_stop):
+
+        """Function:  test_ssh_mux
+
+        Description:  Test with SSH multiplexing torn down after the run.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_log.return_value = merge_repo.gen_class.Logger
+        mock_start.return_value = "/tmp/merge-repo-ssh.abc123"
+
+        self.assertFalse(merge_repo.run_program(self.args, self.func_names))
+        mock_stop.assert_called_once_with(
+            "/tmp/merge-repo-ssh.abc123", merge_repo.gen_class.Logger)
+
+    @mock.patch("merge_repo.mail_stop")
+    @mock.patch("merge_repo.mail_start")
+    @mock.patch("merge_repo.gen_class.Logger")
+    @mock.patch("merge_repo.load_cfg")
+    def test_mail_queue(self, mock_cfg, mock_log, mock_start, mock_stop):
+
+        """Function:  test_mail_queue
+
+        Description:  Test with the mail sender stopped after the run.
+
+        Arguments:
+
+        """
+
+        queue = {"spool_dir": "/data/merge-repo/mail_spool"}
+        mock_cfg.return_value = (self.cfg, True, [])
+        mock_log.return_value = merge_repo.gen_class.Logger
+        mock_start.return_value = queue
+
+        self.assertFalse(merge_repo.run_program(self.args, self.func_names))
+        mock_stop.assert_called_once_with(queue, merge_repo.gen_class.Logger)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,278 @@
+# Classification (U)
+
+"""Program:  scan_spool.py
+
+    Description:  Unit testing of scan_spool in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/scan_spool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class StatResult(object):                       # pylint:disable=R0903,R0205
+
+    """Class:  StatResult
+
+    Description:  Class stub holder for os.stat_result class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, mtime):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.st_mtime = mtime
+
+
+class SpoolDir(object):                                 # pylint:disable=R0205
+
+    """Class:  SpoolDir
+
+    Description:  Class stub holder for the entries of a spool directory.
+
+    Methods:
+        __init__
+        listdir
+        isdir
+        stat
+
+    """
+
+    def __init__(self, entries):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) entries -> Dictionary of name and (is_dir, mtime)
+
+        """
+
+        self.entries = entries
+
+    def listdir(self, path):
+
+        """Method:  listdir
+
+        Description:  Method stub holder for os.listdir.
+
+        Arguments:
+
+        """
+
+        return list(self.entries) if path == "/spool_dir" else []
+
+    def isdir(self, path):
+
+        """Method:  isdir
+
+        Description:  Method stub holder for os.path.isdir.
+
+        Arguments:
+
+        """
+
+        return self.entries[os.path.basename(path)][0]
+
+    def stat(self, path):
+
+        """Method:  stat
+
+        Description:  Method stub holder for os.stat.
+
+        Arguments:
+
+        """
+
+        if os.path.basename(path) not in self.entries:
+            raise OSError("No such file or directory")
+
+        return StatResult(self.entries[os.path.basename(path)][1])
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_spool
+        test_hidden_entry
+        test_file_entry
+        test_pending_entry
+        test_ready_entries
+        test_removed_entry
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.now = 1000
+        self.settle = 30
+
+    def use_spool(self, mock_os, entries):
+
+        """Function:  use_spool
+
+        Description:  Set up the os module mock with the spool entries.
+
+        Arguments:
+
+        """
+
+        spool = SpoolDir(entries)
+        mock_os.path.join = os.path.join
+        mock_os.path.basename = os.path.basename
+        mock_os.listdir.side_effect = spool.listdir
+        mock_os.path.isdir.side_effect = spool.isdir
+        mock_os.stat.side_effect = spool.stat
+
+    @mock.patch("merge_repo.os.listdir")
+    def test_empty_spool(self, mock_list):
+
+        """Function:  test_empty_spool
+
+        Description:  Test with an empty spool directory.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = []
+
+        self.assertEqual(merge_repo.scan_spool("/spool_dir", self.settle),
+                         ([], {}))
+
+    @mock.patch("merge_repo.time.time")
+    @mock.patch("merge_repo.os")
+    def test_hidden_entry(self, mock_os, mock_time):
+
+        """Function:  test_hidden_entry
+
+        Description:  Test with a hidden directory still being transferred.
+
+        Arguments:
+
+        """
+
+        self.use_spool(mock_os, {".repo-name": (True, 0)})
+        mock_time.return_value = self.now
+
+        self.assertEqual(merge_repo.scan_spool("/spool_dir", self.settle),
+                         ([], {}))
+
+    @mock.patch("merge_repo.time.time")
+    @mock.patch("merge_repo.os")
+    def test_file_entry(self, mock_os, mock_time):
+
+        """Function:  test_file_entry
+
+        Description:  Test with a file in the spool directory.
+
+        Arguments:
+
+        """
+
+        self.use_spool(mock_os, {"file_name": (False, 0)})
+        mock_time.return_value = self.now
+
+        self.assertEqual(merge_repo.scan_spool("/spool_dir", self.settle),
+                         ([], {}))
+
+    @mock.patch("merge_repo.time.time")
+    @mock.patch("merge_repo.os")
+    def test_pending_entry(self, mock_os, mock_time):
+
+        """Function:  test_pending_entry
+
+        Description:  Test with a directory modified within the settle time.
+
+        Arguments:
+
+        """
+
+        self.use_spool(mock_os, {"repo-name": (True, 990)})
+        mock_time.return_value = self.now
+
+        self.assertEqual(merge_repo.scan_spool("/spool_dir", self.settle),
+                         ([], {"/spool_dir/repo-name": 990}))
+
+    @mock.patch("merge_repo.time.time")
+    @mock.patch("merge_repo.os")
+    def test_ready_entries(self, mock_os, mock_time):
+
+        """Function:  test_ready_entries
+
+        Description:  Test with directories ready to be merged.
+
+        Arguments:
+
+        """
+
+        self.use_spool(mock_os, {"repo2": (True, 900),
+                                   "repo1": (True, 100)})
+        mock_time.return_value = self.now
+
+        self.assertEqual(merge_repo.scan_spool("/spool_dir", self.settle),
+                         (["/spool_dir/repo1", "/spool_dir/repo2"], {}))
+
+    @mock.patch("merge_repo.time.time")
+    @mock.patch("merge_repo.os")
+    def test_removed_entry(self, mock_os, mock_time):
+
+        """Function:  test_removed_entry
+
+        Description:  Test with a directory removed since the listing.
+
+        Arguments:
+
+        """
+
+        self.use_spool(mock_os, {"repo-name": (True, 900)})
+        mock_os.stat.side_effect = OSError("No such file or directory")
+        mock_time.return_value = self.now
+
+        self.assertEqual(merge_repo.scan_spool("/spool_dir", self.settle),
+                         ([], {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
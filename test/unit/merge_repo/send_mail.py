@@ -65,7 +65,11 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        tearDown
         test_send_mail
+        test_mail_queued
+        test_worker_queued
+        test_queue_failed
 
     """
 
@@ -82,6 +86,20 @@ class UnitTest(unittest.TestCase):
         self.cfg = CfgTest()
         self.subj = "Email_Subject"
         self.email_body = ["Email Body Line 1", "Email Body Line 2"]
+        self.spool_dir = "/data/merge-repo/mail_spool"
+        self.wake = mock.Mock()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.MAIL_QUEUE.clear()
 
     @mock.patch("merge_repo.gen_class.Mail")
     def test_send_mail(self, mock_mail):
@@ -99,6 +117,75 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             merge_repo.send_mail(self.cfg, self.subj, self.email_body))
 
+    @mock.patch("merge_repo.mail_deliver")
+    @mock.patch("merge_repo.mail_enqueue")
+    def test_mail_queued(self, mock_queue, mock_deliver):
+
+        """Function:  test_mail_queued
+
+        Description:  Test with the message queued in the mail spool.
+
+        Arguments:
+
+        """
+
+        merge_repo.MAIL_QUEUE.update(
+            {"spool_dir": self.spool_dir, "pid": os.getpid(),
+             "wake": self.wake})
+
+        merge_repo.send_mail(self.cfg.to_line, self.subj, self.email_body)
+
+        mock_queue.assert_called_once_with(
+            self.spool_dir, self.cfg.to_line, self.subj, self.email_body)
+        self.assertTrue(self.wake.set.called)
+        self.assertFalse(mock_deliver.called)
+
+    @mock.patch("merge_repo.mail_deliver")
+    @mock.patch("merge_repo.mail_enqueue")
+    def test_worker_queued(self, mock_queue, mock_deliver):
+
+        """Function:  test_worker_queued
+
+        Description:  Test with the message queued by a worker process.
+
+        Arguments:
+
+        """
+
+        merge_repo.MAIL_QUEUE.update(
+            {"spool_dir": self.spool_dir, "pid": os.getpid() + 1,
+             "wake": self.wake})
+
+        merge_repo.send_mail(self.cfg.to_line, self.subj, self.email_body)
+
+        self.assertTrue(mock_queue.called)
+        self.assertFalse(self.wake.set.called)
+        self.assertFalse(mock_deliver.called)
+
+    @mock.patch("merge_repo.mail_deliver")
+    @mock.patch("merge_repo.mail_enqueue")
+    def test_queue_failed(self, mock_queue, mock_deliver):
+
+        """Function:  test_queue_failed
+
+        Description:  Test with the message sent directly when it cannot be
+            queued.
+
+        Arguments:
+
+        """
+
+        merge_repo.MAIL_QUEUE.update(
+            {"spool_dir": self.spool_dir, "pid": os.getpid(),
+             "wake": self.wake})
+        mock_queue.side_effect = OSError("No space left on device")
+
+        merge_repo.send_mail(self.cfg.to_line, self.subj, self.email_body)
+
+        self.assertFalse(self.wake.set.called)
+        self.assertEqual(mock_deliver.call_args[0][0]["body"],
+                         self.email_body)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  snapshot_dir.py
+
+    Description:  Unit testing of snapshot_dir in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/snapshot_dir.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_dir
+        test_copy
+        test_hardlink_objects
+        test_symlink
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.src_dir = "/directory/repo-name"
+        self.dst_dir = "/archive_dir/repo-name"
+        self.walk = [
+            ("/directory/repo-name", [".git"], ["file1"]),
+            ("/directory/repo-name/.git", ["objects"], ["HEAD"]),
+            ("/directory/repo-name/.git/objects", ["ab", "info"], []),
+            ("/directory/repo-name/.git/objects/ab", [], ["cdef"]),
+            ("/directory/repo-name/.git/objects/info", [], ["packs"])]
+
+    @mock.patch("merge_repo.shutil.copystat", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.makedirs", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.walk")
+    def test_empty_dir(self, mock_walk):
+
+        """Function:  test_empty_dir
+
+        Description:  Test with an empty directory.
+
+        Arguments:
+
+        """
+
+        mock_walk.return_value = [(self.src_dir, [], [])]
+
+        self.assertEqual(
+            merge_repo.snapshot_dir(self.src_dir, self.dst_dir, "copy"),
+            ({"reflink": 0, "hardlink": 0, "copy": 0, "symlink": 0}, 0))
+
+    @mock.patch("merge_repo.shutil.copystat", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.makedirs", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.getsize", mock.Mock(return_value=10))
+    @mock.patch("merge_repo.os.path.islink", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.snapshot_file")
+    @mock.patch("merge_repo.os.walk")
+    def test_copy(self, mock_walk, mock_file):
+
+        """Function:  test_copy
+
+        Description:  Test with copy strategy.
+
+        Arguments:
+
+        """
+
+        mock_walk.return_value = self.walk
+        mock_file.return_value = "copy"
+
+        self.assertEqual(
+            merge_repo.snapshot_dir(self.src_dir, self.dst_dir, "copy"),
+            ({"reflink": 0, "hardlink": 0, "copy": 4, "symlink": 0}, 40))
+
+    @mock.patch("merge_repo.shutil.copystat", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.makedirs", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.getsize", mock.Mock(return_value=10))
+    @mock.patch("merge_repo.os.path.islink", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.snapshot_file")
+    @mock.patch("merge_repo.os.walk")
+    def test_hardlink_objects(self, mock_walk, mock_file):
+
+        """Function:  test_hardlink_objects
+
+        Description:  Test with hardlink strategy only used for objects.
+
+        Arguments:
+
+        """
+
+        mock_walk.return_value = self.walk
+        mock_file.side_effect = lambda src, dst, strategy: strategy
+
+        self.assertEqual(
+            merge_repo.snapshot_dir(self.src_dir, self.dst_dir, "hardlink"),
+            ({"reflink": 0, "hardlink": 1, "copy": 3, "symlink": 0}, 40))
+
+    @mock.patch("merge_repo.shutil.copystat", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.makedirs", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.lstat",
+                mock.Mock(return_value=mock.Mock(st_size=5)))
+    @mock.patch("merge_repo.os.readlink", mock.Mock(return_value="file1"))
+    @mock.patch("merge_repo.os.path.islink", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.symlink")
+    @mock.patch("merge_repo.snapshot_file")
+    @mock.patch("merge_repo.os.walk")
+    def test_symlink(self, mock_walk, mock_file, mock_link):
+
+        """Function:  test_symlink
+
+        Description:  Test with symbolic links kept as links.
+
+        Arguments:
+
+        """
+
+        mock_walk.return_value = [(self.src_dir, [], ["link1"])]
+
+        self.assertEqual(
+            merge_repo.snapshot_dir(self.src_dir, self.dst_dir, "reflink"),
+            ({"reflink": 0, "hardlink": 0, "copy": 0, "symlink": 1}, 5))
+        mock_link.assert_called_once_with(
+            "file1", os.path.join(self.dst_dir, "link1"))
+        self.assertFalse(mock_file.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# Classification (U)
+
+"""Program:  snapshot_file.py
+
+    Description:  Unit testing of snapshot_file in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/snapshot_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_copy
+        test_hardlink
+        test_hardlink_failed
+        test_reflink
+        test_reflink_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.src_file = "/directory/repo-name/file1"
+        self.dst_file = "/archive_dir/repo-name/file1"
+
+    @mock.patch("merge_repo.shutil.copy2")
+    def test_copy(self, mock_copy):
+
+        """Function:  test_copy
+
+        Description:  Test with copy strategy.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.snapshot_file(
+            self.src_file, self.dst_file, "copy"), "copy")
+        mock_copy.assert_called_once_with(self.src_file, self.dst_file)
+
+    @mock.patch("merge_repo.shutil.copy2")
+    @mock.patch("merge_repo.os.link")
+    def test_hardlink(self, mock_link, mock_copy):
+
+        """Function:  test_hardlink
+
+        Description:  Test with hardlink strategy.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.snapshot_file(
+            self.src_file, self.dst_file, "hardlink"), "hardlink")
+        self.assertFalse(mock_copy.called)
+
+    @mock.patch("merge_repo.shutil.copy2")
+    @mock.patch("merge_repo.os.link")
+    def test_hardlink_failed(self, mock_link, mock_copy):
+
+        """Function:  test_hardlink_failed
+
+        Description:  Test with hardlink across filesystems.
+
+        Arguments:
+
+        """
+
+        mock_link.side_effect = OSError("Invalid cross-device link")
+
+        self.assertEqual(merge_repo.snapshot_file(
+            self.src_file, self.dst_file, "hardlink"), "copy")
+        mock_copy.assert_called_once_with(self.src_file, self.dst_file)
+
+    @mock.patch("merge_repo.shutil.copystat", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.fcntl.ioctl", mock.Mock(return_value=0))
+    @mock.patch("merge_repo.shutil.copy2")
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    def test_reflink(self, mock_copy):
+
+        """Function:  test_reflink
+
+        Description:  Test with reflink strategy.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.snapshot_file(
+            self.src_file, self.dst_file, "reflink"), "reflink")
+        self.assertFalse(mock_copy.called)
+
+    @mock.patch("merge_repo.fcntl.ioctl")
+    @mock.patch("merge_repo.shutil.copy2")
+    @mock.patch("merge_repo.open", mock.mock_open(), create=True)
+    def test_reflink_failed(self, mock_copy, mock_ioctl):
+
+        """Function:  test_reflink_failed
+
+        Description:  Test with reflink not supported by the filesystem.
+
+        Arguments:
+
+        """
+
+        mock_ioctl.side_effect = IOError("Operation not supported")
+
+        self.assertEqual(merge_repo.snapshot_file(
+            self.src_file, self.dst_file, "reflink"), "copy")
+        mock_copy.assert_called_once_with(self.src_file, self.dst_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# Classification (U)
+
+"""Program:  snapshot_thread.py
+
+    Description:  Unit testing of snapshot_thread in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/snapshot_thread.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.archive_dir = "/data/merge-repo/archive_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_snapshot_made
+        test_snapshot_failed
+        test_archive_timing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.arch_dir = "/data/merge-repo/archive_dir/repo-name"
+        self.snapshot = {"args": "args", "arch_dir": None, "error": None}
+        merge_repo.RUN_METRICS.clear()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.RUN_METRICS.clear()
+
+    @mock.patch("merge_repo.archive_original")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_snapshot_made(self, mock_log, mock_arch):
+
+        """Function:  test_snapshot_made
+
+        Description:  Test with the archive snapshot made.
+
+        Arguments:
+
+        """
+
+        mock_arch.return_value = self.arch_dir
+
+        merge_repo.snapshot_thread(self.snapshot, self.cfg, mock_log)
+
+        self.assertEqual(self.snapshot["arch_dir"], self.arch_dir)
+        self.assertIsNone(self.snapshot["error"])
+        mock_arch.assert_called_once_with("args", self.cfg, mock_log)
+
+    @mock.patch("merge_repo.archive_original")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_snapshot_failed(self, mock_log, mock_arch):
+
+        """Function:  test_snapshot_failed
+
+        Description:  Test with the archive snapshot raising an exception.
+
+        Arguments:
+
+        """
+
+        err = OSError("Error Message")
+        mock_arch.side_effect = err
+
+        merge_repo.snapshot_thread(self.snapshot, self.cfg, mock_log)
+
+        self.assertIsNone(self.snapshot["arch_dir"])
+        self.assertIs(self.snapshot["error"], err)
+
+    @mock.patch("merge_repo.time.time")
+    @mock.patch("merge_repo.archive_original")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_archive_timing(self, mock_log, mock_arch, mock_time):
+
+        """Function:  test_archive_timing
+
+        Description:  Test with the snapshot time added to the archive stage.
+
+        Arguments:
+
+        """
+
+        merge_repo.RUN_METRICS["stages"] = {"archive": 1.0}
+        mock_arch.return_value = self.arch_dir
+        mock_time.side_effect = [100.0, 102.5]
+
+        merge_repo.snapshot_thread(self.snapshot, self.cfg, mock_log)
+
+        self.assertEqual(merge_repo.RUN_METRICS["stages"]["archive"], 3.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  ssh_mux_start.py
+
+    Description:  Unit testing of ssh_mux_start in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/ssh_mux_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.ssh_mux = True
+        self.ssh_persist = 300
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_disabled
+        test_git_ssh_set
+        test_enabled
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.ctl_dir = "/tmp/merge-repo-ssh.abc123"
+
+    @mock.patch.dict("merge_repo.os.environ", {}, clear=True)
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_disabled(self, mock_log):
+
+        """Function:  test_disabled
+
+        Description:  Test with SSH multiplexing disabled.
+
+        Arguments:
+
+        """
+
+        self.cfg.ssh_mux = False
+
+        self.assertIsNone(merge_repo.ssh_mux_start(self.cfg, mock_log))
+        self.assertNotIn("GIT_SSH_COMMAND", merge_repo.os.environ)
+
+    @mock.patch.dict("merge_repo.os.environ", {"GIT_SSH_COMMAND": "ssh -v"},
+                     clear=True)
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_git_ssh_set(self, mock_log):
+
+        """Function:  test_git_ssh_set
+
+        Description:  Test with GIT_SSH_COMMAND already set.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(merge_repo.ssh_mux_start(self.cfg, mock_log))
+        self.assertEqual(merge_repo.os.environ["GIT_SSH_COMMAND"], "ssh -v")
+
+    @mock.patch.dict("merge_repo.os.environ", {}, clear=True)
+    @mock.patch("merge_repo.tempfile.mkdtemp")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_enabled(self, mock_log, mock_temp):
+
+        """Function:  test_enabled
+
+        Description:  Test with SSH multiplexing enabled.
+
+        Arguments:
+
+        """
+
+        mock_temp.return_value = self.ctl_dir
+
+        self.assertEqual(
+            merge_repo.ssh_mux_start(self.cfg, mock_log), self.ctl_dir)
+        self.assertIn(self.ctl_dir + "/%r@%n:%p",
+                      merge_repo.os.environ["GIT_SSH_COMMAND"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  ssh_mux_stop.py
+
+    Description:  Unit testing of ssh_mux_stop in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/ssh_mux_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_ctl_dir
+        test_connections
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ctl_dir = "/tmp/merge-repo-ssh.abc123"
+        self.sockets = ["git@server:22", "git@alias:22"]
+
+    @mock.patch("merge_repo.shutil.rmtree")
+    @mock.patch("merge_repo.subprocess.call")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_no_ctl_dir(self, mock_log, mock_call, mock_rm):
+
+        """Function:  test_no_ctl_dir
+
+        Description:  Test with SSH multiplexing not set up.
+
+        Arguments:
+
+        """
+
+        merge_repo.ssh_mux_stop(None, mock_log)
+
+        self.assertFalse(mock_call.called)
+        self.assertFalse(mock_rm.called)
+
+    @mock.patch.dict("merge_repo.os.environ", {"GIT_SSH_COMMAND": "ssh"},
+                     clear=True)
+    @mock.patch("merge_repo.shutil.rmtree")
+    @mock.patch("merge_repo.subprocess.call")
+    @mock.patch("merge_repo.os.listdir")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_connections(self, mock_log, mock_list, mock_call, mock_rm):
+
+        """Function:  test_connections
+
+        Description:  Test with open ControlMaster connections.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.sockets
+
+        merge_repo.ssh_mux_stop(self.ctl_dir, mock_log)
+
+        self.assertEqual(mock_call.call_count, 2)
+        self.assertTrue(mock_rm.called)
+        self.assertNotIn("GIT_SSH_COMMAND", merge_repo.os.environ)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# Classification (U)
+
+"""Program:  start_snapshot.py
+
+    Description:  Unit testing of start_snapshot in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/start_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.archive_dir = "/data/merge-repo/archive_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_thread_started
+        test_snapshot_complete
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.arch_dir = "/data/merge-repo/archive_dir/repo-name"
+
+    @mock.patch("merge_repo.threading.Thread")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_thread_started(self, mock_log, mock_thread):
+
+        """Function:  test_thread_started
+
+        Description:  Test with the snapshot started in a daemon thread.
+
+        Arguments:
+
+        """
+
+        snapshot = merge_repo.start_snapshot("args", self.cfg, mock_log)
+
+        self.assertEqual(snapshot["args"], "args")
+        self.assertIs(snapshot["thread"], mock_thread.return_value)
+        self.assertTrue(snapshot["thread"].daemon)
+        mock_thread.return_value.start.assert_called_once_with()
+        mock_thread.assert_called_once_with(
+            target=merge_repo.snapshot_thread,
+            args=(snapshot, self.cfg, mock_log))
+
+    @mock.patch("merge_repo.archive_original")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_snapshot_complete(self, mock_log, mock_arch):
+
+        """Function:  test_snapshot_complete
+
+        Description:  Test with the background snapshot run to completion.
+
+        Arguments:
+
+        """
+
+        mock_arch.return_value = self.arch_dir
+
+        snapshot = merge_repo.start_snapshot("args", self.cfg, mock_log)
+        snapshot["thread"].join()
+
+        self.assertEqual(snapshot["arch_dir"], self.arch_dir)
+        merge_repo.RUN_METRICS.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
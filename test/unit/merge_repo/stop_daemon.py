@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  stop_daemon.py
+
+    Description:  Unit testing of stop_daemon in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/stop_daemon.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_stop_daemon
+        test_daemon_woken
+        test_worker_not_woken
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.wake = 7
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.DAEMON_STOP.update(
+            {"signum": None, "pid": None, "wake": None})
+
+    @mock.patch("merge_repo.os.write")
+    def test_stop_daemon(self, mock_write):
+
+        """Function:  test_stop_daemon
+
+        Description:  Test with the stop flag set and no exception raised.
+
+        Arguments:
+
+        """
+
+        merge_repo.stop_daemon(15, None)
+
+        self.assertEqual(merge_repo.DAEMON_STOP["signum"], 15)
+        self.assertFalse(mock_write.called)
+
+    @mock.patch("merge_repo.os.write")
+    def test_daemon_woken(self, mock_write):
+
+        """Function:  test_daemon_woken
+
+        Description:  Test with the daemon's wait woken up.
+
+        Arguments:
+
+        """
+
+        merge_repo.DAEMON_STOP.update({"pid": os.getpid(), "wake": self.wake})
+
+        merge_repo.stop_daemon(15, None)
+
+        mock_write.assert_called_once_with(self.wake, b"\0")
+
+    @mock.patch("merge_repo.os.write")
+    def test_worker_not_woken(self, mock_write):
+
+        """Function:  test_worker_not_woken
+
+        Description:  Test with the handler inherited by a worker process.
+
+        Arguments:
+
+        """
+
+        merge_repo.DAEMON_STOP.update(
+            {"pid": os.getpid() + 1, "wake": self.wake})
+
+        merge_repo.stop_daemon(15, None)
+
+        self.assertEqual(merge_repo.DAEMON_STOP["signum"], 15)
+        self.assertFalse(mock_write.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
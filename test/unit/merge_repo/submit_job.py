@@ -0,0 +1,255 @@
+# Classification (U)
+
+"""Program:  submit_job.py
+
+    Description:  Unit testing of submit_job in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/submit_job.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs         # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser(object):                                # pylint:disable=R0205
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_job_submitted
+        test_job_wait
+        test_multiple_projects
+        test_daemon_not_running
+        test_no_lazy_imports
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {
+            "-c": "merge", "-d": "/config_dir", "-r": "repo-name",
+            "-Q": "/data/merge-repo/merge.sock", "-a": True}
+        self.proj_list = ["/directory/repo-name"]
+        self.proj_list2 = ["/directory/repo-name", "/directory/repo-name2"]
+        self.sock = mock.Mock()
+        self.queued = '{"job_id": "0123456789ab", "status": "queued"}\n'
+        self.merged = '{"job_id": "0123456789ab", "status": true}\n'
+
+    def get_job(self, call_nbr=0):
+
+        """Function:  get_job
+
+        Description:  Return the job sent on the socket.
+
+        Arguments:
+
+        """
+
+        return json.loads(
+            self.sock.sendall.call_args_list[call_nbr][0][0].decode("utf-8"))
+
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.socket.socket")
+    def test_job_submitted(self, mock_sock, mock_list):
+
+        """Function:  test_job_submitted
+
+        Description:  Test with a job submitted and queued.
+
+        Arguments:
+
+        """
+
+        mock_sock.return_value = self.sock
+        mock_list.return_value = self.proj_list
+        self.sock.makefile.return_value.readline.return_value = self.queued
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                merge_repo.submit_job(self.args),
+                {"/directory/repo-name": {"job_id": "0123456789ab",
+                                          "status": "queued"}})
+
+        job = self.get_job()
+        self.assertEqual(job["-r"], "repo-name")
+        self.assertTrue(job["-a"])
+        self.assertFalse(job["wait"])
+        self.sock.connect.assert_called_once_with(
+            "/data/merge-repo/merge.sock")
+
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.socket.socket")
+    def test_job_wait(self, mock_sock, mock_list):
+
+        """Function:  test_job_wait
+
+        Description:  Test with the client waiting for the merge status.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-w"] = True
+        mock_sock.return_value = self.sock
+        mock_list.return_value = self.proj_list
+        self.sock.makefile.return_value.readline.side_effect = [
+            self.queued, self.merged]
+
+        with gen_libs.no_std_out():
+            results = merge_repo.submit_job(self.args)
+
+        self.assertTrue(results["/directory/repo-name"]["status"])
+        self.assertTrue(self.get_job()["wait"])
+
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.socket.socket")
+    def test_multiple_projects(self, mock_sock, mock_list):
+
+        """Function:  test_multiple_projects
+
+        Description:  Test with multiple projects submitted.
+
+        Arguments:
+
+        """
+
+        mock_sock.return_value = self.sock
+        mock_list.return_value = self.proj_list2
+        self.sock.makefile.return_value.readline.return_value = self.queued
+
+        with gen_libs.no_std_out():
+            self.assertEqual(len(merge_repo.submit_job(self.args)), 2)
+
+        self.assertIsNone(self.get_job(1)["-r"])
+
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.socket.socket")
+    def test_daemon_not_running(self, mock_sock, mock_list):
+
+        """Function:  test_daemon_not_running
+
+        Description:  Test with no daemon listening on the socket.
+
+        Arguments:
+
+        """
+
+        mock_sock.return_value = self.sock
+        mock_list.return_value = self.proj_list
+        self.sock.connect.side_effect = OSError("Connection refused")
+
+        with gen_libs.no_std_out():
+            results = merge_repo.submit_job(self.args)
+
+        self.assertEqual(results["/directory/repo-name"]["status"], "error")
+        self.sock.close.assert_called_once_with()
+
+    @mock.patch("merge_repo.get_proj_list")
+    @mock.patch("merge_repo.socket.socket")
+    def test_no_lazy_imports(self, mock_sock, mock_list):
+
+        """Function:  test_no_lazy_imports
+
+        Description:  Test with the client not importing the lazily
+            imported modules.
+
+        Arguments:
+
+        """
+
+        mock_sock.return_value = self.sock
+        mock_list.return_value = self.proj_list
+        self.sock.makefile.return_value.readline.return_value = self.queued
+
+        with gen_libs.no_std_out():
+            merge_repo.submit_job(self.args)
+
+        for module in [merge_repo.git, merge_repo.git_class,
+                       merge_repo.multiprocessing, merge_repo.asyncio]:
+            if module is not None:
+                self.assertIsNone(module.module)
+
+
+if __name__ == "__main__":
+    unittest.main()
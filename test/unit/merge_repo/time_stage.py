@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  time_stage.py
+
+    Description:  Unit testing of time_stage in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/time_stage.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_stage
+        test_stage_repeated
+        test_stage_exception
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.func = mock.Mock(return_value=(True, {}))
+        merge_repo.RUN_METRICS.clear()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.RUN_METRICS.clear()
+
+    @mock.patch("merge_repo.time.time", mock.Mock(side_effect=[10.0, 12.5]))
+    def test_stage(self):
+
+        """Function:  test_stage
+
+        Description:  Test with the time of a stage.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.time_stage("fetch", self.func, "arg1", key="val1"),
+            (True, {}))
+        self.func.assert_called_once_with("arg1", key="val1")
+        self.assertEqual(merge_repo.RUN_METRICS["stages"], {"fetch": 2.5})
+        self.assertEqual(merge_repo.RUN_METRICS["stage"], "fetch")
+
+    @mock.patch("merge_repo.time.time",
+                mock.Mock(side_effect=[10.0, 12.5, 20.0, 21.0]))
+    def test_stage_repeated(self):
+
+        """Function:  test_stage_repeated
+
+        Description:  Test with the time of a stage run twice.
+
+        Arguments:
+
+        """
+
+        merge_repo.time_stage("push", self.func)
+        merge_repo.time_stage("push", self.func)
+
+        self.assertEqual(merge_repo.RUN_METRICS["stages"], {"push": 3.5})
+
+    @mock.patch("merge_repo.time.time", mock.Mock(side_effect=[10.0, 11.0]))
+    def test_stage_exception(self):
+
+        """Function:  test_stage_exception
+
+        Description:  Test with the stage raising an exception.
+
+        Arguments:
+
+        """
+
+        self.func.side_effect = OSError("Error Message")
+
+        with self.assertRaises(OSError):
+            merge_repo.time_stage("move", self.func)
+
+        self.assertEqual(merge_repo.RUN_METRICS["stages"], {"move": 1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
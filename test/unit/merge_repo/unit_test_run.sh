@@ -23,5 +23,97 @@ echo "Unit testing merge_repo.py"
 /usr/bin/python test/unit/merge_repo/cleanup_repo.py
 /usr/bin/python test/unit/merge_repo/help_message.py
 /usr/bin/python test/unit/merge_repo/run_program.py
+/usr/bin/python test/unit/merge_repo/get_proj_list.py
+/usr/bin/python test/unit/merge_repo/run_merge.py
+/usr/bin/python test/unit/merge_repo/batch_merge.py
+/usr/bin/python test/unit/merge_repo/merge_proj_dir.py
+/usr/bin/python test/unit/merge_repo/init_worker.py
+/usr/bin/python test/unit/merge_repo/worker_merge.py
+/usr/bin/python test/unit/merge_repo/pool_merge.py
+/usr/bin/python test/unit/merge_repo/merge_list.py
+/usr/bin/python test/unit/merge_repo/inotify_watch.py
+/usr/bin/python test/unit/merge_repo/wait_spool.py
+/usr/bin/python test/unit/merge_repo/scan_spool.py
+/usr/bin/python test/unit/merge_repo/stop_daemon.py
+/usr/bin/python test/unit/merge_repo/daemon_merge.py
+/usr/bin/python test/unit/merge_repo/get_url.py
+/usr/bin/python test/unit/merge_repo/preflight.py
+/usr/bin/python test/unit/merge_repo/snapshot_file.py
+/usr/bin/python test/unit/merge_repo/snapshot_dir.py
+/usr/bin/python test/unit/merge_repo/archive_original.py
+/usr/bin/python test/unit/merge_repo/get_worktree_state.py
+/usr/bin/python test/unit/merge_repo/open_tar.py
+/usr/bin/python test/unit/merge_repo/close_tar.py
+/usr/bin/python test/unit/merge_repo/archive_bundle.py
+/usr/bin/python test/unit/merge_repo/archive_project.py
+/usr/bin/python test/unit/merge_repo/restore_archive.py
+/usr/bin/python test/unit/merge_repo/restore.py
+/usr/bin/python test/unit/merge_repo/get_status.py
+/usr/bin/python test/unit/merge_repo/ssh_mux_start.py
+/usr/bin/python test/unit/merge_repo/ssh_mux_stop.py
+/usr/bin/python test/unit/merge_repo/push_atomic.py
+/usr/bin/python test/unit/merge_repo/get_push_tags.py
+/usr/bin/python test/unit/merge_repo/push_tags.py
+/usr/bin/python test/unit/merge_repo/get_ahead_behind.py
+/usr/bin/python test/unit/merge_repo/parse_push.py
+/usr/bin/python test/unit/merge_repo/fetch_branch.py
+/usr/bin/python test/unit/merge_repo/update_mirror.py
+/usr/bin/python test/unit/merge_repo/dissociate.py
+/usr/bin/python test/unit/merge_repo/is_same_tree.py
+/usr/bin/python test/unit/merge_repo/index_merge.py
+/usr/bin/python test/unit/merge_repo/resolve_theirs.py
+/usr/bin/python test/unit/merge_repo/is_related.py
+/usr/bin/python test/unit/merge_repo/metrics_start.py
+/usr/bin/python test/unit/merge_repo/time_stage.py
+/usr/bin/python test/unit/merge_repo/add_counter.py
+/usr/bin/python test/unit/merge_repo/dir_usage.py
+/usr/bin/python test/unit/merge_repo/metrics_summary.py
+/usr/bin/python test/unit/merge_repo/prom_text.py
+/usr/bin/python test/unit/merge_repo/export_metrics.py
+/usr/bin/python test/unit/merge_repo/lazy_module.py
+/usr/bin/python test/unit/merge_repo/job_reply.py
+/usr/bin/python test/unit/merge_repo/job_request.py
+/usr/bin/python test/unit/merge_repo/job_listen.py
+/usr/bin/python test/unit/merge_repo/open_socket.py
+/usr/bin/python test/unit/merge_repo/run_job.py
+/usr/bin/python test/unit/merge_repo/submit_job.py
+/usr/bin/python test/unit/merge_repo/job_done.py
+/usr/bin/python test/unit/merge_repo/worker_rss.py
+/usr/bin/python test/unit/merge_repo/prefork_worker.py
+/usr/bin/python test/unit/merge_repo/prefork_spawn.py
+/usr/bin/python test/unit/merge_repo/prefork_start.py
+/usr/bin/python test/unit/merge_repo/prefork_reap.py
+/usr/bin/python test/unit/merge_repo/prefork_merge.py
+/usr/bin/python test/unit/merge_repo/prefork_round.py
+/usr/bin/python test/unit/merge_repo/prefork_stop.py
+/usr/bin/python test/unit/merge_repo/async_git.py
+/usr/bin/python test/unit/merge_repo/remote_check.py
+/usr/bin/python test/unit/merge_repo/refresh_mirror.py
+/usr/bin/python test/unit/merge_repo/prefetch_mirror.py
+/usr/bin/python test/unit/merge_repo/snapshot_thread.py
+/usr/bin/python test/unit/merge_repo/start_snapshot.py
+/usr/bin/python test/unit/merge_repo/wait_snapshot.py
+/usr/bin/python test/unit/merge_repo/discard_snapshot.py
+/usr/bin/python test/unit/merge_repo/mail_write.py
+/usr/bin/python test/unit/merge_repo/mail_enqueue.py
+/usr/bin/python test/unit/merge_repo/mail_deliver.py
+/usr/bin/python test/unit/merge_repo/mail_attempt.py
+/usr/bin/python test/unit/merge_repo/mail_flush.py
+/usr/bin/python test/unit/merge_repo/mail_sender.py
+/usr/bin/python test/unit/merge_repo/mail_start.py
+/usr/bin/python test/unit/merge_repo/mail_stop.py
+/usr/bin/python test/unit/merge_repo/fork_context.py
+/usr/bin/python test/unit/merge_repo/wait_ready.py
+/usr/bin/python test/unit/merge_repo/find_program.py
+/usr/bin/python test/unit/merge_repo/git_error.py
+/usr/bin/python test/unit/merge_repo/dir_mtime.py
+/usr/bin/python test/unit/merge_repo/push_branch.py
+/usr/bin/python test/unit/merge_repo/parse_merge_tree.py
+/usr/bin/python test/unit/merge_repo/add_record.py
+/usr/bin/python test/unit/merge_repo/merge_item.py
+/usr/bin/python test/unit/merge_repo/daemon_start.py
+/usr/bin/python test/unit/merge_repo/daemon_stop.py
+/usr/bin/python test/unit/merge_repo/daemon_round.py
+/usr/bin/python test/unit/merge_repo/mirror_check.py
 /usr/bin/python test/unit/merge_repo/main.py
 
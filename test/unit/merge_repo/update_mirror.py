@@ -0,0 +1,229 @@
+# Classification (U)
+
+"""Program:  update_mirror.py
+
+    Description:  Unit testing of update_mirror in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/update_mirror.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest(object):                          # pylint:disable=R0903,R0205
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.mirror_dir = "/data/merge-repo/mirror_dir"
+
+
+class GitMerge(object):                         # pylint:disable=R0903,R0205
+
+    """Class:  GitMerge
+
+    Description:  Class which is a representation of GitMerge module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the GitMerge class.
+
+        Arguments:
+
+        """
+
+        self.repo_name = "repo-name"
+        self.url = "git@server:project/repo-name.git"
+        self.branch = "develop"
+        self.git_dir = "/data/merge-repo/work_dir/repo-name"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_mirror
+        test_existing_mirror
+        test_alternate_exists
+        test_fetch_failed
+        test_mirror_fresh
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.gitr = GitMerge()
+        self.mirror = "/data/merge-repo/mirror_dir/repo-name.git"
+        self.alternate = self.mirror + "/objects\n"
+
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.git.Git")
+    @mock.patch("merge_repo.git.Repo.init")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_new_mirror(self, mock_log, mock_init, mock_git, mock_open):
+
+        """Function:  test_new_mirror
+
+        Description:  Test with mirror created.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            merge_repo.update_mirror(self.gitr, self.cfg, mock_log))
+        mock_init.assert_called_once_with(self.mirror, bare=True)
+        mock_git.return_value.fetch.assert_called_once_with(
+            self.gitr.url, "+refs/heads/develop:refs/heads/develop",
+            "+refs/tags/*:refs/tags/*")
+        mock_open.return_value.write.assert_called_once_with(self.alternate)
+
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.git.Git", mock.Mock())
+    @mock.patch("merge_repo.git.Repo.init")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_existing_mirror(self, mock_log, mock_init, mock_open):
+
+        """Function:  test_existing_mirror
+
+        Description:  Test with mirror refreshed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            merge_repo.update_mirror(self.gitr, self.cfg, mock_log))
+        self.assertFalse(mock_init.called)
+        self.assertTrue(mock_open.return_value.write.called)
+
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.git.Git", mock.Mock())
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_alternate_exists(self, mock_log, mock_open):
+
+        """Function:  test_alternate_exists
+
+        Description:  Test with mirror already in the alternates.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value.read.return_value = self.alternate
+
+        self.assertTrue(
+            merge_repo.update_mirror(self.gitr, self.cfg, mock_log))
+        self.assertFalse(mock_open.return_value.write.called)
+
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.git.Git")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_fetch_failed(self, mock_log, mock_git, mock_open):
+
+        """Function:  test_fetch_failed
+
+        Description:  Test with the mirror refresh failing.
+
+        Arguments:
+
+        """
+
+        mock_git.return_value.fetch.side_effect = \
+            merge_repo.git.exc.GitCommandError("git fetch", 128)
+
+        self.assertFalse(
+            merge_repo.update_mirror(self.gitr, self.cfg, mock_log))
+        self.assertFalse(mock_open.return_value.write.called)
+
+    @mock.patch("merge_repo.fcntl.flock", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.os.path.isfile", mock.Mock(return_value=False))
+    @mock.patch("merge_repo.os.path.isdir", mock.Mock(return_value=True))
+    @mock.patch("merge_repo.open", new_callable=mock.mock_open, create=True)
+    @mock.patch("merge_repo.git.Git")
+    @mock.patch("merge_repo.gen_class.Logger")
+    def test_mirror_fresh(self, mock_log, mock_git, mock_open):
+
+        """Function:  test_mirror_fresh
+
+        Description:  Test with mirror already refreshed by the remote check.
+
+        Arguments:
+
+        """
+
+        merge_repo.MIRROR_FRESH.add(self.mirror)
+
+        self.assertTrue(
+            merge_repo.update_mirror(self.gitr, self.cfg, mock_log))
+        self.assertFalse(mock_git.return_value.fetch.called)
+        self.assertNotIn(self.mirror, merge_repo.MIRROR_FRESH)
+        mock_open.return_value.write.assert_called_once_with(self.alternate)
+
+
+if __name__ == "__main__":
+    unittest.main()
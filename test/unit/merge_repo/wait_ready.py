@@ -0,0 +1,93 @@
+# Classification (U)
+
+"""Program:  wait_ready.py
+
+    Description:  Unit testing of wait_ready in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/wait_ready.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_ready
+        test_interrupted
+        test_select_error
+
+    """
+
+    @mock.patch("merge_repo.select.select")
+    def test_ready(self, mock_select):
+
+        """Function:  test_ready
+
+        Description:  Test with a file descriptor ready for reading.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = ([5], [], [])
+
+        self.assertEqual(merge_repo.wait_ready([5, 6], 30), [5])
+        mock_select.assert_called_once_with([5, 6], [], [], 30)
+
+    @mock.patch("merge_repo.select.select")
+    def test_interrupted(self, mock_select):
+
+        """Function:  test_interrupted
+
+        Description:  Test with the wait interrupted by a signal.
+
+        Arguments:
+
+        """
+
+        mock_select.side_effect = merge_repo.select.error(
+            merge_repo.errno.EINTR, "Interrupted system call")
+
+        self.assertEqual(merge_repo.wait_ready([5]), [])
+
+    @mock.patch("merge_repo.select.select")
+    def test_select_error(self, mock_select):
+
+        """Function:  test_select_error
+
+        Description:  Test with the select failing.
+
+        Arguments:
+
+        """
+
+        mock_select.side_effect = merge_repo.select.error(
+            merge_repo.errno.EBADF, "Bad file descriptor")
+
+        self.assertRaises(merge_repo.select.error, merge_repo.wait_ready, [5])
+
+
+if __name__ == "__main__":
+    unittest.main()
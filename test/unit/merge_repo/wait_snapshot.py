@@ -0,0 +1,88 @@
+# Classification (U)
+
+"""Program:  wait_snapshot.py
+
+    Description:  Unit testing of wait_snapshot in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/wait_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_snapshot_made
+        test_snapshot_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.arch_dir = "/data/merge-repo/archive_dir/repo-name"
+        self.snapshot = {"args": "args", "arch_dir": self.arch_dir,
+                         "error": None, "thread": mock.Mock()}
+
+    def test_snapshot_made(self):
+
+        """Function:  test_snapshot_made
+
+        Description:  Test with the archive snapshot made.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            merge_repo.wait_snapshot(self.snapshot), self.arch_dir)
+        self.snapshot["thread"].join.assert_called_once_with()
+
+    def test_snapshot_failed(self):
+
+        """Function:  test_snapshot_failed
+
+        Description:  Test with the archive snapshot exception raised again.
+
+        Arguments:
+
+        """
+
+        self.snapshot["arch_dir"] = None
+        self.snapshot["error"] = OSError("Error Message")
+
+        self.assertRaises(OSError, merge_repo.wait_snapshot, self.snapshot)
+
+
+if __name__ == "__main__":
+    unittest.main()
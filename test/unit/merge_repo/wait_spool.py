@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  wait_spool.py
+
+    Description:  Unit testing of wait_spool in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/wait_spool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_inotify
+        test_timeout
+        test_events
+        test_events_drained
+        test_wake_pipe
+
+    """
+
+    @mock.patch("merge_repo.time.sleep")
+    def test_no_inotify(self, mock_sleep):
+
+        """Function:  test_no_inotify
+
+        Description:  Test with no inotify watch.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(merge_repo.wait_spool(None, 60))
+        mock_sleep.assert_called_once_with(60)
+
+    @mock.patch("merge_repo.os.read")
+    @mock.patch("merge_repo.select.select")
+    def test_timeout(self, mock_select, mock_read):
+
+        """Function:  test_timeout
+
+        Description:  Test with timeout expiring before any events.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = ([], [], [])
+
+        self.assertFalse(merge_repo.wait_spool(5, 60))
+        self.assertFalse(mock_read.called)
+
+    @mock.patch("merge_repo.os.read")
+    @mock.patch("merge_repo.select.select")
+    def test_events(self, mock_select, mock_read):
+
+        """Function:  test_events
+
+        Description:  Test with events read until none are left.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = ([5], [], [])
+        mock_read.side_effect = [b"event", b""]
+
+        self.assertFalse(merge_repo.wait_spool(5, 60))
+
+    @mock.patch("merge_repo.os.read")
+    @mock.patch("merge_repo.select.select")
+    def test_events_drained(self, mock_select, mock_read):
+
+        """Function:  test_events_drained
+
+        Description:  Test with events read until the read would block.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = ([5], [], [])
+        mock_read.side_effect = [b"event", OSError("Resource unavailable")]
+
+        self.assertFalse(merge_repo.wait_spool(5, 60))
+
+    @mock.patch("merge_repo.os.read")
+    @mock.patch("merge_repo.select.select")
+    def test_wake_pipe(self, mock_select, mock_read):
+
+        """Function:  test_wake_pipe
+
+        Description:  Test with a submitted job waking up the wait.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = ([7], [], [])
+        mock_read.side_effect = [b"j", OSError("Resource unavailable")]
+
+        self.assertFalse(merge_repo.wait_spool(None, 60, 7))
+        mock_select.assert_called_once_with([7], [], [], 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Classification (U)
+
+"""Program:  worker_merge.py
+
+    Description:  Unit testing of worker_merge in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/worker_merge.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_worker_merge
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.WORKER_ENV.update(
+            {"args": "Args", "cfg": "Cfg", "log": "Log"})
+        self.proj_dir = "/directory/repo-name"
+
+    @mock.patch("merge_repo.merge_proj_dir")
+    def test_worker_merge(self, mock_merge):
+
+        """Function:  test_worker_merge
+
+        Description:  Test with the merge of a project in a worker.
+
+        Arguments:
+
+        """
+
+        mock_merge.return_value = True
+
+        self.assertEqual(merge_repo.worker_merge(self.proj_dir),
+                         (self.proj_dir, True))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        merge_repo.WORKER_ENV.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# Classification (U)
+
+"""Program:  worker_rss.py
+
+    Description:  Unit testing of worker_rss in merge_repo.py.
+
+    Usage:
+        test/unit/merge_repo/worker_rss.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import merge_repo                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_resident_memory
+        test_not_available
+
+    """
+
+    @mock.patch("merge_repo.os.sysconf", mock.Mock(return_value=4096))
+    @mock.patch("merge_repo.open", mock.mock_open(read_data="900 512 1 0"),
+                create=True)
+    def test_resident_memory(self):
+
+        """Function:  test_resident_memory
+
+        Description:  Test with resident memory read from the process.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(merge_repo.worker_rss(), 2.0)
+
+    @mock.patch("merge_repo.open", mock.Mock(side_effect=IOError("Error")),
+                create=True)
+    def test_not_available(self):
+
+        """Function:  test_not_available
+
+        Description:  Test with resident memory not available.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(merge_repo.worker_rss())
+
+
+if __name__ == "__main__":
+    unittest.main()
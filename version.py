@@ -6,4 +6,4 @@
 
 """
 
-__version__ = "1.1.4"
+__version__ = "1.2.0"